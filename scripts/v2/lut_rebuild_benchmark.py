@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+"""Benchmark: full 3D LUT rebuild time vs resident brick count.
+
+Compares ``rebuild_lut`` (one scatter + repeat over each level's
+occupied bounding box, or per-brick writes for sparse levels) against
+the plain per-brick Python sweep, on a 128^3 base grid with a 7-level
+pyramid.  Bricks are split evenly between two slice
+positions so the two-phase foreground/background sweep is exercised.
+The "export" column is the ``resident_bricks()`` share of the
+rebuild time: the one remaining per-brick Python pass.  The "delta"
+column is ``LutIndirectionManager3D.rebuild`` applying one committed
+level-6 brick incrementally, which rewrites only that brick's box.
+
+No GPU is needed; textures are only scheduled for upload.
+
+Run with:
+    uv run python scripts/v2/lut_rebuild_benchmark.py
+"""
+
+from __future__ import annotations
+
+import time
+
+import numpy as np
+
+from cellier.render.block_cache import (
+    BlockCacheParameters3D,
+    BlockKey3D,
+    TileManager3D,
+)
+from cellier.render.lut_indirection import BlockLayout3D, LutIndirectionManager3D
+from cellier.render.lut_indirection._lut_indirection_manager_3d import (
+    _level_scale,
+    rebuild_lut,
+)
+
+GRID_SIDE = 128
+N_LEVELS = 7
+BRICK_COUNTS = (200, 2_000, 20_000, 60_000)
+N_REPEATS = 5
+SLICE_COORDS = (((0, 10),), ((0, 20),))
+RNG = np.random.default_rng(0)
+
+
+def _populate(n_bricks: int) -> TileManager3D:
+    """Commit *n_bricks* distinct random bricks, finest-heavy."""
+    tile_manager = TileManager3D(
+        BlockCacheParameters3D(grid_side=48, block_size=8, overlap=1)
+    )
+    keys: dict[BlockKey3D, int] = {}
+    while len(keys) < n_bricks:
+        level = int(min(RNG.geometric(0.6), N_LEVELS))
+        side = GRID_SIDE >> (level - 1)
+        g0, g1, g2 = (int(v) for v in RNG.integers(0, side, size=3))
+        slice_coord = SLICE_COORDS[len(keys) % 2]
+        keys[BlockKey3D(level, g0, g1, g2, slice_coord)] = level
+    for key, slot in tile_manager.stage(keys, frame_number=1):
+        slot.brick_max = float(RNG.random())
+        tile_manager.commit(key, slot)
+    return tile_manager
+
+
+def _loop_rebuild(lut: LutIndirectionManager3D, tile_manager: TileManager3D) -> None:
+    """Per-brick reference sweep: one slice assignment per brick."""
+    lut.lut_data[:] = 0
+    lut.brick_max_data[:] = 0.0
+    gd, gh, gw = lut.brick_max_data.shape
+    for foreground in (False, True):
+        for level in range(N_LEVELS, 0, -1):
+            sz, sy, sx = _level_scale(level, None)
+            for key, slot in tile_manager.tilemap.items():
+                if key.level != level or (key.slice_coord == SLICE_COORDS[1]) != (
+                    foreground
+                ):
+                    continue
+                cz, cy, cx = slot.grid_pos
+                z0, y0, x0 = key.g0 * sz, key.g1 * sy, key.g2 * sx
+                cells = (
+                    slice(z0, min(z0 + sz, gd)),
+                    slice(y0, min(y0 + sy, gh)),
+                    slice(x0, min(x0 + sx, gw)),
+                )
+                lut.lut_data[cells] = (cx, cy, cz, level)
+                lut.brick_max_data[cells] = slot.brick_max
+
+
+def _delta_ms(lut: LutIndirectionManager3D, tile_manager: TileManager3D) -> float:
+    """Return the best time to apply one committed coarse brick as a LUT delta."""
+    # A slice position no populated brick uses, so the key is always new.
+    key = BlockKey3D(N_LEVELS - 1, 1, 0, 1, ((0, 30),))
+    lut.rebuild(tile_manager, SLICE_COORDS[1])
+    timings = []
+    for frame in range(2, 2 + N_REPEATS):
+        required = {resident: resident.level for resident in tile_manager.tilemap}
+        required[key] = key.level
+        for staged_key, slot in tile_manager.stage(required, frame_number=frame):
+            tile_manager.commit(staged_key, slot)
+        start = time.perf_counter()
+        lut.rebuild(tile_manager, SLICE_COORDS[1])
+        timings.append(time.perf_counter() - start)
+        tile_manager.tilemap.pop(key)
+        lut.rebuild(tile_manager, SLICE_COORDS[1])
+    return 1000.0 * min(timings)
+
+
+def _best_of(fn) -> float:
+    """Return the fastest of ``N_REPEATS`` runs of *fn*, in milliseconds."""
+    timings = []
+    for _ in range(N_REPEATS):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return 1000.0 * min(timings)
+
+
+def main() -> None:
+    layout = BlockLayout3D(volume_shape=(GRID_SIDE,) * 3, block_size=1)
+    print(f"base grid {GRID_SIDE}^3, {N_LEVELS} levels, best of {N_REPEATS}")
+    print(
+        f"{'bricks':>8}  {'export ms':>10}  {'rebuild_lut ms':>14}  "
+        f"{'per-brick ms':>13}  {'speedup':>8}  {'delta ms':>9}"
+    )
+    for n_bricks in BRICK_COUNTS:
+        tile_manager = _populate(n_bricks)
+        lut = LutIndirectionManager3D(layout, n_levels=N_LEVELS)
+        reference = LutIndirectionManager3D(layout, n_levels=N_LEVELS)
+
+        def _rebuild(lut=lut, tile_manager=tile_manager) -> None:
+            rebuild_lut(
+                layout,
+                tile_manager,
+                N_LEVELS,
+                lut.lut_data,
+                lut.lut_tex,
+                lut.brick_max_data,
+                lut.brick_max_tex,
+                current_slice_coord=SLICE_COORDS[1],
+            )
+
+        export_ms = _best_of(tile_manager.resident_bricks)
+        rebuild_ms = _best_of(_rebuild)
+        loop_ms = _best_of(
+            lambda ref=reference, tm=tile_manager: _loop_rebuild(ref, tm)
+        )
+        assert np.array_equal(lut.lut_data, reference.lut_data)
+        delta_ms = _delta_ms(lut, tile_manager)
+        print(
+            f"{n_bricks:>8}  {export_ms:>10.2f}  {rebuild_ms:>14.2f}  "
+            f"{loop_ms:>13.2f}  {loop_ms / rebuild_ms:>7.1f}x  {delta_ms:>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
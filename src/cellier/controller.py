@@ -480,6 +480,7 @@ class CellierController:
             The same object passed in.
         """
         self._model.data.stores[data_store.id] = data_store
+        self._render_manager.open_data_store(data_store)
         return data_store
 
     # ------------------------------------------------------------------
@@ -527,7 +528,7 @@ class CellierController:
         """
         if data_store is not None:
             if data_store.id not in self._model.data.stores:
-                self._model.data.stores[data_store.id] = data_store
+                self.add_data_store(data_store)
 
         if isinstance(visual_model, MultiscaleImageVisual):
             return self._add_multiscale_image_visual(scene_id, visual_model)
@@ -1134,6 +1135,7 @@ class CellierController:
             level_shapes=list(data_store.level_shapes),
             render_modes=render_modes,
             displayed_axes=displayed_axes,
+            data_dtype=getattr(data_store, "dtype", None),
         )
         self._register_visual(
             scene_id, visual_model, gfx_visual, data_store, displayed_axes
@@ -1227,6 +1229,7 @@ class CellierController:
             render_modes=render_modes,
             displayed_axes=displayed_axes,
             transform=visual_model.transform,
+            data_dtype=getattr(data_store, "dtype", None),
         )
         self._register_visual(
             scene_id, visual_model, gfx_visual, data_store, displayed_axes
@@ -1869,6 +1872,8 @@ class CellierController:
                     lod_bias=visual.appearance.lod_bias,
                     force_level=visual.appearance.force_level,
                     frustum_cull=visual.appearance.frustum_cull,
+                    load_priority=visual.appearance.load_priority,
+                    progressive=visual.appearance.progressive,
                 )
             else:
                 configs[visual.id] = VisualRenderConfig()
@@ -2292,6 +2297,8 @@ class CellierController:
                 lod_bias=visual.appearance.lod_bias,
                 force_level=visual.appearance.force_level,
                 frustum_cull=visual.appearance.frustum_cull,
+                load_priority=visual.appearance.load_priority,
+                progressive=visual.appearance.progressive,
             )
         else:
             cfg = VisualRenderConfig()
@@ -2813,6 +2820,29 @@ class CellierController:
             self._settle_after(canvas_id, event.scene_id)
         )
 
+        if self._render_manager.config.camera.prefetch_enabled:
+            self._prefetch_camera_motion(canvas_id, event.scene_id)
+
+    def _prefetch_camera_motion(self, canvas_id: UUID, scene_id: UUID) -> None:
+        """Prefetch chunks for where the moving camera is heading."""
+        scene = self._model.scenes[scene_id]
+        target_ids = frozenset(v.id for v in scene.visuals if v.requires_camera_reslice)
+        if not target_ids:
+            return
+        n_prefetched = self._render_manager.prefetch_canvas(
+            canvas_id,
+            self._dims_state_for_scene(scene_id),
+            self._build_visual_configs_for_scene(scene_id),
+            target_visual_ids=target_ids,
+        )
+        if n_prefetched:
+            _CAMERA_LOGGER.debug(
+                "prefetch_submit  canvas=%s  scene=%s  chunks=%d",
+                canvas_id,
+                scene_id,
+                n_prefetched,
+            )
+
     def _update_camera_model(
         self, scene_id: UUID, canvas_id: UUID, camera_state: CameraState
     ) -> None:
@@ -3641,6 +3671,25 @@ class CellierController:
             return 0
         return gfx_visual.invalidate_painted_tiles_2d(dirty_grid_coords)
 
+    def _invalidate_host_cache(self, data_store_id: UUID) -> int:
+        """Drop host-cached decoded chunks read from *data_store_id*.
+
+        Used by :class:`MultiscalePaintController` after flushing a paint
+        transaction so the follow-up reslice re-reads the committed values
+        instead of serving pre-paint chunks from the shared host cache.
+
+        Parameters
+        ----------
+        data_store_id :
+            The data store whose contents changed.
+
+        Returns
+        -------
+        int
+            Number of cached chunks dropped.
+        """
+        return self._render_manager.invalidate_host_cache(data_store_id)
+
     def _patch_painted_tiles_2d(
         self,
         visual_id: UUID,
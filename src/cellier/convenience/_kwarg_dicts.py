@@ -98,6 +98,12 @@ class MultiscaleImageAppearanceKwargs(BaseImageAppearanceKwargs, total=False):
         Overrides automatic LOD selection when set. Default ``None``.
     frustum_cull : bool
         Skip bricks outside the camera frustum. Default ``True``.
+    load_priority : int
+        Scheduling priority of this visual's chunk reads relative to
+        other visuals; lower values load first. Default ``0``.
+    progressive : bool
+        Load a coarse cover first, then refine coarse-to-fine in 3D.
+        Default ``False``.
     iso_threshold : float
         Isosurface threshold for 3D raycast rendering. Default ``0.2``.
     render_mode : str
@@ -124,6 +130,8 @@ class MultiscaleImageAppearanceKwargs(BaseImageAppearanceKwargs, total=False):
     lod_bias: float
     force_level: int | None
     frustum_cull: bool
+    load_priority: int
+    progressive: bool
     iso_threshold: float
     render_mode: Literal["iso", "mip", "smooth_iso", "attenuated_mip"]
     attenuation: float
@@ -201,6 +209,12 @@ class MultiscaleLabelsAppearanceKwargs(BaseLabelsAppearanceKwargs, total=False):
         Overrides automatic LOD selection when set. Default ``None``.
     frustum_cull : bool
         Skip bricks outside the camera frustum. Default ``True``.
+    load_priority : int
+        Scheduling priority of this visual's chunk reads relative to
+        other visuals; lower values load first. Default ``0``.
+    progressive : bool
+        Load a coarse cover first, then refine coarse-to-fine in 3D.
+        Default ``False``.
     visible : bool
         Default ``True``.
     opacity : float
@@ -223,6 +237,8 @@ class MultiscaleLabelsAppearanceKwargs(BaseLabelsAppearanceKwargs, total=False):
     lod_bias: float
     force_level: int | None
     frustum_cull: bool
+    load_priority: int
+    progressive: bool
 
 
 class MeshFlatAppearanceKwargs(BaseAppearanceKwargs, total=False):
@@ -451,12 +467,23 @@ class MultiscaleImageRenderConfigKwargs(TypedDict, total=False):
     paint_max_tiles : int
         Maximum number of finest-level tiles paintable in one session.
         Default ``512``.
+    cache_precision : {"native", "float16", "uint8"}
+        On-GPU storage precision for float32 image bricks.  Default
+        ``"native"`` (lossless).
+    upload_budget_bytes : int
+        Maximum bytes uploaded into each GPU cache texture per frame.
+        Default 64 MiB.
+    lod_strategy : {"distance_bands", "octree", "screen_space_error"}
+        3D LOD selection strategy.  Default ``"distance_bands"``.
     """
 
     block_size: int
     gpu_budget_bytes: int
     gpu_budget_bytes_2d: int
     paint_max_tiles: int
+    cache_precision: Literal["native", "float16", "uint8"]
+    upload_budget_bytes: int
+    lod_strategy: Literal["distance_bands", "octree", "screen_space_error"]
 
 
 class MultiscaleLabelRenderConfigKwargs(TypedDict, total=False):
@@ -1,7 +1,7 @@
 """Base class for data stores."""
 
 import uuid
-from typing import Annotated
+from typing import Annotated, ClassVar
 from uuid import uuid4
 
 from psygnal import EventedModel
@@ -23,8 +23,21 @@ class BaseDataStore(EventedModel):
     ----------
     id : str
         The unique identifier for the data store.
+    host_cacheable : bool
+        Class-level flag.  ``True`` for stores whose ``get_data`` returns a
+        freshly decoded chunk that is expensive to re-read (e.g. zarr on
+        disk or object storage); these reads are memoised in the render
+        layer's shared host-RAM chunk cache.  In-memory stores leave it
+        ``False`` since caching would only duplicate their data.
+    supports_batch_read : bool
+        Class-level flag.  ``True`` for stores that also provide
+        ``get_data_batch(requests)``, which reads many chunks
+        at once and coalesces neighbouring reads.
     """
 
+    host_cacheable: ClassVar[bool] = False
+    supports_batch_read: ClassVar[bool] = False
+
     # store a UUID to identify this specific scene.
     id: UUID4 | Annotated[str, AfterValidator(lambda x: uuid.UUID(x, version=4))] = (
         Field(frozen=True, default_factory=lambda: uuid4())
@@ -7,7 +7,7 @@ tensorstore handles for async data access.
 from __future__ import annotations
 
 import pathlib
-from typing import TYPE_CHECKING, Any, Literal
+from typing import TYPE_CHECKING, Any, ClassVar, Literal
 from urllib.parse import urlparse
 
 import numpy as np
@@ -16,6 +16,11 @@ from pydantic import ConfigDict, PrivateAttr
 
 from cellier.data._base_data_store import BaseDataStore
 from cellier.data.image._axis_info import AxisInfo
+from cellier.data.image._padded_read import (
+    padded_out_shape,
+    read_padded_batch,
+    read_padded_into,
+)
 from cellier.transform import AffineTransform
 
 if TYPE_CHECKING:
@@ -154,6 +159,7 @@ def _open_ome_ts_stores(
     zarr_path: str,
     scale_names: list[str],
     anonymous: bool = False,
+    context: ts.Context | None = None,
 ) -> list[ts.TensorStore]:
     """Open one TensorStore per scale level (synchronous, read-only).
 
@@ -168,6 +174,9 @@ def _open_ome_ts_stores(
     anonymous : bool
         When True, use anonymous credentials for S3/GCS access
         (for public buckets). Default False.
+    context : ts.Context or None
+        Shared resource context (cache pool, concurrency and retry
+        limits).  ``None`` gives each level a fresh default context.
     """
     stores: list[ts.TensorStore] = []
     scheme = urlparse(zarr_path).scheme
@@ -185,7 +194,7 @@ def _open_ome_ts_stores(
                 }
             else:
                 spec.setdefault("context", {})["gcs_user_project"] = ""
-        store = ts.open(spec).result()
+        store = ts.open(spec, context=context).result()
         stores.append(store)
     return stores
 
@@ -295,17 +304,42 @@ class OMEZarrImageDataStore(BaseDataStore):
     anonymous: bool = False
     name: str = "ome zarr image data store"
 
+    host_cacheable: ClassVar[bool] = True
+    supports_batch_read: ClassVar[bool] = True
+
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
-    _ts_stores: list[ts.TensorStore] = PrivateAttr(default_factory=list)
+    _ts_handles: list[ts.TensorStore] = PrivateAttr(default_factory=list)
+    _ts_context: ts.Context | None = PrivateAttr(default=None)
 
     # ── Lifecycle ───────────────────────────────────────────────────────
 
-    def model_post_init(self, __context: Any) -> None:
-        """Open all TensorStore handles (synchronous, before QtAsyncio)."""
-        self._ts_stores = _open_ome_ts_stores(
-            self.zarr_path, self.scale_names, anonymous=self.anonymous
+    def open_ts_stores(self, context: ts.Context | None = None) -> None:
+        """Open the level handles in *context* unless they are already open.
+
+        ``RenderManager`` calls this when the store is registered, so
+        stores created before it (e.g. deserialized with a model) open in
+        its configured context.  Handles are opened once and never
+        reopened; ``None`` opens them in a fresh context.  Synchronous:
+        call before ``QtAsyncio.run()``.
+        """
+        if self._ts_handles:
+            return
+        if context is None:
+            context = ts.Context()
+        self._ts_handles = _open_ome_ts_stores(
+            self.zarr_path,
+            self.scale_names,
+            anonymous=self.anonymous,
+            context=context,
         )
+        self._ts_context = context
+
+    @property
+    def _ts_stores(self) -> list[ts.TensorStore]:
+        """Level handles, opened in a fresh context on first use if needed."""
+        self.open_ts_stores()
+        return self._ts_handles
 
     # ── Convenience constructor ─────────────────────────────────────────
 
@@ -509,10 +543,15 @@ class OMEZarrImageDataStore(BaseDataStore):
         """Data type of the underlying arrays."""
         return self._ts_stores[0].dtype.numpy_dtype
 
+    @property
+    def read_dtype(self) -> np.dtype:
+        """Dtype of the arrays ``get_data`` allocates: the native ``dtype``."""
+        return self.dtype
+
     # ── Async data access ───────────────────────────────────────────────
 
     async def get_data(self, request: ChunkRequest) -> np.ndarray:
-        """Read a single padded brick, returning a zero-padded float32 array.
+        """Read a single padded brick as a zero-padded array of ``self.dtype``.
 
         Interprets ``request.axis_selections`` generically: displayed axes
         (tuple ranges) become slice dimensions in the output; sliced axes
@@ -526,43 +565,29 @@ class OMEZarrImageDataStore(BaseDataStore):
         Returns
         -------
         np.ndarray
-            ``float32`` array.
+            New ``self.dtype`` array.  Tensorstore writes the in-bounds
+            region straight into it and only the halo is zero-filled.
         """
-        store = self._ts_stores[request.scale_index]
-        store_shape = tuple(int(d) for d in store.domain.shape)
-
-        out_shape = tuple(
-            stop - start
-            for sel in request.axis_selections
-            if isinstance(sel, tuple)
-            for start, stop in [sel]
+        out = np.empty(padded_out_shape(request.axis_selections), self.dtype)
+        return await read_padded_into(
+            self._ts_stores[request.scale_index], request.axis_selections, out
         )
-        out = np.zeros(out_shape, dtype=np.float32)
 
-        store_idx: list[int | slice] = []
-        dest_starts: list[int] = []
-        valid = True
+    async def get_data_batch(self, requests: list[ChunkRequest]) -> list[np.ndarray]:
+        """Read several padded bricks, coalescing neighbouring reads.
 
-        for axis_i, sel in enumerate(request.axis_selections):
-            size = store_shape[axis_i]
-            if isinstance(sel, int):
-                store_idx.append(max(0, min(sel, size - 1)))
-            else:
-                start, stop = sel
-                c_start = max(start, 0)
-                c_stop = min(stop, size)
-                if c_stop <= c_start:
-                    valid = False
-                    break
-                store_idx.append(slice(c_start, c_stop))
-                dest_starts.append(c_start - start)
-
-        if valid:
-            region = np.asarray(
-                await store[tuple(store_idx)].read(),
-                dtype=np.float32,
-            )
-            dest_idx = tuple(slice(d, d + s) for d, s in zip(dest_starts, region.shape))
-            out[dest_idx] = region
+        Bricks that share storage chunks are merged into chunk-aligned
+        super-regions read once in a single tensorstore batch, so shared
+        chunks are fetched and decoded once.  Results match ``get_data``.
+
+        Parameters
+        ----------
+        requests : list[ChunkRequest]
+            Padded brick specifications.
 
-        return out
+        Returns
+        -------
+        list[np.ndarray]
+            One zero-padded array per request, in request order.
+        """
+        return await read_padded_batch(self._ts_stores, requests, self.dtype)
@@ -0,0 +1,296 @@
+"""Shared padded-brick read path for tensorstore-backed data stores.
+
+``ChunkRequest.axis_selections`` may extend past the store bounds (the
+halo around edge bricks).  ``read_padded_into`` clamps the selection to
+the store, has tensorstore write the in-bounds region directly into the
+matching window of the padded output array (casting to its dtype on the
+fly), and zero-fills only the out-of-bounds halo, so no clamped
+intermediate is allocated and copied into the padded array.  The stores
+allocate that output themselves; the render layer copies it into the GPU
+cache slot when the brick is committed.
+
+``read_padded_batch`` serves many requests at once: neighbouring bricks
+(which share storage chunks along their overlapping borders) are merged
+into chunk-aligned super-regions that are read once inside a
+``ts.Batch`` and sliced apart, so each shared chunk is fetched and
+decoded once instead of once per brick.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+from typing import TYPE_CHECKING, NamedTuple
+
+import numpy as np
+import tensorstore as ts
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from cellier.data.image._image_requests import ChunkRequest
+
+# A merged super-region may read at most this multiple of the chunk volume
+# its members would have read individually.  Slightly over-reading is far
+# cheaper than an extra request round trip on object storage.
+_MAX_OVERREAD = 1.25
+
+
+def padded_out_shape(
+    axis_selections: tuple[int | tuple[int, int], ...],
+) -> tuple[int, ...]:
+    """Return the output shape: one dimension per range (displayed) selection."""
+    return tuple(
+        stop - start
+        for sel in axis_selections
+        if isinstance(sel, tuple)
+        for start, stop in [sel]
+    )
+
+
+class _ClampedRegion(NamedTuple):
+    """In-bounds part of one padded request.
+
+    ``points`` holds the clamped point index of every int-selected axis
+    (``None`` for range axes); ``lo`` / ``hi`` are the clamped store
+    bounds of the range axes and ``dest_idx`` the matching window in the
+    padded output.
+    """
+
+    points: tuple[int | None, ...]
+    lo: tuple[int, ...]
+    hi: tuple[int, ...]
+    dest_idx: tuple[slice, ...]
+
+    def store_index(self, lo=None, hi=None) -> tuple[int | slice, ...]:
+        """Return the store index, optionally with overridden range bounds."""
+        lo = self.lo if lo is None else lo
+        hi = self.hi if hi is None else hi
+        ranges = iter(zip(lo, hi))
+        return tuple(p if p is not None else slice(*next(ranges)) for p in self.points)
+
+
+def _clamp(
+    store_shape: tuple[int, ...],
+    axis_selections: tuple[int | tuple[int, int], ...],
+) -> _ClampedRegion | None:
+    """Clamp *axis_selections* to the store; ``None`` if nothing is in bounds."""
+    points: list[int | None] = []
+    lo: list[int] = []
+    hi: list[int] = []
+    dest_idx: list[slice] = []
+    for axis_i, sel in enumerate(axis_selections):
+        size = store_shape[axis_i]
+        if isinstance(sel, int):
+            points.append(max(0, min(sel, size - 1)))
+            continue
+        start, stop = sel
+        c_start = max(start, 0)
+        c_stop = min(stop, size)
+        if c_stop <= c_start:
+            return None
+        points.append(None)
+        lo.append(c_start)
+        hi.append(c_stop)
+        dest_idx.append(slice(c_start - start, c_stop - start))
+    return _ClampedRegion(tuple(points), tuple(lo), tuple(hi), tuple(dest_idx))
+
+
+def _zero_halo(out: np.ndarray, dest_idx: tuple[slice, ...]) -> None:
+    """Zero only the halo slabs on each side of the in-bounds window."""
+    for dim, window in enumerate(dest_idx):
+        lead = (slice(None),) * dim
+        if window.start > 0:
+            out[(*lead, slice(0, window.start))] = 0
+        if window.stop < out.shape[dim]:
+            out[(*lead, slice(window.stop, None))] = 0
+
+
+async def read_padded_into(
+    store: ts.TensorStore,
+    axis_selections: tuple[int | tuple[int, int], ...],
+    out: np.ndarray,
+) -> np.ndarray:
+    """Read a padded brick from *store* straight into *out*.
+
+    Parameters
+    ----------
+    store : ts.TensorStore
+        Open handle for one scale level.
+    axis_selections : tuple[int | tuple[int, int], ...]
+        One entry per store axis.  ``int`` entries are point selections
+        (clamped into range); ``(start, stop)`` entries are ranges that
+        become output dimensions and may exceed the store bounds.
+    out : np.ndarray
+        Writable destination of shape ``padded_out_shape(axis_selections)``.
+        May be a strided view (e.g. a slot of a cache array).  Its
+        contents on return are the clamped region with a zero halo.
+
+    Returns
+    -------
+    np.ndarray
+        *out*, for convenience.
+    """
+    region = _clamp(tuple(int(d) for d in store.domain.shape), axis_selections)
+    if region is None:
+        # Entirely outside the store: the whole brick is halo.
+        out[...] = 0
+        return out
+    _zero_halo(out, region.dest_idx)
+
+    source = store[region.store_index()].translate_to[0]
+    if source.dtype.numpy_dtype != out.dtype:
+        source = ts.cast(source, out.dtype)
+    in_bounds = out[region.dest_idx] if region.dest_idx else out
+    dest = ts.array(in_bounds, copy=False, write=True)
+
+    write = dest.write(source)
+    try:
+        await write
+    except asyncio.CancelledError:
+        # Stop tensorstore from touching *out* once the caller has given
+        # up on it; the destination may be handed to another read next.
+        write.cancel()
+        raise
+    return out
+
+
+def _chunk_aligned(
+    lo: tuple[int, ...],
+    hi: tuple[int, ...],
+    chunk: tuple[int, ...],
+    size: tuple[int, ...],
+) -> tuple[tuple[int, ...], tuple[int, ...]]:
+    """Expand ``[lo, hi)`` outward to chunk boundaries, clamped to *size*."""
+    a_lo = tuple((lo_i // c) * c for lo_i, c in zip(lo, chunk))
+    a_hi = tuple(min(-(-hi_i // c) * c, s) for hi_i, c, s in zip(hi, chunk, size))
+    return a_lo, a_hi
+
+
+def _volume(lo: tuple[int, ...], hi: tuple[int, ...]) -> int:
+    return math.prod(h - lo_i for lo_i, h in zip(lo, hi))
+
+
+def _cluster_regions(
+    regions: list[tuple[int, _ClampedRegion]],
+    chunk: tuple[int, ...],
+    size: tuple[int, ...],
+) -> list[list[tuple[int, _ClampedRegion]]]:
+    """Greedily merge regions whose chunk-aligned union stays compact.
+
+    A region joins a cluster when the aligned bounding box of the merged
+    cluster is at most ``_MAX_OVERREAD`` times the summed aligned volume
+    of its members, i.e. when neighbouring bricks can be read as one
+    box without fetching much data nobody asked for.
+    """
+    clusters: list[list[tuple[int, _ClampedRegion]]] = []
+    boxes: list[tuple[tuple[int, ...], tuple[int, ...], int]] = []
+    for item in sorted(regions, key=lambda it: it[1].lo):
+        a_lo, a_hi = _chunk_aligned(item[1].lo, item[1].hi, chunk, size)
+        own = _volume(a_lo, a_hi)
+        for ci, (b_lo, b_hi, member_vol) in enumerate(boxes):
+            m_lo = tuple(map(min, a_lo, b_lo))
+            m_hi = tuple(map(max, a_hi, b_hi))
+            if _volume(m_lo, m_hi) <= _MAX_OVERREAD * (member_vol + own):
+                clusters[ci].append(item)
+                boxes[ci] = (m_lo, m_hi, member_vol + own)
+                break
+        else:
+            clusters.append([item])
+            boxes.append((a_lo, a_hi, own))
+    return clusters
+
+
+async def read_padded_batch(
+    stores: Sequence[ts.TensorStore],
+    requests: Sequence[ChunkRequest],
+    dtype: np.dtype,
+) -> list[np.ndarray]:
+    """Read many padded bricks, coalescing neighbours into shared reads.
+
+    Requests are grouped by scale level and point (sliced-axis)
+    selection, then clustered into chunk-aligned super-regions (see
+    ``_cluster_regions``).  Multi-member clusters are read once inside a
+    single ``ts.Batch`` and each brick is sliced out of the result;
+    singleton clusters take the in-place ``read_padded_into`` path.
+
+    Parameters
+    ----------
+    stores : Sequence[ts.TensorStore]
+        Open handles, one per scale level (indexed by ``scale_index``).
+    requests : Sequence[ChunkRequest]
+        Padded brick specifications.
+    dtype : np.dtype
+        Dtype of the allocated output arrays.
+
+    Returns
+    -------
+    list[np.ndarray]
+        One padded array per request, in request order.
+    """
+    results: list[np.ndarray] = [
+        np.empty(padded_out_shape(req.axis_selections), dtype=dtype) for req in requests
+    ]
+
+    # Group in-bounds regions by (scale, point selection); fill empties.
+    groups: dict[tuple, list[tuple[int, _ClampedRegion]]] = {}
+    for i, req in enumerate(requests):
+        store = stores[req.scale_index]
+        region = _clamp(tuple(int(d) for d in store.domain.shape), req.axis_selections)
+        if region is None:
+            results[i][...] = 0
+            continue
+        _zero_halo(results[i], region.dest_idx)
+        groups.setdefault((req.scale_index, region.points), []).append((i, region))
+
+    singles: list[tuple[int, _ClampedRegion]] = []
+    merged: list[tuple[ts.TensorStore, tuple, list]] = []
+    for (scale_index, _), members in groups.items():
+        store = stores[scale_index]
+        range_axes = [a for a, p in enumerate(members[0][1].points) if p is None]
+        size = tuple(int(store.domain.shape[a]) for a in range_axes)
+        read_chunk = store.chunk_layout.read_chunk.shape or (None,) * store.rank
+        chunk = tuple(int(read_chunk[a] or 1) for a in range_axes)
+        for cluster in _cluster_regions(members, chunk, size):
+            if len(cluster) == 1:
+                singles.append(cluster[0])
+                continue
+            lo = tuple(map(min, *(r.lo for _, r in cluster)))
+            hi = tuple(map(max, *(r.hi for _, r in cluster)))
+            merged.append((store, (lo, hi), cluster))
+
+    futures = []
+    with ts.Batch() as batch:
+        for store, (lo, hi), cluster in merged:
+            index = cluster[0][1].store_index(lo, hi)
+            futures.append(store[index].read(batch=batch))
+
+    async def _slice_out(future, lo, cluster) -> None:
+        block = await future
+        for i, region in cluster:
+            src = tuple(
+                slice(r_lo - b_lo, r_hi - b_lo)
+                for r_lo, r_hi, b_lo in zip(region.lo, region.hi, lo)
+            )
+            results[i][region.dest_idx] = block[src]
+
+    try:
+        await asyncio.gather(
+            *[
+                _slice_out(future, lo, cluster)
+                for future, (_, (lo, _hi), cluster) in zip(futures, merged)
+            ],
+            *[
+                read_padded_into(
+                    stores[requests[i].scale_index],
+                    requests[i].axis_selections,
+                    results[i],
+                )
+                for i, _ in singles
+            ],
+        )
+    except asyncio.CancelledError:
+        for future in futures:
+            future.cancel()
+        raise
+    return results
@@ -18,13 +18,18 @@ base class definition.
 from __future__ import annotations
 
 import pathlib
-from typing import TYPE_CHECKING, Any, Literal
+from typing import TYPE_CHECKING, Any, ClassVar, Literal
 
 import numpy as np
 import tensorstore as ts
 from pydantic import ConfigDict, PrivateAttr, model_validator
 
 from cellier.data._base_data_store import BaseDataStore
+from cellier.data.image._padded_read import (
+    padded_out_shape,
+    read_padded_batch,
+    read_padded_into,
+)
 from cellier.transform import AffineTransform
 
 if TYPE_CHECKING:
@@ -60,10 +65,11 @@ def _detect_zarr_driver(level_path: pathlib.Path) -> str:
 def _open_ts_stores(
     zarr_path: pathlib.Path,
     scale_names: list[str],
+    context: ts.Context | None = None,
 ) -> list[ts.TensorStore]:
     """Open one tensorstore per scale level (read-only, synchronous).
 
-    Must be called — or triggered via ``model_post_init`` — **before**
+    Must be called — or triggered via ``open_ts_stores`` — **before**
     ``QtAsyncio.run()`` starts the event loop.
 
     Parameters
@@ -73,6 +79,9 @@ def _open_ts_stores(
     scale_names :
         Subdirectory names in order finest → coarsest, e.g.
         ``["s0", "s1", "s2"]``.
+    context :
+        Shared resource context (cache pool, concurrency limits).
+        ``None`` gives each level a fresh default context.
 
     Returns
     -------
@@ -91,7 +100,7 @@ def _open_ts_stores(
                 "path": str(level_path),
             },
         }
-        store = ts.open(spec).result()
+        store = ts.open(spec, context=context).result()
         stores.append(store)
     return stores
 
@@ -141,8 +150,12 @@ class MultiscaleZarrDataStore(BaseDataStore):
     level_transforms: list[AffineTransform]
     name: str = "multiscale zarr data store"
 
+    host_cacheable: ClassVar[bool] = True
+    supports_batch_read: ClassVar[bool] = True
+
     # ── Private tensorstore handles (not serialised) ────────────────────
-    _ts_stores: list[ts.TensorStore] = PrivateAttr(default_factory=list)
+    _ts_handles: list[ts.TensorStore] = PrivateAttr(default_factory=list)
+    _ts_context: ts.Context | None = PrivateAttr(default=None)
 
     # Allow non-pydantic types in private attrs.
     model_config = ConfigDict(arbitrary_types_allowed=True)
@@ -162,16 +175,30 @@ class MultiscaleZarrDataStore(BaseDataStore):
 
     # ── Lifecycle ───────────────────────────────────────────────────────
 
-    def model_post_init(self, __context: Any) -> None:
-        """Open all tensorstore handles.
+    def open_ts_stores(self, context: ts.Context | None = None) -> None:
+        """Open the level handles in *context* unless they are already open.
 
-        Called automatically by pydantic after ``__init__``.
+        ``RenderManager`` calls this when the store is registered so the
+        handles share its configured context.  Handles are opened once
+        and never reopened; ``None`` opens them in a fresh context.
         Must run before ``QtAsyncio.run()`` starts the event loop.
         """
-        self._ts_stores = _open_ts_stores(
+        if self._ts_handles:
+            return
+        if context is None:
+            context = ts.Context()
+        self._ts_handles = _open_ts_stores(
             pathlib.Path(self.zarr_path),
             self.scale_names,
+            context=context,
         )
+        self._ts_context = context
+
+    @property
+    def _ts_stores(self) -> list[ts.TensorStore]:
+        """Level handles, opened in a fresh context on first use if needed."""
+        self.open_ts_stores()
+        return self._ts_handles
 
     # ── Convenience constructor ─────────────────────────────────────────
 
@@ -230,10 +257,20 @@ class MultiscaleZarrDataStore(BaseDataStore):
         """Shape for each scale level, finest first."""
         return [tuple(int(d) for d in store.domain.shape) for store in self._ts_stores]
 
+    @property
+    def dtype(self) -> np.dtype:
+        """Data type of the underlying arrays."""
+        return self._ts_stores[0].dtype.numpy_dtype
+
+    @property
+    def read_dtype(self) -> np.dtype:
+        """Dtype of the arrays ``get_data`` allocates: the native ``dtype``."""
+        return self.dtype
+
     # ── Async data access ───────────────────────────────────────────────
 
     async def get_data(self, request: ChunkRequest) -> np.ndarray:
-        """Read a single padded brick, returning a zero-padded float32 array.
+        """Read a single padded brick as a zero-padded array of ``self.dtype``.
 
         Interprets ``request.axis_selections`` generically: displayed axes
         (tuple ranges) become slice dimensions in the output; sliced axes
@@ -248,53 +285,32 @@ class MultiscaleZarrDataStore(BaseDataStore):
         Returns
         -------
         out :
-            ``float32`` array.  Shape has one dimension per displayed axis
-            (those with tuple selections).  Out-of-bounds regions are
-            filled with zero.
+            New ``self.dtype`` array.  Tensorstore writes the in-bounds
+            region straight into it and only the halo is zero-filled.
+            Shape has one
+            dimension per displayed axis (those with tuple selections).
+            Out-of-bounds regions are filled with zero.
         """
-        return await self._get_data_and(request)
-
-    async def _get_data_and(self, request: ChunkRequest) -> np.ndarray:
-        """Read a padded brick using generic nD axis_selections."""
-        store = self._ts_stores[request.scale_index]
-        store_shape = tuple(int(d) for d in store.domain.shape)
-
-        # Output shape: one dimension per displayed (tuple) axis.
-        out_shape = tuple(
-            stop - start
-            for sel in request.axis_selections
-            if isinstance(sel, tuple)
-            for start, stop in [sel]
+        out = np.empty(padded_out_shape(request.axis_selections), self.dtype)
+        return await read_padded_into(
+            self._ts_stores[request.scale_index], request.axis_selections, out
         )
-        out = np.zeros(out_shape, dtype=np.float32)
-
-        # Build the clamped store index and track destination offsets.
-        store_idx: list[int | slice] = []
-        dest_starts: list[int] = []
-        valid = True
-
-        for axis_i, sel in enumerate(request.axis_selections):
-            size = store_shape[axis_i]
-            if isinstance(sel, int):
-                # Point selection: clamp to valid range.
-                store_idx.append(max(0, min(sel, size - 1)))
-            else:
-                start, stop = sel
-                c_start = max(start, 0)
-                c_stop = min(stop, size)
-                if c_stop <= c_start:
-                    valid = False
-                    break
-                store_idx.append(slice(c_start, c_stop))
-                dest_starts.append(c_start - start)
-
-        if valid:
-            region = np.asarray(
-                await store[tuple(store_idx)].read(),
-                dtype=np.float32,
-            )
-            # Compute the destination slice in out for each displayed axis.
-            dest_idx = tuple(slice(d, d + s) for d, s in zip(dest_starts, region.shape))
-            out[dest_idx] = region
 
-        return out
+    async def get_data_batch(self, requests: list[ChunkRequest]) -> list[np.ndarray]:
+        """Read several padded bricks, coalescing neighbouring reads.
+
+        Bricks that share storage chunks are merged into chunk-aligned
+        super-regions read once in a single tensorstore batch, so shared
+        chunks are fetched and decoded once.  Results match ``get_data``.
+
+        Parameters
+        ----------
+        requests : list[ChunkRequest]
+            Padded brick specifications.
+
+        Returns
+        -------
+        list[np.ndarray]
+            One zero-padded array per request, in request order.
+        """
+        return await read_padded_batch(self._ts_stores, requests, self.dtype)
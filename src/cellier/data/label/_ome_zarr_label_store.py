@@ -6,16 +6,22 @@ for async data access.  Returns int32 bricks (never float32).
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Literal
+from typing import TYPE_CHECKING, ClassVar, Literal
 
 import numpy as np
+import tensorstore as ts
 from pydantic import ConfigDict, PrivateAttr
 
 if TYPE_CHECKING:
-    import tensorstore as ts
+    from cellier.data.image._image_requests import ChunkRequest
 
 from cellier.data._base_data_store import BaseDataStore
 from cellier.data.image._ome_zarr_image_store import _validate_uri_scheme
+from cellier.data.image._padded_read import (
+    padded_out_shape,
+    read_padded_batch,
+    read_padded_into,
+)
 from cellier.transform import AffineTransform
 
 _ACCEPTED_LABEL_DTYPES = {np.int8, np.int16, np.int32}
@@ -63,17 +69,38 @@ class OMEZarrLabelDataStore(BaseDataStore):
     anonymous: bool = False
     name: str = "ome zarr label data store"
 
+    host_cacheable: ClassVar[bool] = True
+    supports_batch_read: ClassVar[bool] = True
+
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
-    _ts_stores: list[ts.TensorStore] = PrivateAttr(default_factory=list)
+    _ts_handles: list[ts.TensorStore] = PrivateAttr(default_factory=list)
+    _ts_context: ts.Context | None = PrivateAttr(default=None)
+
+    def open_ts_stores(self, context: ts.Context | None = None) -> None:
+        """Open the level handles in *context* unless they are already open.
 
-    def model_post_init(self, __context: Any) -> None:
-        """Open all TensorStore handles (synchronous, before QtAsyncio)."""
+        See ``OMEZarrImageDataStore.open_ts_stores``.
+        """
         from cellier.data.image._ome_zarr_image_store import _open_ome_ts_stores
 
-        self._ts_stores = _open_ome_ts_stores(
-            self.zarr_path, self.scale_names, anonymous=self.anonymous
+        if self._ts_handles:
+            return
+        if context is None:
+            context = ts.Context()
+        self._ts_handles = _open_ome_ts_stores(
+            self.zarr_path,
+            self.scale_names,
+            anonymous=self.anonymous,
+            context=context,
         )
+        self._ts_context = context
+
+    @property
+    def _ts_stores(self) -> list[ts.TensorStore]:
+        """Level handles, opened in a fresh context on first use if needed."""
+        self.open_ts_stores()
+        return self._ts_handles
 
     # ── Convenience constructors ────────────────────────────────────────
 
@@ -238,43 +265,29 @@ class OMEZarrLabelDataStore(BaseDataStore):
         Returns
         -------
         np.ndarray
-            int32 array.
+            New int32 array.  Tensorstore casts the in-bounds region
+            straight into it and only the halo is zero-filled.
         """
-        store = self._ts_stores[request.scale_index]
-        store_shape = tuple(int(d) for d in store.domain.shape)
-
-        out_shape = tuple(
-            stop - start
-            for sel in request.axis_selections
-            if isinstance(sel, tuple)
-            for start, stop in [sel]
+        out = np.empty(padded_out_shape(request.axis_selections), np.int32)
+        return await read_padded_into(
+            self._ts_stores[request.scale_index], request.axis_selections, out
         )
-        out = np.zeros(out_shape, dtype=np.int32)
-
-        store_idx: list[int | slice] = []
-        dest_starts: list[int] = []
-        valid = True
-
-        for axis_i, sel in enumerate(request.axis_selections):
-            size = store_shape[axis_i]
-            if isinstance(sel, int):
-                store_idx.append(max(0, min(sel, size - 1)))
-            else:
-                start, stop = sel
-                c_start = max(start, 0)
-                c_stop = min(stop, size)
-                if c_stop <= c_start:
-                    valid = False
-                    break
-                store_idx.append(slice(c_start, c_stop))
-                dest_starts.append(c_start - start)
-
-        if valid:
-            region = np.asarray(
-                await store[tuple(store_idx)].read(),
-                dtype=np.int32,
-            )
-            dest_idx = tuple(slice(d, d + s) for d, s in zip(dest_starts, region.shape))
-            out[dest_idx] = region
 
-        return out
+    async def get_data_batch(self, requests: list[ChunkRequest]) -> list[np.ndarray]:
+        """Read several padded bricks, coalescing neighbouring reads.
+
+        Bricks that share storage chunks are merged into chunk-aligned
+        super-regions read once in a single tensorstore batch, so shared
+        chunks are fetched and decoded once.  Results match ``get_data``.
+
+        Parameters
+        ----------
+        requests : list[ChunkRequest]
+            Padded brick specifications.
+
+        Returns
+        -------
+        list[np.ndarray]
+            One zero-padded ``int32`` array per request, in request order.
+        """
+        return await read_padded_batch(self._ts_stores, requests, np.int32)
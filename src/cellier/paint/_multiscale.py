@@ -112,7 +112,7 @@ class MultiscalePaintController(AbstractPaintController):
         if not data_store._ts_stores:
             raise ValueError(
                 "data_store has no open tensorstore handles; ensure "
-                "model_post_init has run."
+                "open_ts_stores has run."
             )
 
         self._data_store = data_store
@@ -213,8 +213,10 @@ class MultiscalePaintController(AbstractPaintController):
         # 1. Rebuild coarser LOD levels within the open transaction.
         self._rebuild_pyramid(self._write_buffer.transaction)
 
-        # 2. Flush level-0 + all rebuilt levels atomically.
+        # 2. Flush level-0 + all rebuilt levels atomically, then drop the
+        #    now-stale decoded chunks from the shared host cache.
         self._write_buffer.commit()
+        self._controller._invalidate_host_cache(self._data_store.id)
 
         # 3. Drop GPU paint textures — paint is now on disk.
         self._controller._clear_painted_tiles_2d(self._visual_id)
@@ -268,8 +270,9 @@ class MultiscalePaintController(AbstractPaintController):
         # 1. Rebuild coarser LOD levels within the open transaction.
         self._rebuild_pyramid(self._write_buffer.transaction)
 
-        # 2. Flush level-0 + rebuilt levels atomically.
+        # 2. Flush level-0 + rebuilt levels atomically; drop stale host cache.
         self._write_buffer.commit()
+        self._controller._invalidate_host_cache(self._data_store.id)
 
         # 3. Create a fresh transaction for continued staging.
         self._write_buffer = TensorStoreWriteBuffer(self._data_store._ts_stores[0])
@@ -3,7 +3,9 @@
 from cellier.render._config import (
     CameraConfig,
     RenderManagerConfig,
+    SlicePrefetchConfig,
     SlicingConfig,
+    StorageConfig,
     TemporalAccumulationConfig,
 )
 from cellier.render._requests import DimsState, ReslicingRequest
@@ -23,7 +25,9 @@ __all__ = [
     "ReslicingRequest",
     "SceneManager",
     "SliceCoordinator",
+    "SlicePrefetchConfig",
     "SlicingConfig",
+    "StorageConfig",
     "TemporalAccumulationConfig",
     "TemporalAccumulationPass",
     "VisualRenderConfig",
@@ -0,0 +1,143 @@
+"""Per-brick value ranges for contrast-aware empty-space skipping.
+
+The brick shader only learns a brick's maximum after the brick has been
+fetched.  On sparse data (expansion microscopy, sparse labelling) most
+fetched bricks are then found to be background.  ``BrickValueRanges``
+keeps the ``(min, max)`` of every brick it has been told about, at every
+level, so the planner can drop bricks that cannot be visible under the
+current contrast limits *before* requesting them.
+
+Ranges come from two sources:
+
+* ``record`` — bricks as they arrive from the slicer, so a brick that
+  was once found empty is never fetched again while it stays empty
+  under the current contrast limits;
+* ``record_level`` — a whole level at once, e.g. from a precomputed
+  sidecar, so empty bricks are skipped before their first fetch.
+
+Ranges do not depend on the contrast limits, so changing ``clim`` only
+changes the cutoff passed to ``empty_mask``; nothing is refetched.
+
+Coarser levels are not used to bound finer ones: averaging downsamplers
+lower the maximum, so a coarse brick below the cutoff can still contain
+bright fine-level voxels.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from cellier.render.block_cache import pack_brick_ids
+
+
+class BrickValueRanges:
+    """Known ``(min, max)`` value range per brick, keyed by packed brick ID.
+
+    Brick IDs pack ``(slice_id, level, g0, g1, g2)`` with
+    ``pack_brick_ids``; ``slice_id`` indexes a registry of the
+    ``slice_coord`` tuples seen so far.  Recorded ranges are buffered
+    and merged into sorted arrays on the next lookup, so recording one
+    brick at a time from ``on_data_ready`` stays cheap.
+    """
+
+    def __init__(self) -> None:
+        self._slice_ids: dict[tuple, int] = {}
+        self._pending: list[tuple[np.ndarray, np.ndarray, np.ndarray]] = []
+        self.clear()
+
+    def __len__(self) -> int:
+        self._merge_pending()
+        return len(self._ids)
+
+    def _slice_id(self, slice_coord: tuple) -> int:
+        return self._slice_ids.setdefault(slice_coord, len(self._slice_ids))
+
+    def record(
+        self,
+        brick_arr: np.ndarray,
+        mins: np.ndarray,
+        maxs: np.ndarray,
+        slice_coord: tuple = (),
+    ) -> None:
+        """Record the value range of each ``[level, g0, g1, g2]`` row.
+
+        A later record of the same brick replaces the earlier one.
+        """
+        ids = pack_brick_ids(brick_arr, slice_id=self._slice_id(slice_coord))
+        self._pending.append(
+            (
+                ids,
+                np.asarray(mins, dtype=np.float32).reshape(-1),
+                np.asarray(maxs, dtype=np.float32).reshape(-1),
+            )
+        )
+
+    def record_level(
+        self,
+        level: int,
+        mins: np.ndarray,
+        maxs: np.ndarray,
+        slice_coord: tuple = (),
+    ) -> None:
+        """Record every brick of *level* from ``(gz, gy, gx)``-shaped arrays.
+
+        NaN entries mark bricks whose range is unknown and are skipped.
+        """
+        mins = np.asarray(mins, dtype=np.float32)
+        maxs = np.asarray(maxs, dtype=np.float32)
+        known = ~(np.isnan(mins) | np.isnan(maxs))
+        grid = np.argwhere(known)
+        brick_arr = np.empty((len(grid), 4), dtype=np.int64)
+        brick_arr[:, 0] = level
+        brick_arr[:, 1:] = grid
+        self.record(brick_arr, mins[known], maxs[known], slice_coord=slice_coord)
+
+    def lookup(
+        self, brick_arr: np.ndarray, slice_coord: tuple = ()
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Return ``(mins, maxs)`` for each row; NaN where the range is unknown."""
+        self._merge_pending()
+        n = len(brick_arr)
+        mins = np.full(n, np.nan, dtype=np.float32)
+        maxs = np.full(n, np.nan, dtype=np.float32)
+        slice_id = self._slice_ids.get(slice_coord)
+        if n == 0 or slice_id is None or len(self._ids) == 0:
+            return mins, maxs
+        ids = pack_brick_ids(brick_arr, slice_id=slice_id)
+        pos = np.minimum(np.searchsorted(self._ids, ids), len(self._ids) - 1)
+        found = self._ids[pos] == ids
+        mins[found] = self._mins[pos[found]]
+        maxs[found] = self._maxs[pos[found]]
+        return mins, maxs
+
+    def empty_mask(
+        self, brick_arr: np.ndarray, cutoff: float, slice_coord: tuple = ()
+    ) -> np.ndarray:
+        """Return a mask of the rows known to lie entirely below *cutoff*.
+
+        Bricks with an unknown range are never reported empty.
+        """
+        _, maxs = self.lookup(brick_arr, slice_coord=slice_coord)
+        with np.errstate(invalid="ignore"):
+            return maxs < cutoff
+
+    def clear(self) -> None:
+        """Forget every recorded range, e.g. after the data changed."""
+        self._slice_ids.clear()
+        self._pending = []
+        self._ids = np.empty(0, dtype=np.int64)
+        self._mins = np.empty(0, dtype=np.float32)
+        self._maxs = np.empty(0, dtype=np.float32)
+
+    def _merge_pending(self) -> None:
+        """Fold buffered records into the sorted arrays; newest wins."""
+        if not self._pending:
+            return
+        ids = np.concatenate([self._ids, *(p[0] for p in self._pending)])
+        mins = np.concatenate([self._mins, *(p[1] for p in self._pending)])
+        maxs = np.concatenate([self._maxs, *(p[2] for p in self._pending)])
+        self._pending = []
+        # np.unique keeps the first occurrence, so search the reversed arrays.
+        self._ids, first = np.unique(ids[::-1], return_index=True)
+        self._mins = mins[::-1][first]
+        self._maxs = maxs[::-1][first]
@@ -2,16 +2,24 @@
 
 from __future__ import annotations
 
+from typing import Annotated, Any
+
 from pydantic import BaseModel, Field
 
 DEFAULT_CAMERA_SETTLE_THRESHOLD_S: float = 0.3
+DEFAULT_PREFETCH_LOOKAHEAD_S: float = 0.5
+DEFAULT_PREFETCH_INTERVAL_S: float = 0.1
+DEFAULT_HOST_CACHE_BYTES: int = 512 * 1024**2
+DEFAULT_SLICE_PREFETCH_BYTES: int = 128 * 1024**2
 
 
 class SlicingConfig(BaseModel):
     """Configuration for the async chunk-slicing pipeline.
 
     These parameters are construction-time only. Changing them after
-    ``RenderManager`` is created has no effect.
+    ``RenderManager`` is created has no effect.  With ``adaptive`` set,
+    ``batch_size`` and ``render_every`` are starting values; read the
+    current tuned values from ``RenderManager.slicing_cadence``.
 
     Parameters
     ----------
@@ -22,10 +30,40 @@ class SlicingConfig(BaseModel):
         Number of completed batches between progressive redraws.
         1 = redraw after every batch (lowest latency to first pixels);
         higher values reduce GPU upload overhead on fast I/O.
+    max_in_flight : int
+        Global cap on concurrent chunk reads across every visual, canvas
+        and scene.  Queued reads are served in priority order (displayed
+        view before prefetch, visual ``load_priority``, focused canvas,
+        coarse level, nearest first).
+    host_cache_bytes : int
+        Byte budget of the host-RAM LRU cache of decoded chunks shared by
+        every visual reading the same data store.  Chunks evicted from a
+        GPU cache are served from RAM on the next miss instead of being
+        re-read and re-decoded.  0 disables the cache.
+    adaptive : bool
+        When ``True`` the slicer tunes ``batch_size`` (AIMD: grow while
+        per-chunk throughput keeps up, halve when batch latency rises
+        without a throughput gain) and ``render_every`` (keep redraw time
+        near ``render_overhead_fraction`` of the loading time) as it runs.
+        Useful when the best values are unknown, e.g. remote storage.
+    max_batch_size : int
+        Upper bound on the tuned ``batch_size``.  Values above
+        ``max_in_flight`` are capped to it.
+    max_render_every : int
+        Upper bound on the tuned ``render_every``.
+    render_overhead_fraction : float
+        Target share of loading wall time spent on GPU uploads and
+        redraws between batches.  Must be in ``(0, 1)``.
     """
 
     batch_size: int = Field(default=8, gt=0)
     render_every: int = Field(default=1, gt=0)
+    max_in_flight: int = Field(default=32, gt=0)
+    host_cache_bytes: int = Field(default=DEFAULT_HOST_CACHE_BYTES, ge=0)
+    adaptive: bool = False
+    max_batch_size: int = Field(default=32, gt=0)
+    max_render_every: int = Field(default=8, gt=0)
+    render_overhead_fraction: float = Field(default=0.25, gt=0.0, lt=1.0)
 
 
 class TemporalAccumulationConfig(BaseModel):
@@ -60,10 +98,125 @@ class CameraConfig(BaseModel):
         Seconds of camera stillness required before a reslice is
         triggered. Lower values give more responsive LOD updates;
         higher values reduce redundant I/O during fast panning.
+    prefetch_enabled : bool
+        When ``True`` (and the host chunk cache is enabled), camera motion
+        is extrapolated and the chunks the predicted view needs are read
+        into the host cache at low priority, so most of the view is
+        already in RAM when the camera settles.  Off by default: it adds
+        background I/O and a planning pass on the UI thread every
+        ``prefetch_interval_s`` while the camera moves.
+    prefetch_lookahead_s : float
+        How far ahead, in seconds, the camera motion is extrapolated.
+    prefetch_interval_s : float
+        Minimum seconds between two predictions for one canvas.  Bounds
+        the planning cost while the camera moves every frame.
     """
 
     reslice_enabled: bool = True
     settle_threshold_s: float = Field(default=DEFAULT_CAMERA_SETTLE_THRESHOLD_S, gt=0.0)
+    prefetch_enabled: bool = False
+    prefetch_lookahead_s: float = Field(default=DEFAULT_PREFETCH_LOOKAHEAD_S, gt=0.0)
+    prefetch_interval_s: float = Field(default=DEFAULT_PREFETCH_INTERVAL_S, gt=0.0)
+
+
+class SlicePrefetchConfig(BaseModel):
+    """Configuration for idle-time prefetching of neighbouring slices.
+
+    After every reslice the tiles (2D) or bricks (3D) the current view
+    needs at slice positions ``±1 … ±radius`` along each non-displayed
+    axis are read into the host chunk cache at the lowest priority, so
+    stepping through z or t is served from RAM instead of storage.
+    Requires the host chunk cache (``SlicingConfig.host_cache_bytes``).
+
+    Parameters
+    ----------
+    default_radius : int
+        Number of neighbouring positions prefetched on each side of the
+        current slice, for every non-displayed axis not listed in
+        ``axis_radius``.  0 disables prefetching along those axes.
+    axis_radius : dict[str, int]
+        Per-axis override of ``default_radius``, keyed by axis label
+        (e.g. ``{"t": 3, "z": 1}``).
+    budget_bytes : int
+        Upper bound on the decoded bytes requested by one round of
+        neighbour prefetching.  Nearer positions are requested first, so
+        the budget trims the farthest ones.  0 disables prefetching.
+    """
+
+    default_radius: int = Field(default=1, ge=0)
+    axis_radius: dict[str, Annotated[int, Field(ge=0)]] = Field(default_factory=dict)
+    budget_bytes: int = Field(default=DEFAULT_SLICE_PREFETCH_BYTES, ge=0)
+
+    def radius_for(self, axis_label: str) -> int:
+        """Return the prefetch radius for the axis labelled *axis_label*."""
+        return self.axis_radius.get(axis_label, self.default_radius)
+
+
+class StorageConfig(BaseModel):
+    """Configuration of the tensorstore context shared by zarr data stores.
+
+    ``RenderManager`` builds one ``tensorstore.Context`` from these
+    settings and opens every level of every OME-Zarr / multiscale zarr
+    store registered with it in that context, so they share one chunk
+    cache and one set of I/O limits.  Stores whose handles were opened
+    before registration keep their own context.
+    ``None`` leaves a setting at tensorstore's default.
+
+    Parameters
+    ----------
+    cache_pool_bytes : int
+        Byte budget of tensorstore's shared cache of encoded storage
+        chunks (``cache_pool.total_bytes_limit``).  Complements the host
+        cache of decoded bricks: neighbouring bricks cut from the same
+        storage chunk are served without another request.  0 disables it.
+    data_copy_concurrency : int or None
+        Threads used for decoding and copying chunk data.  ``None`` uses
+        one per CPU core.
+    file_io_concurrency : int or None
+        Maximum concurrent local file operations.
+    request_concurrency : int or None
+        Maximum concurrent S3, GCS and HTTP requests.  Raise it for
+        high-latency object storage.
+    max_retries : int or None
+        Attempts before a failing S3/GCS/HTTP request is reported.
+    retry_initial_delay_s : float or None
+        Delay before the first retry; later delays back off exponentially.
+    retry_max_delay_s : float or None
+        Upper bound on the delay between retries.
+    """
+
+    cache_pool_bytes: int = Field(default=0, ge=0)
+    data_copy_concurrency: int | None = Field(default=None, gt=0)
+    file_io_concurrency: int | None = Field(default=None, gt=0)
+    request_concurrency: int | None = Field(default=None, gt=0)
+    max_retries: int | None = Field(default=None, ge=0)
+    retry_initial_delay_s: float | None = Field(default=None, gt=0.0)
+    retry_max_delay_s: float | None = Field(default=None, gt=0.0)
+
+    def context_spec(self) -> dict[str, Any]:
+        """Return the tensorstore context JSON for these settings."""
+        spec: dict[str, Any] = {
+            "cache_pool": {"total_bytes_limit": self.cache_pool_bytes}
+        }
+        if self.data_copy_concurrency is not None:
+            spec["data_copy_concurrency"] = {"limit": self.data_copy_concurrency}
+        if self.file_io_concurrency is not None:
+            spec["file_io_concurrency"] = {"limit": self.file_io_concurrency}
+        retries: dict[str, Any] = {}
+        if self.max_retries is not None:
+            retries["max_retries"] = self.max_retries
+        if self.retry_initial_delay_s is not None:
+            retries["initial_delay"] = f"{self.retry_initial_delay_s}s"
+        if self.retry_max_delay_s is not None:
+            retries["max_delay"] = f"{self.retry_max_delay_s}s"
+        for service in ("s3", "gcs", "http"):
+            if self.request_concurrency is not None:
+                spec[f"{service}_request_concurrency"] = {
+                    "limit": self.request_concurrency
+                }
+            if retries:
+                spec[f"{service}_request_retries"] = dict(retries)
+        return spec
 
 
 class RenderManagerConfig(BaseModel):
@@ -81,6 +234,10 @@ class RenderManagerConfig(BaseModel):
         Temporal accumulation pass settings.
     camera : CameraConfig
         Camera-driven reslicing settings.
+    slice_prefetch : SlicePrefetchConfig
+        Neighbouring-slice prefetch settings.
+    storage : StorageConfig
+        Shared tensorstore context settings for zarr data stores.
 
     Examples
     --------
@@ -100,3 +257,5 @@ class RenderManagerConfig(BaseModel):
         default_factory=TemporalAccumulationConfig
     )
     camera: CameraConfig = Field(default_factory=CameraConfig)
+    slice_prefetch: SlicePrefetchConfig = Field(default_factory=SlicePrefetchConfig)
+    storage: StorageConfig = Field(default_factory=StorageConfig)
@@ -0,0 +1,151 @@
+"""Host-RAM LRU cache of decoded chunk data shared by all visuals.
+
+Sits underneath ``AsyncSlicer``: a GPU-cache miss first consults this
+cache and only falls through to the data store's ``get_data`` when the
+decoded brick is not resident in host memory.  Entries are keyed by
+``(data_store_id, scale_index, axis_selections)`` so every visual,
+canvas and scene reading the same store shares one pool.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import TYPE_CHECKING
+
+from cellier.logging import _CACHE_LOGGER
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from cellier.data.image._image_requests import ChunkRequest
+
+# (data_store_id, scale_index, axis_selections)
+HostCacheKey = tuple[Hashable, int, tuple]
+
+
+class HostBrickCache:
+    """Byte-budgeted LRU cache of decoded bricks / tiles in host memory.
+
+    Cached arrays are marked read-only on insertion; consumers copy them
+    into their GPU staging arrays and must never mutate them in place.
+
+    Parameters
+    ----------
+    budget_bytes : int
+        Maximum total ``nbytes`` of cached arrays.  ``0`` disables the
+        cache (every ``put`` is a no-op).  Arrays larger than the budget
+        are never cached.
+    """
+
+    def __init__(self, budget_bytes: int) -> None:
+        self._budget_bytes = int(budget_bytes)
+        self._entries: OrderedDict[HostCacheKey, np.ndarray] = OrderedDict()
+        self._nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    # ── Properties ──────────────────────────────────────────────────────
+
+    @property
+    def budget_bytes(self) -> int:
+        """Maximum total size of cached arrays in bytes."""
+        return self._budget_bytes
+
+    @property
+    def nbytes(self) -> int:
+        """Total size of currently cached arrays in bytes."""
+        return self._nbytes
+
+    @property
+    def enabled(self) -> bool:
+        """``True`` when the budget allows anything to be cached."""
+        return self._budget_bytes > 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: HostCacheKey) -> bool:
+        return key in self._entries
+
+    # ── Public API ──────────────────────────────────────────────────────
+
+    @staticmethod
+    def make_key(namespace: Hashable, request: ChunkRequest) -> HostCacheKey:
+        """Return the cache key for *request* read from store *namespace*.
+
+        ``chunk_request_id`` and ``slice_request_id`` are deliberately
+        excluded: they change on every replan while the decoded data for
+        a given ``(scale_index, axis_selections)`` does not.
+        """
+        return (namespace, request.scale_index, request.axis_selections)
+
+    def get(self, key: HostCacheKey) -> np.ndarray | None:
+        """Return the cached array for *key* and mark it most recently used.
+
+        Returns ``None`` on a miss.
+        """
+        data = self._entries.get(key)
+        if data is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return data
+
+    def put(self, key: HostCacheKey, data: np.ndarray) -> None:
+        """Insert *data* under *key*, evicting LRU entries to fit the budget."""
+        size = int(data.nbytes)
+        if size > self._budget_bytes:
+            return
+
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._nbytes -= int(old.nbytes)
+
+        data.flags.writeable = False
+        self._entries[key] = data
+        self._nbytes += size
+
+        n_evicted = 0
+        while self._nbytes > self._budget_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._nbytes -= int(evicted.nbytes)
+            n_evicted += 1
+
+        if n_evicted:
+            _CACHE_LOGGER.debug(
+                "host_cache_evict  n=%d  resident=%d  nbytes=%d",
+                n_evicted,
+                len(self._entries),
+                self._nbytes,
+            )
+
+    def invalidate(self, namespace: Hashable) -> int:
+        """Drop every entry read from store *namespace*.
+
+        Called when the underlying data changes (e.g. a paint commit)
+        so subsequent reads see the new values.
+
+        Returns
+        -------
+        n_dropped : int
+            Number of entries removed.
+        """
+        stale = [key for key in self._entries if key[0] == namespace]
+        for key in stale:
+            self._nbytes -= int(self._entries.pop(key).nbytes)
+        if stale:
+            _CACHE_LOGGER.info(
+                "host_cache_invalidate  namespace=%s  dropped=%d",
+                namespace,
+                len(stale),
+            )
+        return len(stale)
+
+    def clear(self) -> None:
+        """Drop all entries and reset hit / miss counters."""
+        self._entries.clear()
+        self._nbytes = 0
+        self.hits = 0
+        self.misses = 0
@@ -28,6 +28,8 @@ import numpy as np
 from cellier.render.block_cache import BlockKey3D
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from cellier.render.lut_indirection import BlockLayout3D
 
 # Pre-computed (8, 3) offset table for AABB corner construction.
@@ -414,3 +416,101 @@ def arr_to_brick_keys(
         )
         required[key] = level
     return required
+
+
+def progressive_order(arr: np.ndarray, cover: np.ndarray) -> np.ndarray:
+    """Order a brick plan for coarse-to-fine progressive loading.
+
+    The coarse *cover* comes first so that one cheap pass fills the whole
+    visible volume; the remaining bricks of the target plan follow,
+    coarsest level first (stable, so the nearest-first order is kept
+    within each level).  Rows of *arr* at the cover level are already in
+    the cover and are dropped.
+
+    Parameters
+    ----------
+    arr : ndarray, shape (M, 4)
+        Target plan, ``[level, gz, gy, gx]`` rows sorted nearest-first.
+    cover : ndarray, shape (K, 4)
+        Single-level cover of the visible volume, sorted nearest-first.
+
+    Returns
+    -------
+    ordered_arr : ndarray, shape (K + M', 4)
+    """
+    if len(cover) == 0:
+        return arr
+    refine = arr[arr[:, 0] != cover[0, 0]]
+    refine = refine[np.argsort(-refine[:, 0], kind="stable")]
+    return np.concatenate([cover, refine.astype(cover.dtype, copy=False)], axis=0)
+
+
+def progressive_cover_order(
+    arr: np.ndarray,
+    geometry,
+    camera_pos_data: np.ndarray,
+    frustum_planes: np.ndarray | None = None,
+    use_octree: bool = False,
+    cover_filter: Callable[[np.ndarray], np.ndarray] | None = None,
+) -> np.ndarray:
+    """Put a coarsest-level cover of the visible volume ahead of a plan.
+
+    Builds the cover, sorts it nearest-first, culls it to the frustum and
+    orders *arr* behind it with ``progressive_order``.  Budget truncation
+    after this drops the farthest fine bricks, whose region the cover
+    still fills.
+
+    Parameters
+    ----------
+    arr : ndarray, shape (M, 4)
+        Target plan, ``[level, gz, gy, gx]`` rows sorted nearest-first.
+    geometry : MultiscaleBrickLayout3D
+        Brick layout the plan was made for.
+    camera_pos_data : ndarray, shape (3,)
+        Camera position in level-0 data space ``(x, y, z)``.
+    frustum_planes : ndarray or None
+        Frustum to cull the cover to.  ``None`` keeps the whole cover.
+    use_octree : bool
+        Build the cover with the octree walk over
+        ``geometry._octree_levels``, which culls as it goes, instead of
+        the per-brick level grids.
+    cover_filter : callable or None
+        Applied to the culled cover, e.g. to drop known-empty bricks.
+
+    Returns
+    -------
+    ordered_arr : ndarray, shape (K + M', 4)
+    """
+    from cellier.render._frustum import bricks_in_frustum_arr
+    from cellier.render._lod_octree import select_levels_octree
+
+    if use_octree:
+        # No thresholds: the walk stops at the (culled) coarsest level.
+        cover = select_levels_octree(
+            geometry._octree_levels,
+            camera_pos_data,
+            [],
+            frustum_planes=frustum_planes,
+        )
+    else:
+        cover = select_levels_arr_forced(
+            geometry.base_layout, geometry.n_levels, geometry._level_grids
+        )
+    cover = sort_arr_by_distance(
+        cover,
+        camera_pos_data,
+        geometry.block_size,
+        scale_vecs_shader=geometry._scale_arr_shader,
+        translation_vecs_shader=geometry._translation_arr_shader,
+    )
+    if frustum_planes is not None and not use_octree:
+        cover, _ = bricks_in_frustum_arr(
+            cover,
+            geometry.block_size,
+            frustum_planes,
+            level_scale_arr_shader=geometry._scale_arr_shader,
+            level_translation_arr_shader=geometry._translation_arr_shader,
+        )
+    if cover_filter is not None:
+        cover = cover_filter(cover)
+    return progressive_order(arr, cover)
@@ -5,10 +5,21 @@ the coarsest level where each tile still has sufficient resolution.
 
 For orthographic cameras, all tiles are at the same effective "distance",
 so a single global LOD level is selected based on the zoom ratio.
+``select_mixed_lod_2d`` then layers a coarse cover under that level, so
+the LUT can fall back to coarser tiles wherever finer ones are missing.
+
+The planner stays array-native until after culling: ``tiles_in_view_2d``
+derives the visible tile index range of a level directly from the view
+bounds, so a pan over a whole-slide image enumerates only the tiles on
+screen rather than the level's full grid.  The full-grid forms,
+``select_lod_2d`` and ``viewport_cull_2d``, are no longer on the planning
+path; they are kept as the reference implementations that
+``select_level_2d`` and ``tiles_in_view_2d`` are tested against.
 """
 
 from __future__ import annotations
 
+import itertools
 import math
 from typing import TYPE_CHECKING
 
@@ -17,9 +28,46 @@ import numpy as np
 from cellier.render.block_cache._tile_manager_2d import BlockKey2D
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from cellier.render.lut_indirection._layout_2d import BlockLayout2D
 
 
+def tile_grid_dims_2d(
+    base_layout: BlockLayout2D,
+    n_levels: int,
+    level_shapes: list[tuple[int, int]] | None = None,
+) -> list[tuple[int, int]]:
+    """Return the ``(gH, gW)`` tile grid dimensions of every level.
+
+    Parameters
+    ----------
+    base_layout : BlockLayout2D
+        Layout of the finest (level 1) resolution.
+    n_levels : int
+        Total number of LOD levels.
+    level_shapes : list[tuple[int, int]] or None
+        ``(H, W)`` shape per level (data order).  When ``None`` each level
+        halves the finest grid (power-of-2 fallback).
+
+    Returns
+    -------
+    grid_dims : list[tuple[int, int]]
+        One entry per level (index 0 = level 1).
+    """
+    bs = base_layout.block_size
+    gh, gw = base_layout.grid_dims
+    dims = []
+    for k in range(n_levels):
+        if level_shapes is not None:
+            h_k, w_k = level_shapes[k]
+            dims.append(((h_k + bs - 1) // bs, (w_k + bs - 1) // bs))
+        else:
+            scale = 1 << k
+            dims.append(((gh + scale - 1) // scale, (gw + scale - 1) // scale))
+    return dims
+
+
 def build_tile_grids_2d(
     base_layout: BlockLayout2D,
     n_levels: int,
@@ -57,21 +105,12 @@ def build_tile_grids_2d(
             World-space ``(x, y)`` centre of each coarse tile.
     """
     bs = base_layout.block_size
-    gh, gw = base_layout.grid_dims
 
     grids = []
+    grid_dims = tile_grid_dims_2d(base_layout, n_levels, level_shapes)
     for level in range(1, n_levels + 1):
         k = level - 1  # 0-indexed
-
-        if level_shapes is not None:
-            # data order: (H=axis0, W=axis1)
-            h_k, w_k = level_shapes[k]
-            cgh = (h_k + bs - 1) // bs
-            cgw = (w_k + bs - 1) // bs
-        else:
-            scale = 1 << k
-            cgh = (gh + scale - 1) // scale
-            cgw = (gw + scale - 1) // scale
+        cgh, cgw = grid_dims[k]
 
         gy_c, gx_c = np.meshgrid(
             np.arange(cgh, dtype=np.int32),
@@ -143,12 +182,35 @@ def select_lod_2d(
     arr : ndarray, shape (M, 3), dtype int32
         ``[level, gy_c, gx_c]`` rows for all selected tiles.
     """
+    level = select_level_2d(
+        n_levels,
+        viewport_width_px,
+        voxel_width,
+        lod_bias=lod_bias,
+        force_level=force_level,
+        level_scale_factors=level_scale_factors,
+    )
+    return level_grids[level - 1]["arr"].copy()
+
+
+def select_level_2d(
+    n_levels: int,
+    viewport_width_px: float,
+    voxel_width: float,
+    lod_bias: float = 1.0,
+    force_level: int | None = None,
+    level_scale_factors: list[float] | None = None,
+) -> int:
+    """Return the 1-based level ``select_lod_2d`` would pick.
+
+    Takes the same arguments as ``select_lod_2d`` minus the grids, so the
+    caller can enumerate only the visible tiles (see ``tiles_in_view_2d``).
+    """
     if force_level is not None:
-        level = min(max(force_level, 1), n_levels)
-        return level_grids[level - 1]["arr"].copy()
+        return min(max(force_level, 1), n_levels)
 
     if voxel_width <= 0 or viewport_width_px <= 0:
-        return level_grids[0]["arr"].copy()
+        return 1
 
     # Level-0 voxels per screen pixel.
     screen_pixel_size = voxel_width / viewport_width_px
@@ -171,7 +233,147 @@ def select_lod_2d(
         ideal = 1.0 + math.log2(max(biased, 1e-6))
         selected_level = max(1, min(n_levels, round(ideal)))
 
-    return level_grids[selected_level - 1]["arr"].copy()
+    return selected_level
+
+
+def _visible_index_range(
+    n: int, tile_width: float, offset: float, lo: float, hi: float
+) -> np.ndarray:
+    """Return the grid indices along one axis whose tile overlaps ``(lo, hi)``.
+
+    Tile ``g`` spans ``[g, g + 1) * tile_width + offset``.  The range is
+    estimated by division, widened by one tile each way, and then tested
+    with the same comparisons as ``viewport_cull_2d`` so the two agree
+    exactly at tile boundaries.
+    """
+    if tile_width <= 0:
+        return np.arange(n)
+    g0 = max(0, math.floor((lo - offset) / tile_width) - 1)
+    g1 = min(n, math.ceil((hi - offset) / tile_width) + 1)
+    g = np.arange(g0, max(g0, g1))
+    gf = g.astype(np.float64)
+    keep = ((gf + 1.0) * tile_width + offset > lo) & (gf * tile_width + offset < hi)
+    return g[keep]
+
+
+def tiles_in_view_2d(
+    level: int,
+    grid_dims: tuple[int, int],
+    block_size: int,
+    view_min: np.ndarray | None = None,
+    view_max: np.ndarray | None = None,
+    level_scale_arr_shader: np.ndarray | None = None,
+    level_translation_arr_shader: np.ndarray | None = None,
+) -> np.ndarray:
+    """Return the tiles of one level that overlap the viewport.
+
+    Equivalent to culling the level's full grid with ``viewport_cull_2d``,
+    but computed per axis from the view bounds, so the cost follows the
+    number of visible tiles rather than the size of the level.
+
+    Parameters
+    ----------
+    level : int
+        1-based LOD level.
+    grid_dims : tuple[int, int]
+        ``(gH, gW)`` tile grid of this level (see ``tile_grid_dims_2d``).
+    block_size : int
+        Tile side length in data pixels at finest level.
+    view_min, view_max : ndarray, shape (2,) or None
+        Viewport AABB ``(x, y)`` in level-0 data space.  ``None`` returns
+        the full grid.
+    level_scale_arr_shader : ndarray, shape (n_levels, 2) or None
+        Per-level scale in shader order ``(x=W, y=H)``.
+    level_translation_arr_shader : ndarray, shape (n_levels, 2) or None
+        Per-level translation in shader order ``(x=W, y=H)``.
+
+    Returns
+    -------
+    arr : ndarray, shape (M, 3), dtype int32
+        ``[level, gy, gx]`` rows in row-major grid order.
+    """
+    gh, gw = grid_dims
+    if level_scale_arr_shader is not None and level_translation_arr_shader is not None:
+        bw_x = block_size * float(level_scale_arr_shader[level - 1, 0])
+        bw_y = block_size * float(level_scale_arr_shader[level - 1, 1])
+        tv_x = float(level_translation_arr_shader[level - 1, 0])
+        tv_y = float(level_translation_arr_shader[level - 1, 1])
+    else:
+        bw_x = bw_y = float(block_size * (1 << (level - 1)))
+        tv_x = tv_y = 0.0
+
+    if view_min is None or view_max is None:
+        gy, gx = np.arange(gh), np.arange(gw)
+    else:
+        gx = _visible_index_range(
+            gw, bw_x, tv_x, float(view_min[0]), float(view_max[0])
+        )
+        gy = _visible_index_range(
+            gh, bw_y, tv_y, float(view_min[1]), float(view_max[1])
+        )
+
+    arr = np.empty((len(gy) * len(gx), 3), dtype=np.int32)
+    arr[:, 0] = level
+    arr[:, 1] = np.repeat(gy, len(gx))
+    arr[:, 2] = np.tile(gx, len(gy))
+    return arr
+
+
+def select_mixed_lod_2d(
+    target: dict[BlockKey2D, int],
+    target_level: int,
+    n_levels: int,
+    max_tiles: int,
+    visible_tiles: Callable[[int], dict[BlockKey2D, int]],
+) -> dict[BlockKey2D, int]:
+    """Combine the target level with a coarse cover of the view.
+
+    The coarsest level's visible tiles are planned first.  They are cheap
+    and stay resident, so a level change or a pan never exposes blank
+    tiles: the LUT sweep draws coarsest-to-finest and shows the cover
+    wherever the target tiles have not loaded yet.
+
+    When the cover plus the target level exceed ``max_tiles``, the plan
+    is foveated instead of truncated: the finest intermediate level whose
+    visible tiles fit in half the remaining budget covers the periphery,
+    and the target tiles nearest the view centre fill the rest.
+
+    Parameters
+    ----------
+    target : dict[BlockKey2D, int]
+        Visible tiles of ``target_level``, sorted nearest-first.
+    target_level : int
+        Level chosen by ``select_lod_2d``.
+    n_levels : int
+        Number of LOD levels; the cover uses the coarsest one.
+    max_tiles : int
+        Slot budget for the whole plan.
+    visible_tiles : callable
+        Maps a level coarser than ``target_level`` to its visible tiles,
+        sorted nearest-first.
+
+    Returns
+    -------
+    required : dict[BlockKey2D, int]
+        Cover, then periphery, then target tiles.  Only longer than
+        ``max_tiles`` when the cover alone does not fit.
+    """
+    if target_level >= n_levels:
+        return target
+    cover = visible_tiles(n_levels)
+    budget = max_tiles - len(cover)
+    if len(target) <= budget:
+        return {**cover, **target}
+
+    periphery: dict[BlockKey2D, int] = {}
+    for level in range(target_level + 1, n_levels):
+        tiles = visible_tiles(level)
+        if len(tiles) <= budget // 2:
+            periphery = tiles
+            break
+    n_foveal = max(0, budget - len(periphery))
+    foveal = dict(itertools.islice(target.items(), n_foveal))
+    return {**cover, **periphery, **foveal}
 
 
 def sort_tiles_by_distance_2d(
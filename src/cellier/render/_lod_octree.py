@@ -0,0 +1,406 @@
+"""Top-down octree LOD traversal for bricked volume rendering.
+
+``select_levels_from_cache`` scores every brick of every level against
+the camera, so its cost (and the memory of ``build_level_grids``) grows
+with the brick count of the finest level.  This module walks the
+pyramid as a tree instead: it starts from the coarsest level and only
+expands nodes that are inside the frustum *and* closer than their
+level's LOD threshold.  A node rejected by the frustum test prunes its
+whole subtree, so planning cost scales with the visible bricks rather
+than with the dataset size.
+
+``select_levels_sse`` walks the same tree greedily instead: it always
+refines the brick with the largest screen-space error next and stops
+when the brick budget is reached, so the view stays fully covered at
+the best resolution the cache can hold.
+
+Parent/child links
+------------------
+Level shapes are not always exact powers of two, so child ranges are
+not derived from a fixed ratio.  Every level-``L-1`` brick is assigned
+to the single level-``L`` brick that contains its world-space centre
+(clamped to the parent grid).  This mapping is monotone per axis, so
+the children of a parent form a contiguous ``[start, stop)`` range
+on each axis, precomputed once by ``build_octree_levels``.  Because
+each brick has exactly one parent, the selected bricks always partition
+the volume: no gaps and no overlapping levels.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+from typing import TYPE_CHECKING, Literal
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from cellier.render.lut_indirection import BlockLayout3D
+
+LodStrategy = Literal["distance_bands", "octree", "screen_space_error"]
+
+
+# ---------------------------------------------------------------------------
+# Startup: per-level tree metadata
+# ---------------------------------------------------------------------------
+
+
+def _grid_dims(
+    base_layout: BlockLayout3D,
+    level: int,
+    level_shapes: list[tuple[int, ...]] | None,
+) -> tuple[int, int, int]:
+    """Return the ``(gz, gy, gx)`` grid dims of *level* (1-indexed).
+
+    Mirrors the dims computed by ``build_level_grids``.
+    """
+    bs = base_layout.block_size
+    if level_shapes is not None:
+        d_k, h_k, w_k = level_shapes[level - 1]
+        return (d_k + bs - 1) // bs, (h_k + bs - 1) // bs, (w_k + bs - 1) // bs
+    gd, gh, gw = base_layout.grid_dims
+    scale = 1 << (level - 1)
+    return (
+        (gd + scale - 1) // scale,
+        (gh + scale - 1) // scale,
+        (gw + scale - 1) // scale,
+    )
+
+
+def build_octree_levels(
+    base_layout: BlockLayout3D,
+    n_levels: int,
+    scale_vecs_shader: list[np.ndarray],
+    translation_vecs_shader: list[np.ndarray],
+    level_shapes: list[tuple[int, ...]] | None = None,
+) -> list[dict]:
+    """Precompute per-level tree metadata.  Called once at startup.
+
+    Only ``O(grid side)`` data is stored per level, never one row per
+    brick, so this stays small for arbitrarily large volumes.
+
+    Parameters
+    ----------
+    base_layout : BlockLayout3D
+        Layout of the finest (level 1) resolution.
+    n_levels : int
+        Total number of LOD levels.
+    scale_vecs_shader : list[np.ndarray]
+        ``(3,)`` per level in shader order ``(x=W, y=H, z=D)``.
+    translation_vecs_shader : list[np.ndarray]
+        ``(3,)`` per level in shader order ``(x=W, y=H, z=D)``.
+    level_shapes : list[tuple[int, ...]] or None
+        ``(D, H, W)`` shape per level (data order).  When ``None``,
+        grid dims are derived from ``base_layout`` using power-of-2
+        downsampling.
+
+    Returns
+    -------
+    levels : list[dict]
+        One dict per level (index 0 = level 1).  Each dict contains:
+
+        ``grid_dims`` : ndarray, shape (3,), dtype int64
+            Brick grid dims ``(gz, gy, gx)``.
+        ``brick_world`` : ndarray, shape (3,), dtype float64
+            World-space brick width ``(x, y, z)``.
+        ``translation`` : ndarray, shape (3,), dtype float64
+            World-space origin of brick ``(0, 0, 0)``, ``(x, y, z)``.
+        ``child_start``, ``child_stop`` : tuple of 3 ndarrays
+            Per grid axis ``(z, y, x)``, the ``[start, stop)`` range of
+            level ``L-1`` indices owned by each level-``L`` index.
+            ``None`` for level 1.
+    """
+    bs = base_layout.block_size
+    levels: list[dict] = []
+    for level in range(1, n_levels + 1):
+        k = level - 1
+        levels.append(
+            {
+                "grid_dims": np.asarray(
+                    _grid_dims(base_layout, level, level_shapes), dtype=np.int64
+                ),
+                "brick_world": bs * np.asarray(scale_vecs_shader[k], dtype=np.float64),
+                "translation": np.asarray(translation_vecs_shader[k], dtype=np.float64),
+                "child_start": None,
+                "child_stop": None,
+            }
+        )
+
+    for k in range(1, n_levels):
+        parent, child = levels[k], levels[k - 1]
+        starts, stops = [], []
+        # Grid axes are (z, y, x); world vectors are (x, y, z).
+        for axis, world_axis in enumerate((2, 1, 0)):
+            n_child = int(child["grid_dims"][axis])
+            n_parent = int(parent["grid_dims"][axis])
+            centres = (np.arange(n_child) + 0.5) * child["brick_world"][
+                world_axis
+            ] + child["translation"][world_axis]
+            owner = np.floor(
+                (centres - parent["translation"][world_axis])
+                / parent["brick_world"][world_axis]
+            )
+            owner = np.clip(owner, 0, n_parent - 1).astype(np.int64)
+            parent_idx = np.arange(n_parent)
+            starts.append(np.searchsorted(owner, parent_idx, side="left"))
+            stops.append(np.searchsorted(owner, parent_idx, side="right"))
+        parent["child_start"] = tuple(starts)
+        parent["child_stop"] = tuple(stops)
+
+    return levels
+
+
+# ---------------------------------------------------------------------------
+# Hot path: top-down traversal
+# ---------------------------------------------------------------------------
+
+
+def _expand_children(level_data: dict, nodes: np.ndarray) -> np.ndarray:
+    """Return the ``(K, 3)`` child grid indices of every row of *nodes*."""
+    start = np.stack(
+        [level_data["child_start"][a][nodes[:, a]] for a in range(3)], axis=1
+    )
+    extent = (
+        np.stack([level_data["child_stop"][a][nodes[:, a]] for a in range(3)], axis=1)
+        - start
+    )
+    counts = extent.prod(axis=1)
+    total = int(counts.sum())
+    if total == 0:
+        return np.empty((0, 3), dtype=np.int64)
+
+    owner = np.repeat(np.arange(len(nodes)), counts)
+    # Position of each child within its parent's (ez, ey, ex) block.
+    local = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+    ey = extent[owner, 1]
+    ex = extent[owner, 2]
+    offsets = np.stack([local // (ey * ex), (local // ex) % ey, local % ex], axis=1)
+    return start[owner] + offsets
+
+
+def _visible(
+    level_data: dict, nodes: np.ndarray, frustum_planes: np.ndarray | None
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return the *nodes* inside the frustum and their world-space centres.
+
+    Uses the positive-vertex AABB test: a box is kept when the corner
+    farthest along each inward normal is inside that plane.
+    """
+    # Grid (z, y, x) -> world (x, y, z).
+    centres = (nodes[:, ::-1] + 0.5) * level_data["brick_world"] + level_data[
+        "translation"
+    ]
+    if frustum_planes is None:
+        return nodes, centres
+    reach = (
+        centres @ frustum_planes[:, :3].T
+        + frustum_planes[:, 3]
+        + np.abs(frustum_planes[:, :3]) @ (level_data["brick_world"] / 2.0)
+    )
+    inside = (reach >= 0.0).all(axis=1)
+    return nodes[inside], centres[inside]
+
+
+def select_levels_octree(
+    levels: list[dict],
+    camera_pos: np.ndarray,
+    thresholds: list[float],
+    frustum_planes: np.ndarray | None = None,
+) -> np.ndarray:
+    """Select LOD levels by refining the brick pyramid from the top down.
+
+    All coarsest-level bricks seed the traversal.  At each level a node
+    is dropped if it lies outside the frustum, kept if it is far enough
+    for its level, and otherwise replaced by its children one level
+    finer.  A node at level ``L > 1`` is refined when the nearest point
+    of its box is closer than ``thresholds[L-2]``, the distance below
+    which ``select_levels_from_cache`` prefers level ``L-1``.
+
+    Parameters
+    ----------
+    levels : list[dict]
+        Output of ``build_octree_levels``.
+    camera_pos : np.ndarray
+        Camera world-space position ``(x, y, z)``.
+    thresholds : list[float]
+        LOD cutoff distances; ``thresholds[i]`` is the distance beyond
+        which level ``i+2`` is preferred over level ``i+1``.  An empty
+        list refines nothing and returns the coarsest level.
+    frustum_planes : ndarray, shape (6, 4) or None
+        Inward-pointing half-space planes; ``None`` disables culling.
+        The box test is the same conservative AABB test as
+        ``bricks_in_frustum_arr``.
+
+    Returns
+    -------
+    arr : ndarray, shape (M, 4), dtype int32
+        ``[level, gz, gy, gx]`` rows for all selected bricks, not yet
+        sorted — call ``sort_arr_by_distance`` next.
+    """
+    cam = np.asarray(camera_pos, dtype=np.float64)
+    n_levels = len(levels)
+
+    top = levels[-1]
+    gz, gy, gx = np.meshgrid(
+        *(np.arange(n, dtype=np.int64) for n in top["grid_dims"]), indexing="ij"
+    )
+    nodes = np.stack([gz.ravel(), gy.ravel(), gx.ravel()], axis=1)
+
+    parts: list[np.ndarray] = []
+    for level in range(n_levels, 0, -1):
+        level_data = levels[level - 1]
+        half = level_data["brick_world"] / 2.0
+        nodes, centres = _visible(level_data, nodes, frustum_planes)
+
+        if level > 1 and level - 2 < len(thresholds):
+            gap = np.maximum(np.abs(centres - cam) - half, 0.0)
+            refine = np.sqrt((gap * gap).sum(axis=1)) < thresholds[level - 2]
+            # A parent that owns no children keeps its own brick.
+            for axis in range(3):
+                idx = nodes[:, axis]
+                refine &= (
+                    level_data["child_stop"][axis][idx]
+                    > level_data["child_start"][axis][idx]
+                )
+        else:
+            refine = np.zeros(len(nodes), dtype=bool)
+
+        kept = nodes[~refine]
+        if len(kept):
+            rows = np.empty((len(kept), 4), dtype=np.int32)
+            rows[:, 0] = level
+            rows[:, 1:] = kept
+            parts.append(rows)
+        if not refine.any():
+            break
+        nodes = _expand_children(level_data, nodes[refine])
+
+    if not parts:
+        return np.empty((0, 4), dtype=np.int32)
+    return np.concatenate(parts, axis=0)
+
+
+def _screen_space_error(
+    level_data: dict,
+    block_size: int,
+    centres: np.ndarray,
+    camera_pos: np.ndarray,
+    focal_px: float,
+) -> np.ndarray:
+    """Projected voxel size in pixels at the nearest point of each brick.
+
+    The voxel size is the geometric mean of the per-axis world-space
+    voxel widths, as for ``MultiscaleBrickLayout3D._level_scale_factors``.  A
+    brick containing the camera has infinite error.
+    """
+    voxel = float(np.prod(level_data["brick_world"] / block_size) ** (1.0 / 3.0))
+    gap = np.maximum(
+        np.abs(centres - camera_pos) - level_data["brick_world"] / 2.0, 0.0
+    )
+    nearest = np.sqrt((gap * gap).sum(axis=1))
+    with np.errstate(divide="ignore"):
+        return voxel * focal_px / nearest
+
+
+def select_levels_sse(
+    levels: list[dict],
+    block_size: int,
+    camera_pos: np.ndarray,
+    focal_px: float,
+    max_bricks: int,
+    pixel_tolerance: float = 1.0,
+    frustum_planes: np.ndarray | None = None,
+) -> np.ndarray:
+    """Select LOD levels by greedy screen-space-error refinement.
+
+    The visible coarsest-level bricks seed the selection.  The selected
+    brick whose voxels project largest on screen is then replaced by its
+    visible children, one brick at a time, until every brick is within
+    *pixel_tolerance* or the next refinement would exceed the budget.
+    A child is never larger on screen than its parent, so refinement
+    proceeds in globally decreasing error order and the selection always
+    covers the visible volume.
+
+    Parameters
+    ----------
+    levels : list[dict]
+        Output of ``build_octree_levels``.
+    block_size : int
+        Brick side length in voxels.
+    camera_pos : np.ndarray
+        Camera world-space position ``(x, y, z)``.
+    focal_px : float
+        Focal length in pixels, ``(screen_height / 2) / tan(fov_y / 2)``.
+    max_bricks : int
+        Maximum number of selected bricks, typically the usable cache
+        slots, which the cache already sizes from its byte budget.  If
+        the coarsest cover alone is larger, it is returned unrefined and
+        the caller must truncate.
+    pixel_tolerance : float
+        Bricks whose projected voxel size is at most this many pixels
+        are not refined.
+    frustum_planes : ndarray, shape (6, 4) or None
+        Inward-pointing half-space planes; ``None`` disables culling.
+
+    Returns
+    -------
+    arr : ndarray, shape (M, 4), dtype int32
+        ``[level, gz, gy, gx]`` rows for all selected bricks, not yet
+        sorted — call ``sort_arr_by_distance`` next.
+    """
+    cam = np.asarray(camera_pos, dtype=np.float64)
+
+    n_levels = len(levels)
+    top = levels[-1]
+    gz, gy, gx = np.meshgrid(
+        *(np.arange(n, dtype=np.int64) for n in top["grid_dims"]), indexing="ij"
+    )
+    nodes, centres = _visible(
+        top, np.stack([gz.ravel(), gy.ravel(), gx.ravel()], axis=1), frustum_planes
+    )
+
+    # Selected bricks keyed by (level, gz, gy, gx); insertion order is kept
+    # so the output is deterministic.
+    selected: dict[tuple[int, int, int, int], None] = {}
+    heap: list[tuple[float, tuple[int, int, int, int]]] = []
+
+    def _add(level: int, nodes: np.ndarray, centres: np.ndarray) -> None:
+        if level > 1:
+            error = _screen_space_error(
+                levels[level - 1], block_size, centres, cam, focal_px
+            )
+        for i, node in enumerate(nodes.tolist()):
+            key = (level, *node)
+            selected[key] = None
+            if level > 1 and error[i] > pixel_tolerance:
+                heapq.heappush(heap, (-float(error[i]), key))
+
+    _add(n_levels, nodes, centres)
+    while heap:
+        _, key = heapq.heappop(heap)
+        level = key[0]
+        parent = levels[level - 1]
+        # One node at a time: plain ranges beat the batched expansion here.
+        children = np.array(
+            list(
+                itertools.product(
+                    *(
+                        range(parent["child_start"][a][g], parent["child_stop"][a][g])
+                        for a, g in enumerate(key[1:])
+                    )
+                )
+            ),
+            dtype=np.int64,
+        ).reshape(-1, 3)
+        if len(children) == 0:
+            # A parent that owns no children keeps its own brick.
+            continue
+        children, child_centres = _visible(levels[level - 2], children, frustum_planes)
+        if len(selected) - 1 + len(children) > max_bricks:
+            break
+        del selected[key]
+        _add(level - 1, children, child_centres)
+
+    if not selected:
+        return np.empty((0, 4), dtype=np.int32)
+    return np.array(list(selected), dtype=np.int32)
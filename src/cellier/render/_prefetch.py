@@ -0,0 +1,165 @@
+"""Camera-motion and slice-neighbourhood prediction for chunk prefetching.
+
+During a smooth pan, zoom or orbit the settle timer keeps restarting, so
+nothing is resliced until the camera stops.  ``CameraMotionPredictor``
+extrapolates the camera from successive reslicing snapshots so the
+``SliceCoordinator`` can plan the predicted view and warm the host-RAM
+chunk cache while the camera is still moving.  ``neighbour_slice_states``
+lists the dims states one step away (and further) along each
+non-displayed axis, so the slices a z/t scrub will visit next are
+already in RAM.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from uuid import uuid4
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from cellier._state import DimsState
+    from cellier.render._config import CameraConfig, SlicePrefetchConfig
+    from cellier.render._requests import ReslicingRequest
+
+# Per-step zoom ratios are clamped to this range before extrapolation so a
+# single jittery sample cannot predict an absurd orthographic extent.
+_MAX_ZOOM_RATIO = 4.0
+
+
+class CameraMotionPredictor:
+    """Linear extrapolation of one canvas camera from its recent snapshots.
+
+    Camera position and every frustum corner are extrapolated linearly,
+    which covers panning, dollying and (approximately) orbiting.  The
+    orthographic world extent is extrapolated geometrically so zooming
+    in and out is symmetric.
+
+    Parameters
+    ----------
+    config : CameraConfig
+        Live camera configuration; ``prefetch_lookahead_s``,
+        ``prefetch_interval_s`` and ``settle_threshold_s`` are read on
+        every ``update`` so changes take effect immediately.
+    """
+
+    def __init__(self, config: CameraConfig) -> None:
+        self._config = config
+        self._last: tuple[float, ReslicingRequest] | None = None
+
+    def reset(self) -> None:
+        """Forget the motion history (e.g. after the camera settled)."""
+        self._last = None
+
+    def update(self, request: ReslicingRequest, t: float) -> ReslicingRequest | None:
+        """Record a camera snapshot and return the predicted future request.
+
+        Parameters
+        ----------
+        request : ReslicingRequest
+            Snapshot of the current camera.
+        t : float
+            Monotonic timestamp of the snapshot in seconds.
+
+        Returns
+        -------
+        ReslicingRequest or None
+            A copy of *request* with the camera moved
+            ``prefetch_lookahead_s`` ahead along its current velocity, or
+            ``None`` when no prediction is available: first sample, less
+            than ``prefetch_interval_s`` since the last one (the sample is
+            then ignored), a gap longer than ``settle_threshold_s`` (a new
+            gesture), a camera-type change, or a stationary camera.
+        """
+        cfg = self._config
+        prev = self._last
+        if prev is not None and t - prev[0] < cfg.prefetch_interval_s:
+            return None
+        self._last = (t, request)
+        if prev is None:
+            return None
+
+        t_prev, prev_request = prev
+        dt = t - t_prev
+        if dt > cfg.settle_threshold_s:
+            return None
+        if prev_request.camera_type != request.camera_type:
+            return None
+
+        steps = cfg.prefetch_lookahead_s / dt
+        d_pos = request.camera_pos - prev_request.camera_pos
+        d_corners = request.frustum_corners - prev_request.frustum_corners
+        zoom = [
+            float(np.clip(cur / old, 1.0 / _MAX_ZOOM_RATIO, _MAX_ZOOM_RATIO))
+            if old > 0 and cur > 0
+            else 1.0
+            for cur, old in zip(request.world_extent, prev_request.world_extent)
+        ]
+        if not (np.any(d_pos) or np.any(d_corners) or any(z != 1.0 for z in zoom)):
+            return None
+
+        return request._replace(
+            camera_pos=request.camera_pos + d_pos * steps,
+            frustum_corners=request.frustum_corners + d_corners * steps,
+            world_extent=tuple(
+                ext * z**steps for ext, z in zip(request.world_extent, zoom)
+            ),
+            request_id=uuid4(),
+        )
+
+
+def neighbour_slice_states(
+    dims_state: DimsState,
+    config: SlicePrefetchConfig,
+    axis_extents: dict[int, int] | None = None,
+) -> list[DimsState]:
+    """Return the dims states of the neighbouring slices, nearest first.
+
+    For every non-displayed axis with a non-zero radius, the slice
+    position is stepped by ``±1 … ±radius``; positions below zero or at
+    or past the axis extent are skipped.  States are ordered by distance,
+    then axis, forward before backward, so a budget that trims the tail
+    drops the farthest positions first.
+
+    Parameters
+    ----------
+    dims_state : DimsState
+        Current dims state of the scene.
+    config : SlicePrefetchConfig
+        Per-axis prefetch radii.
+    axis_extents : dict[int, int] or None
+        Number of positions along each axis, e.g. from the level-0 data
+        shape.  Axes missing from the mapping are unbounded above.
+
+    Returns
+    -------
+    list[DimsState]
+        One state per neighbouring slice position.
+    """
+    selection = dims_state.selection
+    slice_indices = getattr(selection, "slice_indices", None)
+    if not slice_indices:
+        return []
+    radii = {
+        axis: config.radius_for(dims_state.axis_labels[axis])
+        for axis in sorted(slice_indices)
+    }
+    extents = axis_extents or {}
+    states: list[DimsState] = []
+    for step in range(1, max(radii.values()) + 1):
+        for axis, radius in radii.items():
+            if step > radius:
+                continue
+            for position in (
+                slice_indices[axis] + step,
+                slice_indices[axis] - step,
+            ):
+                if position < 0 or position >= extents.get(axis, position + 1):
+                    continue
+                indices = {**slice_indices, axis: position}
+                states.append(
+                    dims_state._replace(
+                        selection=selection._replace(slice_indices=indices)
+                    )
+                )
+    return states
@@ -28,8 +28,18 @@ class VisualRenderConfig:
         When ``True``, bricks outside the camera frustum are skipped.
         When ``False``, all bricks in the scene are submitted regardless
         of visibility.  Default ``True``.
+    load_priority : int
+        Scheduling priority of this visual's chunk reads relative to
+        other visuals; lower values load first.  Default ``0``.
+    progressive : bool
+        When ``True``, 3D multiscale planning first loads a coarsest-level
+        cover of the visible volume and then refines coarse-to-fine
+        toward the target LOD, trading time-to-full-resolution for a
+        complete first image.  Default ``False``.
     """
 
     lod_bias: float = 1.0
     force_level: int | None = None
     frustum_cull: bool = True
+    load_priority: int = 0
+    progressive: bool = False
@@ -8,8 +8,15 @@ from cellier.render.block_cache._cache_parameters_3d import (
     commit_block_3d,
     compute_block_cache_parameters_3d,
 )
+from cellier.render.block_cache._layered_block_cache import LayeredBlockCache
+from cellier.render.block_cache._packed_tile_manager_3d import (
+    PackedTileManager3D,
+    pack_brick_ids,
+    unpack_brick_ids,
+)
 from cellier.render.block_cache._tile_manager_3d import (
     BlockKey3D,
+    ResidentBricks3D,
     TileManager3D,
     TileSlot,
 )
@@ -18,8 +25,13 @@ __all__ = [
     "BlockCache3D",
     "BlockCacheParameters3D",
     "BlockKey3D",
+    "LayeredBlockCache",
+    "PackedTileManager3D",
+    "ResidentBricks3D",
     "TileManager3D",
     "TileSlot",
     "commit_block_3d",
     "compute_block_cache_parameters_3d",
+    "pack_brick_ids",
+    "unpack_brick_ids",
 ]
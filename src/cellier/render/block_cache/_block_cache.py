@@ -9,20 +9,36 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 from cellier.logging import _GPU_LOGGER
+from cellier.render.block_cache._cache_dtype import cache_texture_format
 from cellier.render.block_cache._cache_parameters_3d import (
     BlockCacheParameters3D,
     build_cache_texture_3d,
-    commit_block_3d,
+)
+from cellier.render.block_cache._quantization import (
+    build_slot_params_texture,
+    cache_storage_dtype,
+    float16_error_bound,
+    quantize_uint8_into,
 )
 from cellier.render.block_cache._tile_manager_3d import (
     BlockKey3D,
     TileManager3D,
     TileSlot,
 )
+from cellier.render.block_cache._upload_scheduler import (
+    SlotUploadScheduler,
+    StagedSlot,
+)
 
 if TYPE_CHECKING:
-    import numpy as np
+    from collections.abc import Callable
+
+    import pygfx as gfx
+
+    from cellier.render.block_cache._quantization import CachePrecision
 
 
 class BlockCache3D:
@@ -34,7 +50,17 @@ class BlockCache3D:
         Cache sizing metadata produced by ``compute_cache_info()``.
     dtype : np.dtype or None
         Data type for the cache texture. Defaults to float32.
-        Pass ``np.int32`` for label caches.
+        Pass ``np.int32`` for label caches.  Ignored by lossy precisions.
+    precision : {"native", "float16", "uint8"}
+        Opt-in lossy storage for float data (see ``_quantization``).
+        ``"native"`` stores *dtype* unchanged.
+    upload_budget_bytes : int or None
+        Maximum brick bytes uploaded per frame (see ``flush_uploads``).
+        ``None`` uploads every staged brick on each flush.
+    tile_manager : TileManager3D or None
+        Slot allocation to share with other caches of the same
+        parameters, which then hold other channels of the same bricks
+        (see ``LayeredBlockCache``).  ``None`` creates a private one.
 
     Attributes
     ----------
@@ -42,18 +68,42 @@ class BlockCache3D:
         Cache sizing metadata (grid dims, slot count, padded brick size).
     tile_manager : TileManager3D
         Brick-to-slot mapping with LRU eviction.
-    cache_data : np.ndarray
-        CPU-side backing array, shape ``(cD, cH, cW)``.
+    dtype : np.dtype
+        Dtype the cache texture stores; bricks are cast to it on upload.
     cache_tex : gfx.Texture
-        GPU 3-D texture wrapping ``cache_data``.
+        GPU 3-D texture, shape ``(cD, cH, cW)``.  It has no CPU-side
+        mirror: each brick is uploaded straight from the array passed to
+        ``write_brick`` (or a brick-sized cast of it), merged with
+        grid-adjacent bricks by ``flush_uploads``.
+    slot_params_tex : gfx.Texture or None
+        Per-slot ``(scale, offset)`` RG32Float texture, shape
+        ``cache_grid``; only allocated for ``precision="uint8"``.
     """
 
-    def __init__(self, cache_parameters: BlockCacheParameters3D, dtype=None) -> None:
+    def __init__(
+        self,
+        cache_parameters: BlockCacheParameters3D,
+        dtype=None,
+        precision: CachePrecision = "native",
+        upload_budget_bytes: int | None = None,
+        tile_manager: TileManager3D | None = None,
+    ) -> None:
         self.info = cache_parameters
-        self.tile_manager = TileManager3D(cache_parameters)
-        self.cache_data, self.cache_tex = build_cache_texture_3d(
-            cache_parameters, dtype=dtype
+        self.precision = precision
+        if tile_manager is None:
+            tile_manager = TileManager3D(cache_parameters)
+        self.tile_manager = tile_manager
+        self.dtype, _ = cache_texture_format(cache_storage_dtype(precision) or dtype)
+        self.cache_tex = build_cache_texture_3d(cache_parameters, dtype=self.dtype)
+        self._uploads = SlotUploadScheduler(
+            self.cache_tex, cache_parameters.padded_block_size, upload_budget_bytes
         )
+        self.slot_params_data: np.ndarray | None = None
+        self.slot_params_tex: gfx.Texture | None = None
+        if precision == "uint8":
+            self.slot_params_data, self.slot_params_tex = build_slot_params_texture(
+                cache_parameters.cache_grid
+            )
 
     def stage(
         self,
@@ -90,10 +140,13 @@ class BlockCache3D:
         key: BlockKey3D | None = None,
         background_label: int = 0,
     ) -> bool:
-        """Write a padded brick into the CPU array and mark dirty for GPU upload.
+        """Stage a padded brick for upload into *slot*.
 
-        The actual GPU transfer is deferred until the next
-        ``renderer.render()`` call (uses pygfx ``update_range``).
+        The brick is sent by the next ``flush_uploads`` call, which also
+        commits it to the tile manager; the GPU transfer itself happens
+        on the following ``renderer.render()``.  *data* is uploaded
+        without a copy when it already has the cache dtype, so it must
+        not be modified afterwards.
 
         Parameters
         ----------
@@ -103,12 +156,17 @@ class BlockCache3D:
             Array of shape ``(pbs, pbs, pbs)`` where
             ``pbs = block_size + 2 * overlap``.
         key : BlockKey3D or None
-            Brick identity for logging.
+            Brick identity.  Staged bricks with a key are committed to
+            the tile manager when uploaded; ``None`` only uploads.
         background_label : int
             For integer (label) caches: value treated as background.
             Returns True if the brick contains any non-background value.
             Ignored for float caches (always returns False).
 
+        In a lossy cache the brick is rounded (``"float16"``) or
+        quantized (``"uint8"``) on the way in, and ``slot.brick_scale``,
+        ``slot.brick_offset`` and ``slot.brick_error`` describe the result.
+
         Returns
         -------
         bool
@@ -116,25 +174,87 @@ class BlockCache3D:
             label caches to set ``slot.brick_max``).  For float caches
             this is always False.
         """
-        import numpy as np
-
-        commit_block_3d(
-            cache_data=self.cache_data,
-            cache_tex=self.cache_tex,
-            grid_pos=slot.grid_pos,
-            padded_block_size=self.info.padded_block_size,
-            data=data,
-        )
+        if self.precision == "uint8":
+            staged = np.empty(data.shape, dtype=np.uint8)
+            scale, offset, slot.brick_error = quantize_uint8_into(data, staged)
+            slot.brick_scale, slot.brick_offset = scale, offset
+            sz, sy, sx = slot.grid_pos
+            self.slot_params_data[sz, sy, sx] = (scale, offset)
+            self.slot_params_tex.update_range((sx, sy, sz), (1, 1, 1))
+        else:
+            if self.precision == "float16":
+                slot.brick_error = float16_error_bound(data)
+            staged = np.ascontiguousarray(data, dtype=self.dtype)
+
+        self._uploads.stage(slot, staged, key=key)
         _GPU_LOGGER.debug(
-            "brick_written  key=%s  slot=%d  grid_pos=%s",
+            "brick_written  key=%s  slot=%d  grid_pos=%s  error=%g",
             key,
             slot.index,
             slot.grid_pos,
+            slot.brick_error,
         )
-        if np.issubdtype(self.cache_data.dtype, np.integer):
+        if self.precision == "native" and np.issubdtype(self.dtype, np.integer):
             return bool(np.any(data != background_label))
         return False
 
+    def flush(
+        self, is_live: Callable[[BlockKey3D | None, TileSlot], bool] | None = None
+    ) -> list[StagedSlot]:
+        """Upload staged bricks within this frame's budget without committing.
+
+        Grid-adjacent bricks are merged into one texture write.  Bricks
+        over the budget stay staged for a later frame (see
+        ``begin_frame``).
+
+        Parameters
+        ----------
+        is_live : callable or None
+            ``is_live(key, slot)`` returns False for bricks whose slot was
+            released or reassigned since they were staged; those are
+            dropped unsent.
+
+        Returns
+        -------
+        list[StagedSlot]
+            The bricks sent, in staging order.
+        """
+        return self._uploads.flush(is_live=is_live)
+
+    def flush_uploads(self) -> list[tuple[BlockKey3D, TileSlot]]:
+        """Upload staged bricks within this frame's budget and commit them.
+
+        See ``flush``; bricks whose slot is no longer in flight for them
+        are dropped, and bricks over the budget are not yet renderable.
+
+        Returns
+        -------
+        list[tuple[BlockKey3D, TileSlot]]
+            Bricks committed to ``tile_manager.tilemap`` by this call;
+            the LUT must be rebuilt when it is non-empty.
+        """
+        tile_manager = self.tile_manager
+        sent = self.flush(
+            is_live=lambda key, slot: (
+                key is None or tile_manager.is_in_flight(slot, key)
+            )
+        )
+        committed = []
+        for entry in sent:
+            if entry.key is not None:
+                tile_manager.commit(entry.key, entry.slot)
+                committed.append((entry.key, entry.slot))
+        return committed
+
+    def begin_frame(self) -> None:
+        """Reset the per-frame upload budget; call once per rendered frame."""
+        self._uploads.begin_frame()
+
+    @property
+    def n_pending_uploads(self) -> int:
+        """Number of bricks staged but not yet uploaded."""
+        return self._uploads.n_staged
+
     @property
     def n_resident(self) -> int:
         """Number of hot (rendered) bricks in the cache."""
@@ -147,4 +267,5 @@ class BlockCache3D:
 
     def clear(self) -> None:
         """Evict all resident bricks and reset the cache to empty."""
+        self._uploads.discard()
         self.tile_manager.clear()
@@ -1,15 +1,27 @@
 import numpy as np
 
 from cellier.logging import _GPU_LOGGER
+from cellier.render.block_cache._cache_dtype import cache_texture_format
 from cellier.render.block_cache._cache_parameters_2d import (
     BlockCacheParameters2D,
     build_cache_texture_2d,
 )
+from cellier.render.block_cache._quantization import (
+    CachePrecision,
+    build_slot_params_texture,
+    cache_storage_dtype,
+    float16_error_bound,
+    quantize_uint8_into,
+)
 from cellier.render.block_cache._tile_manager_2d import (
     BlockKey2D,
     TileManager2D,
     TileSlot,
 )
+from cellier.render.block_cache._upload_scheduler import (
+    SlotUploadScheduler,
+    StagedSlot,
+)
 
 
 class BlockCache2D:
@@ -19,6 +31,19 @@ class BlockCache2D:
     ----------
     cache_parameters : BlockCacheParameters2D
         Cache sizing metadata produced by ``compute_block_cache_parameters_2d()``.
+    dtype : np.dtype or None
+        Data type for the cache texture. Defaults to float32.  Ignored by
+        lossy precisions.
+    precision : {"native", "float16", "uint8"}
+        Opt-in lossy storage for float data (see ``_quantization``).
+        ``"native"`` stores *dtype* unchanged.
+    upload_budget_bytes : int or None
+        Maximum tile bytes uploaded per frame (see ``flush_uploads``).
+        ``None`` uploads every staged tile on each flush.
+    tile_manager : TileManager2D or None
+        Slot allocation to share with other caches of the same
+        parameters, which then hold other channels of the same tiles
+        (see ``LayeredBlockCache``).  ``None`` creates a private one.
 
     Attributes
     ----------
@@ -26,46 +51,119 @@ class BlockCache2D:
         Cache sizing metadata (grid dims, slot count, padded block size).
     tile_manager : TileManager2D
         Tile-to-slot mapping with LRU eviction.
-    cache_data : np.ndarray
-        CPU-side backing array, shape ``(cH, cW)``, dtype float32.
+    dtype : np.dtype
+        Dtype the cache texture stores; tiles are cast to it on upload.
     cache_tex : gfx.Texture
-        GPU 2-D float32 texture wrapping ``cache_data``.
+        GPU 2-D texture, shape ``(cH, cW)``, with no CPU-side mirror.
+    slot_params_tex : gfx.Texture or None
+        Per-slot ``(scale, offset)`` RG32Float texture, shape
+        ``(grid_side, grid_side)``; only allocated for ``precision="uint8"``.
     """
 
-    def __init__(self, cache_parameters: BlockCacheParameters2D, dtype=None) -> None:
+    def __init__(
+        self,
+        cache_parameters: BlockCacheParameters2D,
+        dtype=None,
+        precision: CachePrecision = "native",
+        upload_budget_bytes: int | None = None,
+        tile_manager: TileManager2D | None = None,
+    ) -> None:
         self.info = cache_parameters
-        self.tile_manager = TileManager2D(cache_parameters)
-        self.cache_data, self.cache_tex = build_cache_texture_2d(
-            cache_parameters, dtype=dtype
+        self.precision = precision
+        if tile_manager is None:
+            tile_manager = TileManager2D(cache_parameters)
+        self.tile_manager = tile_manager
+        self.dtype, _ = cache_texture_format(cache_storage_dtype(precision) or dtype)
+        self.cache_tex = build_cache_texture_2d(cache_parameters, dtype=self.dtype)
+        self._uploads = SlotUploadScheduler(
+            self.cache_tex, cache_parameters.padded_block_size, upload_budget_bytes
         )
+        self.slot_params_data = None
+        self.slot_params_tex = None
+        if precision == "uint8":
+            gs = cache_parameters.grid_side
+            self.slot_params_data, self.slot_params_tex = build_slot_params_texture(
+                (gs, gs)
+            )
 
     def write_tile(
         self, slot: TileSlot, data: np.ndarray, key: BlockKey2D | None = None
     ) -> None:
-        """Write a padded 2D tile into the CPU array and mark dirty for GPU upload.
+        """Stage a padded 2D tile for upload into *slot*.
+
+        Like ``BlockCache3D.write_brick``: the tile is sent and committed
+        by the next ``flush_uploads``, without a copy when it already has
+        the cache dtype, so it must not be modified afterwards.
 
         Parameters
         ----------
         slot : TileSlot
             Target slot -- ``grid_pos`` determines the write offset.
         data : np.ndarray
-            Float32 array of shape ``(pbs, pbs)`` where
-            ``pbs = block_size + 2 * overlap``.
+            Array of shape ``(pbs, pbs)`` where
+            ``pbs = block_size + 2 * overlap``, cast to the cache dtype.
         key : BlockKey2D or None
-            Tile identity for logging.
+            Tile identity, committed to the tile manager on upload.
+
+        In a lossy cache the tile is rounded (``"float16"``) or quantized
+        (``"uint8"``) on the way in, and ``slot.brick_scale``,
+        ``slot.brick_offset`` and ``slot.brick_error`` describe the result.
         """
         sy, sx = slot.grid_pos
-        pbs = self.info.padded_block_size
-        y0 = sy * pbs
-        x0 = sx * pbs
-        self.cache_data[y0 : y0 + pbs, x0 : x0 + pbs] = data
-        self.cache_tex.update_range(
-            offset=(x0, y0, 0),
-            size=(pbs, pbs, 1),
-        )
+        if self.precision == "uint8":
+            staged = np.empty(data.shape, dtype=np.uint8)
+            scale, offset, slot.brick_error = quantize_uint8_into(data, staged)
+            slot.brick_scale, slot.brick_offset = scale, offset
+            self.slot_params_data[sy, sx] = (scale, offset)
+            self.slot_params_tex.update_range((sx, sy, 0), (1, 1, 1))
+        else:
+            if self.precision == "float16":
+                slot.brick_error = float16_error_bound(data)
+            staged = np.ascontiguousarray(data, dtype=self.dtype)
+        self._uploads.stage(slot, staged, key=key)
         _GPU_LOGGER.debug(
-            "brick_written  key=%s  slot=%d  grid_pos=%s",
+            "brick_written  key=%s  slot=%d  grid_pos=%s  error=%g",
             key,
             slot.index,
             slot.grid_pos,
+            slot.brick_error,
+        )
+
+    def flush(self, is_live=None) -> list[StagedSlot]:
+        """Upload staged tiles within this frame's budget without committing.
+
+        2D counterpart of ``BlockCache3D.flush``.
+        """
+        return self._uploads.flush(is_live=is_live)
+
+    def flush_uploads(self) -> list[tuple[BlockKey2D, TileSlot]]:
+        """Upload staged tiles within this frame's budget and commit them.
+
+        2D counterpart of ``BlockCache3D.flush_uploads``.
+        """
+        tile_manager = self.tile_manager
+        sent = self.flush(
+            is_live=lambda key, slot: (
+                key is None or tile_manager.is_in_flight(slot, key)
+            )
         )
+        committed = []
+        for entry in sent:
+            if entry.key is not None:
+                tile_manager.commit(entry.key, entry.slot)
+                committed.append((entry.key, entry.slot))
+        return committed
+
+    def begin_frame(self) -> None:
+        """Reset the per-frame upload budget; call once per rendered frame."""
+        self._uploads.begin_frame()
+
+    @property
+    def n_pending_uploads(self) -> int:
+        """Number of tiles staged but not yet uploaded."""
+        return self._uploads.n_staged
+
+    def clear(self) -> None:
+        """Evict all resident tiles and reset the cache to empty."""
+        self._uploads.discard()
+        self.tile_manager.clear()
@@ -0,0 +1,92 @@
+"""Choose the GPU cache texture dtype for a store's native dtype.
+
+Image bricks stay in their native dtype on the GPU whenever WebGPU has a
+filterable single-channel texture format for it.  Normalised formats
+(``r8unorm``) sample as ``value / max``, so the shaders multiply the
+sample by ``cache_value_scale`` to get back to data units before the
+contrast limits are applied.
+
+``uint16`` has no filterable 16-bit format in core WebGPU (``r16unorm``
+is a native-only extension and ``r16uint`` cannot be sampled with a
+filtering sampler), so it is widened to float32 like every other dtype
+without a native entry.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+# native dtype -> scale that maps the sampled value back to data units.
+_NATIVE_CACHE_DTYPES: dict[np.dtype, float] = {
+    np.dtype(np.uint8): float(np.iinfo(np.uint8).max),
+    np.dtype(np.float16): 1.0,
+    np.dtype(np.float32): 1.0,
+}
+
+# cache dtype -> pygfx texture format.  Anything else is stored as float32.
+_TEXTURE_FORMATS: dict[np.dtype, str] = {
+    np.dtype(np.float32): "1xf4",
+    np.dtype(np.float16): "1xf2",
+    np.dtype(np.uint8): "1xu1",
+    np.dtype(np.int32): "1xi4",
+}
+
+
+def cache_dtype_for(data_dtype: np.dtype | str | None) -> np.dtype:
+    """Return the image cache dtype used for data of *data_dtype*.
+
+    Parameters
+    ----------
+    data_dtype : np.dtype, str or None
+        Native dtype of the data store.  ``None`` (unknown) selects
+        float32.
+
+    Returns
+    -------
+    np.dtype
+        *data_dtype* itself when it has a native cache format, otherwise
+        float32.
+    """
+    if data_dtype is None:
+        return np.dtype(np.float32)
+    dtype = np.dtype(data_dtype)
+    return dtype if dtype in _NATIVE_CACHE_DTYPES else np.dtype(np.float32)
+
+
+def cache_value_scale(cache_dtype: np.dtype | str) -> float:
+    """Return the factor that maps a sampled cache value to data units.
+
+    Parameters
+    ----------
+    cache_dtype : np.dtype or str
+        Dtype returned by ``cache_dtype_for``.
+
+    Returns
+    -------
+    float
+        ``255.0`` for ``uint8`` (sampled through ``r8unorm``), else ``1.0``.
+    """
+    return _NATIVE_CACHE_DTYPES.get(np.dtype(cache_dtype), 1.0)
+
+
+def cache_texture_format(dtype: np.dtype | str | None) -> tuple[np.dtype, str]:
+    """Return the dtype a cache texture stores for *dtype*, and its format.
+
+    Parameters
+    ----------
+    dtype : np.dtype, str or None
+        Requested cache dtype.  ``None`` selects float32; ``np.int32`` is
+        the label cache dtype.
+
+    Returns
+    -------
+    dtype : np.dtype
+        *dtype* when it has a texture format, otherwise float32.  Bricks
+        are cast to it before upload.
+    format : str
+        pygfx texture format string (``"1xf4"``, ``"1xu1"``, ...).
+    """
+    dtype = np.dtype(np.float32 if dtype is None else dtype)
+    if dtype not in _TEXTURE_FORMATS:
+        dtype = np.dtype(np.float32)
+    return dtype, _TEXTURE_FORMATS[dtype]
@@ -5,6 +5,9 @@ from dataclasses import dataclass
 
 import numpy as np
 import pygfx as gfx
+import wgpu
+
+from cellier.render.block_cache._cache_dtype import cache_texture_format
 
 
 @dataclass(frozen=True)
@@ -34,6 +37,7 @@ def compute_block_cache_parameters_2d(
     block_size: int,
     overlap: int = 1,
     bytes_per_pixel: int = 4,
+    dtype: np.dtype = None,
 ) -> BlockCacheParameters2D:
     """Compute cache dimensions that fit within the GPU memory budget.
 
@@ -48,13 +52,18 @@ def compute_block_cache_parameters_2d(
     overlap : int
         Border pixels duplicated on each side.
     bytes_per_pixel : int
-        Bytes per pixel (4 for float32).
+        Bytes per pixel (4 for float32). Ignored when *dtype* is provided.
+    dtype : np.dtype, optional
+        If provided, overrides *bytes_per_pixel* using
+        ``np.dtype(dtype).itemsize``.
 
     Returns
     -------
     info : BlockCacheParameters2D
         Cache sizing metadata.
     """
+    if dtype is not None:
+        bytes_per_pixel = np.dtype(dtype).itemsize
     padded = block_size + 2 * overlap
     bytes_per_tile = padded * padded * bytes_per_pixel
     max_slots = gpu_budget_bytes // bytes_per_tile
@@ -72,14 +81,15 @@ def compute_block_cache_parameters_2d(
     )
 
 
-_FORMAT_MAP_2D = {np.float32: None, np.int32: "1xi4"}
-
-
 def build_cache_texture_2d(
     cache_info: BlockCacheParameters2D,
     dtype=None,
-) -> tuple[np.ndarray, gfx.Texture]:
-    """Allocate the fixed-size 2D cache texture (zeroed).
+) -> gfx.Texture:
+    """Allocate the fixed-size 2D cache texture on the GPU only.
+
+    The 2D counterpart of ``build_cache_texture_3d``: there is no
+    CPU-side backing array, tiles are uploaded one at a time and
+    unwritten texels read as zero.
 
     Parameters
     ----------
@@ -87,25 +97,20 @@ def build_cache_texture_2d(
         Cache sizing metadata.
     dtype : np.dtype or None
         Data type for the cache texture. Defaults to float32.
-        Pass ``np.int32`` for label caches.
+        ``np.uint8`` and ``np.float16`` allocate ``r8unorm`` and
+        ``r16float`` textures (see ``cache_dtype_for``); pass ``np.int32``
+        for label caches.
 
     Returns
     -------
-    cache_data : np.ndarray
-        The backing array ``(cH, cW)``.
     cache_tex : gfx.Texture
-        pygfx 2D texture wrapping ``cache_data``.
+        pygfx 2D texture of ``(gs * pbs, gs * pbs)`` texels.
     """
-    if dtype is None:
-        dtype = np.float32
-    dtype = np.dtype(dtype)
-    pbs = cache_info.padded_block_size
-    gs = cache_info.grid_side
-    cache_shape = (gs * pbs, gs * pbs)
-    cache_data = np.zeros(cache_shape, dtype=dtype)
-    fmt = _FORMAT_MAP_2D.get(dtype.type)
-    if fmt is not None:
-        cache_tex = gfx.Texture(cache_data, dim=2, format=fmt)
-    else:
-        cache_tex = gfx.Texture(cache_data, dim=2)
-    return cache_data, cache_tex
+    _, fmt = cache_texture_format(dtype)
+    side = cache_info.grid_side * cache_info.padded_block_size
+    return gfx.Texture(
+        dim=2,
+        size=(side, side, 1),
+        format=fmt,
+        usage=wgpu.TextureUsage.COPY_DST,
+    )
@@ -4,6 +4,9 @@ from dataclasses import dataclass
 
 import numpy as np
 import pygfx as gfx
+import wgpu
+
+from cellier.render.block_cache._cache_dtype import cache_texture_format
 
 
 @dataclass(frozen=True)
@@ -40,13 +43,11 @@ class BlockCacheParameters3D:
         ``grid_side ** 3`` — total number of slots including the
         reserved slot 0.
     cache_shape : tuple[int, int, int]
-        Shape of the backing numpy array and GPU texture in numpy axis
-        order ``(cD, cH, cW)``, where each dimension equals
-        ``grid_side * padded_block_size``.
-        Pass directly to ``np.zeros()`` and ``gfx.Texture()``.
-        Note: ``gfx.Texture.update_range()`` uses the reversed
+        Shape of the GPU texture in numpy axis order ``(cD, cH, cW)``,
+        where each dimension equals ``grid_side * padded_block_size``.
+        Note: ``gfx.Texture`` sizes and upload offsets use the reversed
         ``(x, y, z)`` = ``(cW, cH, cD)`` convention — see
-        ``commit_block()`` for the conversion.
+        ``commit_block_3d()`` for the conversion.
     cache_grid : tuple[int, int, int]
         ``(grid_side, grid_side, grid_side)`` — the slot count per
         axis as a tuple.  Retained for completeness; in practice
@@ -122,8 +123,12 @@ def compute_block_cache_parameters_3d(
 def build_cache_texture_3d(
     params: BlockCacheParameters3D,
     dtype: np.dtype = None,
-) -> tuple[np.ndarray, gfx.Texture]:
-    """Allocate the fixed-size cache texture, zeroed.
+) -> gfx.Texture:
+    """Allocate the fixed-size cache texture on the GPU only.
+
+    The texture has no CPU-side backing array: bricks are uploaded one
+    at a time by ``commit_block_3d``, so host memory does not scale with
+    the cache size.  Unwritten voxels read as zero.
 
     Parameters
     ----------
@@ -131,44 +136,42 @@ def build_cache_texture_3d(
         Cache sizing metadata.
     dtype : np.dtype or None
         Data type for the cache texture. Defaults to float32.
-        Pass ``np.int32`` for label caches.
+        ``np.uint8`` and ``np.float16`` allocate ``r8unorm`` and
+        ``r16float`` textures (see ``cache_dtype_for``); pass ``np.int32``
+        for label caches.
 
     Returns
     -------
-    cache_data : np.ndarray
-        CPU-side backing array of shape ``(cD, cH, cW)``.
     cache_tex : gfx.Texture
-        pygfx 3-D texture wrapping ``cache_data``.
+        pygfx 3-D texture of size ``cache_shape`` (reversed to
+        ``(cW, cH, cD)``).
     """
-    _FORMAT_MAP = {np.float32: "1xf4", np.int32: "1xi4"}
-    if dtype is None:
-        dtype = np.float32
-    else:
-        dtype = np.dtype(dtype).type
-    fmt = _FORMAT_MAP.get(dtype, "1xf4")
-    cache_data = np.zeros(params.cache_shape, dtype=dtype)
-    cache_tex = gfx.Texture(cache_data, dim=3, format=fmt)
-    return cache_data, cache_tex
+    _, fmt = cache_texture_format(dtype)
+    return gfx.Texture(
+        dim=3,
+        size=tuple(reversed(params.cache_shape)),
+        format=fmt,
+        usage=wgpu.TextureUsage.COPY_DST,
+    )
 
 
 def commit_block_3d(
-    cache_data: np.ndarray,
     cache_tex: gfx.Texture,
     grid_pos: tuple[int, int, int],
     padded_block_size: int,
     data: np.ndarray,
 ) -> None:
-    """Write a padded brick into the CPU cache array and schedule a GPU upload.
+    """Schedule the upload of a padded brick into one cache slot.
 
     The GPU transfer is deferred until the next ``renderer.render()`` call
-    (pygfx ``update_range`` semantics).
+    (pygfx ``send_data`` semantics).  *data* is uploaded as is — no
+    staging copy is made when it is already C-contiguous — so it must not
+    be modified until then.
 
     Parameters
     ----------
-    cache_data : np.ndarray
-        CPU-side backing array for the cache texture.
     cache_tex : gfx.Texture
-        pygfx texture to mark dirty for upload.
+        Cache texture built by ``build_cache_texture_3d``.
     grid_pos : tuple[int, int, int]
         Slot grid indices (slot_index_z, slot_index_y, slot_index_x)
         in numpy axis order.
@@ -176,19 +179,16 @@ def commit_block_3d(
         Side length of the padded brick in voxels
         (block_size + 2 * overlap).
     data : np.ndarray
-        Float32 block of data to commit of shape
-        (padded_block_size, padded_block_size, padded_block_size).
+        Block of data to commit of shape
+        (padded_block_size, padded_block_size, padded_block_size), already
+        in the cache dtype.
     """
     slot_index_z, slot_index_y, slot_index_x = grid_pos
-    z_start = slot_index_z * padded_block_size
-    y_start = slot_index_y * padded_block_size
-    x_start = slot_index_x * padded_block_size
-    cache_data[
-        z_start : z_start + padded_block_size,
-        y_start : y_start + padded_block_size,
-        x_start : x_start + padded_block_size,
-    ] = data
-    cache_tex.update_range(
-        offset=(x_start, y_start, z_start),
-        size=(padded_block_size, padded_block_size, padded_block_size),
+    cache_tex.send_data(
+        offset=(
+            slot_index_x * padded_block_size,
+            slot_index_y * padded_block_size,
+            slot_index_z * padded_block_size,
+        ),
+        data=data,
     )
@@ -0,0 +1,156 @@
+"""Per-channel cache textures that share one slot allocation.
+
+A multichannel image plans identical bricks for every channel.  Giving
+each channel its own tile manager and LUT would duplicate the slot
+bookkeeping, the LUT texture and every LUT rebuild once per channel.
+``LayeredBlockCache`` instead treats the channels' caches as *layers*:
+every layer is a ``BlockCache3D`` / ``BlockCache2D`` with the same
+parameters, built over the same tile manager, so a brick occupies the
+same slot in every layer and one LUT addresses all of them.
+
+Layers must stay in lockstep: a brick is committed to the shared tile
+manager only once its data has been sent to every layer.  ``write``
+therefore stages a slot in all layers at once, and ``flush_uploads``
+sends every layer before committing.  Layers staged together with
+equal-sized bricks and equal budgets send the same slots on every
+flush; should one layer fall behind, a slot it has not sent yet stays
+uncommitted until it has, so the channels of a brick always become
+renderable together.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from cellier.logging import _GPU_LOGGER
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Sequence
+
+    import numpy as np
+
+    from cellier.render.block_cache._block_cache import BlockCache3D
+    from cellier.render.block_cache._block_cache_2d import BlockCache2D
+
+
+class LayeredBlockCache:
+    """Block caches that share one tile manager, written and flushed together.
+
+    Parameters
+    ----------
+    layers : Sequence[BlockCache3D | BlockCache2D]
+        One cache per channel, all built over the same ``tile_manager``.
+
+    Attributes
+    ----------
+    layers : list[BlockCache3D | BlockCache2D]
+        The per-channel caches, in the order ``write`` expects data.
+    tile_manager : TileManager3D or TileManager2D
+        The slot allocation shared by every layer.
+
+    Raises
+    ------
+    ValueError
+        If *layers* is empty or the layers do not share a tile manager.
+    """
+
+    def __init__(self, layers: Sequence[BlockCache3D | BlockCache2D]) -> None:
+        if not layers:
+            raise ValueError("LayeredBlockCache needs at least one layer")
+        self.layers = list(layers)
+        self.tile_manager = self.layers[0].tile_manager
+        if any(layer.tile_manager is not self.tile_manager for layer in layers):
+            raise ValueError("all layers must share one tile manager")
+        self._writes = [
+            getattr(layer, "write_brick", None) or layer.write_tile
+            for layer in self.layers
+        ]
+        # (slot index, key) -> [slot, number of layers that have sent it].
+        self._sent: dict[tuple[int, Hashable], list] = {}
+
+    def __len__(self) -> int:
+        return len(self.layers)
+
+    @property
+    def info(self):
+        """Cache sizing metadata, identical for every layer."""
+        return self.layers[0].info
+
+    def write(
+        self, slot, layer_data: Sequence[np.ndarray], key: Hashable | None = None
+    ) -> None:
+        """Stage one brick / tile in every layer.
+
+        Parameters
+        ----------
+        slot : TileSlot
+            Target slot, shared by all layers.
+        layer_data : Sequence[np.ndarray]
+            One padded array per layer, in layer order.
+        key : Hashable or None
+            Brick / tile identity, committed once every layer is sent.
+        """
+        if len(layer_data) != len(self.layers):
+            raise ValueError(
+                f"expected {len(self.layers)} layers of data, got {len(layer_data)}"
+            )
+        for write, data in zip(self._writes, layer_data):
+            write(slot, data, key=key)
+
+    def flush_uploads(self) -> list[tuple]:
+        """Send every layer's staged writes, then commit slots all layers sent.
+
+        A slot is committed once every layer has sent it, in this call or
+        an earlier one; slots that are no longer in flight for their key
+        are forgotten.
+
+        Returns
+        -------
+        list[tuple]
+            ``(key, slot)`` pairs committed to the shared tile manager;
+            the LUT must be rebuilt when it is non-empty.
+        """
+        tile_manager = self.tile_manager
+
+        # Liveness is checked against the tile manager before anything is
+        # committed, so every layer makes the same decision for a slot.
+        def is_live(key, slot) -> bool:
+            return key is None or tile_manager.is_in_flight(slot, key)
+
+        for layer in self.layers:
+            for entry in layer.flush(is_live=is_live):
+                if entry.key is None:
+                    continue
+                sent = self._sent.setdefault(
+                    (entry.slot.index, entry.key), [entry.slot, 0]
+                )
+                sent[1] += 1
+
+        committed = []
+        for ident, (slot, n_sent) in list(self._sent.items()):
+            key = ident[1]
+            if not is_live(key, slot):
+                del self._sent[ident]
+            elif n_sent >= len(self.layers):
+                del self._sent[ident]
+                tile_manager.commit(key, slot)
+                committed.append((key, slot))
+        if self._sent:
+            _GPU_LOGGER.debug("layer_flush_partial  slots=%d", len(self._sent))
+        return committed
+
+    def begin_frame(self) -> None:
+        """Reset every layer's per-frame upload budget."""
+        for layer in self.layers:
+            layer.begin_frame()
+
+    @property
+    def n_pending_uploads(self) -> int:
+        """Number of slots staged but not yet uploaded in some layer."""
+        return max(layer.n_pending_uploads for layer in self.layers)
+
+    def clear(self) -> None:
+        """Drop staged writes in every layer and empty the shared tile manager."""
+        for layer in self.layers:
+            layer.clear()
+        self._sent.clear()
@@ -0,0 +1,453 @@
+"""Array-native tile manager keyed by packed int64 brick IDs.
+
+``TileManager3D`` keeps one ``BlockKey3D`` and one ``TileSlot`` object
+per brick in dicts, and the planner builds a ``BlockKey3D`` per planned
+row (``arr_to_brick_keys``).  With tens of thousands of planned bricks
+that bookkeeping is Python-object-bound.  ``PackedTileManager3D`` has
+the same slot lifecycle -- stage / commit / release, a reserve tier,
+deferred demotion and reserve-first LRU eviction -- but works on arrays:
+
+* A brick is one int64 ID packing ``(slice_id, level, g0, g1, g2)``
+  (see ``pack_brick_ids``); ``slice_id`` indexes the manager's registry
+  of ``slice_coord`` tuples.
+* Slot metadata (state, brick ID, timestamp, brick max, commit order)
+  lives in per-slot numpy arrays.
+* ``stage`` takes the planner's ``(M, 4)`` ``[level, g0, g1, g2]`` brick
+  array directly and classifies hits, reserve promotions and misses with
+  ``np.isin`` against the occupied slots.  LRU victims are chosen with
+  one ``np.lexsort``.
+
+``resident_bricks()`` exports the hot set without a per-brick pass, so
+``rebuild_lut`` accepts this manager in place of ``TileManager3D``.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from cellier.logging import _CACHE_LOGGER
+from cellier.render.block_cache._tile_manager_3d import ResidentBricks3D
+
+if TYPE_CHECKING:
+    from cellier.render.block_cache._cache_parameters_3d import (
+        BlockCacheParameters3D,
+    )
+
+# ── Brick ID packing ─────────────────────────────────────────────────────
+
+_GRID_BITS = 14
+_LEVEL_BITS = 5
+_SLICE_BITS = 16
+_GRID_MASK = (1 << _GRID_BITS) - 1
+_LEVEL_MASK = (1 << _LEVEL_BITS) - 1
+_LEVEL_SHIFT = 3 * _GRID_BITS
+_SLICE_SHIFT = _LEVEL_SHIFT + _LEVEL_BITS
+
+# Slot states.  Slot 0 is the reserved out-of-bounds slot.
+_FREE = 0
+_IN_FLIGHT = 1
+_HOT = 2
+_RESERVE = 3
+_SENTINEL = 4
+
+
+def pack_brick_ids(brick_arr: np.ndarray, slice_id: int = 0) -> np.ndarray:
+    """Pack ``[level, g0, g1, g2]`` rows and a slice ID into int64 brick IDs.
+
+    Parameters
+    ----------
+    brick_arr : np.ndarray
+        ``(M, 4)`` integer array with columns ``[level, g0, g1, g2]``.
+    slice_id : int
+        Registry index of the rows' ``slice_coord``.
+
+    Returns
+    -------
+    np.ndarray
+        ``(M,)`` int64 IDs, non-negative.
+
+    Raises
+    ------
+    ValueError
+        If a level, grid position or the slice ID does not fit its field.
+    """
+    rows = np.asarray(brick_arr, dtype=np.int64).reshape(-1, 4)
+    level, grid = rows[:, 0], rows[:, 1:]
+    if (
+        np.any(level < 0)
+        or np.any(level > _LEVEL_MASK)
+        or np.any(grid < 0)
+        or np.any(grid > _GRID_MASK)
+        or not 0 <= slice_id < (1 << _SLICE_BITS)
+    ):
+        raise ValueError(
+            f"brick rows must have 0 <= level <= {_LEVEL_MASK}, "
+            f"0 <= g <= {_GRID_MASK} and slice_id < {1 << _SLICE_BITS}"
+        )
+    return (
+        (np.int64(slice_id) << _SLICE_SHIFT)
+        | (level << _LEVEL_SHIFT)
+        | (grid[:, 0] << (2 * _GRID_BITS))
+        | (grid[:, 1] << _GRID_BITS)
+        | grid[:, 2]
+    )
+
+
+def unpack_brick_ids(
+    brick_ids: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Split packed brick IDs back into their fields.
+
+    Returns
+    -------
+    level : np.ndarray
+        ``(M,)`` int32.
+    grid : np.ndarray
+        ``(M, 3)`` int64 ``(g0, g1, g2)``.
+    slice_id : np.ndarray
+        ``(M,)`` int32.
+    """
+    ids = np.asarray(brick_ids, dtype=np.int64)
+    grid = np.stack(
+        (
+            (ids >> (2 * _GRID_BITS)) & _GRID_MASK,
+            (ids >> _GRID_BITS) & _GRID_MASK,
+            ids & _GRID_MASK,
+        ),
+        axis=-1,
+    )
+    level = ((ids >> _LEVEL_SHIFT) & _LEVEL_MASK).astype(np.int32)
+    slice_id = (ids >> _SLICE_SHIFT).astype(np.int32)
+    return level, grid, slice_id
+
+
+class PackedTileManager3D:
+    """Brick-to-slot mapping held in numpy arrays, keyed by packed IDs.
+
+    Semantics match ``TileManager3D``: staged misses are in flight until
+    ``commit``; hot bricks the new plan drops are demoted to the reserve
+    tier once every load of the plan has committed; reserve hits are
+    promoted without a load; eviction takes the least-recently-used
+    reserve brick first, then the least-recently-used hot brick.
+
+    Parameters
+    ----------
+    cache_parameters : BlockCacheParameters3D
+        Cache sizing metadata (grid dimensions, slot count, etc.).
+
+    Attributes
+    ----------
+    slot_state : np.ndarray
+        ``(n_slots,)`` int8 lifecycle state of each slot.
+    slot_brick : np.ndarray
+        ``(n_slots,)`` int64 packed ID of the slot's brick; ``-1`` when free.
+    slot_timestamp : np.ndarray
+        ``(n_slots,)`` int64 frame number of the last access (LRU).
+    slot_brick_max : np.ndarray
+        ``(n_slots,)`` float32 maximum of the resident brick.
+    """
+
+    def __init__(self, cache_parameters: BlockCacheParameters3D) -> None:
+        self.cache_parameters = cache_parameters
+        n_slots = cache_parameters.n_slots
+        self.slot_state = np.full(n_slots, _FREE, dtype=np.int8)
+        self.slot_state[0] = _SENTINEL
+        self.slot_brick = np.full(n_slots, -1, dtype=np.int64)
+        self.slot_timestamp = np.zeros(n_slots, dtype=np.int64)
+        self.slot_brick_max = np.zeros(n_slots, dtype=np.float32)
+        # Commit sequence number, so the hot set exports in commit order.
+        self._slot_commit_seq = np.zeros(n_slots, dtype=np.int64)
+        self._n_commits = 0
+        # Hot slots to demote to reserve once the current plan fully loads.
+        self._pending_demote = np.zeros(n_slots, dtype=bool)
+        self._pending_plan_count = 0
+
+        self._slice_ids: dict[tuple[tuple[int, int], ...], int] = {}
+        self._slice_coords: list[tuple[tuple[int, int], ...]] = []
+
+    # ── Brick IDs ────────────────────────────────────────────────────────
+
+    def slice_id(self, slice_coord: tuple[tuple[int, int], ...] = ()) -> int:
+        """Return the registry index of *slice_coord*, registering it if new."""
+        slice_id = self._slice_ids.get(slice_coord)
+        if slice_id is None:
+            slice_id = len(self._slice_coords)
+            self._slice_ids[slice_coord] = slice_id
+            self._slice_coords.append(slice_coord)
+        return slice_id
+
+    def brick_ids(
+        self,
+        brick_arr: np.ndarray,
+        slice_coord: tuple[tuple[int, int], ...] = (),
+    ) -> np.ndarray:
+        """Pack planner rows ``[level, g0, g1, g2]`` at *slice_coord* into IDs."""
+        return pack_brick_ids(brick_arr, self.slice_id(slice_coord))
+
+    def slot_grid_pos(self, slots: np.ndarray) -> np.ndarray:
+        """Convert flat slot indices to ``(sz, sy, sx)`` cache-grid rows."""
+        gs = self.cache_parameters.grid_side
+        slots = np.asarray(slots, dtype=np.int64)
+        sz, rem = np.divmod(slots, gs * gs)
+        sy, sx = np.divmod(rem, gs)
+        return np.stack((sz, sy, sx), axis=-1)
+
+    # ── Slot lifecycle ───────────────────────────────────────────────────
+
+    def stage(
+        self,
+        brick_arr: np.ndarray,
+        frame_number: int,
+        slice_coord: tuple[tuple[int, int], ...] = (),
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Process the planned bricks: mark hits, promote reserve hits, queue misses.
+
+        Same rules as ``TileManager3D.stage``: hot hits refresh their
+        timestamp, reserve hits are promoted, in-flight bricks the plan
+        still needs are adopted and the others released, and hot bricks
+        the plan drops are demoted once the plan has fully loaded.
+
+        Parameters
+        ----------
+        brick_arr : np.ndarray
+            ``(M, 4)`` planned rows ``[level, g0, g1, g2]``, in priority
+            order.  Duplicate rows are staged once.
+        frame_number : int
+            Current frame number for LRU timestamps.
+        slice_coord : tuple of (axis_index, world_value) pairs
+            Slice position shared by every planned brick.
+
+        Returns
+        -------
+        miss_ids : np.ndarray
+            int64 IDs of the bricks that need loading, in plan order.
+        miss_slots : np.ndarray
+            int64 slot allocated to each miss.
+
+        Raises
+        ------
+        RuntimeError
+            If there are more misses than free and evictable slots.
+        """
+        planned = self.brick_ids(brick_arr, slice_coord)
+        _, first = np.unique(planned, return_index=True)
+        planned = planned[np.sort(first)]
+
+        state = self.slot_state
+        required = np.isin(self.slot_brick, planned)
+        self._pending_demote = (state == _HOT) & ~required
+
+        # Release in-flight bricks the new plan no longer needs.
+        released = (state == _IN_FLIGHT) & ~required
+        state[released] = _FREE
+        self.slot_brick[released] = -1
+        n_adopted = int(np.count_nonzero(state == _IN_FLIGHT))
+
+        hot_hits = (state == _HOT) & required
+        promoted = (state == _RESERVE) & required
+        state[promoted] = _HOT
+        self.slot_timestamp[hot_hits | promoted] = frame_number
+        self._stamp_commit_order(np.flatnonzero(promoted))
+
+        occupied = self.slot_brick[(state == _HOT) | (state == _RESERVE)]
+        loading = self.slot_brick[state == _IN_FLIGHT]
+        miss_ids = planned[~np.isin(planned, np.concatenate((occupied, loading)))]
+
+        self._pending_plan_count = len(miss_ids) + n_adopted
+        if self._pending_plan_count == 0:
+            self._flush_pending_demote()
+
+        miss_slots, n_evictions = self._allocate(len(miss_ids))
+        state[miss_slots] = _IN_FLIGHT
+        self.slot_brick[miss_slots] = miss_ids
+        self.slot_timestamp[miss_slots] = frame_number
+        self.slot_brick_max[miss_slots] = 0.0
+        self._pending_demote[miss_slots] = False
+
+        _CACHE_LOGGER.debug(
+            "cache_state  frame=%d  hot=%d  reserve=%d  hot_hits=%d  "
+            "reserve_hits=%d  adopted=%d  misses=%d  evictions=%d  "
+            "pending_demote=%d",
+            frame_number,
+            self.n_hot,
+            self.n_reserve,
+            int(np.count_nonzero(hot_hits)),
+            int(np.count_nonzero(promoted)),
+            n_adopted,
+            len(miss_ids),
+            n_evictions,
+            int(np.count_nonzero(self._pending_demote)),
+        )
+        return miss_ids, miss_slots
+
+    def commit(self, brick_ids, slots) -> None:
+        """Move bricks from in-flight to hot (renderable).
+
+        Call after the bricks' data has been written to their cache
+        slots.  When this completes the current plan, pending demotions
+        fire, as in ``TileManager3D.commit``.
+
+        Parameters
+        ----------
+        brick_ids : int or np.ndarray
+            Packed IDs of the bricks being committed.
+        slots : int or np.ndarray
+            Slot allocated to each brick by ``stage``.
+        """
+        brick_ids = np.atleast_1d(np.asarray(brick_ids, dtype=np.int64))
+        slots = np.atleast_1d(np.asarray(slots, dtype=np.int64))
+        self.slot_state[slots] = _HOT
+        self.slot_brick[slots] = brick_ids
+        self._stamp_commit_order(slots)
+
+        self._pending_plan_count = max(0, self._pending_plan_count - len(slots))
+        if self._pending_plan_count == 0 and self._pending_demote.any():
+            self._flush_pending_demote()
+
+    def release_all_in_flight(self) -> None:
+        """Return all in-flight slots to the free pool.
+
+        ``TileManager3D.release_all_in_flight`` semantics: hot bricks
+        are untouched and the plan accounting is reset.
+        """
+        in_flight = self.slot_state == _IN_FLIGHT
+        self.slot_state[in_flight] = _FREE
+        self.slot_brick[in_flight] = -1
+        self._pending_plan_count = 0
+        self._pending_demote[:] = False
+
+    def set_brick_max(self, slots, brick_max) -> None:
+        """Record the maximum of the bricks written to *slots*."""
+        self.slot_brick_max[np.asarray(slots, dtype=np.int64)] = brick_max
+
+    def missing(
+        self,
+        brick_arr: np.ndarray,
+        slice_coord: tuple[tuple[int, int], ...] = (),
+    ) -> np.ndarray:
+        """Return the rows of *brick_arr* that are neither resident nor loading.
+
+        Read-only, like ``TileManager3D.missing``.
+        """
+        occupied = self.slot_brick[
+            (self.slot_state == _HOT)
+            | (self.slot_state == _RESERVE)
+            | (self.slot_state == _IN_FLIGHT)
+        ]
+        return brick_arr[~np.isin(self.brick_ids(brick_arr, slice_coord), occupied)]
+
+    def evict_finer_than(self, min_level: int) -> int:
+        """Evict all hot bricks with level < min_level; return how many."""
+        level, _, _ = unpack_brick_ids(self.slot_brick)
+        evict = (self.slot_state == _HOT) & (level < min_level)
+        self.slot_state[evict] = _FREE
+        self.slot_brick[evict] = -1
+        n = int(np.count_nonzero(evict))
+        if n:
+            _CACHE_LOGGER.debug(
+                "evict_finer_than  min_level=%d  evicted=%d", min_level, n
+            )
+        return n
+
+    def clear(self) -> None:
+        """Reset to an empty cache, discarding all committed and in-flight bricks."""
+        self.slot_state[1:] = _FREE
+        self.slot_brick[:] = -1
+        self._pending_demote[:] = False
+        self._pending_plan_count = 0
+
+    # ── Queries ──────────────────────────────────────────────────────────
+
+    @property
+    def n_hot(self) -> int:
+        """Number of hot (rendered) bricks."""
+        return int(np.count_nonzero(self.slot_state == _HOT))
+
+    @property
+    def n_reserve(self) -> int:
+        """Number of warm (GPU-present, not rendered) bricks."""
+        return int(np.count_nonzero(self.slot_state == _RESERVE))
+
+    @property
+    def in_flight(self) -> dict[int, int]:
+        """Slot index -> packed ID for staged but uncommitted bricks."""
+        slots = np.flatnonzero(self.slot_state == _IN_FLIGHT)
+        return dict(zip(slots.tolist(), self.slot_brick[slots].tolist()))
+
+    def hot_slots(self, brick_ids: np.ndarray) -> np.ndarray:
+        """Return the hot slot of each brick ID, or ``-1`` when not hot."""
+        brick_ids = np.asarray(brick_ids, dtype=np.int64)
+        hot = np.flatnonzero(self.slot_state == _HOT)
+        order = np.argsort(self.slot_brick[hot])
+        sorted_ids = self.slot_brick[hot][order]
+        pos = np.searchsorted(sorted_ids, brick_ids)
+        pos = np.minimum(pos, max(len(sorted_ids) - 1, 0))
+        found = (len(sorted_ids) > 0) & (sorted_ids[pos] == brick_ids)
+        return np.where(found, hot[order][pos], -1)
+
+    def resident_bricks(self) -> ResidentBricks3D:
+        """Export the hot bricks as a struct of arrays, in commit order."""
+        hot = np.flatnonzero(self.slot_state == _HOT)
+        hot = hot[np.argsort(self._slot_commit_seq[hot], kind="stable")]
+        level, grid, slice_id = unpack_brick_ids(self.slot_brick[hot])
+        return ResidentBricks3D(
+            level=level,
+            grid=grid,
+            slot_grid_pos=self.slot_grid_pos(hot).astype(np.int32),
+            brick_max=self.slot_brick_max[hot],
+            slice_id=slice_id,
+            slice_coords=list(self._slice_coords),
+        )
+
+    # ── Internal helpers ─────────────────────────────────────────────────
+
+    def _allocate(self, n: int) -> tuple[np.ndarray, int]:
+        """Return *n* slots for new bricks and the number of evictions.
+
+        Free slots are used first, lowest index first.  The rest are
+        evicted: reserve before hot, oldest timestamp first, then lowest
+        index.  In-flight slots are never evicted.
+        """
+        free = np.flatnonzero(self.slot_state == _FREE)
+        if len(free) >= n:
+            return free[:n], 0
+        n_evict = n - len(free)
+        state = self.slot_state
+        candidates = np.flatnonzero((state == _HOT) | (state == _RESERVE))
+        if len(candidates) < n_evict:
+            raise RuntimeError("_allocate: no valid victim for every miss")
+        order = np.lexsort(
+            (
+                candidates,
+                self.slot_timestamp[candidates],
+                state[candidates] != _RESERVE,
+            )
+        )
+        victims = candidates[order[:n_evict]]
+        _CACHE_LOGGER.debug(
+            "evict  reserve=%d  hot=%d",
+            int(np.count_nonzero(state[victims] == _RESERVE)),
+            int(np.count_nonzero(state[victims] == _HOT)),
+        )
+        return np.concatenate((free, victims)), n_evict
+
+    def _stamp_commit_order(self, slots: np.ndarray) -> None:
+        """Record *slots* as the most recently (re)entered hot bricks."""
+        self._slot_commit_seq[slots] = np.arange(
+            self._n_commits, self._n_commits + len(slots)
+        )
+        self._n_commits += len(slots)
+
+    def _flush_pending_demote(self) -> int:
+        """Move pending-demote hot bricks to the reserve tier; return how many."""
+        demote = self._pending_demote & (self.slot_state == _HOT)
+        self.slot_state[demote] = _RESERVE
+        self._pending_demote[:] = False
+        n = int(np.count_nonzero(demote))
+        if n:
+            _CACHE_LOGGER.debug(
+                "demote_to_reserve  count=%d  reserve_size=%d", n, self.n_reserve
+            )
+        return n
@@ -0,0 +1,105 @@
+"""Lossy cache precisions for float image data.
+
+A float32 image cache can opt into a narrower on-GPU representation:
+
+``"float16"``
+    Bricks are stored as ``r16float``.  The store still delivers float32
+    (or reads straight into the float16 slot); the cast rounds each voxel
+    to the nearest half-precision value.
+``"uint8"``
+    Each brick is linearly quantized to 8-bit codes with its own
+    ``scale`` / ``offset`` (``value = code * scale + offset``), stored as
+    ``r8unorm``.  The per-slot scale and offset live in a small slot-params
+    texture that the shader reads next to the cache sample.
+
+Both modes report a per-brick absolute error bound on the slot
+(``brick_error``).
+"""
+
+from __future__ import annotations
+
+from typing import Literal
+
+import numpy as np
+import pygfx as gfx
+
+CachePrecision = Literal["native", "float16", "uint8"]
+
+_FLOAT16_MAX = float(np.finfo(np.float16).max)
+
+
+def cache_storage_dtype(precision: CachePrecision) -> np.dtype | None:
+    """Return the cache dtype a lossy *precision* stores, or ``None`` for native."""
+    if precision == "float16":
+        return np.dtype(np.float16)
+    if precision == "uint8":
+        return np.dtype(np.uint8)
+    return None
+
+
+def build_slot_params_texture(
+    grid_shape: tuple[int, ...],
+) -> tuple[np.ndarray, gfx.Texture]:
+    """Allocate the per-slot ``(scale, offset)`` texture of a quantized cache.
+
+    Parameters
+    ----------
+    grid_shape : tuple[int, ...]
+        Slot count per cache axis in numpy order (2 or 3 axes).
+
+    Returns
+    -------
+    slot_params_data : np.ndarray
+        float32 array of shape ``(*grid_shape, 2)``, initialised to the
+        identity ``(1, 0)``.
+    slot_params_tex : gfx.Texture
+        RG32Float texture wrapping ``slot_params_data``.
+    """
+    slot_params_data = np.zeros((*grid_shape, 2), dtype=np.float32)
+    slot_params_data[..., 0] = 1.0
+    slot_params_tex = gfx.Texture(
+        slot_params_data, dim=len(grid_shape), format="rg32float"
+    )
+    return slot_params_data, slot_params_tex
+
+
+def quantize_uint8_into(
+    data: np.ndarray, out: np.ndarray
+) -> tuple[float, float, float]:
+    """Quantize *data* to 8-bit codes spanning its own value range.
+
+    Parameters
+    ----------
+    data : np.ndarray
+        Brick values in data units.
+    out : np.ndarray
+        ``uint8`` destination of the same shape (usually a cache slot view).
+
+    Returns
+    -------
+    scale, offset, error : float
+        ``data ≈ out * scale + offset``; *error* bounds the absolute
+        reconstruction error (half a quantization step).
+    """
+    offset = float(data.min())
+    scale = (float(data.max()) - offset) / 255.0
+    if scale > 0.0:
+        codes = np.subtract(data, offset, dtype=np.float32)
+        codes *= np.float32(1.0 / scale)
+        np.rint(codes, out=codes)
+        out[...] = np.clip(codes, 0, 255)
+    else:
+        out[...] = 0
+    return scale, offset, 0.5 * scale
+
+
+def float16_error_bound(data: np.ndarray) -> float:
+    """Return the absolute rounding error bound of storing *data* as float16.
+
+    Half an ulp at the brick's largest magnitude; ``inf`` when that
+    magnitude overflows float16.
+    """
+    absmax = float(np.abs(data).max())
+    if absmax > _FLOAT16_MAX:
+        return float("inf")
+    return 0.5 * float(np.spacing(np.float16(absmax)))
@@ -10,12 +10,28 @@ Slot lifecycle
 2. ``commit()``                -- called after data is written to the
                                   GPU cache; moves the entry from
                                   ``_in_flight`` into ``tilemap`` and
-                                  pushes it onto the LRU heap.
+                                  pushes it onto the LRU heap.  When
+                                  the last outstanding load commits,
+                                  ``_flush_pending_demote()`` fires
+                                  automatically.
 3. ``release_all_in_flight()`` -- called on cancellation; returns all
                                   reserved-but-not-yet-committed slots
                                   to ``free_slots``.  ``tilemap`` is
                                   untouched, so only valid tiles remain
                                   renderable.
+
+A replan may also call ``stage()`` while tiles are still in flight: those
+the new plan requires are adopted (their slots stay reserved and they are
+not returned as misses) and the rest are released.
+
+Reserve tier
+------------
+Tiles the current plan no longer needs -- typically those of a previous
+slice position -- stay in ``tilemap`` as placeholders until every miss
+of the new plan has committed, then move to ``_reserve``.  Reserve tiles
+keep their GPU data but have no LUT entry; re-planning one (e.g. going
+back to a previously viewed z-plane) promotes it to ``tilemap`` with no
+fetch.  Under memory pressure reserve tiles are evicted before hot ones.
 """
 
 from __future__ import annotations
@@ -28,6 +44,8 @@ from typing import TYPE_CHECKING
 from cellier.logging import _CACHE_LOGGER
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from cellier.render.block_cache._cache_parameters_2d import (
         BlockCacheParameters2D,
     )
@@ -71,17 +89,26 @@ class TileSlot:
         ``(sy, sx)`` in the cache grid.
     timestamp : int
         Frame number when last accessed (for LRU).
+    brick_scale, brick_offset : float
+        Dequantization of the resident tile (``value = code * scale +
+        offset``); identity unless the cache precision is ``"uint8"``.
+    brick_error : float
+        Absolute error bound of the resident tile in a lossy cache.
     """
 
     index: int
     grid_pos: tuple[int, int]
     timestamp: int = 0
+    brick_scale: float = 1.0
+    brick_offset: float = 0.0
+    brick_error: float = 0.0
 
 
 class TileManager2D:
     """Manage tile-to-slot mapping with LRU eviction and late insertion.
 
-    Uses a min-heap with lazy deletion for O(log N) eviction.
+    Uses min-heaps with lazy deletion for O(log N) eviction, draining the
+    reserve tier before evicting hot (rendered) tiles.
 
     Parameters
     ----------
@@ -94,7 +121,9 @@ class TileManager2D:
 
         # tile -> slot  (committed, renderable tiles only)
         self.tilemap: dict[BlockKey2D, TileSlot] = {}
-        # slot index -> tile  (committed tiles only; None = free or in-flight)
+        # tile -> slot  (GPU data present, NOT rendered, NOT in LUT)
+        self._reserve: dict[BlockKey2D, TileSlot] = {}
+        # slot index -> tile  (hot or reserve; None = free or in-flight)
         self.slot_index: dict[int, BlockKey2D | None] = {
             i: None for i in range(cache_parameters.n_slots)
         }
@@ -106,8 +135,15 @@ class TileManager2D:
         # slot index -> tile  (allocated by stage() but not yet committed)
         self._in_flight: dict[int, BlockKey2D] = {}
 
-        # Min-heap of (timestamp, slot_index) tuples.
+        # Min-heap of (timestamp, slot_index) tuples for hot tiles.
         self._lru_heap: list[tuple[int, int]] = []
+        # Min-heap of (timestamp, slot_index) tuples for reserve tiles.
+        self._reserve_lru_heap: list[tuple[int, int]] = []
+
+        # Hot tiles to demote to reserve once the current plan fully loads.
+        self._pending_demote: set[BlockKey2D] = set()
+        # Number of outstanding loads (misses) for the current plan.
+        self._pending_plan_count: int = 0
 
     def _slot_grid_pos(self, flat_idx: int) -> tuple[int, int]:
         """Convert flat slot index to 2D grid position ``(sy, sx)``."""
@@ -120,12 +156,22 @@ class TileManager2D:
         required: dict[BlockKey2D, int],
         frame_number: int,
     ) -> list[tuple[BlockKey2D, TileSlot]]:
-        """Process required tiles: mark hits, reserve slots for misses.
+        """Process required tiles: mark hits, promote reserve hits, queue misses.
+
+        Hits update the timestamp of the existing committed slot.  Reserve
+        hits are promoted back into ``tilemap`` with no load.  Misses
+        allocate a slot (evicting LRU if necessary) and record it in
+        ``_in_flight``.  The slot is **not** added to ``tilemap`` here --
+        only ``commit()`` does that.
+
+        Committed tiles absent from ``required`` are recorded in
+        ``_pending_demote`` and moved to ``_reserve`` once every miss of
+        this plan has committed, so they keep rendering as a placeholder
+        while the new tiles load.
 
-        Hits update the timestamp of the existing committed slot.
-        Misses allocate a slot (evicting LRU if necessary) and record it
-        in ``_in_flight``.  The slot is **not** added to ``tilemap`` here
-        -- only ``commit()`` does that.
+        Tiles already in flight from an earlier plan are adopted when
+        still required (kept reserved, not returned as misses, so their
+        running reads can finish) and released otherwise.
 
         Parameters
         ----------
@@ -139,7 +185,18 @@ class TileManager2D:
         fill_plan : list[tuple[BlockKey2D, TileSlot]]
             Tiles that need data uploaded, paired with their target slots.
         """
+        # Committed tiles to demote once this plan has loaded.
+        self._pending_demote = set(self.tilemap.keys()).difference(required)
+
+        # Release in-flight tiles the new plan no longer needs.
+        for slot_idx, tile_key in list(self._in_flight.items()):
+            if tile_key not in required:
+                del self._in_flight[slot_idx]
+                self.free_slots.append(slot_idx)
+        loading = set(self._in_flight.values())
+
         miss_list: list[BlockKey2D] = []
+        n_promoted = 0
 
         for tile_key in required:
             if tile_key in self.tilemap:
@@ -147,9 +204,21 @@ class TileManager2D:
                 slot = self.tilemap[tile_key]
                 slot.timestamp = frame_number
                 heapq.heappush(self._lru_heap, (frame_number, slot.index))
-            else:
+            elif tile_key in self._reserve:
+                # Reserve hit -- promote to hot; no load needed.
+                slot = self._reserve.pop(tile_key)
+                slot.timestamp = frame_number
+                self.tilemap[tile_key] = slot
+                heapq.heappush(self._lru_heap, (frame_number, slot.index))
+                n_promoted += 1
+            elif tile_key not in loading:
                 miss_list.append(tile_key)
 
+        # Flush immediately if the plan is already satisfied (all hits).
+        self._pending_plan_count = len(miss_list) + len(loading)
+        if self._pending_plan_count == 0:
+            self._flush_pending_demote()
+
         fill_plan: list[tuple[BlockKey2D, TileSlot]] = []
         n_evictions = 0
 
@@ -169,19 +238,24 @@ class TileManager2D:
             fill_plan.append((tile_key, slot))
 
         if _CACHE_LOGGER.isEnabledFor(logging.INFO):
-            n_hits = len(required) - len(miss_list)
+            n_hits = len(required) - len(miss_list) - n_promoted - len(loading)
             n_occupied = len(self.tilemap)
             n_total = self.cache_info.n_slots
             _CACHE_LOGGER.info(
-                "cache_state  frame=%d  occupied=%d/%d  free=%d  "
-                "hits=%d  misses=%d  evictions=%d",
+                "cache_state  frame=%d  occupied=%d/%d  reserve=%d  free=%d  "
+                "hits=%d  reserve_hits=%d  adopted=%d  misses=%d  evictions=%d  "
+                "pending_demote=%d",
                 frame_number,
                 n_occupied,
                 n_total,
+                len(self._reserve),
                 len(self.free_slots),
                 n_hits,
+                n_promoted,
+                len(loading),
                 len(miss_list),
                 n_evictions,
+                len(self._pending_demote),
             )
 
         return fill_plan
@@ -191,7 +265,8 @@ class TileManager2D:
 
         Must be called after data has been written into the GPU cache
         slot.  After this call the tile appears in ``tilemap`` and will
-        be picked up by the next ``rebuild_lut``.
+        be picked up by the next ``rebuild_lut``.  The last outstanding
+        load of the current plan flushes ``_pending_demote``.
 
         Parameters
         ----------
@@ -205,23 +280,104 @@ class TileManager2D:
         self.slot_index[slot.index] = tile_key
         heapq.heappush(self._lru_heap, (slot.timestamp, slot.index))
 
+        self._pending_plan_count = max(0, self._pending_plan_count - 1)
+        if self._pending_plan_count == 0 and self._pending_demote:
+            self._flush_pending_demote()
+
     def release_all_in_flight(self) -> None:
         """Return all reserved-but-not-committed slots to the free pool.
 
         Called on cancellation so that slots reserved by ``stage()`` but
         never committed are reclaimed.  ``tilemap`` is untouched, so only
-        valid tiles remain renderable.
+        valid tiles remain renderable.  The pending demotion is dropped
+        with the plan; the next ``stage()`` recomputes it.
         """
         for slot_idx in list(self._in_flight.keys()):
             self.free_slots.append(slot_idx)
         self._in_flight.clear()
+        self._pending_plan_count = 0
+        self._pending_demote.clear()
+
+    @property
+    def in_flight(self) -> dict[int, BlockKey2D]:
+        """Slot index -> tile for staged but uncommitted tiles (a copy)."""
+        return dict(self._in_flight)
+
+    def is_in_flight(self, slot: TileSlot, tile_key: BlockKey2D) -> bool:
+        """Return whether *slot* is still reserved for loading *tile_key*.
+
+        2D counterpart of ``TileManager3D.is_in_flight``.
+        """
+        return self._in_flight.get(slot.index) == tile_key
+
+    def missing(self, tile_keys: Iterable[BlockKey2D]) -> list[BlockKey2D]:
+        """Return the tiles that are neither committed nor loading.
+
+        Read-only counterpart of ``stage()`` used to plan speculative
+        prefetches.
+
+        Parameters
+        ----------
+        tile_keys : Iterable[BlockKey2D]
+            Candidate tiles, in priority order.
+
+        Returns
+        -------
+        list[BlockKey2D]
+            The candidates absent from ``tilemap``, the reserve tier and
+            the in-flight set, in input order.
+        """
+        loading = set(self._in_flight.values())
+        return [
+            key
+            for key in tile_keys
+            if key not in self.tilemap
+            and key not in self._reserve
+            and key not in loading
+        ]
+
+    def _flush_pending_demote(self) -> int:
+        """Move ``_pending_demote`` tiles from ``tilemap`` to ``_reserve``.
+
+        Returns the number of tiles demoted.
+        """
+        n = 0
+        for key in self._pending_demote:
+            slot = self.tilemap.pop(key, None)
+            if slot is None:
+                continue
+            # slot_index keeps the mapping -- the slot is still occupied.
+            self._reserve[key] = slot
+            heapq.heappush(self._reserve_lru_heap, (slot.timestamp, slot.index))
+            n += 1
+        self._pending_demote.clear()
+        if n:
+            _CACHE_LOGGER.debug(
+                "demote_to_reserve  count=%d  reserve_size=%d", n, len(self._reserve)
+            )
+        return n
 
     def _evict_lru(self) -> int:
         """Evict the least-recently-used slot and return its index.
 
-        Pops entries from the min-heap, discarding stale ones, until a
-        valid (non-stale) LRU entry is found.
+        Reserve tiles are drained first (no visual disruption); hot tiles
+        are evicted only once the reserve is empty.  Pops entries from the
+        min-heaps, discarding stale ones, until a valid LRU entry is found.
         """
+        while self._reserve_lru_heap:
+            ts, slot_idx = heapq.heappop(self._reserve_lru_heap)
+
+            tile_key = self.slot_index.get(slot_idx)
+            slot = self._reserve.get(tile_key) if tile_key is not None else None
+            if slot is None or slot.timestamp != ts:
+                # Promoted, evicted or refreshed since the push -- stale.
+                continue
+
+            del self._reserve[tile_key]
+            self.slot_index[slot_idx] = None
+            _CACHE_LOGGER.debug("evict_reserve  victim=%s  slot=%d", tile_key, slot_idx)
+            return slot_idx
+
         while self._lru_heap:
             ts, slot_idx = heapq.heappop(self._lru_heap)
 
@@ -249,8 +405,8 @@ class TileManager2D:
         """Evict all committed tiles with level < min_level.
 
         Removes entries from tilemap and returns their slots to free_slots.
-        In-flight slots are unaffected (they are handled by
-        ``release_all_in_flight``).
+        Reserve and in-flight slots are unaffected (the latter are handled
+        by ``release_all_in_flight``).
 
         Parameters
         ----------
@@ -277,11 +433,18 @@ class TileManager2D:
     def clear(self) -> None:
         """Remove all resident tiles (reset to empty cache)."""
         was_occupied = len(self.tilemap)
+        was_reserve = len(self._reserve)
         self.tilemap.clear()
+        self._reserve.clear()
         self._in_flight.clear()
         for i in range(self.cache_info.n_slots):
             self.slot_index[i] = None
         self.slot_index[0] = BlockKey2D(level=0, g0=0, g1=0)
         self.free_slots = list(range(self.cache_info.n_slots - 1, 0, -1))
         self._lru_heap.clear()
-        _CACHE_LOGGER.info("cache_cleared  was_occupied=%d", was_occupied)
+        self._reserve_lru_heap.clear()
+        self._pending_demote.clear()
+        self._pending_plan_count = 0
+        _CACHE_LOGGER.info(
+            "cache_cleared  was_occupied=%d  was_reserve=%d", was_occupied, was_reserve
+        )
@@ -11,6 +11,13 @@ been written to the GPU cache.  This means:
   and the reserved-but-never-written slots are returned to the free list
   without touching ``tilemap``.
 
+Replanning while loading
+------------------------
+``stage()`` may be called while bricks from an earlier plan are still in
+flight.  Those the new plan requires are adopted -- their slots stay
+reserved and they are not returned as misses, so the reads already under
+way can finish -- and the rest are released.
+
 Reserve tier
 ------------
 When the LOD plan changes (e.g. on zoom-out), bricks that were hot but
@@ -53,9 +60,13 @@ import logging
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 from cellier.logging import _CACHE_LOGGER
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from cellier.render.block_cache._cache_parameters_3d import (
         BlockCacheParameters3D,
     )
@@ -102,12 +113,65 @@ class TileSlot:
         ``(sz, sy, sx)`` in the cache grid.
     timestamp : int
         Frame number when last accessed (for LRU).
+    brick_max : float
+        Maximum value of the resident brick, for MIP / iso early-out.
+    brick_scale, brick_offset : float
+        Dequantization of the resident brick (``value = code * scale +
+        offset``); identity unless the cache precision is ``"uint8"``.
+    brick_error : float
+        Absolute error bound of the resident brick in a lossy cache.
     """
 
     index: int
     grid_pos: tuple[int, int, int]
     timestamp: int = 0
     brick_max: float = 0.0
+    brick_scale: float = 1.0
+    brick_offset: float = 0.0
+    brick_error: float = 0.0
+
+
+@dataclass
+class ResidentBricks3D:
+    """Struct-of-arrays snapshot of the committed bricks in ``tilemap``.
+
+    Row ``i`` of every array describes the same brick; rows follow
+    ``tilemap`` order.  The level-0 sentinel is excluded.
+
+    Attributes
+    ----------
+    level : np.ndarray
+        ``(n,)`` int32 LOAD level of each brick.
+    grid : np.ndarray
+        ``(n, 3)`` int64 brick grid position ``(g0, g1, g2)``.
+    slot_grid_pos : np.ndarray
+        ``(n, 3)`` int32 cache slot position ``(sz, sy, sx)``.
+    brick_max : np.ndarray
+        ``(n,)`` float32 per-brick maximum.
+    slice_id : np.ndarray
+        ``(n,)`` int32 index of each brick's ``slice_coord`` in
+        ``slice_coords``.
+    slice_coords : list[tuple[tuple[int, int], ...]]
+        Distinct ``slice_coord`` values, in first-seen order.
+    """
+
+    level: np.ndarray
+    grid: np.ndarray
+    slot_grid_pos: np.ndarray
+    brick_max: np.ndarray
+    slice_id: np.ndarray
+    slice_coords: list[tuple[tuple[int, int], ...]]
+
+    def __len__(self) -> int:
+        return len(self.level)
+
+    def slice_mask(self, slice_coord: tuple[tuple[int, int], ...]) -> np.ndarray:
+        """Return a bool mask of the bricks whose ``slice_coord`` matches."""
+        try:
+            target = self.slice_coords.index(slice_coord)
+        except ValueError:
+            return np.zeros(len(self), dtype=bool)
+        return self.slice_id == target
 
 
 class TileManager3D:
@@ -197,6 +261,10 @@ class TileManager3D:
         every miss in this plan has committed.  Until then they remain hot
         so they continue to render as a placeholder while new data loads.
 
+        Bricks still in flight from an earlier plan are adopted when
+        required (they count as outstanding loads of this plan but are not
+        returned as misses) and released otherwise.
+
         Parameters
         ----------
         required_bricks :
@@ -219,6 +287,13 @@ class TileManager3D:
         self._pending_demote = set(self.tilemap.keys()) - required_keys
         self._pending_demote.discard(sentinel)
 
+        # Release in-flight bricks the new plan no longer needs.
+        for slot_idx, brick_key in list(self._in_flight.items()):
+            if brick_key not in required_keys:
+                del self._in_flight[slot_idx]
+                self.free_slots.append(slot_idx)
+        loading = set(self._in_flight.values())
+
         miss_list: list[BlockKey3D] = []
         n_promoted = 0
 
@@ -237,12 +312,12 @@ class TileManager3D:
                 self.slot_index[slot.index] = brick_key
                 heapq.heappush(self._lru_heap, (frame_number, slot.index))
                 n_promoted += 1
-            else:
+            elif brick_key not in loading:
                 miss_list.append(brick_key)
 
-        # Track outstanding loads; flush immediately if the plan is already
-        # fully satisfied (all hits / warm promotions, no network fetches needed).
-        self._pending_plan_count = len(miss_list)
+        # Track outstanding loads (adopted and new); flush immediately if the
+        # plan is already fully satisfied (all hits / warm promotions).
+        self._pending_plan_count = len(miss_list) + len(loading)
         if self._pending_plan_count == 0:
             self._flush_pending_demote()
 
@@ -265,17 +340,20 @@ class TileManager3D:
             fill_plan.append((brick_key, slot))
 
         if _CACHE_LOGGER.isEnabledFor(logging.INFO):
-            n_hot_hits = len(required_bricks) - len(miss_list) - n_promoted
+            n_hot_hits = (
+                len(required_bricks) - len(miss_list) - n_promoted - len(loading)
+            )
             _CACHE_LOGGER.info(
                 "cache_state  frame=%d  hot=%d  reserve=%d  free=%d  "
-                "hot_hits=%d  reserve_hits=%d  misses=%d  evictions=%d  "
-                "pending_demote=%d",
+                "hot_hits=%d  reserve_hits=%d  adopted=%d  misses=%d  "
+                "evictions=%d  pending_demote=%d",
                 frame_number,
                 len(self.tilemap),
                 len(self._reserve),
                 len(self.free_slots),
                 n_hot_hits,
                 n_promoted,
+                len(loading),
                 len(miss_list),
                 n_evictions,
                 len(self._pending_demote),
@@ -334,6 +412,84 @@ class TileManager3D:
         self._pending_plan_count = 0
         self._pending_demote.clear()
 
+    def resident_bricks(self) -> ResidentBricks3D:
+        """Export the committed bricks as a struct of arrays.
+
+        One pass over ``tilemap``; array-native consumers such as
+        ``rebuild_lut`` then work on whole levels at a time.
+
+        Returns
+        -------
+        ResidentBricks3D
+            Snapshot of ``tilemap``; later changes are not reflected.
+        """
+        slice_ids: dict[tuple[tuple[int, int], ...], int] = {}
+        rows = [
+            (
+                key.level,
+                key.g0,
+                key.g1,
+                key.g2,
+                *slot.grid_pos,
+                slice_ids.setdefault(key.slice_coord, len(slice_ids)),
+            )
+            for key, slot in self.tilemap.items()
+            if key.level > 0
+        ]
+        table = np.array(rows, dtype=np.int64).reshape(-1, 8)
+        brick_max = np.fromiter(
+            (slot.brick_max for key, slot in self.tilemap.items() if key.level > 0),
+            dtype=np.float32,
+            count=len(rows),
+        )
+        return ResidentBricks3D(
+            level=table[:, 0].astype(np.int32),
+            grid=table[:, 1:4],
+            slot_grid_pos=table[:, 4:7].astype(np.int32),
+            brick_max=brick_max,
+            slice_id=table[:, 7].astype(np.int32),
+            slice_coords=list(slice_ids),
+        )
+
+    @property
+    def in_flight(self) -> dict[int, BlockKey3D]:
+        """Slot index -> brick for staged but uncommitted bricks (a copy)."""
+        return dict(self._in_flight)
+
+    def is_in_flight(self, slot: TileSlot, brick_key: BlockKey3D) -> bool:
+        """Return whether *slot* is still reserved for loading *brick_key*.
+
+        False once the brick is committed, or when the slot was released
+        or given to another brick since ``stage()``.
+        """
+        return self._in_flight.get(slot.index) == brick_key
+
+    def missing(self, brick_keys: Iterable[BlockKey3D]) -> list[BlockKey3D]:
+        """Return the bricks that are neither resident nor loading.
+
+        Read-only: unlike ``stage()`` this allocates nothing and touches
+        no timestamps, so it can be used to plan speculative prefetches.
+
+        Parameters
+        ----------
+        brick_keys :
+            Candidate bricks, in priority order.
+
+        Returns
+        -------
+        missing :
+            The candidates absent from ``tilemap``, the reserve tier and
+            the in-flight set, in input order.
+        """
+        loading = set(self._in_flight.values())
+        return [
+            key
+            for key in brick_keys
+            if key not in self.tilemap
+            and key not in self._reserve
+            and key not in loading
+        ]
+
     # -- Internal helpers ------------------------------------------------
 
     def _slot_grid_pos(self, flat_idx: int) -> tuple[int, int, int]:
@@ -0,0 +1,204 @@
+"""Coalesced, budgeted uploads of cache slots into a GPU cache texture.
+
+``write_brick`` / ``write_tile`` stage each slot's data here instead of
+sending it straight away.  ``flush`` sends the staged slots with as few
+texture writes as possible: slots adjacent in the cache grid are merged
+into boxes (runs along x, then equal runs stacked along y, then along
+z) and every box becomes one ``Texture.send_data`` call.
+
+A per-frame byte budget caps how much a frame may send, so a large
+slicer batch is spread over several frames instead of stalling one.
+Slots over the budget stay staged until ``begin_frame`` opens the next
+frame's budget; at least one slot is sent per frame so a brick larger
+than the budget still makes progress.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from cellier.logging import _GPU_LOGGER
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
+    import pygfx as gfx
+
+
+@dataclass
+class StagedSlot:
+    """One slot write waiting to be uploaded.
+
+    Attributes
+    ----------
+    key : Hashable or None
+        Brick / tile identity the data belongs to.
+    slot : TileSlot
+        Target slot (2D or 3D); ``grid_pos`` gives the upload offset.
+    data : np.ndarray
+        Padded brick in the cache dtype, C-contiguous.
+    """
+
+    key: Hashable | None
+    slot: Any
+    data: np.ndarray
+
+
+class SlotUploadScheduler:
+    """Stage slot writes and flush them as merged, budgeted texture uploads.
+
+    Parameters
+    ----------
+    texture : gfx.Texture
+        GPU-only cache texture (see ``build_cache_texture_3d``).
+    padded_block_size : int
+        Slot side length in texels.
+    budget_bytes : int or None
+        Maximum bytes sent per frame.  ``None`` sends everything staged
+        on every ``flush``.
+    """
+
+    def __init__(
+        self,
+        texture: gfx.Texture,
+        padded_block_size: int,
+        budget_bytes: int | None = None,
+    ) -> None:
+        self._texture = texture
+        self._pbs = padded_block_size
+        self.budget_bytes = budget_bytes
+        # slot index -> staged write, in arrival (priority) order.
+        self._staged: dict[int, StagedSlot] = {}
+        self._sent_this_frame = 0
+
+    @property
+    def n_staged(self) -> int:
+        """Number of slot writes waiting to be sent."""
+        return len(self._staged)
+
+    def stage(self, slot: Any, data: np.ndarray, key: Hashable | None = None) -> None:
+        """Queue *data* for upload into *slot*.
+
+        A newer write to the same slot replaces the staged one.
+        """
+        self._staged.pop(slot.index, None)
+        self._staged[slot.index] = StagedSlot(key=key, slot=slot, data=data)
+
+    def begin_frame(self) -> None:
+        """Open a new frame's upload budget."""
+        self._sent_this_frame = 0
+
+    def discard(self) -> None:
+        """Drop every staged write."""
+        self._staged.clear()
+
+    def flush(
+        self, is_live: Callable[[Hashable | None, Any], bool] | None = None
+    ) -> list[StagedSlot]:
+        """Send staged writes, in arrival order, within this frame's budget.
+
+        Parameters
+        ----------
+        is_live : callable or None
+            ``is_live(key, slot)`` returns False for writes whose slot
+            has since been given to another brick; those are dropped
+            unsent.
+
+        Returns
+        -------
+        list[StagedSlot]
+            The writes sent, in arrival order.
+        """
+        budget = self.budget_bytes
+        sent: list[StagedSlot] = []
+        for index, entry in list(self._staged.items()):
+            if is_live is not None and not is_live(entry.key, entry.slot):
+                del self._staged[index]
+                continue
+            nbytes = entry.data.nbytes
+            if (
+                budget is not None
+                and self._sent_this_frame > 0
+                and self._sent_this_frame + nbytes > budget
+            ):
+                break
+            del self._staged[index]
+            sent.append(entry)
+            self._sent_this_frame += nbytes
+        if not sent:
+            return sent
+
+        boxes = merge_slot_boxes({e.slot.grid_pos: e.data for e in sent})
+        for start, block in boxes:
+            offset = [g * self._pbs for g in reversed(start)]
+            offset += [0] * (3 - len(offset))
+            self._texture.send_data(offset=tuple(offset), data=block)
+        _GPU_LOGGER.debug(
+            "uploads_flushed  slots=%d  writes=%d  bytes=%d  staged=%d",
+            len(sent),
+            len(boxes),
+            sum(e.data.nbytes for e in sent),
+            len(self._staged),
+        )
+        return sent
+
+
+def merge_slot_boxes(
+    blocks: dict[tuple[int, ...], np.ndarray],
+) -> list[tuple[tuple[int, ...], np.ndarray]]:
+    """Merge grid-adjacent slot blocks into as few boxes as possible.
+
+    Blocks are merged along the last grid axis first (x runs), then runs
+    with the same footprint are stacked along each earlier axis in turn.
+
+    Parameters
+    ----------
+    blocks : dict[tuple[int, ...], np.ndarray]
+        Slot grid position (numpy axis order) -> that slot's block.  All
+        blocks share one shape and dtype, with one array axis per grid
+        axis.
+
+    Returns
+    -------
+    list[tuple[tuple[int, ...], np.ndarray]]
+        ``(start_grid_pos, block)`` per merged box; single slots are
+        returned without a copy.
+    """
+    if not blocks:
+        return []
+    ndim = len(next(iter(blocks)))
+    boxes = [(start, (1,) * ndim, block) for start, block in blocks.items()]
+    for axis in reversed(range(ndim)):
+        # Boxes can merge along *axis* only when they agree on every
+        # other axis, both in start and in extent.
+        groups: dict[tuple, list] = {}
+        for box in boxes:
+            start, extent, _ = box
+            footprint = start[:axis] + start[axis + 1 :] + extent
+            groups.setdefault(footprint, []).append(box)
+        boxes = []
+        for group in groups.values():
+            group.sort(key=lambda b: b[0][axis])
+            run = [group[0]]
+            for box in group[1:]:
+                prev_start, prev_extent, _ = run[-1]
+                if box[0][axis] == prev_start[axis] + prev_extent[axis]:
+                    run.append(box)
+                else:
+                    boxes.append(_concat_run(run, axis))
+                    run = [box]
+            boxes.append(_concat_run(run, axis))
+    return [(start, block) for start, _, block in boxes]
+
+
+def _concat_run(run: list, axis: int) -> tuple:
+    """Concatenate a run of adjacent boxes along *axis* into one box."""
+    if len(run) == 1:
+        return run[0]
+    start, extent, _ = run[0]
+    length = sum(b[1][axis] for b in run)
+    extent = (*extent[:axis], length, *extent[axis + 1 :])
+    return start, extent, np.concatenate([b[2] for b in run], axis=axis)
@@ -1,12 +1,19 @@
 from __future__ import annotations
 
+import itertools
 from typing import TYPE_CHECKING
 
 import numpy as np
 import pygfx as gfx
 
+from cellier.logging import _GPU_LOGGER
+
 if TYPE_CHECKING:
-    from cellier.render.block_cache._tile_manager_2d import TileManager2D
+    from cellier.render.block_cache._tile_manager_2d import (
+        BlockKey2D,
+        TileManager2D,
+        TileSlot,
+    )
     from cellier.render.lut_indirection._layout_2d import BlockLayout2D
 
 
@@ -41,6 +48,13 @@ class LutIndirectionManager2D:
         self._n_levels = n_levels
         self._scale_vecs_data = scale_vecs_data
         self.lut_data, self.lut_tex = build_lut_texture_2d(base_layout.grid_dims)
+        # Tilemap state the LUT currently reflects: key -> slot index.
+        # ``None`` until the first full rebuild.
+        self._applied: dict[BlockKey2D, int] | None = None
+        self._applied_view: tuple | None = None
+        # level -> (g0, g1) -> resident keys at that position (one per
+        # slice_coord), in commit order.
+        self._resident_index: dict[int, dict[tuple[int, int], dict]] = {}
 
     def rebuild(
         self,
@@ -48,13 +62,22 @@ class LutIndirectionManager2D:
         current_slice_coord: tuple[tuple[int, int], ...] | None = None,
         viewport_cells: tuple[int, int, int, int] | None = None,
     ) -> None:
-        """Rewrite ``lut_data`` from current tilemap state and schedule GPU upload.
+        """Bring ``lut_data`` up to date with the tilemap and schedule GPU upload.
 
         Uses a two-phase sweep when ``current_slice_coord`` is provided:
         old-slice tiles are written first (background), then current-slice
         tiles overwrite them (foreground).  This keeps the previous image
         visible while new tiles stream in.
 
+        Tiles committed, demoted or evicted since the previous call are
+        applied as deltas: only the base-grid boxes they cover are
+        re-swept and uploaded.  A full rebuild (``rebuild_lut_2d``) runs
+        on the first call, when ``current_slice_coord`` or
+        ``viewport_cells`` changes, or when the deltas would cost more
+        than a full rebuild: the dirty boxes cover more than half the
+        grid, or finding the tiles inside them would visit more grid
+        positions than there are resident tiles.
+
         Parameters
         ----------
         tile_manager : TileManager2D
@@ -70,6 +93,61 @@ class LutIndirectionManager2D:
             referenced in the LUT.  ``None`` disables clipping (background tiles
             written across the full grid, backward-compatible).
         """
+        tilemap = {
+            key: slot
+            for key, slot in tile_manager.tilemap.items()
+            if 0 < key.level <= self._n_levels
+        }
+        state = {key: slot.index for key, slot in tilemap.items()}
+        view = (current_slice_coord, viewport_cells)
+        if self._applied is None or view != self._applied_view:
+            self._rebuild_full(tile_manager, view, tilemap, state)
+            return
+
+        applied = self._applied
+        dirty = [key for key, index in applied.items() if state.get(key) != index]
+        dirty += [key for key in state if key not in applied]
+        if not dirty:
+            return
+        boxes = self._dirty_boxes(dirty)
+        n_cells = sum((y1 - y0) * (x1 - x0) for y0, y1, x0, x1 in boxes)
+        if 2 * n_cells > self.lut_data.shape[0] * self.lut_data.shape[1]:
+            self._rebuild_full(tile_manager, view, tilemap, state)
+            return
+
+        for key in dirty:
+            if key in applied:
+                self._index_remove(key)
+            if key in state:
+                self._index_add(key)
+        visits = sum(self._scan_cost(box) for box in boxes)
+        if visits > len(state):
+            self._rebuild_full(tile_manager, view, tilemap, state)
+            return
+
+        for box in boxes:
+            self._rewrite_box(box, tilemap, current_slice_coord, viewport_cells)
+            y0, y1, x0, x1 = box
+            self.lut_tex.update_range((x0, y0, 0), (x1 - x0, y1 - y0, 1))
+        self._applied = state
+        _GPU_LOGGER.debug(
+            "lut_updated_2d  dirty_tiles=%d  boxes=%d  cells=%d",
+            len(dirty),
+            len(boxes),
+            n_cells,
+        )
+
+    # ── Incremental update ───────────────────────────────────────────────
+
+    def _rebuild_full(
+        self,
+        tile_manager: TileManager2D,
+        view: tuple,
+        tilemap: dict[BlockKey2D, TileSlot],
+        state: dict[BlockKey2D, int],
+    ) -> None:
+        """Rewrite and upload the whole LUT, then reset the delta state."""
+        current_slice_coord, viewport_cells = view
         rebuild_lut_2d(
             self._base_layout,
             tile_manager,
@@ -80,6 +158,130 @@ class LutIndirectionManager2D:
             current_slice_coord=current_slice_coord,
             viewport_cells=viewport_cells,
         )
+        self._resident_index = {}
+        for key in tilemap:
+            self._index_add(key)
+        self._applied = state
+        self._applied_view = view
+
+    def _index_add(self, key: BlockKey2D) -> None:
+        """Record *key* as resident at its grid position."""
+        positions = self._resident_index.setdefault(key.level, {})
+        positions.setdefault((key.g0, key.g1), {})[key] = None
+
+    def _index_remove(self, key: BlockKey2D) -> None:
+        """Forget *key*, dropping its grid position once nothing is left there."""
+        positions = self._resident_index[key.level]
+        position = (key.g0, key.g1)
+        positions[position].pop(key, None)
+        if not positions[position]:
+            del positions[position]
+
+    def _level_range(
+        self, level: int, box: tuple[int, int, int, int]
+    ) -> tuple[tuple[int, int], tuple[int, int]]:
+        """Return the half-open *level* grid range ``(lo, hi)`` overlapping *box*."""
+        y0, y1, x0, x1 = box
+        sy, sx = _level_scale_2d(level, self._scale_vecs_data)
+        return (y0 // sy, x0 // sx), ((y1 - 1) // sy + 1, (x1 - 1) // sx + 1)
+
+    def _scan_cost(self, box: tuple[int, int, int, int]) -> int:
+        """Return how many grid positions ``_positions_in`` visits for *box*."""
+        cost = 0
+        for level, positions in self._resident_index.items():
+            (a0, a1), (b0, b1) = self._level_range(level, box)
+            cost += min((b0 - a0) * (b1 - a1), len(positions))
+        return cost
+
+    def _positions_in(
+        self, level: int, box: tuple[int, int, int, int]
+    ) -> list[tuple[int, int]]:
+        """Return the resident *level* grid positions overlapping *box*.
+
+        Walks whichever is smaller: the box's range of *level* grid
+        positions, or the positions resident at *level*.
+        """
+        positions = self._resident_index.get(level)
+        if not positions:
+            return []
+        (a0, a1), (b0, b1) = self._level_range(level, box)
+        if (b0 - a0) * (b1 - a1) <= len(positions):
+            candidates = itertools.product(range(a0, b0), range(a1, b1))
+            return [p for p in candidates if p in positions]
+        return [(g0, g1) for g0, g1 in positions if a0 <= g0 < b0 and a1 <= g1 < b1]
+
+    def _footprint(self, level: int, g0: int, g1: int) -> tuple[int, int, int, int]:
+        """Return the clamped base-grid box ``(y0, y1, x0, x1)``."""
+        gh, gw = self.lut_data.shape[:2]
+        sy, sx = _level_scale_2d(level, self._scale_vecs_data)
+        y0, x0 = g0 * sy, g1 * sx
+        return min(y0, gh), min(y0 + sy, gh), min(x0, gw), min(x0 + sx, gw)
+
+    def _dirty_boxes(self, dirty: list[BlockKey2D]) -> list[tuple[int, int, int, int]]:
+        """Return the footprints of *dirty*, skipping ones inside a coarser box."""
+        kept: set[tuple[int, int, int, int]] = set()
+        kept_levels: list[int] = []
+        for key in sorted(dirty, key=lambda k: -k.level):
+            box = self._footprint(key.level, key.g0, key.g1)
+            y0, y1, x0, x1 = box
+            if y0 >= y1 or x0 >= x1 or box in kept:
+                continue
+            covered = False
+            for level in kept_levels:
+                if level == key.level:
+                    continue
+                sy, sx = _level_scale_2d(level, self._scale_vecs_data)
+                if self._footprint(level, y0 // sy, x0 // sx) in kept:
+                    covered = True
+                    break
+            if covered:
+                continue
+            kept.add(box)
+            if key.level not in kept_levels:
+                kept_levels.append(key.level)
+        return list(kept)
+
+    def _rewrite_box(
+        self,
+        box: tuple[int, int, int, int],
+        tilemap: dict[BlockKey2D, TileSlot],
+        current_slice_coord: tuple[tuple[int, int], ...] | None,
+        viewport_cells: tuple[int, int, int, int] | None,
+    ) -> None:
+        """Re-sweep every resident tile overlapping *box* into the LUT.
+
+        Same order and background clipping as ``rebuild_lut_2d``, with
+        every write additionally clipped to *box*.
+        """
+        y0, y1, x0, x1 = box
+        self.lut_data[y0:y1, x0:x1] = 0
+        phases = (None,) if current_slice_coord is None else (False, True)
+        for foreground in phases:
+            clip_y0, clip_y1, clip_x0, clip_x1 = y0, y1, x0, x1
+            if foreground is False and viewport_cells is not None:
+                cy0, cx0, cy1, cx1 = viewport_cells
+                clip_y0, clip_y1 = max(y0, cy0), min(y1, cy1)
+                clip_x0, clip_x1 = max(x0, cx0), min(x1, cx1)
+                if clip_y0 >= clip_y1 or clip_x0 >= clip_x1:
+                    continue
+            clip = (clip_y0, clip_y1, clip_x0, clip_x1)
+            for level in range(self._n_levels, 0, -1):
+                level_index = self._resident_index.get(level, {})
+                for g0, g1 in self._positions_in(level, clip):
+                    for key in level_index[(g0, g1)]:
+                        if (
+                            foreground is not None
+                            and (key.slice_coord == current_slice_coord) != foreground
+                        ):
+                            continue
+                        slot = tilemap[key]
+                        cy, cx = slot.grid_pos
+                        ty0, ty1, tx0, tx1 = self._footprint(level, g0, g1)
+                        cells = (
+                            slice(max(ty0, clip_y0), min(ty1, clip_y1)),
+                            slice(max(tx0, clip_x0), min(tx1, clip_x1)),
+                        )
+                        self.lut_data[cells] = (cx, cy, level, 0)
 
 
 def build_lut_texture_2d(
@@ -181,15 +383,7 @@ def rebuild_lut_2d(
         for level in range(n_levels, 0, -1):
             if level not in tiles_by_level:
                 continue
-            level_idx = level - 1  # 0-indexed into scale_vecs_data
-            if scale_vecs_data is not None and level_idx < len(scale_vecs_data):
-                sv = scale_vecs_data[level_idx]
-                scale_y = max(1, int(round(float(sv[0]))))
-                scale_x = max(1, int(round(float(sv[1]))))
-            else:
-                iso_scale = 2 ** (level - 1)
-                scale_y = iso_scale
-                scale_x = iso_scale
+            scale_y, scale_x = _level_scale_2d(level, scale_vecs_data)
             for key, slot in tiles_by_level[level]:
                 sy, sx = slot.grid_pos
                 # Base-grid slice covered by this coarse tile, clamped.
@@ -231,3 +425,15 @@ def rebuild_lut_2d(
         _write_tiles(fg_by_level)
 
     lut_tex.update_range((0, 0, 0), lut_tex.size)
+
+
+def _level_scale_2d(
+    level: int, scale_vecs_data: list[np.ndarray] | None
+) -> tuple[int, int]:
+    """Return the base-grid cells ``(sy, sx)`` one tile of *level* spans."""
+    level_idx = level - 1  # 0-indexed into scale_vecs_data
+    if scale_vecs_data is not None and level_idx < len(scale_vecs_data):
+        sv = scale_vecs_data[level_idx]
+        return max(1, int(round(float(sv[0])))), max(1, int(round(float(sv[1]))))
+    iso_scale = 2 ** (level - 1)
+    return iso_scale, iso_scale
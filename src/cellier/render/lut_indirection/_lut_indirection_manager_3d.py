@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import itertools
 import logging
+import math
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -11,9 +13,22 @@ import pygfx as gfx
 from cellier.logging import _GPU_LOGGER
 
 if TYPE_CHECKING:
-    from cellier.render.block_cache import TileManager3D
+    from cellier.render.block_cache import (
+        BlockKey3D,
+        PackedTileManager3D,
+        TileManager3D,
+        TileSlot,
+    )
     from cellier.render.lut_indirection._layout_3d import BlockLayout3D
 
+# Fixed costs of one per-brick LUT write and of one whole-box scatter,
+# in base cells of scatter work; ``_write_level`` picks the cheaper.
+_BRICK_WRITE_CELLS = 256
+_SCATTER_CELLS = 16384
+# Fixed cost of rewriting one dirty box, in grid positions visited; a
+# full rebuild costs about one visit per resident brick.
+_BOX_VISITS = 128
+
 
 class LutIndirectionManager3D:
     """LUT indirection table for a bricked 3-D volume.
@@ -77,6 +92,14 @@ class LutIndirectionManager3D:
         self._level_scale_vecs_data = level_scale_vecs_data
         self.lut_data, self.lut_tex = build_lut_texture(base_layout)
         self.brick_max_data, self.brick_max_tex = build_brick_max_texture(base_layout)
+        # Tilemap state the LUT currently reflects: key -> (slot index,
+        # brick max).  ``None`` until the first full rebuild.
+        self._applied: dict[BlockKey3D, tuple[int, float]] | None = None
+        self._applied_slice_coord: tuple[tuple[int, int], ...] | None = None
+        # level -> (g0, g1, g2) -> resident keys at that position (one per
+        # slice_coord), in commit order.  Built lazily by the first
+        # incremental update after a full rebuild.
+        self._resident_index: dict[int, dict[tuple[int, int, int], dict]] | None = None
 
     # ------------------------------------------------------------------
     # GPU writes
@@ -84,14 +107,22 @@ class LutIndirectionManager3D:
 
     def rebuild(
         self,
-        tile_manager: TileManager3D,
+        tile_manager: TileManager3D | PackedTileManager3D,
         current_slice_coord: tuple[tuple[int, int], ...] | None = None,
     ) -> None:
-        """Rewrite ``lut_data`` from current tilemap state and schedule GPU upload.
-
-        Strategy: sweep coarsest-to-finest through all resident bricks.
-        Each brick slice-writes the base-grid cells it covers, so finer
-        writes naturally overwrite coarser fallbacks.
+        """Bring ``lut_data`` up to date with the tilemap and schedule GPU upload.
+
+        Bricks committed, demoted or evicted since the previous call are
+        applied as deltas: only the base-grid boxes they cover are
+        re-swept (see ``rebuild_lut`` for the sweep order) and only those
+        boxes are uploaded.  A full rebuild runs on the first call, when
+        ``current_slice_coord`` changes (it decides which bricks are
+        foreground), or when the deltas would cost more than a full
+        rebuild: the dirty boxes cover more than half the grid, or
+        rewriting them would visit more grid positions (see
+        ``_BOX_VISITS``) than there are resident bricks.  A tile manager
+        without a ``tilemap`` dict (such as ``PackedTileManager3D``) is
+        always rebuilt in full.
 
         When ``current_slice_coord`` is provided, uses a two-phase sweep:
 
@@ -107,12 +138,75 @@ class LutIndirectionManager3D:
 
         Parameters
         ----------
-        tile_manager : TileManager3D
+        tile_manager : TileManager3D or PackedTileManager3D
             Current tile manager holding the resident brick mapping.
         current_slice_coord : tuple of (axis_index, world_value) pairs or None
             Non-displayed axis positions for the current frame.  ``None``
             disables the two-phase sweep (single-phase, backward-compatible).
         """
+        if getattr(tile_manager, "tilemap", None) is None:
+            self._rebuild_full(tile_manager, current_slice_coord, None)
+            return
+        tilemap = {
+            key: slot
+            for key, slot in tile_manager.tilemap.items()
+            if 0 < key.level <= self._n_levels
+        }
+        state = {key: (slot.index, slot.brick_max) for key, slot in tilemap.items()}
+        if self._applied is None or current_slice_coord != self._applied_slice_coord:
+            self._rebuild_full(tile_manager, current_slice_coord, state)
+            return
+
+        applied = self._applied
+        dirty = [key for key, value in applied.items() if state.get(key) != value]
+        dirty += [key for key in state if key not in applied]
+        if not dirty:
+            return
+        boxes = self._dirty_boxes(dirty)
+        n_cells = sum(
+            (z1 - z0) * (y1 - y0) * (x1 - x0) for z0, z1, y0, y1, x0, x1 in boxes
+        )
+        if 2 * n_cells > self.brick_max_data.size:
+            self._rebuild_full(tile_manager, current_slice_coord, state)
+            return
+
+        if self._resident_index is None:
+            self._resident_index = {}
+            for key in applied:
+                self._index_add(key)
+        for key in dirty:
+            if key in applied:
+                self._index_remove(key)
+            if key in state:
+                self._index_add(key)
+        visits = sum(_BOX_VISITS + self._scan_cost(box) for box in boxes)
+        if visits > len(state):
+            self._rebuild_full(tile_manager, current_slice_coord, state)
+            return
+
+        for box in boxes:
+            self._rewrite_box(box, tilemap, current_slice_coord)
+            z0, z1, y0, y1, x0, x1 = box
+            offset, size = (x0, y0, z0), (x1 - x0, y1 - y0, z1 - z0)
+            self.lut_tex.update_range(offset, size)
+            self.brick_max_tex.update_range(offset, size)
+        self._applied = state
+        _GPU_LOGGER.debug(
+            "lut_updated  dirty_bricks=%d  boxes=%d  cells=%d",
+            len(dirty),
+            len(boxes),
+            n_cells,
+        )
+
+    # ── Incremental update ───────────────────────────────────────────────
+
+    def _rebuild_full(
+        self,
+        tile_manager: TileManager3D | PackedTileManager3D,
+        current_slice_coord: tuple[tuple[int, int], ...] | None,
+        state: dict[BlockKey3D, tuple[int, float]] | None,
+    ) -> None:
+        """Rewrite and upload the whole LUT, then reset the delta state."""
         rebuild_lut(
             self._base_layout,
             tile_manager,
@@ -124,6 +218,151 @@ class LutIndirectionManager3D:
             level_scale_vecs_data=self._level_scale_vecs_data,
             current_slice_coord=current_slice_coord,
         )
+        self._resident_index = None
+        self._applied = state
+        self._applied_slice_coord = current_slice_coord
+
+    def _index_add(self, key: BlockKey3D) -> None:
+        """Record *key* as resident at its grid position."""
+        positions = self._resident_index.setdefault(key.level, {})
+        positions.setdefault((key.g0, key.g1, key.g2), {})[key] = None
+
+    def _index_remove(self, key: BlockKey3D) -> None:
+        """Forget *key*, dropping its grid position once nothing is left there."""
+        positions = self._resident_index[key.level]
+        position = (key.g0, key.g1, key.g2)
+        positions[position].pop(key, None)
+        if not positions[position]:
+            del positions[position]
+
+    def _level_range(
+        self, level: int, box: tuple[int, int, int, int, int, int]
+    ) -> tuple[tuple[int, int, int], tuple[int, int, int]]:
+        """Return the half-open *level* grid range ``(lo, hi)`` overlapping *box*."""
+        z0, z1, y0, y1, x0, x1 = box
+        sz, sy, sx = _level_scale(level, self._level_scale_vecs_data)
+        lo = (z0 // sz, y0 // sy, x0 // sx)
+        hi = ((z1 - 1) // sz + 1, (y1 - 1) // sy + 1, (x1 - 1) // sx + 1)
+        return lo, hi
+
+    def _scan_cost(self, box: tuple[int, int, int, int, int, int]) -> int:
+        """Return how many grid positions ``_positions_in`` visits for *box*."""
+        cost = 0
+        for level, positions in self._resident_index.items():
+            (a0, a1, a2), (b0, b1, b2) = self._level_range(level, box)
+            cost += min((b0 - a0) * (b1 - a1) * (b2 - a2), len(positions))
+        return cost
+
+    def _positions_in(
+        self, level: int, box: tuple[int, int, int, int, int, int]
+    ) -> list[tuple[int, int, int]]:
+        """Return the resident *level* grid positions overlapping *box*.
+
+        Walks whichever is smaller: the box's range of *level* grid
+        positions, or the positions resident at *level*.  A coarse box
+        holds far more fine positions than there are fine bricks.
+        """
+        positions = self._resident_index.get(level)
+        if not positions:
+            return []
+        (a0, a1, a2), (b0, b1, b2) = self._level_range(level, box)
+        if (b0 - a0) * (b1 - a1) * (b2 - a2) <= len(positions):
+            candidates = itertools.product(range(a0, b0), range(a1, b1), range(a2, b2))
+            return [p for p in candidates if p in positions]
+        return [
+            (g0, g1, g2)
+            for g0, g1, g2 in positions
+            if a0 <= g0 < b0 and a1 <= g1 < b1 and a2 <= g2 < b2
+        ]
+
+    def _footprint(
+        self, level: int, g0: int, g1: int, g2: int
+    ) -> tuple[int, int, int, int, int, int]:
+        """Return the clamped base-grid box ``(z0, z1, y0, y1, x0, x1)``."""
+        gd, gh, gw = self._base_layout.grid_dims
+        sz, sy, sx = _level_scale(level, self._level_scale_vecs_data)
+        z0, y0, x0 = g0 * sz, g1 * sy, g2 * sx
+        return (
+            min(z0, gd),
+            min(z0 + sz, gd),
+            min(y0, gh),
+            min(y0 + sy, gh),
+            min(x0, gw),
+            min(x0 + sx, gw),
+        )
+
+    def _dirty_boxes(
+        self, dirty: list[BlockKey3D]
+    ) -> list[tuple[int, int, int, int, int, int]]:
+        """Return the footprints of *dirty*, skipping ones inside a coarser box.
+
+        Footprints are visited coarsest first; a finer footprint whose
+        ancestor box at a coarser dirty level is already kept adds
+        nothing, because rewriting a box re-sweeps everything inside it.
+        """
+        kept: set[tuple[int, int, int, int, int, int]] = set()
+        kept_levels: list[int] = []
+        for key in sorted(dirty, key=lambda k: -k.level):
+            box = self._footprint(key.level, key.g0, key.g1, key.g2)
+            z0, z1, y0, y1, x0, x1 = box
+            if z0 >= z1 or y0 >= y1 or x0 >= x1 or box in kept:
+                continue
+            covered = False
+            for level in kept_levels:
+                if level == key.level:
+                    continue
+                sz, sy, sx = _level_scale(level, self._level_scale_vecs_data)
+                if self._footprint(level, z0 // sz, y0 // sy, x0 // sx) in kept:
+                    covered = True
+                    break
+            if covered:
+                continue
+            kept.add(box)
+            if key.level not in kept_levels:
+                kept_levels.append(key.level)
+        return list(kept)
+
+    def _rewrite_box(
+        self,
+        box: tuple[int, int, int, int, int, int],
+        tilemap: dict[BlockKey3D, TileSlot],
+        current_slice_coord: tuple[tuple[int, int], ...] | None,
+    ) -> None:
+        """Re-sweep every resident brick overlapping *box* into the LUT.
+
+        Same order as ``rebuild_lut``: background then foreground, each
+        coarsest-to-finest, with each level written by ``_write_level``
+        into the window of the LUT arrays that *box* covers.
+        """
+        z0, z1, y0, y1, x0, x1 = box
+        lut_window = self.lut_data[z0:z1, y0:y1, x0:x1]
+        max_window = self.brick_max_data[z0:z1, y0:y1, x0:x1]
+        lut_window[:] = 0
+        max_window[:] = 0.0
+        phases = (None,) if current_slice_coord is None else (False, True)
+        for foreground in phases:
+            for level in range(self._n_levels, 0, -1):
+                level_index = self._resident_index.get(level, {})
+                keys = [
+                    key
+                    for position in self._positions_in(level, box)
+                    for key in level_index[position]
+                    if foreground is None
+                    or (key.slice_coord == current_slice_coord) == foreground
+                ]
+                if not keys:
+                    continue
+                slots = [tilemap[key] for key in keys]
+                _write_level(
+                    lut_window,
+                    max_window,
+                    level,
+                    _level_scale(level, self._level_scale_vecs_data),
+                    np.array([(k.g0, k.g1, k.g2) for k in keys], dtype=np.int64),
+                    np.array([slot.grid_pos for slot in slots], dtype=np.int32),
+                    np.array([slot.brick_max for slot in slots], dtype=np.float32),
+                    origin=(z0, y0, x0),
+                )
 
 
 def build_lut_texture(base_layout: BlockLayout3D) -> tuple[np.ndarray, gfx.Texture]:
@@ -181,7 +420,7 @@ def build_brick_max_texture(
 
 def rebuild_lut(
     base_layout: BlockLayout3D,
-    tile_manager: TileManager3D,
+    tile_manager: TileManager3D | PackedTileManager3D,
     n_levels: int,
     lut_data: np.ndarray,
     lut_tex: gfx.Texture,
@@ -192,10 +431,12 @@ def rebuild_lut(
 ) -> None:
     """Rebuild the full LUT from the current tile manager state.
 
-    This works coarsest-to-finest.  Each level writes its slot
-    data into all base-grid cells it covers via a numpy slice assignment
-    (one C-speed fill per resident brick).  Because finer levels are
-    written last, they naturally overwrite the coarser fallback.
+    This works coarsest-to-finest on the struct-of-arrays export of
+    ``tile_manager.resident_bricks()``.  Each level is written as a
+    whole (see ``_write_level``): dense levels with one array scatter
+    over their occupied bounding box, sparse ones brick by brick.
+    Because finer levels are written last, they naturally overwrite the
+    coarser fallback.
 
     When ``current_slice_coord`` is provided, uses a two-phase sweep:
 
@@ -213,8 +454,9 @@ def rebuild_lut(
     ----------
     base_layout : BlockLayout
         Layout of the finest (level 1) resolution.
-    tile_manager : TileManager3D
-        Current tile manager with resident bricks.
+    tile_manager : TileManager3D or PackedTileManager3D
+        Current tile manager with resident bricks; only its
+        ``resident_bricks()`` export is used.
     n_levels : int
         Total number of LOAD levels.
     lut_data : np.ndarray
@@ -235,67 +477,38 @@ def rebuild_lut(
         Non-displayed axis positions for the current frame.  ``None``
         disables the two-phase sweep.
     """
-    gd, gh, gw = base_layout.grid_dims
-
     lut_data[:] = 0  # Reset everything to out-of-bounds (level 0 = black).
     brick_max_data[:] = 0.0
 
-    def _scale_for_level(level: int) -> tuple[int, int, int]:
-        if level_scale_vecs_data is not None and (level - 1) < len(
-            level_scale_vecs_data
-        ):
-            sv = level_scale_vecs_data[level - 1]
-            return (
-                max(1, int(round(float(sv[0])))),
-                max(1, int(round(float(sv[1])))),
-                max(1, int(round(float(sv[2])))),
-            )
-        uniform = 2 ** (level - 1)
-        return (uniform, uniform, uniform)
-
-    def _write_bricks(by_level: dict[int, list]) -> None:
-        """Write one group of bricks coarsest-to-finest into lut_data."""
-        for level in range(n_levels, 0, -1):
-            if level not in by_level:
-                continue
-            gz_scale, gy_scale, gx_scale = _scale_for_level(level)
-            for key, slot in by_level[level]:
-                sz, sy, sx = slot.grid_pos
-                gz0 = key.g0 * gz_scale
-                gz1 = min(gz0 + gz_scale, gd)
-                gy0 = key.g1 * gy_scale
-                gy1 = min(gy0 + gy_scale, gh)
-                gx0 = key.g2 * gx_scale
-                gx1 = min(gx0 + gx_scale, gw)
-                lut_data[gz0:gz1, gy0:gy1, gx0:gx1] = (sx, sy, sz, level)
-                brick_max_data[gz0:gz1, gy0:gy1, gx0:gx1] = slot.brick_max
-
+    bricks = tile_manager.resident_bricks()
+    in_range = bricks.level <= n_levels
     if current_slice_coord is None:
         # Single-phase: all bricks treated as foreground.
-        by_level: dict[int, list] = {}
-        for key, slot in tile_manager.tilemap.items():
-            if key.level > 0:
-                by_level.setdefault(key.level, []).append((key, slot))
-        _write_bricks(by_level)
+        phases = [in_range]
     else:
         # Two-phase: background (old-slice) first, then foreground (current-slice).
-        bg_by_level: dict[int, list] = {}
-        fg_by_level: dict[int, list] = {}
-        for key, slot in tile_manager.tilemap.items():
-            if key.level <= 0:
+        foreground = bricks.slice_mask(current_slice_coord)
+        phases = [in_range & ~foreground, in_range & foreground]
+    for phase in phases:
+        for level in range(n_levels, 0, -1):
+            rows = phase & (bricks.level == level)
+            if not rows.any():
                 continue
-            if key.slice_coord == current_slice_coord:
-                fg_by_level.setdefault(key.level, []).append((key, slot))
-            else:
-                bg_by_level.setdefault(key.level, []).append((key, slot))
-        _write_bricks(bg_by_level)
-        _write_bricks(fg_by_level)
-        by_level = {**bg_by_level, **fg_by_level}
+            _write_level(
+                lut_data,
+                brick_max_data,
+                level,
+                _level_scale(level, level_scale_vecs_data),
+                bricks.grid[rows],
+                bricks.slot_grid_pos[rows],
+                bricks.brick_max[rows],
+            )
 
     # Log per-level brick counts resident in LUT (np.unique scan is deferred
     # behind the level check to avoid scanning the full array every batch).
     if _GPU_LOGGER.isEnabledFor(logging.INFO):
-        lut_by_level = {level: len(bricks) for level, bricks in by_level.items()}
+        levels, counts = np.unique(bricks.level[in_range], return_counts=True)
+        lut_by_level = {int(lv): int(cnt) for lv, cnt in zip(levels, counts)}
         lut_level_vals, lut_level_counts = np.unique(
             lut_data[:, :, :, 3], return_counts=True
         )
@@ -312,3 +525,121 @@ def rebuild_lut(
 
     lut_tex.update_range((0, 0, 0), lut_tex.size)
     brick_max_tex.update_range((0, 0, 0), brick_max_tex.size)
+
+
+def _write_level(
+    lut_data: np.ndarray,
+    brick_max_data: np.ndarray,
+    level: int,
+    scale: tuple[int, int, int],
+    grid: np.ndarray,
+    slot_grid_pos: np.ndarray,
+    brick_max: np.ndarray,
+    origin: tuple[int, int, int] = (0, 0, 0),
+) -> None:
+    """Write one level's bricks into the base-resolution LUT arrays.
+
+    Each RGBA8 LUT texel is handled as one packed uint32.  When the
+    bricks fill enough of their bounding box (see ``_SCATTER_CELLS``)
+    they are scattered into a level-resolution grid of that box, which is
+    then repeated ``scale`` times along each axis and copied over the
+    base grid wherever a brick is present.  Sparser levels are written
+    brick by brick, which is cheaper than touching the whole box.
+    Either way, bricks sharing a grid position resolve to the last one,
+    as in a sequential sweep.
+
+    The arrays may also be a window of the base grid whose first cell is
+    the base cell *origin*; every write is then clipped to that window.
+    """
+    dims = brick_max_data.shape
+    sz, sy, sx = scale
+    start = grid * np.asarray(scale) - np.asarray(origin)
+    inside = np.all((start < dims) & (start + scale > 0), axis=1)
+    if not inside.any():
+        return
+    grid = grid[inside]
+    start = start[inside]
+    slot_grid_pos = slot_grid_pos[inside]
+    brick_max = brick_max[inside]
+
+    texels = np.empty((len(grid), 4), dtype=np.uint8)
+    texels[:, 0] = slot_grid_pos[:, 2]
+    texels[:, 1] = slot_grid_pos[:, 1]
+    texels[:, 2] = slot_grid_pos[:, 0]
+    texels[:, 3] = level
+    packed = texels.view(np.uint32)[:, 0]
+    lut_cells = lut_data.view(np.uint32)[..., 0]
+
+    lo = grid.min(axis=0)
+    hi = grid.max(axis=0) + 1
+    box = tuple(int(v) for v in hi - lo)
+    # Base cells of the bounding box inside the arrays, and where that
+    # window starts within the box once repeated to base resolution.
+    box_start = [int(v) for v in start.min(axis=0)]
+    region = tuple(
+        slice(max(b, 0), min(b + n * s, d))
+        for b, n, s, d in zip(box_start, box, scale, dims)
+    )
+    region_cells = math.prod(r.stop - r.start for r in region)
+    brick_cells = min(sz * sy * sx, region_cells)
+    if len(grid) * (_BRICK_WRITE_CELLS + brick_cells) < _SCATTER_CELLS + region_cells:
+        for (z0, y0, x0), entry, value in zip(start.tolist(), packed, brick_max):
+            cells = (
+                slice(max(z0, 0), z0 + sz),
+                slice(max(y0, 0), y0 + sy),
+                slice(max(x0, 0), x0 + sx),
+            )
+            lut_cells[cells] = entry
+            brick_max_data[cells] = value
+        return
+
+    g0, g1, g2 = (grid - lo).T
+    covered = np.zeros(box, dtype=bool)
+    entries = np.zeros(box, dtype=np.uint32)
+    maxima = np.zeros(box, dtype=brick_max_data.dtype)
+    covered[g0, g1, g2] = True
+    entries[g0, g1, g2] = packed
+    maxima[g0, g1, g2] = brick_max
+
+    crop = tuple(slice(r.start - b, r.stop - b) for r, b in zip(region, box_start))
+    covered, entries, maxima = (
+        _repeat_cells(a, scale, crop) for a in (covered, entries, maxima)
+    )
+    np.copyto(lut_cells[region], entries, where=covered)
+    np.copyto(brick_max_data[region], maxima, where=covered)
+
+
+def _repeat_cells(
+    cells: np.ndarray, scale: tuple[int, int, int], crop: tuple[slice, ...]
+) -> np.ndarray:
+    """Repeat each cell ``scale`` times per axis and crop to *crop*.
+
+    *crop* is in repeated (base) cells.  Only the cells it overlaps are
+    repeated, so cropping a small window out of a coarse level stays
+    cheap.
+    """
+    window = []
+    for axis, (repeats, part) in enumerate(zip(scale, crop)):
+        if repeats > 1:
+            first = part.start // repeats
+            last = -(-part.stop // repeats)
+            cells = cells[(slice(None),) * axis + (slice(first, last),)]
+            cells = cells.repeat(repeats, axis=axis)
+            part = slice(part.start - first * repeats, part.stop - first * repeats)
+        window.append(part)
+    return cells[tuple(window)]
+
+
+def _level_scale(
+    level: int, level_scale_vecs_data: list | None
+) -> tuple[int, int, int]:
+    """Return the base-grid cells ``(sz, sy, sx)`` one brick of *level* spans."""
+    if level_scale_vecs_data is not None and (level - 1) < len(level_scale_vecs_data):
+        sv = level_scale_vecs_data[level - 1]
+        return (
+            max(1, int(round(float(sv[0])))),
+            max(1, int(round(float(sv[1])))),
+            max(1, int(round(float(sv[2])))),
+        )
+    uniform = 2 ** (level - 1)
+    return (uniform, uniform, uniform)
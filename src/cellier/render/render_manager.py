@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
+import time
 from typing import TYPE_CHECKING, NamedTuple
 from uuid import uuid4
 
 import numpy as np
+import tensorstore as ts
 
 from cellier.events import DimsChangedEvent, EventBus
 from cellier.events._events import ViewRay, _CanvasRawPointerEvent
 from cellier.render._config import RenderManagerConfig
+from cellier.render._host_brick_cache import HostBrickCache
+from cellier.render._prefetch import CameraMotionPredictor
 from cellier.render._scene_config import VisualRenderConfig
 from cellier.render.canvas_view import CanvasView
 from cellier.render.scene_manager import SceneManager
@@ -102,9 +106,19 @@ class RenderManager:
         self._event_bus: EventBus | None = None
         self._active_gestures: dict[UUID, UUID] = {}
         self._pick_details_enabled: dict[UUID, bool] = {}
+        self._motion_predictors: dict[UUID, CameraMotionPredictor] = {}
+        # Zarr stores registered with this manager open their level handles
+        # in this context (see open_data_store).
+        self._ts_context = ts.Context(ts.Context.Spec(config.storage.context_spec()))
         self._slicer = AsyncSlicer(
             batch_size=config.slicing.batch_size,
             render_every=config.slicing.render_every,
+            max_in_flight=config.slicing.max_in_flight,
+            host_cache=HostBrickCache(config.slicing.host_cache_bytes),
+            adaptive=config.slicing.adaptive,
+            max_batch_size=config.slicing.max_batch_size,
+            max_render_every=config.slicing.max_render_every,
+            render_overhead_fraction=config.slicing.render_overhead_fraction,
         )
         self._slice_coordinator = SliceCoordinator(
             scenes=self._scenes,
@@ -132,10 +146,27 @@ class RenderManager:
         """Current rendering performance configuration.
 
         Reflects live state: mutations via ``temporal_alpha`` and
-        ``temporal_enabled`` setters are visible here immediately.
+        ``temporal_enabled`` setters are visible here immediately.  With
+        ``slicing.adaptive`` set, ``slicing.batch_size`` and
+        ``slicing.render_every`` keep their starting values; read the
+        tuned ones from ``slicing_cadence``.
         """
         return self._config
 
+    @property
+    def slicing_cadence(self) -> tuple[int, int]:
+        """The slicer's current ``(batch_size, render_every)``.
+
+        Equal to the configured values unless ``slicing.adaptive`` is
+        set, in which case they are the values tuned so far.
+        """
+        return self._slicer.batch_size, self._slicer.render_every
+
+    @property
+    def ts_context(self) -> ts.Context:
+        """The tensorstore context built from ``config.storage``."""
+        return self._ts_context
+
     @property
     def temporal_alpha(self) -> float:
         """EMA floor weight for temporal accumulation."""
@@ -258,6 +289,22 @@ class RenderManager:
         self._scenes[scene_id].add_visual(visual, displayed_axes)
         self._visual_to_scene[visual.visual_model_id] = scene_id
         self._data_stores[visual.visual_model_id] = data_store
+        self.open_data_store(data_store)
+
+    def open_data_store(self, data_store: BaseDataStore) -> None:
+        """Open *data_store*'s tensorstore handles in this manager's context.
+
+        A no-op for stores without tensorstore handles and for stores whose
+        handles are already open; those keep the context they were opened in.
+
+        Parameters
+        ----------
+        data_store : BaseDataStore
+            The store to open.
+        """
+        open_ts_stores = getattr(data_store, "open_ts_stores", None)
+        if open_ts_stores is not None:
+            open_ts_stores(self._ts_context)
 
     def add_canvas_overlay(
         self,
@@ -292,6 +339,10 @@ class RenderManager:
 
         The resulting _CanvasRawPointerEvent contains no gfx.* types.
         """
+        # The canvas under the pointer is the one the user is looking at;
+        # its chunk reads are scheduled ahead of other canvases.
+        self._slice_coordinator.focused_canvas_id = canvas_id
+
         if self._event_bus is None:
             return
 
@@ -539,8 +590,9 @@ class RenderManager:
             ID of the visual to remove.
         """
         scene_id = self._visual_to_scene.pop(visual_id)
-        self._data_stores.pop(visual_id)
+        data_store = self._data_stores.pop(visual_id)
         self._scenes[scene_id].remove_visual(visual_id)
+        self._release_host_cache(data_store)
 
     def remove_scene(self, scene_id: UUID) -> None:
         """Remove a scene and all its visuals and canvases.
@@ -557,7 +609,7 @@ class RenderManager:
         scene_manager = self._scenes.pop(scene_id)
         for vid in scene_manager.visual_ids:
             self._visual_to_scene.pop(vid, None)
-            self._data_stores.pop(vid, None)
+            self._release_host_cache(self._data_stores.pop(vid, None))
         # scene_manager goes out of scope here; GC drops gfx.Scene + all nodes.
 
         canvas_ids = [
@@ -566,8 +618,10 @@ class RenderManager:
         for cid in canvas_ids:
             self._canvas_to_scene.pop(cid)
             self._canvases.pop(cid).close()
+            self._forget_focus(cid)
             self._active_gestures.pop(cid, None)
             self._pick_details_enabled.pop(cid, None)
+            self._motion_predictors.pop(cid, None)
 
     def remove_canvas(self, canvas_id: UUID) -> None:
         """Remove a single canvas, closing it and dropping its references.
@@ -584,8 +638,10 @@ class RenderManager:
         """
         self._canvas_to_scene.pop(canvas_id)
         self._canvases.pop(canvas_id).close()
+        self._forget_focus(canvas_id)
         self._active_gestures.pop(canvas_id, None)
         self._pick_details_enabled.pop(canvas_id, None)
+        self._motion_predictors.pop(canvas_id, None)
 
     def close(self) -> None:
         """Close every registered canvas and drop the render references.
@@ -596,8 +652,46 @@ class RenderManager:
             canvas_view.close()
         self._canvases.clear()
         self._canvas_to_scene.clear()
+        self._slice_coordinator.focused_canvas_id = None
         self._active_gestures.clear()
         self._pick_details_enabled.clear()
+        self._motion_predictors.clear()
+        if self._slicer.host_cache is not None:
+            self._slicer.host_cache.clear()
+
+    def invalidate_host_cache(self, data_store_id: UUID) -> int:
+        """Drop host-cached chunks read from *data_store_id*.
+
+        Must be called whenever the contents of a cacheable store change
+        (e.g. after a paint commit) so the next reslice re-reads from the
+        store instead of serving stale decoded chunks from RAM.
+
+        Parameters
+        ----------
+        data_store_id : UUID
+            ID of the data store whose cached chunks are stale.
+
+        Returns
+        -------
+        int
+            Number of cached chunks dropped.
+        """
+        if self._slicer.host_cache is None:
+            return 0
+        return self._slicer.host_cache.invalidate(data_store_id)
+
+    def _forget_focus(self, canvas_id: UUID) -> None:
+        """Clear the scheduler's focused canvas if it is *canvas_id*."""
+        if self._slice_coordinator.focused_canvas_id == canvas_id:
+            self._slice_coordinator.focused_canvas_id = None
+
+    def _release_host_cache(self, data_store: BaseDataStore | None) -> None:
+        """Free host-cached chunks of *data_store* once no visual reads it."""
+        if data_store is None:
+            return
+        if any(ds is data_store for ds in self._data_stores.values()):
+            return
+        self.invalidate_host_cache(data_store.id)
 
     def _make_tick_fn(self, scene_id: UUID):
         """Return a callable that ticks all visuals in *scene_id*."""
@@ -637,6 +731,8 @@ class RenderManager:
 
         One reslicing request is submitted per registered canvas so that each
         canvas uses its own camera state for LOD and frustum-culling decisions.
+        The slices around the current one are then prefetched into the host
+        chunk cache at low priority (see ``SlicePrefetchConfig``).
 
         Parameters
         ----------
@@ -657,6 +753,9 @@ class RenderManager:
                 dims_state, target_visual_ids=target_visual_ids
             )
             self._slice_coordinator.submit(request, visual_configs)
+            self._slice_coordinator.prefetch_slices(
+                request, self._config.slice_prefetch, visual_configs
+            )
 
     def reslice_visual(
         self,
@@ -669,6 +768,7 @@ class RenderManager:
         Looks up which scene owns ``visual_id``, then submits one
         ``ReslicingRequest`` per registered canvas so that each canvas uses
         its own camera state.
+        Neighbouring slices are prefetched as in ``reslice_scene``.
 
         Parameters
         ----------
@@ -687,6 +787,55 @@ class RenderManager:
                 dims_state, target_visual_ids=frozenset({visual_id})
             )
             self._slice_coordinator.submit(request, {visual_id: cfg})
+            self._slice_coordinator.prefetch_slices(
+                request, self._config.slice_prefetch, {visual_id: cfg}
+            )
+
+    def prefetch_canvas(
+        self,
+        canvas_id: UUID,
+        dims_state: DimsState,
+        visual_configs: dict[UUID, VisualRenderConfig] | None = None,
+        target_visual_ids: frozenset[UUID] | None = None,
+    ) -> int:
+        """Feed a camera-motion sample and prefetch the predicted view.
+
+        Called on every camera change of *canvas_id*.  The canvas's
+        ``CameraMotionPredictor`` extrapolates the camera
+        ``prefetch_lookahead_s`` ahead; when a prediction is available
+        the predicted view is planned and its missing chunks are read
+        into the host cache at low priority.
+
+        Parameters
+        ----------
+        canvas_id : UUID
+            Canvas whose camera moved.
+        dims_state : DimsState
+            Current dimension display state of the canvas's scene.
+        visual_configs : dict[UUID, VisualRenderConfig] or None
+            Per-visual render configuration.  ``None`` falls back to defaults.
+        target_visual_ids : frozenset[UUID] or None
+            Visuals to prefetch for; ``None`` means every visual.
+
+        Returns
+        -------
+        int
+            Number of chunks submitted for prefetching.
+        """
+        canvas = self._canvases.get(canvas_id)
+        if canvas is None:
+            return 0
+        predictor = self._motion_predictors.get(canvas_id)
+        if predictor is None:
+            predictor = CameraMotionPredictor(self._config.camera)
+            self._motion_predictors[canvas_id] = predictor
+        request = canvas.capture_reslicing_request(
+            dims_state, target_visual_ids=target_visual_ids
+        )
+        predicted = predictor.update(request, time.perf_counter())
+        if predicted is None:
+            return 0
+        return self._slice_coordinator.prefetch(predicted, visual_configs or {})
 
     def look_at_visual(
         self,
@@ -245,10 +245,38 @@ class SceneManager:
             return self._build_slice_requests_2d(request, visual_configs)
         return self._build_slice_requests_3d(request, visual_configs)
 
+    def build_prefetch_requests(
+        self,
+        request: ReslicingRequest,
+        visual_configs: dict[UUID, VisualRenderConfig],
+    ) -> dict[UUID, list[ChunkRequest]]:
+        """Collect speculative ChunkRequests for a predicted camera.
+
+        Like ``build_slice_requests`` but calls each visual's read-only
+        ``build_prefetch_request`` / ``build_prefetch_request_2d``.
+        Visuals without those methods are skipped.
+
+        Parameters
+        ----------
+        request : ReslicingRequest
+            Reslicing request describing the predicted camera.
+        visual_configs : dict[UUID, VisualRenderConfig]
+            Per-visual render configuration.
+
+        Returns
+        -------
+        dict[UUID, list[ChunkRequest]]
+            Mapping of ``visual_model_id`` to that visual's prefetch requests.
+        """
+        if len(request.dims_state.selection.displayed_axes) == 2:
+            return self._build_slice_requests_2d(request, visual_configs, prefetch=True)
+        return self._build_slice_requests_3d(request, visual_configs, prefetch=True)
+
     def _build_slice_requests_3d(
         self,
         request: ReslicingRequest,
         visual_configs: dict[UUID, VisualRenderConfig],
+        prefetch: bool = False,
     ) -> dict[UUID, list[ChunkRequest]]:
         """3D planning path using perspective camera and frustum culling."""
         result: dict[UUID, list[ChunkRequest]] = {}
@@ -260,13 +288,21 @@ class SceneManager:
             ):
                 continue
 
+            build = (
+                getattr(visual, "build_prefetch_request", None)
+                if prefetch
+                else visual.build_slice_request
+            )
+            if build is None:
+                continue
+
             cfg = visual_configs.get(visual_id, VisualRenderConfig())
 
             frustum_corners_world = (
                 request.frustum_corners if cfg.frustum_cull else None
             )
 
-            chunk_requests = visual.build_slice_request(
+            chunk_requests = build(
                 camera_pos_world=request.camera_pos,
                 frustum_corners_world=frustum_corners_world,
                 fov_y_rad=request.fov_y_rad,
@@ -274,6 +310,7 @@ class SceneManager:
                 lod_bias=cfg.lod_bias,
                 dims_state=request.dims_state,
                 force_level=cfg.force_level,
+                progressive=cfg.progressive,
             )
             if chunk_requests:
                 result[visual_id] = chunk_requests
@@ -284,6 +321,7 @@ class SceneManager:
         self,
         request: ReslicingRequest,
         visual_configs: dict[UUID, VisualRenderConfig],
+        prefetch: bool = False,
     ) -> dict[UUID, list[ChunkRequest]]:
         """2D planning path using orthographic camera and viewport culling."""
         result: dict[UUID, list[ChunkRequest]] = {}
@@ -306,9 +344,17 @@ class SceneManager:
             ):
                 continue
 
+            build = (
+                getattr(visual, "build_prefetch_request_2d", None)
+                if prefetch
+                else visual.build_slice_request_2d
+            )
+            if build is None:
+                continue
+
             cfg = visual_configs.get(visual_id, VisualRenderConfig())
 
-            chunk_requests = visual.build_slice_request_2d(
+            chunk_requests = build(
                 camera_pos_world=request.camera_pos,
                 viewport_width_px=viewport_width_px,
                 world_width=world_width,
@@ -8,7 +8,7 @@ buffer references for the tile cache system.
 from __future__ import annotations
 
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 import numpy as np
 import pygfx as gfx
@@ -35,7 +35,8 @@ class ImageBlockMaterial(gfx.ImageBasicMaterial):
     Parameters
     ----------
     cache_texture : gfx.Texture
-        2D float32 texture -- the fixed-size tile cache.
+        2D texture -- the fixed-size tile cache (float32, float16 or
+        r8unorm).
     lut_texture : gfx.Texture
         RGBA float32 2D texture -- the per-tile address lookup table.
         Shape ``(gH, gW, 4)``.
@@ -49,8 +50,20 @@ class ImageBlockMaterial(gfx.ImageBasicMaterial):
         1D colourmap texture.
     interpolation : str
         Sampler filter for the cache texture.
+    value_scale : float
+        Factor applied to every cache sample to recover data units;
+        ``255.0`` for an ``r8unorm`` cache, ``1.0`` otherwise.
+    slot_params_texture : gfx.Texture or None
+        Per-slot ``(scale, offset)`` texture of a ``"uint8"``-precision
+        cache.  When set, each sample is dequantized as
+        ``sample * scale + offset``.
     """
 
+    uniform_type: ClassVar[dict] = dict(
+        gfx.ImageBasicMaterial.uniform_type,
+        value_scale="f4",
+    )
+
     def __init__(
         self,
         cache_texture: gfx.Texture,
@@ -62,6 +75,8 @@ class ImageBlockMaterial(gfx.ImageBasicMaterial):
         clim: tuple[float, float] = (0.0, 1.0),
         map: gfx.TextureMap | None = None,
         interpolation: str = "nearest",
+        value_scale: float = 1.0,
+        slot_params_texture: gfx.Texture | None = None,
         **kwargs,
     ) -> None:
         super().__init__(
@@ -76,6 +91,9 @@ class ImageBlockMaterial(gfx.ImageBasicMaterial):
         self.block_scales_buffer = block_scales_buffer
         self.paint_cache_texture = paint_cache_texture
         self.paint_lut_texture = paint_lut_texture
+        self.slot_params_texture = slot_params_texture
+        self.uniform_buffer.data["value_scale"] = float(value_scale)
+        self.uniform_buffer.update_full()
 
 
 _vertex_and_fragment = wgpu.ShaderStage.VERTEX | wgpu.ShaderStage.FRAGMENT
@@ -96,6 +114,7 @@ class ImageBlockShader(ImageShader):
         - t_lut: float32 LUT texture (textureLoad, no sampler)
         - u_lut_params: LutParams uniform
         - u_block_scales: BlockScales uniform
+        - t_slot_params: per-slot dequantization (quantized caches only)
         """
         geometry = wobject.geometry
         material = wobject.material
@@ -132,6 +151,14 @@ class ImageBlockShader(ImageShader):
         lut_view = GfxTextureView(material.lut_texture)
         bindings.append(Binding("t_lut", "texture/auto", lut_view, "FRAGMENT"))
 
+        # Per-slot (scale, offset) of a quantized cache.
+        self["quantized"] = material.slot_params_texture is not None
+        if self["quantized"]:
+            slot_params_view = GfxTextureView(material.slot_params_texture)
+            bindings.append(
+                Binding("t_slot_params", "texture/auto", slot_params_view, "FRAGMENT")
+            )
+
         # Uniform buffers.
         # structname= tells pygfx to auto-generate the WGSL struct
         # from the numpy dtype. Do NOT write the struct manually in WGSL.
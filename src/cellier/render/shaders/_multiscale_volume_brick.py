@@ -333,7 +333,8 @@ class MultiscaleVolumeBrickMaterial(gfx.VolumeIsoMaterial):
     Parameters
     ----------
     cache_texture : gfx.Texture
-        3D float32 texture — the fixed-size brick cache.
+        3D texture — the fixed-size brick cache (float32, float16 or
+        r8unorm).
     lut_texture : gfx.Texture
         RGBA8UI 3D texture — the per-brick address lookup table.
     vol_params_buffer : Buffer
@@ -351,11 +352,19 @@ class MultiscaleVolumeBrickMaterial(gfx.VolumeIsoMaterial):
         Depth attenuation coefficient for ``"attenuated_mip"`` mode.
         Higher values bias the max-finder toward the near surface.
         Has no effect in other render modes.  Default is ``1.0``.
+    value_scale : float
+        Factor applied to every cache sample to recover data units;
+        ``255.0`` for an ``r8unorm`` cache, ``1.0`` otherwise.
+    slot_params_texture : gfx.Texture, optional
+        Per-slot ``(scale, offset)`` texture of a ``"uint8"``-precision
+        cache.  When set, each sample is dequantized as
+        ``sample * scale + offset``.
     """
 
     uniform_type: ClassVar[dict] = dict(
         gfx.VolumeIsoMaterial.uniform_type,
         attenuation="f4",
+        value_scale="f4",
     )
 
     def __init__(
@@ -369,6 +378,8 @@ class MultiscaleVolumeBrickMaterial(gfx.VolumeIsoMaterial):
         map: gfx.TextureMap | None = None,
         threshold: float = 0.5,
         attenuation: float = 1.0,
+        value_scale: float = 1.0,
+        slot_params_texture: gfx.Texture | None = None,
         **kwargs,
     ) -> None:
         super().__init__(
@@ -381,10 +392,12 @@ class MultiscaleVolumeBrickMaterial(gfx.VolumeIsoMaterial):
         self.cache_texture = cache_texture
         self.lut_texture = lut_texture
         self.brick_max_texture = brick_max_texture
+        self.slot_params_texture = slot_params_texture
         self.vol_params_buffer = vol_params_buffer
         self.block_scales_buffer = block_scales_buffer
         self._store.render_mode = "iso"
         self.uniform_buffer.data["attenuation"] = float(attenuation)
+        self.uniform_buffer.data["value_scale"] = float(value_scale)
         self.uniform_buffer.update_full()
         self._frame_index: int = 0
 
@@ -475,6 +488,14 @@ class MultiscaleVolumeBrickShader(BaseVolumeShader):
             Binding("t_brick_max", "texture/auto", brick_max_view, "FRAGMENT")
         )
 
+        # Per-slot (scale, offset) of a quantized cache.
+        self["quantized"] = material.slot_params_texture is not None
+        if self["quantized"]:
+            slot_params_view = GfxTextureView(material.slot_params_texture)
+            bindings.append(
+                Binding("t_slot_params", "texture/auto", slot_params_view, "FRAGMENT")
+            )
+
         # Uniform buffers.
         bindings.append(
             Binding(
@@ -78,7 +78,15 @@ fn sample_im_lut(texcoord: vec2<f32>) -> vec4<f32> {
     let cache_pos   = tile_origin + within_tile + vec2<f32>(overlap);
     let cache_coord = cache_pos / cache_size;
 
-    return textureSample(t_cache, s_cache, cache_coord);
+    // Normalised cache formats (r8unorm) sample as value / max.
+    let sampled = textureSample(t_cache, s_cache, cache_coord) * u_material.value_scale;
+$$ if quantized
+    // Quantized cache: per-slot dequantization, value = code * scale + offset.
+    let params = textureLoad(t_slot_params, vec2<i32>(lutv.xy), 0).xy;
+    return vec4<f32>(sampled.r * params.x + params.y, sampled.gba);
+$$ else
+    return sampled;
+$$ endif
 }
 
 
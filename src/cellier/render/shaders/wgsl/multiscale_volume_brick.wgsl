@@ -161,7 +161,15 @@ fn sample_atlas(
     let cache_pos   = tile_origin + pos_in_brick + vec3<f32>(BORDER + 0.5);
     let cache_coord = cache_pos / cache_size;
 
-    return textureSample(t_cache, s_cache, cache_coord).r;
+    // Normalised cache formats (r8unorm) sample as value / max.
+    let sampled = textureSample(t_cache, s_cache, cache_coord).r * u_material.value_scale;
+$$ if quantized
+    // Quantized cache: per-slot dequantization, value = code * scale + offset.
+    let params = textureLoad(t_slot_params, vec3<i32>(lut_entry.xyz), 0).xy;
+    return sampled * params.x + params.y;
+$$ else
+    return sampled;
+$$ endif
 }
 
 // ── Brick setup ───────────────────────────────────────────────────────────
@@ -2,20 +2,63 @@
 
 from __future__ import annotations
 
+import math
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
+import numpy as np
+
+from cellier.data.image._padded_read import padded_out_shape
 from cellier.events._events import ResliceCompletedEvent, ResliceStartedEvent
+from cellier.render._prefetch import neighbour_slice_states
+from cellier.render._scene_config import VisualRenderConfig
 
 if TYPE_CHECKING:
-    from cellier.data.image import MultiscaleZarrDataStore
+    from cellier.data.image import ChunkRequest, MultiscaleZarrDataStore
     from cellier.events._bus import EventBus
     from cellier.events._events import DimsChangedEvent
+    from cellier.render._config import SlicePrefetchConfig
     from cellier.render._requests import ReslicingRequest
-    from cellier.render._scene_config import VisualRenderConfig
     from cellier.render.scene_manager import SceneManager
     from cellier.slicer import AsyncSlicer
 
+# Leading element of every submission priority: reads for the displayed
+# view always outrank speculative prefetch reads.
+_LOAD_TIER = 0
+_PREFETCH_TIER = 1
+
+# Bytes per decoded voxel, used to charge prefetches against their budget,
+# for stores that do not report a ``read_dtype`` (labels deliver int32).
+_PREFETCH_ITEMSIZE = 4
+
+
+def _read_itemsize(data_store) -> int:
+    """Bytes per voxel of the arrays *data_store* reads into the host cache."""
+    dtype = getattr(data_store, "read_dtype", None)
+    return dtype.itemsize if isinstance(dtype, np.dtype) else _PREFETCH_ITEMSIZE
+
+
+def _level0_extents(
+    scene_manager: SceneManager, visual_ids: frozenset[UUID] | None
+) -> dict[int, int]:
+    """Largest level-0 extent of each data axis over the scene's visuals."""
+    extents: dict[int, int] = {}
+    for visual_id in scene_manager.visual_ids:
+        if visual_ids is not None and visual_id not in visual_ids:
+            continue
+        shapes = getattr(
+            scene_manager.get_visual(visual_id), "_full_level_shapes", None
+        )
+        if not isinstance(shapes, list) or not shapes:
+            continue
+        for axis, n in enumerate(shapes[0]):
+            extents[axis] = max(extents.get(axis, 0), int(n))
+    return extents
+
+
+def _discard_batch(batch: list[tuple[ChunkRequest, object]]) -> None:
+    """Prefetch callback: the data already landed in the host cache."""
+
 
 class SliceCoordinator:
     """Thin orchestrator owned by ``RenderManager``.
@@ -50,6 +93,11 @@ class SliceCoordinator:
         self._slicer = slicer
         self._data_stores = data_stores
         self._active_slice_ids: dict[tuple[UUID, UUID, UUID], UUID] = {}
+        # Same keying, for speculative host-cache prefetch tasks.
+        self._prefetch_slice_ids: dict[tuple[UUID, UUID, UUID], UUID] = {}
+        # Canvas that most recently received pointer input.  Its reads are
+        # scheduled ahead of other canvases' reads.  None = no preference.
+        self.focused_canvas_id: UUID | None = None
         # Set by RenderManager.connect_event_bus so the coordinator can emit
         # ResliceStartedEvent / ResliceCompletedEvent.  None until wired (e.g.
         # in unit tests that drive submit() directly without a bus).
@@ -75,6 +123,11 @@ class SliceCoordinator:
         ``cancellable`` as part of their public API; an ``AttributeError``
         indicates a missing implementation.
 
+        Visuals that also set ``reuses_in_flight`` (``GFXMultiscaleImageVisual``)
+        are detached instead: their task stops but its running reads are
+        offered to the new submission, which keeps those the new plan still
+        needs (see ``AsyncSlicer.detach``).
+
         Parameters
         ----------
         request : ReslicingRequest
@@ -89,6 +142,8 @@ class SliceCoordinator:
         else:
             to_cancel = frozenset(scene_manager.visual_ids)
 
+        is_2d = len(request.dims_state.selection.displayed_axes) == 2
+        detached: dict[UUID, dict] = {}
         for visual_id in to_cancel:
             try:
                 gfx_visual = scene_manager.get_visual(visual_id)
@@ -96,11 +151,21 @@ class SliceCoordinator:
                 # Visual not yet registered in render layer; cancel defensively.
                 self.cancel_visual(request.scene_id, request.canvas_id, visual_id)
                 continue
-            if gfx_visual.cancellable:
+            if getattr(gfx_visual, "reuses_in_flight", False):
+                detached[visual_id] = self._detach_visual(
+                    request.scene_id, request.canvas_id, visual_id, is_2d
+                )
+            elif gfx_visual.cancellable:
                 self.cancel_visual(request.scene_id, request.canvas_id, visual_id)
 
         requests_by_visual = scene_manager.build_slice_requests(request, visual_configs)
 
+        # Detached visuals with nothing to load this time are done with
+        # their old reads and slots.
+        for visual_id in detached.keys() - requests_by_visual.keys():
+            self._slicer.cancel_reads(detached.pop(visual_id))
+            self.cancel_visual(request.scene_id, request.canvas_id, visual_id)
+
         # Announce the start of the reslice cycle for the visuals being loaded.
         if self._event_bus is not None and requests_by_visual:
             self._event_bus.emit(
@@ -112,11 +177,12 @@ class SliceCoordinator:
                 )
             )
 
-        is_2d = len(request.dims_state.selection.displayed_axes) == 2
+        canvas_rank = self._canvas_rank(request.canvas_id)
 
         for visual_id, chunk_requests in requests_by_visual.items():
             visual = scene_manager.get_visual(visual_id)
             data_store = self._data_stores[visual_id]
+            cfg = visual_configs.get(visual_id, VisualRenderConfig())
 
             # Use the appropriate callback for the scene dimensionality.
             callback = visual.on_data_ready_2d if is_2d else visual.on_data_ready
@@ -139,6 +205,18 @@ class SliceCoordinator:
                 callback=callback,
                 consumer_id=str(visual_id),
                 on_complete=_on_complete,
+                cache_namespace=(
+                    data_store.id
+                    if getattr(data_store, "host_cacheable", False)
+                    else None
+                ),
+                priority=(_LOAD_TIER, cfg.load_priority, canvas_rank),
+                batch_fetch_fn=(
+                    data_store.get_data_batch
+                    if getattr(data_store, "supports_batch_read", False)
+                    else None
+                ),
+                adopt=detached.get(visual_id),
             )
             if slice_id is not None:
                 self._active_slice_ids[
@@ -152,6 +230,172 @@ class SliceCoordinator:
                     request.scene_id, request.canvas_id, visual_id, brick_count
                 )
 
+    def prefetch(
+        self,
+        request: ReslicingRequest,
+        visual_configs: dict[UUID, VisualRenderConfig],
+    ) -> int:
+        """Warm the host chunk cache for a predicted camera.
+
+        Plans each visual against ``request`` with the read-only
+        ``SceneManager.build_prefetch_requests`` and submits the chunks
+        that are neither on the GPU nor in the host cache at the lowest
+        priority tier, with a no-op callback.  Any earlier prefetch for
+        the same canvas and visuals is cancelled first.  Does nothing
+        when the slicer has no enabled host cache.
+
+        Parameters
+        ----------
+        request : ReslicingRequest
+            Reslicing request describing the predicted camera.
+        visual_configs : dict[UUID, VisualRenderConfig]
+            Per-visual render configuration.
+
+        Returns
+        -------
+        int
+            Number of chunks submitted for prefetching.
+        """
+        return self._submit_prefetch(request, [request], visual_configs)
+
+    def prefetch_slices(
+        self,
+        request: ReslicingRequest,
+        config: SlicePrefetchConfig,
+        visual_configs: dict[UUID, VisualRenderConfig],
+    ) -> int:
+        """Warm the host chunk cache for the slices around ``request``.
+
+        Plans the current view at every neighbouring slice position given
+        by ``neighbour_slice_states``, within the visuals' level-0 extents,
+        and submits the missing chunks at
+        the lowest priority tier, nearest positions first, until
+        ``config.budget_bytes`` is spent.  Because prefetch reads only
+        run when no displayed-view read is waiting, this happens in the
+        I/O idle time after the current slice has loaded.
+
+        Parameters
+        ----------
+        request : ReslicingRequest
+            Reslicing request for the current view.
+        config : SlicePrefetchConfig
+            Per-axis radii and byte budget.
+        visual_configs : dict[UUID, VisualRenderConfig]
+            Per-visual render configuration.
+
+        Returns
+        -------
+        int
+            Number of chunks submitted for prefetching.
+        """
+        scene_manager = self._scenes.get(request.scene_id)
+        extents = (
+            {}
+            if scene_manager is None
+            else _level0_extents(scene_manager, request.target_visual_ids)
+        )
+        neighbours = [
+            request._replace(dims_state=state, request_id=uuid4())
+            for state in neighbour_slice_states(request.dims_state, config, extents)
+        ]
+        if not neighbours or config.budget_bytes == 0:
+            return 0
+        return self._submit_prefetch(
+            request, neighbours, visual_configs, config.budget_bytes
+        )
+
+    def _submit_prefetch(
+        self,
+        request: ReslicingRequest,
+        planned: list[ReslicingRequest],
+        visual_configs: dict[UUID, VisualRenderConfig],
+        budget_bytes: int | None = None,
+    ) -> int:
+        """Plan every request in *planned* and submit one prefetch per visual.
+
+        *request* identifies the scene, canvas and target visuals whose
+        earlier prefetch tasks are replaced.  Chunks are deduplicated
+        across *planned* and against the host cache, and accepted in
+        order until *budget_bytes* (``None`` = unbounded) is spent.
+        """
+        for key in [
+            k
+            for k in self._prefetch_slice_ids
+            if k[:2] == (request.scene_id, request.canvas_id)
+            and (request.target_visual_ids is None or k[2] in request.target_visual_ids)
+        ]:
+            self._slicer.cancel(self._prefetch_slice_ids.pop(key))
+
+        cache = getattr(self._slicer, "host_cache", None)
+        scene_manager = self._scenes.get(request.scene_id)
+        if cache is None or not cache.enabled or scene_manager is None:
+            return 0
+
+        requests_by_visual: dict[UUID, list[ChunkRequest]] = {}
+        seen: set = set()
+        remaining = budget_bytes
+        for planned_request in planned:
+            planned_by_visual = scene_manager.build_prefetch_requests(
+                planned_request, visual_configs
+            )
+            for visual_id, chunk_requests in planned_by_visual.items():
+                data_store = self._data_stores.get(visual_id)
+                if data_store is None or not getattr(
+                    data_store, "host_cacheable", False
+                ):
+                    continue
+                accepted = requests_by_visual.setdefault(visual_id, [])
+                itemsize = _read_itemsize(data_store)
+                for r in chunk_requests:
+                    key = cache.make_key(data_store.id, r)
+                    if key in seen or key in cache:
+                        continue
+                    if remaining is not None:
+                        nbytes = itemsize * math.prod(
+                            padded_out_shape(r.axis_selections)
+                        )
+                        if nbytes > remaining:
+                            remaining = 0
+                            break
+                        remaining -= nbytes
+                    seen.add(key)
+                    accepted.append(r)
+                if remaining == 0:
+                    break
+            if remaining == 0:
+                break
+
+        canvas_rank = self._canvas_rank(request.canvas_id)
+        n_submitted = 0
+        for visual_id, chunk_requests in requests_by_visual.items():
+            data_store = self._data_stores[visual_id]
+            cfg = visual_configs.get(visual_id, VisualRenderConfig())
+            slice_id = self._slicer.submit(
+                chunk_requests,
+                fetch_fn=data_store.get_data,
+                callback=_discard_batch,
+                consumer_id=f"prefetch:{visual_id}",
+                cache_namespace=data_store.id,
+                priority=(_PREFETCH_TIER, cfg.load_priority, canvas_rank),
+                batch_fetch_fn=(
+                    data_store.get_data_batch
+                    if getattr(data_store, "supports_batch_read", False)
+                    else None
+                ),
+            )
+            if slice_id is not None:
+                self._prefetch_slice_ids[
+                    (request.scene_id, request.canvas_id, visual_id)
+                ] = slice_id
+                n_submitted += len(chunk_requests)
+        return n_submitted
+
+    def _canvas_rank(self, canvas_id: UUID) -> int:
+        """Return 0 for the focused (or any, if none) canvas, 1 otherwise."""
+        if self.focused_canvas_id is None or canvas_id == self.focused_canvas_id:
+            return 0
+        return 1
+
     def _emit_reslice_completed(
         self, scene_id: UUID, canvas_id: UUID, visual_id: UUID, brick_count: int
     ) -> None:
@@ -191,20 +435,46 @@ class SliceCoordinator:
         scene_id : UUID
             ID of the scene whose tasks should be cancelled.
         """
-        keys = [
+        keys = {
             (s_id, c_id, v_id)
-            for (s_id, c_id, v_id) in list(self._active_slice_ids.keys())
+            for (s_id, c_id, v_id) in [
+                *self._active_slice_ids,
+                *self._prefetch_slice_ids,
+            ]
             if s_id == scene_id
-        ]
+        }
         for s_id, c_id, v_id in keys:
             self.cancel_visual(s_id, c_id, v_id)
 
+    def _detach_visual(
+        self, scene_id: UUID, canvas_id: UUID, visual_id: UUID, is_2d: bool
+    ) -> dict:
+        """Stop one visual's task, returning its reads for the replan to adopt.
+
+        Like ``cancel_visual`` but the reads keep running and the slots of
+        the dimensionality being replanned stay reserved: the visual's
+        ``stage()`` keeps the ones its new plan needs and frees the rest.
+        """
+        key = (scene_id, canvas_id, visual_id)
+        reads = self._slicer.detach(self._active_slice_ids.pop(key, None))
+        prefetch_id = self._prefetch_slice_ids.pop(key, None)
+        if prefetch_id is not None:
+            self._slicer.cancel(prefetch_id)
+
+        visual = self._scenes[scene_id].get_visual(visual_id)
+        if is_2d and "3d" in visual.render_modes:
+            visual.cancel_pending()
+        elif not is_2d and "2d" in visual.render_modes:
+            visual.cancel_pending_2d()
+        return reads
+
     def cancel_visual(self, scene_id: UUID, canvas_id: UUID, visual_id: UUID) -> None:
         """Cancel the in-flight task for one visual on one canvas.
 
-        Also calls ``visual.cancel_pending()`` or ``cancel_pending_2d()``
-        to release any GPU slots reserved during the last planning phase
-        that were never committed.
+        Also cancels any prefetch task for the visual and calls
+        ``visual.cancel_pending()`` or ``cancel_pending_2d()`` to release
+        any GPU slots reserved during the last planning phase that were
+        never committed.
 
         Parameters
         ----------
@@ -219,6 +489,9 @@ class SliceCoordinator:
         slice_id = self._active_slice_ids.pop(key, None)
         if slice_id is not None:
             self._slicer.cancel(slice_id)
+        prefetch_id = self._prefetch_slice_ids.pop(key, None)
+        if prefetch_id is not None:
+            self._slicer.cancel(prefetch_id)
 
         scene = self._scenes.get(scene_id)
         if scene is not None:
@@ -245,8 +518,10 @@ class SliceCoordinator:
         action is needed here.
 
         When only ``slice_indices`` changed, every 2D-capable visual in
-        the scene has its committed tile cache cleared and its LUT
-        indirection table rebuilt against the empty cache.
+        the scene cancels its in-flight tile loads.  Committed tiles are
+        kept: they render as placeholders until the new slice loads, then
+        move to the tile manager's reserve tier so that returning to the
+        slice costs no I/O.
         """
         if event.displayed_axes_changed:
             return
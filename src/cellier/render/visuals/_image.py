@@ -11,6 +11,7 @@ import pygfx as gfx
 
 from cellier.data.image import ChunkRequest
 from cellier.logging import _GPU_LOGGER, _PERF_LOGGER
+from cellier.render._brick_ranges import BrickValueRanges
 from cellier.render._frustum import (
     bricks_in_frustum_arr,
     frustum_planes_from_corners,
@@ -18,6 +19,7 @@ from cellier.render._frustum import (
 from cellier.render._level_of_detail import (
     arr_to_brick_keys,
     build_level_grids,
+    progressive_cover_order,
     select_levels_arr_forced,
     select_levels_from_cache,
     sort_arr_by_distance,
@@ -25,9 +27,16 @@ from cellier.render._level_of_detail import (
 from cellier.render._level_of_detail_2d import (
     arr_to_block_keys_2d,
     build_tile_grids_2d,
-    select_lod_2d,
+    select_level_2d,
+    select_mixed_lod_2d,
     sort_tiles_by_distance_2d,
-    viewport_cull_2d,
+    tile_grid_dims_2d,
+    tiles_in_view_2d,
+)
+from cellier.render._lod_octree import (
+    build_octree_levels,
+    select_levels_octree,
+    select_levels_sse,
 )
 from cellier.render.block_cache import (
     BlockCache3D,
@@ -36,9 +45,11 @@ from cellier.render.block_cache import (
     compute_block_cache_parameters_3d,
 )
 from cellier.render.block_cache._block_cache_2d import BlockCache2D
+from cellier.render.block_cache._cache_dtype import cache_dtype_for, cache_value_scale
 from cellier.render.block_cache._cache_parameters_2d import (
     compute_block_cache_parameters_2d,
 )
+from cellier.render.block_cache._quantization import cache_storage_dtype
 from cellier.render.lut_indirection import BlockLayout3D, LutIndirectionManager3D
 from cellier.render.lut_indirection._layout_2d import BlockLayout2D
 from cellier.render.lut_indirection._lut_buffers_2d import (
@@ -75,6 +86,8 @@ from cellier.transform import AffineTransform
 from cellier.transform._axis_order import select_axes, swap_axes
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from pygfx.resources import Buffer
 
     from cellier._state import AxisAlignedSelectionState, DimsState
@@ -87,12 +100,16 @@ if TYPE_CHECKING:
         TransformChangedEvent,
         VisualVisibilityChangedEvent,
     )
+    from cellier.render._lod_octree import LodStrategy
+    from cellier.render.block_cache._quantization import CachePrecision
     from cellier.render.block_cache._tile_manager_2d import (
         BlockKey2D,
+        TileManager2D,
     )
     from cellier.render.block_cache._tile_manager_2d import (
         TileSlot as TileSlot2D,
     )
+    from cellier.render.block_cache._tile_manager_3d import TileManager3D
     from cellier.visuals._image import MultiscaleImageVisual
 
 # Importing this module registers the shader class with pygfx via the
@@ -375,7 +392,10 @@ class MultiscaleBrickLayout3D:
             for shape in level_shapes
         ]
         self.base_layout = self.layouts[0]
-        self._level_grids = build_level_grids(
+        # The per-brick grids grow with the finest level's brick count, so
+        # they are only built when a caller needs them (see _level_grids).
+        self._level_grids_cache: list[dict] | None = None
+        self._octree_levels = build_octree_levels(
             self.base_layout,
             self.n_levels,
             self._scale_vecs_shader,
@@ -383,6 +403,19 @@ class MultiscaleBrickLayout3D:
             level_shapes=self.level_shapes,
         )
 
+    @property
+    def _level_grids(self) -> list[dict]:
+        """Per-level coarse grid arrays, built on first access."""
+        if self._level_grids_cache is None:
+            self._level_grids_cache = build_level_grids(
+                self.base_layout,
+                self.n_levels,
+                self._scale_vecs_shader,
+                self._translation_vecs_shader,
+                level_shapes=self.level_shapes,
+            )
+        return self._level_grids_cache
+
     def update(self, level_shapes: list[tuple[int, ...]]) -> None:
         """Rebuild from new level shapes after a DataStoreMutated event."""
         self._rebuild(level_shapes)
@@ -451,13 +484,28 @@ class ImageGeometry3D:
             shape=tuple(level_shapes[0]),
             block_size=block_size,
         )
-        self._level_grids = build_tile_grids_2d(
-            self.base_layout,
-            n_levels,
-            level_shapes=self.level_shapes,
-            scale_vecs_shader=self._scale_vecs_shader,
-            translation_vecs_shader=self._translation_vecs_shader,
+        self._rebuild_grids()
+
+    def _rebuild_grids(self) -> None:
+        self._tile_grid_dims = tile_grid_dims_2d(
+            self.base_layout, self.n_levels, level_shapes=self.level_shapes
         )
+        # The planner enumerates visible tiles from _tile_grid_dims; the full
+        # per-tile grids are only built when a caller needs them.
+        self._level_grids_cache: list[dict] | None = None
+
+    @property
+    def _level_grids(self) -> list[dict]:
+        """Per-level tile grid arrays, built on first access."""
+        if self._level_grids_cache is None:
+            self._level_grids_cache = build_tile_grids_2d(
+                self.base_layout,
+                self.n_levels,
+                level_shapes=self.level_shapes,
+                scale_vecs_shader=self._scale_vecs_shader,
+                translation_vecs_shader=self._translation_vecs_shader,
+            )
+        return self._level_grids_cache
 
     def update(self, level_shapes: list[tuple[int, int]]) -> None:
         """Rebuild from new level shapes after displayed axes change."""
@@ -466,13 +514,7 @@ class ImageGeometry3D:
             shape=tuple(level_shapes[0]),
             block_size=self.block_size,
         )
-        self._level_grids = build_tile_grids_2d(
-            self.base_layout,
-            self.n_levels,
-            level_shapes=self.level_shapes,
-            scale_vecs_shader=self._scale_vecs_shader,
-            translation_vecs_shader=self._translation_vecs_shader,
-        )
+        self._rebuild_grids()
 
 
 # ---------------------------------------------------------------------------
@@ -560,6 +602,23 @@ def _block_key_2d_to_padded_coords(
     return y0, x0, y0 + padded, x0 + padded
 
 
+def _adopted_pending(
+    pending_slot_map: dict[UUID, tuple],
+    tile_manager: TileManager2D | TileManager3D,
+) -> list[tuple]:
+    """Return the pending entries ``stage()`` kept in flight for a new plan.
+
+    Each ``(chunk_id, key, slot)`` keeps its original chunk id so the
+    slicer can hand the read already under way to the new submission.
+    """
+    in_flight = tile_manager.in_flight
+    return [
+        (chunk_id, key, slot)
+        for chunk_id, (key, slot) in pending_slot_map.items()
+        if in_flight.get(slot.index) == key
+    ]
+
+
 # ---------------------------------------------------------------------------
 # GFXMultiscaleImageVisual
 # ---------------------------------------------------------------------------
@@ -594,9 +653,38 @@ class GFXMultiscaleImageVisual:
         Maximum GPU memory for the 3D brick cache texture.
     gpu_budget_bytes_2d : int
         Maximum GPU memory for the 2D tile cache texture.
+    data_dtype : np.dtype or None
+        Native dtype of the data store.  The caches keep bricks in this
+        dtype when it has a native GPU format (see ``cache_dtype_for``),
+        so narrower data fits more bricks in the same budget.  ``None``
+        uses float32.
+    cache_precision : {"native", "float16", "uint8"}
+        Opt-in lossy cache storage for data that would otherwise be cached
+        as float32.  Ignored for data with a narrower native cache dtype.
+    upload_budget_bytes : int or None
+        Maximum bytes uploaded into each cache texture per frame; larger
+        batches are spread over several frames.  ``None`` uploads every
+        arriving batch at once.
+    lod_strategy : {"distance_bands", "octree", "screen_space_error"}
+        How ``_plan_bricks`` selects LOD levels.  ``"distance_bands"``
+        scores every brick of every level; ``"octree"`` refines the
+        pyramid top-down from the coarsest level, pruning subtrees
+        outside the frustum (see ``select_levels_octree``);
+        ``"screen_space_error"`` refines the brick with the largest
+        projected voxel size first until the slot budget is full (see
+        ``select_levels_sse``).
+    index_owner : GFXMultiscaleImageVisual or None
+        Visual whose tile managers and LUTs this one shares instead of
+        building its own, so that its cache textures become further
+        layers of the owner's (see ``LayeredBlockCache``).  The owner
+        must be built, and its geometry rebuilt, before this visual's,
+        with the same geometry and budgets.  Used by multichannel slots.
     """
 
     cancellable: bool = True
+    #: Replans keep still-needed in-flight reads instead of cancelling them.
+    #: SliceCoordinator.submit() detaches rather than cancels such visuals.
+    reuses_in_flight: bool = True
 
     def __init__(
         self,
@@ -622,8 +710,14 @@ class GFXMultiscaleImageVisual:
         render_order: int = 0,
         pick_write: bool = True,
         paint_max_tiles: int = 512,
+        data_dtype: np.dtype | None = None,
+        cache_precision: CachePrecision = "native",
+        upload_budget_bytes: int | None = None,
+        lod_strategy: LodStrategy = "distance_bands",
+        index_owner: GFXMultiscaleImageVisual | None = None,
     ) -> None:
         self.visual_model_id = visual_model_id
+        self._index_owner = index_owner
 
         # ndim of the original data (not the displayed subspace).
         if full_level_shapes is not None:
@@ -700,6 +794,17 @@ class GFXMultiscaleImageVisual:
             else 32
         )
         self._gpu_budget_bytes_2d: int = gpu_budget_bytes_2d
+        native_cache_dtype = cache_dtype_for(data_dtype)
+        self._cache_precision: CachePrecision = (
+            cache_precision if native_cache_dtype == np.float32 else "native"
+        )
+        self._cache_dtype: np.dtype = (
+            cache_storage_dtype(self._cache_precision) or native_cache_dtype
+        )
+        self._upload_budget_bytes: int | None = upload_budget_bytes
+        self._lod_strategy: LodStrategy = lod_strategy
+        # Per-brick (min, max) for empty-space skipping in _plan_bricks.
+        self._brick_ranges_3d = BrickValueRanges()
 
         # ── 3D GPU resources (only when volume_geometry is provided) ───
         self._block_cache_3d: BlockCache3D | None = None
@@ -709,13 +814,16 @@ class GFXMultiscaleImageVisual:
                 block_size=volume_geometry.block_size,
                 gpu_budget_bytes=gpu_budget_bytes_3d,
                 overlap=3,
+                dtype=self._cache_dtype,
             )
-            self._block_cache_3d = BlockCache3D(cache_parameters=cache_parameters_3d)
-            self._lut_manager_3d = LutIndirectionManager3D(
-                base_layout=volume_geometry.base_layout,
-                n_levels=volume_geometry.n_levels,
-                level_scale_vecs_data=volume_geometry._scale_vecs_data,
+            self._block_cache_3d = BlockCache3D(
+                cache_parameters=cache_parameters_3d,
+                dtype=self._cache_dtype,
+                precision=self._cache_precision,
+                upload_budget_bytes=self._upload_budget_bytes,
+                tile_manager=self._owner_tile_manager("3d"),
             )
+            self._lut_manager_3d = self._make_lut_manager_3d()
 
         # ── 2D GPU resources (only when image_geometry_2d is provided) ─
         self._block_cache_2d: BlockCache2D | None = None
@@ -737,13 +845,16 @@ class GFXMultiscaleImageVisual:
             cache_parameters_2d = compute_block_cache_parameters_2d(
                 gpu_budget_bytes=gpu_budget_bytes_2d,
                 block_size=image_geometry_2d.block_size,
+                dtype=self._cache_dtype,
             )
-            self._block_cache_2d = BlockCache2D(cache_parameters=cache_parameters_2d)
-            self._lut_manager_2d = LutIndirectionManager2D(
-                base_layout=image_geometry_2d.base_layout,
-                n_levels=image_geometry_2d.n_levels,
-                scale_vecs_data=image_geometry_2d._scale_vecs_data,
+            self._block_cache_2d = BlockCache2D(
+                cache_parameters=cache_parameters_2d,
+                dtype=self._cache_dtype,
+                precision=self._cache_precision,
+                upload_budget_bytes=self._upload_budget_bytes,
+                tile_manager=self._owner_tile_manager("2d"),
             )
+            self._lut_manager_2d = self._make_lut_manager_2d()
             self._lut_params_buffer_2d = build_lut_params_buffer_2d(
                 image_geometry_2d.base_layout, cache_parameters_2d
             )
@@ -861,6 +972,7 @@ class GFXMultiscaleImageVisual:
         level_shapes: list[tuple[int, ...]],
         render_modes: set[str],
         displayed_axes: tuple[int, ...],
+        data_dtype: np.dtype | None = None,
     ) -> GFXMultiscaleImageVisual:
         """Build a ``GFXMultiscaleImageVisual`` from a ``MultiscaleImageVisual`` model.
 
@@ -880,6 +992,8 @@ class GFXMultiscaleImageVisual:
             is 3D; ``len == 2`` means 2D.  In dual-mode (``{"2d", "3d"}``),
             when starting in 3D the 2D geometry is built from
             ``displayed_axes[-2:]``.
+        data_dtype : np.dtype or None
+            Native dtype of the data store; selects the cache dtype.
 
         Returns
         -------
@@ -956,6 +1070,10 @@ class GFXMultiscaleImageVisual:
             full_level_shapes=list(level_shapes),
             pick_write=model.pick_write,
             paint_max_tiles=render_config.paint_max_tiles,
+            data_dtype=data_dtype,
+            cache_precision=render_config.cache_precision,
+            upload_budget_bytes=render_config.upload_budget_bytes,
+            lod_strategy=render_config.lod_strategy,
         )
         for mat in (instance.material_3d, instance.material_2d):
             if mat is not None:
@@ -1171,13 +1289,16 @@ class GFXMultiscaleImageVisual:
             block_size=self._volume_geometry.block_size,
             gpu_budget_bytes=self._gpu_budget_bytes,
             overlap=3,
+            dtype=self._cache_dtype,
         )
-        self._block_cache_3d = BlockCache3D(cache_parameters=cache_parameters_3d)
-        self._lut_manager_3d = LutIndirectionManager3D(
-            base_layout=self._volume_geometry.base_layout,
-            n_levels=self._volume_geometry.n_levels,
-            level_scale_vecs_data=self._volume_geometry._scale_vecs_data,
+        self._block_cache_3d = BlockCache3D(
+            cache_parameters=cache_parameters_3d,
+            dtype=self._cache_dtype,
+            precision=self._cache_precision,
+            upload_budget_bytes=self._upload_budget_bytes,
+            tile_manager=self._owner_tile_manager("3d"),
         )
+        self._lut_manager_3d = self._make_lut_manager_3d()
         ds = self._volume_geometry.level_shapes[0]
         self._dataset_size = np.asarray(
             swap_axes(tuple(float(s) for s in ds), (2, 1, 0)),
@@ -1263,13 +1384,16 @@ class GFXMultiscaleImageVisual:
         cache_parameters_2d = compute_block_cache_parameters_2d(
             gpu_budget_bytes=self._gpu_budget_bytes_2d,
             block_size=self._image_geometry_2d.block_size,
+            dtype=self._cache_dtype,
         )
-        self._block_cache_2d = BlockCache2D(cache_parameters=cache_parameters_2d)
-        self._lut_manager_2d = LutIndirectionManager2D(
-            base_layout=self._image_geometry_2d.base_layout,
-            n_levels=self._image_geometry_2d.n_levels,
-            scale_vecs_data=self._image_geometry_2d._scale_vecs_data,
+        self._block_cache_2d = BlockCache2D(
+            cache_parameters=cache_parameters_2d,
+            dtype=self._cache_dtype,
+            precision=self._cache_precision,
+            upload_budget_bytes=self._upload_budget_bytes,
+            tile_manager=self._owner_tile_manager("2d"),
         )
+        self._lut_manager_2d = self._make_lut_manager_2d()
         self._lut_params_buffer_2d = build_lut_params_buffer_2d(
             self._image_geometry_2d.base_layout, cache_parameters_2d
         )
@@ -1308,15 +1432,10 @@ class GFXMultiscaleImageVisual:
 
     def _rebuild_3d_resources(self) -> None:
         """Rebuild 3D GPU resources after geometry update."""
-        geo = self._volume_geometry
         # Clear cache
         self._block_cache_3d.tile_manager.release_all_in_flight()
         # Rebuild LUT manager
-        self._lut_manager_3d = LutIndirectionManager3D(
-            base_layout=geo.base_layout,
-            n_levels=geo.n_levels,
-            level_scale_vecs_data=geo._scale_vecs_data,
-        )
+        self._lut_manager_3d = self._make_lut_manager_3d()
         # Rebuild node preserving current appearance
         if self.node_3d is not None:
             colormap = self.material_3d.map
@@ -1344,11 +1463,7 @@ class GFXMultiscaleImageVisual:
         # Clear cache
         self._block_cache_2d.tile_manager.release_all_in_flight()
         # Rebuild LUT manager
-        self._lut_manager_2d = LutIndirectionManager2D(
-            base_layout=geo2d.base_layout,
-            n_levels=geo2d.n_levels,
-            scale_vecs_data=geo2d._scale_vecs_data,
-        )
+        self._lut_manager_2d = self._make_lut_manager_2d()
         # Rebuild param buffers
         self._lut_params_buffer_2d = build_lut_params_buffer_2d(
             geo2d.base_layout, self._block_cache_2d.info
@@ -1375,6 +1490,36 @@ class GFXMultiscaleImageVisual:
                 self._update_node_matrix(self._last_displayed_axes)
         self._pending_slot_map_2d = {}
 
+    def _owner_tile_manager(self, mode: str) -> TileManager2D | TileManager3D | None:
+        """Return the index owner's tile manager for *mode*, if there is one."""
+        owner = self._index_owner
+        if owner is None:
+            return None
+        cache = owner._block_cache_3d if mode == "3d" else owner._block_cache_2d
+        return None if cache is None else cache.tile_manager
+
+    def _make_lut_manager_3d(self) -> LutIndirectionManager3D:
+        """Build the 3D LUT manager for the current geometry, or share the owner's."""
+        if self._index_owner is not None:
+            return self._index_owner._lut_manager_3d
+        geo = self._volume_geometry
+        return LutIndirectionManager3D(
+            base_layout=geo.base_layout,
+            n_levels=geo.n_levels,
+            level_scale_vecs_data=geo._scale_vecs_data,
+        )
+
+    def _make_lut_manager_2d(self) -> LutIndirectionManager2D:
+        """Build the 2D LUT manager for the current geometry, or share the owner's."""
+        if self._index_owner is not None:
+            return self._index_owner._lut_manager_2d
+        geo2d = self._image_geometry_2d
+        return LutIndirectionManager2D(
+            base_layout=geo2d.base_layout,
+            n_levels=geo2d.n_levels,
+            scale_vecs_data=geo2d._scale_vecs_data,
+        )
+
     def _update_node_matrix(self, displayed_axes: tuple[int, ...]) -> None:
         """Recompute and apply the pygfx node matrix for *displayed_axes*."""
         self._last_displayed_axes = displayed_axes
@@ -1422,6 +1567,8 @@ class GFXMultiscaleImageVisual:
         screen_height_px: float,
         lod_bias: float,
         force_level: int | None,
+        progressive: bool = False,
+        empty_mask: Callable[[np.ndarray], np.ndarray] | None = None,
     ) -> np.ndarray:
         """Run LOD selection, distance sort, frustum cull, and budget truncation.
 
@@ -1441,9 +1588,20 @@ class GFXMultiscaleImageVisual:
             Viewport height in pixels.
         lod_bias : float
             Bias applied to LOD distance thresholds. Values > 1 prefer coarser
-            levels; values < 1 prefer finer. Clamped to a minimum of 1e-6.
+            levels; values < 1 prefer finer. Under the ``"screen_space_error"``
+            strategy it is the ``pixel_tolerance`` instead.  Clamped to a
+            minimum of 1e-6.
         force_level : int or None
             Override level; ``None`` lets LOD selection choose.
+        progressive : bool
+            When ``True`` (and ``force_level`` is ``None``), a coarsest-level
+            cover of the visible volume is placed first and the target
+            bricks follow coarse-to-fine, so the view fills in completely
+            before it sharpens.  See ``progressive_order``.
+        empty_mask : callable or None
+            Maps a brick array to a mask of bricks to skip as empty.
+            Defaults to ``_empty_brick_mask``, which compares this visual's
+            recorded brick value ranges with its contrast limits.
 
         Returns
         -------
@@ -1488,11 +1646,38 @@ class GFXMultiscaleImageVisual:
         else:
             frustum_planes = None
 
+        # The tree walks need a perspective camera; they cull while they
+        # descend, so step 3 is skipped for their output.
+        use_octree = (
+            self._lod_strategy in ("octree", "screen_space_error")
+            and thresholds is not None
+        )
+        n_budget = self._block_cache_3d.info.n_slots - 1
+
         # 1. LOD selection
         if force_level is not None:
             brick_arr = select_levels_arr_forced(
                 geo.base_layout, force_level, geo._level_grids
             )
+        elif use_octree and self._lod_strategy == "screen_space_error":
+            # Refines within the slot budget, so step 4 only truncates when
+            # even the coarsest visible cover does not fit.
+            brick_arr = select_levels_sse(
+                geo._octree_levels,
+                geo.block_size,
+                camera_pos_data,
+                focal_half_height_world,
+                max_bricks=n_budget,
+                pixel_tolerance=max(lod_bias, 1e-6),
+                frustum_planes=frustum_planes,
+            )
+        elif use_octree:
+            brick_arr = select_levels_octree(
+                geo._octree_levels,
+                camera_pos_data,
+                thresholds,
+                frustum_planes=frustum_planes,
+            )
         else:
             brick_arr = select_levels_from_cache(
                 geo._level_grids,
@@ -1512,7 +1697,7 @@ class GFXMultiscaleImageVisual:
         )
 
         # 3. Frustum cull
-        if frustum_planes is not None:
+        if frustum_planes is not None and not use_octree:
             brick_arr, _ = bricks_in_frustum_arr(
                 brick_arr,
                 geo.block_size,
@@ -1521,8 +1706,24 @@ class GFXMultiscaleImageVisual:
                 level_translation_arr_shader=geo._translation_arr_shader,
             )
 
+        # 3a. Empty-space skip: drop bricks whose recorded value range lies
+        # entirely below what the current contrast / iso threshold can show.
+        brick_arr = self._skip_empty_bricks(brick_arr, empty_mask)
+
+        # 3b. Progressive refinement: coarse cover first, then coarse-to-fine.
+        # Truncation below then drops the farthest fine bricks, whose region
+        # the cover still fills.
+        if progressive and force_level is None and geo.n_levels > 1:
+            brick_arr = progressive_cover_order(
+                brick_arr,
+                geo,
+                camera_pos_data,
+                frustum_planes=frustum_planes,
+                use_octree=use_octree,
+                cover_filter=lambda cover: self._skip_empty_bricks(cover, empty_mask),
+            )
+
         # 4. Budget truncation
-        n_budget = self._block_cache_3d.info.n_slots - 1
         if len(brick_arr) > n_budget:
             _GPU_LOGGER.warning(
                 "budget_truncation  pre=%d  budget=%d  dropped=%d",
@@ -1534,12 +1735,75 @@ class GFXMultiscaleImageVisual:
 
         return brick_arr
 
+    def _empty_brick_mask(self, brick_arr: np.ndarray) -> np.ndarray:
+        """Return a mask of bricks whose recorded maximum is below the cutoff.
+
+        The cutoff is the iso threshold in the iso modes and the lower
+        contrast limit in the MIP modes.  Bricks with no recorded range
+        (see ``set_brick_value_ranges`` and ``on_data_ready``) are never
+        reported empty.
+        """
+        mat = self.material_3d
+        if mat is None:
+            return np.zeros(len(brick_arr), dtype=bool)
+        if mat.render_mode in ("iso", "smooth_iso"):
+            cutoff = float(mat.threshold)
+        else:
+            cutoff = float(mat.clim[0])
+        return self._brick_ranges_3d.empty_mask(
+            brick_arr, cutoff, slice_coord=self._current_slice_coord_3d or ()
+        )
+
+    def _skip_empty_bricks(
+        self,
+        brick_arr: np.ndarray,
+        empty_mask: Callable[[np.ndarray], np.ndarray] | None = None,
+    ) -> np.ndarray:
+        """Drop the rows of *brick_arr* that *empty_mask* reports empty."""
+        if not len(brick_arr):
+            return brick_arr
+        empty = (empty_mask or self._empty_brick_mask)(brick_arr)
+        if not empty.any():
+            return brick_arr
+        _GPU_LOGGER.debug(
+            "empty_skip  skipped=%d  kept=%d",
+            int(empty.sum()),
+            len(brick_arr) - int(empty.sum()),
+        )
+        return brick_arr[~empty]
+
+    def set_brick_value_ranges(
+        self,
+        level: int,
+        mins: np.ndarray,
+        maxs: np.ndarray,
+        slice_coord: tuple[tuple[int, int], ...] = (),
+    ) -> None:
+        """Provide precomputed per-brick value ranges for one 3D level.
+
+        Bricks whose maximum is below the visibility cutoff are skipped by
+        the planner before they are ever requested.  Typically loaded from
+        a sidecar written alongside the multiscale store.
+
+        Parameters
+        ----------
+        level : int
+            1-indexed level (1 = finest).
+        mins, maxs : np.ndarray
+            ``(gz, gy, gx)``-shaped arrays over the level's brick grid,
+            in data units.  NaN marks an unknown range.
+        slice_coord : tuple of (axis_index, world_value) pairs
+            Non-displayed axis positions the ranges belong to; ``()`` for
+            3D data.
+        """
+        self._brick_ranges_3d.record_level(level, mins, maxs, slice_coord=slice_coord)
+
     def _materialize_brick_requests(
         self,
         brick_arr: np.ndarray,
         slice_request_id: UUID,
         dims_state: DimsState | None,
-        fill: dict[int, int] | None = None,
+        fill: dict[int, int | tuple[int, int]] | None = None,
         slice_coord: tuple[tuple[int, int], ...] = (),
     ) -> list[ChunkRequest]:
         """Stage ``brick_arr`` in ``self._block_cache_3d`` and build ChunkRequests.
@@ -1555,10 +1819,10 @@ class GFXMultiscaleImageVisual:
         dims_state : DimsState or None
             Used to map slice indices to data-space coords for non-displayed
             axes.  ``None`` → only display ranges are used.
-        fill : dict[int, int] or None
-            Axis index → scalar value overrides applied after
+        fill : dict[int, int | tuple[int, int]] or None
+            Axis index → selection overrides applied after
             ``_build_axis_selections_multiscale``.  For multichannel use, pass
-            ``{channel_axis: channel_index}``.
+            ``{channel_axis: (first, stop)}`` to read a range of channels.
         slice_coord : tuple of (axis_index, world_value) pairs
             Sorted slice-position encoding to embed in every ``BlockKey3D``
             so that bricks from different non-displayed-axis positions are
@@ -1659,7 +1923,7 @@ class GFXMultiscaleImageVisual:
         force_level: int | None,
         use_culling: bool,
     ) -> tuple[dict, int]:
-        """Run 2D LOD selection, sort, viewport cull, and budget truncation.
+        """Run 2D LOD selection, viewport cull, sort, and budget truncation.
 
         Updates ``self._current_slice_coord`` as a side effect.
         Does **not** stage in the block cache.
@@ -1668,7 +1932,7 @@ class GFXMultiscaleImageVisual:
         -------
         tuple[dict, int]
             ``(required, target_level)`` where ``required`` maps
-            ``BlockKey2D → None`` and ``target_level`` is the coarsest level
+            ``BlockKey2D → level`` and ``target_level`` is the finest level
             requested (used for eviction).
         """
         geo2d = self._image_geometry_2d
@@ -1721,8 +1985,7 @@ class GFXMultiscaleImageVisual:
         )
 
         # 1. LOD selection
-        tile_arr = select_lod_2d(
-            geo2d._level_grids,
+        target_level = select_level_2d(
             n_levels,
             viewport_width_px=viewport_width_px,
             voxel_width=voxel_width,
@@ -1731,44 +1994,67 @@ class GFXMultiscaleImageVisual:
             level_scale_factors=geo2d._level_scale_factors,
         )
 
-        # 2. Distance sort
-        tile_arr = sort_tiles_by_distance_2d(
-            tile_arr,
-            camera_pos,
-            block_size,
-            level_scale_arr_shader=geo2d._scale_arr_shader,
-            level_translation_arr_shader=geo2d._translation_arr_shader,
-        )
-
-        required = arr_to_block_keys_2d(tile_arr, slice_coord=self._current_slice_coord)
+        # 2-3. Viewport cull and distance sort
+        required = self._visible_tiles_2d(target_level, camera_pos, view_min, view_max)
 
-        # 3. Viewport culling
-        if use_culling and view_min is not None and view_max is not None:
-            required, _ = viewport_cull_2d(
+        # 3b. Coarse cover under the target level (foveated when tight)
+        n_budget = self._block_cache_2d.info.n_slots - 1
+        if force_level is None:
+            required = select_mixed_lod_2d(
                 required,
-                block_size,
-                view_min,
-                view_max,
-                level_scale_arr_shader=geo2d._scale_arr_shader,
-                level_translation_arr_shader=geo2d._translation_arr_shader,
+                target_level,
+                n_levels,
+                n_budget,
+                lambda level: self._visible_tiles_2d(
+                    level, camera_pos, view_min, view_max
+                ),
             )
 
         # 4. Budget truncation
-        n_budget = self._block_cache_2d.info.n_slots - 1
         if len(required) > n_budget:
             keys_to_keep = list(required.keys())[:n_budget]
             required = {k: required[k] for k in keys_to_keep}
 
-        target_level = int(tile_arr[0, 0]) if len(tile_arr) > 0 else 1
         return required, target_level
 
+    def _visible_tiles_2d(
+        self,
+        level: int,
+        camera_pos: np.ndarray,
+        view_min: np.ndarray | None,
+        view_max: np.ndarray | None,
+    ) -> dict[BlockKey2D, int]:
+        """Return the tiles of one level inside the view, nearest-first.
+
+        Culls and sorts as arrays; ``BlockKey2D`` objects are only built
+        for the visible tiles.  ``view_min=None`` disables culling.
+        """
+        geo2d = self._image_geometry_2d
+        tile_arr = tiles_in_view_2d(
+            level,
+            geo2d._tile_grid_dims[level - 1],
+            geo2d.block_size,
+            view_min,
+            view_max,
+            level_scale_arr_shader=geo2d._scale_arr_shader,
+            level_translation_arr_shader=geo2d._translation_arr_shader,
+        )
+        tile_arr = sort_tiles_by_distance_2d(
+            tile_arr,
+            camera_pos,
+            geo2d.block_size,
+            level_scale_arr_shader=geo2d._scale_arr_shader,
+            level_translation_arr_shader=geo2d._translation_arr_shader,
+        )
+        return arr_to_block_keys_2d(tile_arr, slice_coord=self._current_slice_coord)
+
     def _materialize_tile_requests(
         self,
         required: dict,
         target_level: int,
         dims_state: DimsState,
         slice_request_id: UUID,
-        fill: dict[int, int] | None = None,
+        fill: dict[int, int | tuple[int, int]] | None = None,
     ) -> list[ChunkRequest]:
         """Evict, stage, and build 2D tile ChunkRequests.
 
@@ -1784,8 +2070,8 @@ class GFXMultiscaleImageVisual:
             For building axis_selections.
         slice_request_id : UUID
             Shared ID embedded in every returned ``ChunkRequest``.
-        fill : dict[int, int] or None
-            Axis index → scalar overrides (e.g. ``{channel_axis: ch_idx}``).
+        fill : dict[int, int | tuple[int, int]] or None
+            Axis index → selection overrides (e.g. ``{channel_axis: ch_idx}``).
         """
         geo2d = self._image_geometry_2d
         block_size = geo2d.block_size
@@ -1796,12 +2082,12 @@ class GFXMultiscaleImageVisual:
             required, self._frame_number
         )
 
-        if not fill_plan:
-            self._lut_manager_2d.rebuild(
-                self._block_cache_2d.tile_manager,
-                current_slice_coord=self._current_slice_coord,
-                viewport_cells=self._current_viewport_cells,
-            )
+        # Unconditional: stage() may have promoted reserve tiles.
+        self._lut_manager_2d.rebuild(
+            self._block_cache_2d.tile_manager,
+            current_slice_coord=self._current_slice_coord,
+            viewport_cells=self._current_viewport_cells,
+        )
 
         chunk_requests: list[ChunkRequest] = []
         self._pending_slot_map_2d = {}
@@ -1852,6 +2138,7 @@ class GFXMultiscaleImageVisual:
         lod_bias: float = 1.0,
         dims_state: DimsState | None = None,
         force_level: int | None = None,
+        progressive: bool = False,
     ) -> list[ChunkRequest]:
         """Run the synchronous 3D planning phase and return ChunkRequests.
 
@@ -1878,6 +2165,9 @@ class GFXMultiscaleImageVisual:
             Current dimension state.
         force_level : int or None
             Override LOD level.
+        progressive : bool
+            Load a coarse cover of the view first, then refine
+            coarse-to-fine (see ``_plan_bricks``).
 
         Returns
         -------
@@ -1921,8 +2211,10 @@ class GFXMultiscaleImageVisual:
             screen_height_px,
             lod_bias,
             force_level,
+            progressive,
         )
         if not len(brick_arr):
+            self.cancel_pending()
             return []
 
         # 5. Stage: find cache hits/misses, reserve slots for misses.
@@ -1947,22 +2239,27 @@ class GFXMultiscaleImageVisual:
         # When there are misses, on_data_ready will rebuild again after each
         # arriving batch, progressively filling the remaining positions.
         #
-        # COUPLING: the 2D path (build_slice_request_2d) rebuilds only when
-        # fill_plan is empty, because TileManager2D has no reserve tier and so
-        # nothing is promoted into tilemap during stage().  See the longer note
-        # there before changing either rebuild policy.
+        # The 2D path (build_slice_request_2d) follows the same policy, since
+        # TileManager2D promotes reserve tiles during stage() as well.
         self._lut_manager_3d.rebuild(
             self._block_cache_3d.tile_manager,
             current_slice_coord=self._current_slice_coord_3d,
         )
 
-        # 6. Build ChunkRequests and populate the pending slot map.
+        # 6. Build ChunkRequests and populate the pending slot map.  Bricks
+        # stage() adopted from the previous plan keep their chunk ids (and
+        # go first, being furthest along) so their reads carry over.
         slice_id = uuid4()
         chunk_requests: list[ChunkRequest] = []
+        adopted = _adopted_pending(
+            self._pending_slot_map, self._block_cache_3d.tile_manager
+        )
         self._pending_slot_map = {}
 
-        for brick_key, slot in fill_plan:
-            chunk_id = uuid4()
+        for chunk_id, brick_key, slot in [
+            *adopted,
+            *((uuid4(), key, slot) for key, slot in fill_plan),
+        ]:
             z0, y0, x0, z1, y1, x1 = _brick_key_to_padded_coords(
                 brick_key, geo.block_size, self._block_cache_3d.info.overlap
             )
@@ -1991,9 +2288,10 @@ class GFXMultiscaleImageVisual:
         plan_total_ms = (time.perf_counter() - t_plan_start) * 1000
 
         self._last_plan_stats = stats = {
-            "hits": len(sorted_required) - len(fill_plan),
+            "hits": len(sorted_required) - len(fill_plan) - len(adopted),
             "misses": len(fill_plan),
             "fills": len(fill_plan),
+            "adopted": len(adopted),
             "total_required": len(brick_arr),
             "stage_ms": stage_ms,
             "plan_total_ms": plan_total_ms,
@@ -2028,20 +2326,57 @@ class GFXMultiscaleImageVisual:
         self,
         batch: list[tuple[ChunkRequest, np.ndarray]],
     ) -> None:
-        """Commit an arriving batch of 3D bricks to the GPU cache."""
+        """Stage an arriving batch of 3D bricks and upload what the budget allows.
+
+        Bricks over this frame's upload budget are uploaded (and become
+        renderable) on later frames by ``flush_uploads``.
+        """
+        self._write_bricks_3d(batch)
+        self._flush_uploads_3d()
+
+    def _write_bricks_3d(self, batch: list[tuple[ChunkRequest, np.ndarray]]) -> None:
+        """Write arriving bricks into their staged cache slots without uploading.
+
+        Records each brick's value range for empty-space skipping.
+        """
+        ranges: dict[tuple, list[tuple]] = {}
         for req, data in batch:
             entry = self._pending_slot_map.get(req.chunk_request_id)
             if entry is None:
                 continue
             brick_key, slot = entry
             slot.brick_max = float(data.max())
+            ranges.setdefault(brick_key.slice_coord, []).append(
+                (
+                    brick_key.level,
+                    brick_key.g0,
+                    brick_key.g1,
+                    brick_key.g2,
+                    float(data.min()),
+                    slot.brick_max,
+                )
+            )
             self._block_cache_3d.write_brick(slot, data, key=brick_key)
-            self._block_cache_3d.tile_manager.commit(brick_key, slot)
+        for slice_coord, rows in ranges.items():
+            rows_arr = np.array(rows)
+            self._brick_ranges_3d.record(
+                rows_arr[:, :4].astype(np.int64),
+                rows_arr[:, 4],
+                rows_arr[:, 5],
+                slice_coord=slice_coord,
+            )
+
+    def _flush_uploads_3d(self) -> None:
+        """Upload staged 3D bricks within budget, then rebuild the LUT."""
+        committed = self._block_cache_3d.flush_uploads()
+        if not committed:
+            return
 
         _GPU_LOGGER.info(
-            "gpu_flush  bricks_in_batch=%d  resident=%d",
-            len(batch),
+            "gpu_flush  bricks_in_batch=%d  resident=%d  staged=%d",
+            len(committed),
             self._block_cache_3d.n_resident,
+            self._block_cache_3d.n_pending_uploads,
         )
 
         self._lut_manager_3d.rebuild(
@@ -2055,7 +2390,10 @@ class GFXMultiscaleImageVisual:
             self._frame_number,
         )
 
-        # On first brick batch, reveal the AABB line if enabled.
+        self._reveal_aabb_3d()
+
+    def _reveal_aabb_3d(self) -> None:
+        """On the first brick batch, reveal the AABB line if enabled."""
         if not self._data_ready_3d and self._aabb_line_3d is not None:
             self._data_ready_3d = True
             self._aabb_line_3d.visible = self._aabb_enabled
@@ -2067,6 +2405,101 @@ class GFXMultiscaleImageVisual:
         self._block_cache_3d.tile_manager.release_all_in_flight()
         self._pending_slot_map = {}
 
+    def build_prefetch_request(
+        self,
+        camera_pos_world: np.ndarray,
+        frustum_corners_world: np.ndarray | None,
+        fov_y_rad: float,
+        screen_height_px: float,
+        lod_bias: float = 1.0,
+        dims_state: DimsState | None = None,
+        force_level: int | None = None,
+        progressive: bool = False,
+    ) -> list[ChunkRequest]:
+        """Plan the bricks a predicted camera would need, without staging.
+
+        Runs the same LOD / sort / cull / budget pipeline as
+        ``build_slice_request`` but leaves the block cache, LUT and
+        pending slot map untouched, so the displayed plan is unaffected.
+        Bricks already resident or loading are skipped.  The returned
+        requests have no cache slot; they only warm the host cache.
+
+        Parameters
+        ----------
+        camera_pos_world : np.ndarray
+            Predicted camera position in world coordinates.
+        frustum_corners_world : np.ndarray or None
+            Predicted frustum corners in world coordinates, or ``None``
+            to skip culling.
+        fov_y_rad : float
+            Vertical field-of-view in radians.
+        screen_height_px : float
+            Viewport height in logical pixels.
+        lod_bias : float
+            Bias applied to LOD distance thresholds.
+        dims_state : DimsState or None
+            Current dimension state.  ``None`` plans nothing.
+        force_level : int or None
+            Override LOD level.
+        progressive : bool
+            Plan coarse-to-fine, as ``build_slice_request`` does.
+
+        Returns
+        -------
+        list[ChunkRequest]
+            Nearest-first.  Empty when the displayed axes differ from the
+            current plan's or nothing new is needed.
+        """
+        if self._volume_geometry is None or self._block_cache_3d is None:
+            return []
+        if dims_state is None:
+            return []
+        if dims_state.selection.displayed_axes != self._last_displayed_axes:
+            return []
+
+        brick_arr = self._plan_bricks(
+            camera_pos_world,
+            frustum_corners_world,
+            fov_y_rad,
+            screen_height_px,
+            lod_bias,
+            force_level,
+            progressive,
+        )
+        if not len(brick_arr):
+            return []
+
+        slice_coord = tuple(sorted(dims_state.selection.slice_indices.items()))
+        missing = self._block_cache_3d.tile_manager.missing(
+            arr_to_brick_keys(brick_arr, slice_coord=slice_coord)
+        )
+        geo = self._volume_geometry
+        overlap = self._block_cache_3d.info.overlap
+        ndim = len(dims_state.axis_labels)
+        slice_id = uuid4()
+        chunk_requests: list[ChunkRequest] = []
+        for brick_key in missing:
+            z0, y0, x0, z1, y1, x1 = _brick_key_to_padded_coords(
+                brick_key, geo.block_size, overlap
+            )
+            level_index = brick_key.level - 1
+            axis_selections = _build_axis_selections_multiscale(
+                dims_state.selection,
+                ndim,
+                [(z0, z1), (y0, y1), (x0, x1)],
+                level_shape=self._full_level_shapes[level_index],
+                world_to_level_k=self._world_to_level_transforms[level_index],
+            )
+            chunk_requests.append(
+                ChunkRequest(
+                    chunk_request_id=uuid4(),
+                    slice_request_id=slice_id,
+                    scale_index=level_index,
+                    axis_selections=axis_selections,
+                )
+            )
+        return chunk_requests
+
     # ── 2D SliceCoordinator interface ──────────────────────────────────
 
     def build_slice_request_2d(
@@ -2085,8 +2518,9 @@ class GFXMultiscaleImageVisual:
 
         World-space inputs are transformed to data space before planning.
 
-        Pipeline: LOD select -> distance sort -> optional viewport cull ->
-        budget cap -> stage() -> build ``ChunkRequest`` objects.
+        Pipeline: LOD select -> optional viewport cull -> distance sort ->
+        coarse cover -> budget cap -> stage() -> build ``ChunkRequest``
+        objects.
 
         Parameters
         ----------
@@ -2141,7 +2575,7 @@ class GFXMultiscaleImageVisual:
         # But select_axes(displayed=(a, b)).imap_coordinates expects input in
         #   (a-world, b-world) = (first-displayed, second-displayed) order
         # and returns (a-data, b-data) = (gy, gx) order.
-        # Downstream consumers (sort_tiles_by_distance_2d, viewport_cull_2d)
+        # Downstream consumers (sort_tiles_by_distance_2d, tiles_in_view_2d)
         # expect (gx, gy) = (second-displayed, first-displayed) order.
         # So we swap the input and swap the output.
         sub_2d = self._transform.select_axes(displayed)
@@ -2221,8 +2655,7 @@ class GFXMultiscaleImageVisual:
 
         # 1. LOD selection
         t0 = time.perf_counter()
-        tile_arr = select_lod_2d(
-            geo2d._level_grids,
+        target_level = select_level_2d(
             n_levels,
             viewport_width_px=viewport_width_px,
             voxel_width=voxel_width,
@@ -2232,7 +2665,24 @@ class GFXMultiscaleImageVisual:
         )
         lod_select_ms = (time.perf_counter() - t0) * 1000
 
-        # 2. Distance sort
+        # 2. Viewport culling: enumerate only the target level's visible
+        # index range, so no work is done for off-screen tiles.
+        t0 = time.perf_counter()
+        grid_dims = geo2d._tile_grid_dims[target_level - 1]
+        tile_arr = tiles_in_view_2d(
+            target_level,
+            grid_dims,
+            block_size,
+            view_min,
+            view_max,
+            level_scale_arr_shader=geo2d._scale_arr_shader,
+            level_translation_arr_shader=geo2d._translation_arr_shader,
+        )
+        n_total = grid_dims[0] * grid_dims[1]
+        n_culled = n_total - len(tile_arr)
+        cull_ms = (time.perf_counter() - t0) * 1000
+
+        # 3. Distance sort
         t0 = time.perf_counter()
         tile_arr = sort_tiles_by_distance_2d(
             tile_arr,
@@ -2245,26 +2695,26 @@ class GFXMultiscaleImageVisual:
 
         # Convert to dict (embed current slice coord into every key).
         required = arr_to_block_keys_2d(tile_arr, slice_coord=self._current_slice_coord)
-        n_total = len(required)
-
-        # 3. Viewport culling
-        n_culled = 0
-        cull_ms = 0.0
-        if use_culling and view_min is not None and view_max is not None:
-            t0 = time.perf_counter()
-            required, n_culled = viewport_cull_2d(
+
+        # 3b. Coarse cover: the coarsest level's visible tiles stay planned
+        # under the target level, so the LUT falls back to them wherever
+        # target tiles are still loading.  When the budget is tight the
+        # target level is kept to the centre of the view (see
+        # select_mixed_lod_2d) rather than truncated.
+        n_budget = self._block_cache_2d.info.n_slots - 1
+        if force_level is None:
+            required = select_mixed_lod_2d(
                 required,
-                block_size,
-                view_min,
-                view_max,
-                level_scale_arr_shader=geo2d._scale_arr_shader,
-                level_translation_arr_shader=geo2d._translation_arr_shader,
+                target_level,
+                n_levels,
+                n_budget,
+                lambda level: self._visible_tiles_2d(
+                    level, camera_pos, view_min, view_max
+                ),
             )
-            cull_ms = (time.perf_counter() - t0) * 1000
 
         # 4. Budget truncation
         n_needed = len(required)
-        n_budget = self._block_cache_2d.info.n_slots - 1
         n_dropped = max(0, n_needed - n_budget)
         if n_dropped:
             keys_to_keep = list(required.keys())[:n_budget]
@@ -2273,8 +2723,6 @@ class GFXMultiscaleImageVisual:
         # 5. Evict finer-than-target tiles, then stage.
         # Evicting first returns slots to free_slots so the incoming coarser
         # tiles can claim them without triggering unnecessary LRU evictions.
-        target_level = int(tile_arr[0, 0]) if len(tile_arr) > 0 else 1
-
         self._block_cache_2d.tile_manager.evict_finer_than(target_level)
 
         t0 = time.perf_counter()
@@ -2283,37 +2731,23 @@ class GFXMultiscaleImageVisual:
         )
         stage_ms = (time.perf_counter() - t0) * 1000
 
-        # When all required tiles are cache hits, on_data_ready_2d never fires
-        # so the LUT would remain stale (pointing to a different slice position
-        # or freed slots).  Rebuild immediately in that case.
-        #
-        # This is intentionally *conditional*, unlike the 3D path
-        # (build_slice_request), which rebuilds the LUT unconditionally after
-        # stage().  The difference is load-bearing and stems from the caches'
-        # residency models: TileManager3D has a reserve tier whose hits are
-        # promoted into ``tilemap`` *during* stage() with no fetch and no
-        # fill_plan entry (_tile_manager_3d.py stage()), so 3D needs an eager
-        # rebuild or those bricks would be invisible until the next miss-batch
-        # (which may never come).  TileManager2D has no reserve tier: stage()
-        # only refreshes existing hits or reserves slots for misses, so the
-        # only new ``tilemap`` content arrives via commit() -> on_data_ready_2d,
-        # which already rebuilds.  The lone gap is the all-hits frame above.
-        #
-        # COUPLING: if a reserve tier is ever added to TileManager2D, this
-        # conditional MUST become unconditional to match the 3D path, or
-        # reserve-promoted tiles will silently fail to render.  Update both
-        # sites together.  See also build_slice_request and the audit notes
-        # in slice_coordinator._on_dims_changed / invalidate_2d_cache.
-        if not fill_plan:
-            self._lut_manager_2d.rebuild(
-                self._block_cache_2d.tile_manager,
-                current_slice_coord=self._current_slice_coord,
-                viewport_cells=self._current_viewport_cells,
-            )
+        # Rebuild the LUT immediately, as the 3D path does: stage() promotes
+        # reserve tiles (e.g. those of a previously viewed slice) into
+        # tilemap with no fill_plan entry, so they must become visible now,
+        # and an all-hits plan never reaches on_data_ready_2d at all.  The
+        # LUT update is incremental, so this is cheap when little changed.
+        self._lut_manager_2d.rebuild(
+            self._block_cache_2d.tile_manager,
+            current_slice_coord=self._current_slice_coord,
+            viewport_cells=self._current_viewport_cells,
+        )
 
-        # 6. Build ChunkRequests
+        # 6. Build ChunkRequests (adopted in-flight tiles first, as in 3D)
         slice_id = uuid4()
         chunk_requests: list[ChunkRequest] = []
+        adopted = _adopted_pending(
+            self._pending_slot_map_2d, self._block_cache_2d.tile_manager
+        )
         self._pending_slot_map_2d = {}
 
         overlap = self._block_cache_2d.info.overlap
@@ -2322,8 +2756,10 @@ class GFXMultiscaleImageVisual:
         sel = dims_state.selection
 
         _debug_tile_count = 0
-        for tile_key, slot in fill_plan:
-            chunk_id = uuid4()
+        for chunk_id, tile_key, slot in [
+            *adopted,
+            *((uuid4(), key, slot) for key, slot in fill_plan),
+        ]:
             y0, x0, y1, x1 = _block_key_2d_to_padded_coords(
                 tile_key, block_size, overlap
             )
@@ -2366,9 +2802,10 @@ class GFXMultiscaleImageVisual:
         plan_total_ms = (time.perf_counter() - t_plan_start) * 1000
 
         self._last_plan_stats = stats = {
-            "hits": len(required) - len(fill_plan),
+            "hits": len(required) - len(fill_plan) - len(adopted),
             "misses": len(fill_plan),
             "fills": len(fill_plan),
+            "adopted": len(adopted),
             "total_required": n_total,
             "n_culled": n_culled,
             "n_needed": n_needed,
@@ -2410,28 +2847,39 @@ class GFXMultiscaleImageVisual:
         self,
         batch: list[tuple[ChunkRequest, np.ndarray]],
     ) -> None:
-        """Commit an arriving batch of 2D tiles to the GPU cache.
+        """Stage an arriving batch of 2D tiles and upload what the budget allows.
 
         Parameters
         ----------
         batch : list of (ChunkRequest, ndarray)
             Each item is a ``(request, data)`` pair where ``data`` has
-            shape ``(pbs, pbs)``, dtype float32.
+            shape ``(pbs, pbs)`` in the store dtype.
         """
+        self._write_tiles_2d(batch)
+        self._flush_uploads_2d()
+
+    def _write_tiles_2d(self, batch: list[tuple[ChunkRequest, np.ndarray]]) -> None:
+        """Write arriving tiles into their staged cache slots without uploading."""
         for req, data in batch:
             entry = self._pending_slot_map_2d.get(req.chunk_request_id)
             if entry is None:
                 continue
             tile_key, slot = entry
             self._block_cache_2d.write_tile(slot, data, key=tile_key)
-            self._block_cache_2d.tile_manager.commit(tile_key, slot)
+
+    def _flush_uploads_2d(self) -> None:
+        """Upload staged 2D tiles within budget, then rebuild the LUT."""
+        committed = self._block_cache_2d.flush_uploads()
+        if not committed:
+            return
 
         n_resident = len(self._block_cache_2d.tile_manager.tilemap)
 
         _GPU_LOGGER.info(
-            "gpu_flush  tiles_in_batch=%d  resident=%d",
-            len(batch),
+            "gpu_flush  tiles_in_batch=%d  resident=%d  staged=%d",
+            len(committed),
             n_resident,
+            self._block_cache_2d.n_pending_uploads,
         )
 
         self._lut_manager_2d.rebuild(
@@ -2446,7 +2894,10 @@ class GFXMultiscaleImageVisual:
             self._frame_number,
         )
 
-        # On first tile batch, reveal the AABB line if enabled.
+        self._reveal_aabb_2d()
+
+    def _reveal_aabb_2d(self) -> None:
+        """On the first tile batch, reveal the AABB line if enabled."""
         if not self._data_ready_2d and self._aabb_line_2d is not None:
             self._data_ready_2d = True
             self._aabb_line_2d.visible = self._aabb_enabled
@@ -2458,13 +2909,108 @@ class GFXMultiscaleImageVisual:
         self._block_cache_2d.tile_manager.release_all_in_flight()
         self._pending_slot_map_2d = {}
 
+    def build_prefetch_request_2d(
+        self,
+        camera_pos_world: np.ndarray,
+        viewport_width_px: float,
+        world_width: float,
+        view_min_world: np.ndarray | None,
+        view_max_world: np.ndarray | None,
+        dims_state: DimsState,
+        lod_bias: float = 1.0,
+        force_level: int | None = None,
+        use_culling: bool = True,
+    ) -> list[ChunkRequest]:
+        """Plan the tiles a predicted camera would need, without staging.
+
+        2D counterpart of ``build_prefetch_request``: the displayed plan's
+        slice coordinate and viewport cells are restored after planning.
+
+        Parameters
+        ----------
+        camera_pos_world : ndarray, shape (3,)
+            Predicted camera world-space position ``(x, y, z)``.
+        viewport_width_px : float
+            Viewport width in logical pixels.
+        world_width : float
+            Predicted visible world width in world units.
+        view_min_world, view_max_world : ndarray, shape (2,) or None
+            Predicted viewport AABB in world space.  ``None`` disables
+            culling.
+        dims_state : DimsState
+            Current dimension display state.
+        lod_bias : float
+            Multiplicative LOD bias.
+        force_level : int or None
+            Override: all tiles assigned this 1-based level.
+        use_culling : bool
+            Enable viewport culling.
+
+        Returns
+        -------
+        list[ChunkRequest]
+            Nearest-first tiles that are neither committed nor loading.
+        """
+        if self._image_geometry_2d is None or self._block_cache_2d is None:
+            return []
+        if dims_state.selection.displayed_axes != self._last_displayed_axes:
+            return []
+
+        saved = (self._current_slice_coord, self._current_viewport_cells)
+        self._current_slice_coord = tuple(
+            sorted(dims_state.selection.slice_indices.items())
+        )
+        try:
+            required, _ = self._plan_tiles_2d(
+                camera_pos_world,
+                viewport_width_px,
+                world_width,
+                view_min_world,
+                view_max_world,
+                lod_bias,
+                force_level,
+                use_culling,
+            )
+        finally:
+            self._current_slice_coord, self._current_viewport_cells = saved
+
+        missing = self._block_cache_2d.tile_manager.missing(required)
+        block_size = self._image_geometry_2d.block_size
+        overlap = self._block_cache_2d.info.overlap
+        ndim = len(dims_state.axis_labels)
+        slice_id = uuid4()
+        chunk_requests: list[ChunkRequest] = []
+        for tile_key in missing:
+            y0, x0, y1, x1 = _block_key_2d_to_padded_coords(
+                tile_key, block_size, overlap
+            )
+            level_index = tile_key.level - 1
+            axis_selections = _build_axis_selections_multiscale(
+                dims_state.selection,
+                ndim,
+                [(y0, y1), (x0, x1)],
+                level_shape=self._full_level_shapes[level_index],
+                world_to_level_k=self._world_to_level_transforms[level_index],
+            )
+            chunk_requests.append(
+                ChunkRequest(
+                    chunk_request_id=uuid4(),
+                    slice_request_id=slice_id,
+                    scale_index=level_index,
+                    axis_selections=axis_selections,
+                )
+            )
+        return chunk_requests
+
     def invalidate_2d_cache(self) -> None:
         """Cancel in-flight 2D requests when the slice position changes.
 
         Old committed tiles are intentionally kept alive as a visible fallback
-        while new tiles load.  Because ``BlockKey2D`` now encodes
-        ``slice_coord``, tiles from different slice positions cannot collide, so
-        keeping them does not cause rendering artefacts.
+        while new tiles load.  Because ``BlockKey2D`` encodes ``slice_coord``,
+        tiles from different slice positions cannot collide, so keeping them
+        does not cause rendering artefacts.  Once the new slice has fully
+        loaded they move to the tile manager's reserve tier, from which a
+        return to that slice promotes them without any I/O.
 
         A full LUT rebuild is not needed here — the LUT remains current from
         the last ``on_data_ready_2d`` call and old tiles are the correct thing
@@ -2839,8 +3385,8 @@ class GFXMultiscaleImageVisual:
     def on_data_store_contents_changed(
         self, event: DataStoreContentsChangedEvent
     ) -> None:
-        """Stub — brick eviction deferred to a future phase."""
-        pass
+        """Forget recorded brick value ranges; eviction is deferred."""
+        self._brick_ranges_3d.clear()
 
     def on_data_store_metadata_changed(
         self, event: DataStoreMetadataChangedEvent
@@ -2849,10 +3395,26 @@ class GFXMultiscaleImageVisual:
         pass
 
     def tick(self) -> None:
-        """Advance jitter seed for the brick shader."""
+        """Advance jitter seed for the brick shader and flush held-back uploads."""
+        self.flush_uploads()
         if self.material_3d is not None:
             self.material_3d.tick()
 
+    def flush_uploads(self) -> None:
+        """Open a new frame's upload budget and send staged bricks / tiles.
+
+        Called once per frame (from ``tick``) so that bricks held back by
+        ``upload_budget_bytes`` trickle in over the following frames.
+        """
+        if self._block_cache_3d is not None:
+            self._block_cache_3d.begin_frame()
+            if self._block_cache_3d.n_pending_uploads:
+                self._flush_uploads_3d()
+        if self._block_cache_2d is not None:
+            self._block_cache_2d.begin_frame()
+            if self._block_cache_2d.n_pending_uploads:
+                self._flush_uploads_2d()
+
     # ── Private helpers ─────────────────────────────────────────────────
 
     def _build_aabb_line_3d(self) -> gfx.Line:
@@ -2916,6 +3478,8 @@ class GFXMultiscaleImageVisual:
             map=colormap,
             threshold=threshold,
             attenuation=attenuation,
+            value_scale=cache_value_scale(self._cache_dtype),
+            slot_params_texture=self._block_cache_3d.slot_params_tex,
             pick_write=pick_write,
         )
 
@@ -2951,6 +3515,8 @@ class GFXMultiscaleImageVisual:
             paint_lut_texture=self._t_paint_lut,
             clim=clim,
             map=colormap,
+            value_scale=cache_value_scale(self._cache_dtype),
+            slot_params_texture=self._block_cache_2d.slot_params_tex,
             pick_write=pick_write,
         )
 
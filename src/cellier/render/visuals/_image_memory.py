@@ -624,6 +624,7 @@ class GFXImageMemoryVisual:
         lod_bias: float = 1.0,
         dims_state: DimsState | None = None,
         force_level: int | None = None,
+        progressive: bool = False,
     ) -> list[ChunkRequest]:
         """Return a single ChunkRequest for the full 3-D sub-volume.
 
@@ -647,6 +648,8 @@ class GFXImageMemoryVisual:
             tests), all axes are treated as displayed.
         force_level : int or None
             Unused. Accepted for interface compatibility.
+        progressive : bool
+            Unused. Accepted for interface compatibility.
 
         Returns
         -------
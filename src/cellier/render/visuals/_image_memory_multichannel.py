@@ -385,6 +385,7 @@ class GFXMultichannelImageMemoryVisual:
         lod_bias: float = 1.0,
         dims_state: DimsState | None = None,
         force_level: int | None = None,
+        progressive: bool = False,
     ) -> list[ChunkRequest]:
         """Return one ChunkRequest per visible channel for the 3D sub-volume."""
         if dims_state is None:
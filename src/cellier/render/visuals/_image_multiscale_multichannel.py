@@ -6,17 +6,18 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
+import numpy as np
 import pygfx as gfx
 
+from cellier.logging import _GPU_LOGGER
+from cellier.render.block_cache import LayeredBlockCache
 from cellier.render.visuals._image import GFXMultiscaleImageVisual
 from cellier.render.visuals._image_memory import _make_colormap
 from cellier.transform._axis_order import select_axes
 
 if TYPE_CHECKING:
-    import numpy as np
-
     from cellier._state import DimsState
-    from cellier.data.image._image_requests import ChunkRequest
+    from cellier.data.image import ChunkRequest
     from cellier.events._events import (
         AABBChangedEvent,
         ChannelAppearanceChangedEvent,
@@ -29,14 +30,82 @@ if TYPE_CHECKING:
     from cellier.visuals._image import MultichannelMultiscaleImageVisual
 
 
+# ---------------------------------------------------------------------------
+# Channel layers
+# ---------------------------------------------------------------------------
+
+
+def _channel_planes(
+    data: np.ndarray,
+    axis_selections: tuple,
+    channel_axis: int,
+    offsets: list[int],
+) -> list[np.ndarray]:
+    """Split a channel-range read into one plane per layer channel.
+
+    The channel range is an output dimension, placed after the other
+    range-selected axes that precede ``channel_axis``.  *offsets* are the
+    layer channels' positions within the range, in layer order.
+    """
+    channel_dim = sum(isinstance(s, tuple) for s in axis_selections[:channel_axis])
+    lead = (slice(None),) * channel_dim
+    return [data[(*lead, k)] for k in offsets]
+
+
+def _channel_runs(channels: tuple[int, ...]) -> list[tuple[int, int]]:
+    """Group sorted *channels* into ``(start, stop)`` runs of consecutive indices."""
+    runs: list[tuple[int, int]] = []
+    for ch in channels:
+        if runs and runs[-1][1] == ch:
+            runs[-1] = (runs[-1][0], ch + 1)
+        else:
+            runs.append((ch, ch + 1))
+    return runs
+
+
+def _split_channel_runs(
+    requests: list[ChunkRequest],
+    channel_axis: int,
+    runs: list[tuple[int, int]],
+) -> tuple[list[ChunkRequest], dict[UUID, UUID]]:
+    """Add a request per further channel run to every brick request.
+
+    *requests* read the first run.  Each brick's requests stay adjacent,
+    so the nearest-first order of the plan is kept.
+
+    Returns
+    -------
+    tuple[list[ChunkRequest], dict[UUID, UUID]]
+        The requests to submit and, for every added request, the ID of
+        the brick request whose pending slot it fills.
+    """
+    if len(runs) <= 1:
+        return requests, {}
+    out: list[ChunkRequest] = []
+    owners: dict[UUID, UUID] = {}
+    for req in requests:
+        out.append(req)
+        for run in runs[1:]:
+            sel = list(req.axis_selections)
+            sel[channel_axis] = run
+            extra = req._replace(chunk_request_id=uuid4(), axis_selections=tuple(sel))
+            out.append(extra)
+            owners[extra.chunk_request_id] = req.chunk_request_id
+    return out, owners
+
+
 class GFXMultichannelMultiscaleImageVisual:
     """Render-layer visual for one ``MultichannelMultiscaleImageVisual``.
 
     Maintains a fixed-size pool of ``GFXMultiscaleImageVisual`` slots, one per
     active channel. A single "planner" slot (always slot 0) runs LOD selection
-    via ``_plan_bricks`` / ``_plan_tiles_2d``; every occupied slot participates
-    in data delivery via its own ``_materialize_brick_requests`` /
-    ``_materialize_tile_requests``.
+    via ``_plan_bricks`` / ``_plan_tiles_2d`` and owns the only tile manager
+    and LUT: the other slots share them (``index_owner``), so each slot's
+    cache texture is one channel layer of a ``LayeredBlockCache``.  Every
+    brick is requested with one read per run of consecutive claimed
+    channels; once all of them have arrived it is staged in the same
+    cache slot of every layer and committed once all layers are
+    uploaded, so channels load in lockstep and the LUT is rebuilt once.
 
     Parameters
     ----------
@@ -51,6 +120,8 @@ class GFXMultichannelMultiscaleImageVisual:
     transform : AffineTransform or None
         Spatial (non-channel) data-to-world transform.  Will be expanded to
         match ``len(level_shapes[0])`` dimensions.
+    data_dtype : np.dtype or None
+        Native dtype of the data store; selects every slot's cache dtype.
 
     Notes
     -----
@@ -69,6 +140,7 @@ class GFXMultichannelMultiscaleImageVisual:
         render_modes: set[str],
         displayed_axes: tuple[int, ...],
         transform: AffineTransform | None = None,
+        data_dtype: np.dtype | None = None,
     ) -> None:
         invalid = render_modes - {"2d", "3d"}
         if invalid or not render_modes:
@@ -82,6 +154,7 @@ class GFXMultichannelMultiscaleImageVisual:
         self._visual_model = visual_model
         self._channel_axis = visual_model.channel_axis
         self._full_level_shapes = list(level_shapes)
+        self._data_dtype = data_dtype
 
         # Expand spatial level_transforms to full data ndim so that
         # _build_world_to_level_transforms inside each slot composes correctly.
@@ -113,6 +186,7 @@ class GFXMultichannelMultiscaleImageVisual:
                 transform=transform,
                 gpu_budget_bytes_3d=per_slot_3d,
                 gpu_budget_bytes_2d=per_slot_2d,
+                index_owner=self._slots[0] if self._slots else None,
             )
             self._slots.append(slot)
 
@@ -123,6 +197,17 @@ class GFXMultichannelMultiscaleImageVisual:
         self._last_displayed_axes: tuple[int, ...] = displayed_axes
         self._current_slice_request_id_3d: UUID | None = None
         self._current_slice_request_id_2d: UUID | None = None
+        # Channel caches over the planner's tile manager, in channel order.
+        self._layers_3d: LayeredBlockCache | None = None
+        self._layers_2d: LayeredBlockCache | None = None
+        self._layer_channels_3d: tuple[int, ...] = ()
+        self._layer_channels_2d: tuple[int, ...] = ()
+        # Extra channel-run request ID -> brick request ID (see
+        # _split_channel_runs), and the planes gathered per brick request.
+        self._brick_reads_3d: dict[UUID, UUID] = {}
+        self._brick_reads_2d: dict[UUID, UUID] = {}
+        self._brick_planes_3d: dict[UUID, dict[int, np.ndarray]] = {}
+        self._brick_planes_2d: dict[UUID, dict[int, np.ndarray]] = {}
 
         # Build wrapper groups containing all slot nodes.
         self._group_3d: gfx.Group | None = None
@@ -162,8 +247,13 @@ class GFXMultichannelMultiscaleImageVisual:
         transform: AffineTransform | None,
         gpu_budget_bytes_3d: int,
         gpu_budget_bytes_2d: int,
+        index_owner: GFXMultiscaleImageVisual | None = None,
     ) -> GFXMultiscaleImageVisual:
-        """Create one ``GFXMultiscaleImageVisual`` channel slot."""
+        """Create one ``GFXMultiscaleImageVisual`` channel slot.
+
+        Every slot but the first shares the first slot's tile managers and
+        LUTs through *index_owner*.
+        """
         from cellier.render.visuals._image import (
             ImageGeometry3D,
             MultiscaleBrickLayout3D,
@@ -226,6 +316,11 @@ class GFXMultichannelMultiscaleImageVisual:
             aabb_color=visual_model.aabb.color,
             aabb_line_width=visual_model.aabb.line_width,
             pick_write=visual_model.pick_write,
+            data_dtype=self._data_dtype,
+            cache_precision=rc.cache_precision,
+            upload_budget_bytes=rc.upload_budget_bytes,
+            lod_strategy=rc.lod_strategy,
+            index_owner=index_owner,
         )
 
     # ------------------------------------------------------------------
@@ -238,6 +333,8 @@ class GFXMultichannelMultiscaleImageVisual:
         slot_idx = self._free_slots.pop(0)
         self._channel_to_slot[ch_idx] = slot_idx
         slot = self._slots[slot_idx]
+        # A reused slot must not keep the previous channel's brick ranges.
+        slot._brick_ranges_3d.clear()
 
         # Apply appearance to the slot's material.
         cm = _make_colormap(appearance.color_map)
@@ -335,14 +432,14 @@ class GFXMultichannelMultiscaleImageVisual:
     # ------------------------------------------------------------------
 
     def cancel_pending(self) -> None:
-        """Release all in-flight 3D slots across all channel slots."""
-        for slot in self._slots:
-            slot.cancel_pending()
+        """Release all in-flight 3D slots of the shared tile manager."""
+        self._brick_planes_3d.clear()
+        self._slots[self._planner_slot_index].cancel_pending()
 
     def cancel_pending_2d(self) -> None:
-        """Release all in-flight 2D slots across all channel slots."""
-        for slot in self._slots:
-            slot.cancel_pending_2d()
+        """Release all in-flight 2D slots of the shared tile manager."""
+        self._brick_planes_2d.clear()
+        self._slots[self._planner_slot_index].cancel_pending_2d()
 
     # ------------------------------------------------------------------
     # Node selection
@@ -472,6 +569,107 @@ class GFXMultichannelMultiscaleImageVisual:
         slot = self._slots[slot_idx]
         return slot.node_3d if len(displayed_axes) == 3 else slot.node_2d
 
+    # ------------------------------------------------------------------
+    # Channel layers
+    # ------------------------------------------------------------------
+
+    def _sync_layers(self, mode: str) -> LayeredBlockCache | None:
+        """Return the layered cache over the claimed channels for *mode*.
+
+        Every claimed channel is a layer, visible or not, so toggling
+        visibility needs no reload.  The layers are rebuilt when the
+        claimed channels or their caches change.  A layer that joins holds
+        none of the resident bricks, so the shared tile manager is then
+        emptied and the planner's LUT rebuilt.
+        """
+        channels = tuple(sorted(self._channel_to_slot))
+        caches = [
+            getattr(self._slots[self._channel_to_slot[ch]], f"_block_cache_{mode}")
+            for ch in channels
+        ]
+        if mode == "3d":
+            old, old_channels = self._layers_3d, self._layer_channels_3d
+        else:
+            old, old_channels = self._layers_2d, self._layer_channels_2d
+        if old is not None:
+            old_layers = set(zip(old_channels, map(id, old.layers)))
+            new_layers = set(zip(channels, map(id, caches)))
+            if new_layers == old_layers:
+                return old
+
+        layers = None
+        if channels and all(cache is not None for cache in caches):
+            layers = LayeredBlockCache(caches)
+        if old is not None and (
+            layers is None
+            or (
+                old.tile_manager is layers.tile_manager and not new_layers <= old_layers
+            )
+        ):
+            old.clear()
+            self._rebuild_planner_lut(mode)
+        if mode == "3d":
+            self._layers_3d, self._layer_channels_3d = layers, channels
+        else:
+            self._layers_2d, self._layer_channels_2d = layers, channels
+        return layers
+
+    def _rebuild_planner_lut(self, mode: str) -> None:
+        """Rebuild the LUT shared by every slot from the shared tile manager."""
+        planner = self._slots[self._planner_slot_index]
+        if mode == "3d":
+            planner._lut_manager_3d.rebuild(
+                planner._block_cache_3d.tile_manager,
+                current_slice_coord=planner._current_slice_coord_3d,
+            )
+        else:
+            planner._lut_manager_2d.rebuild(
+                planner._block_cache_2d.tile_manager,
+                current_slice_coord=planner._current_slice_coord,
+                viewport_cells=planner._current_viewport_cells,
+            )
+
+    def _gather_planes(
+        self,
+        req: ChunkRequest,
+        data: np.ndarray,
+        brick_id: UUID,
+        gathered: dict[UUID, dict[int, np.ndarray]],
+        channels: tuple[int, ...],
+    ) -> list[np.ndarray] | None:
+        """Collect one read's channel planes; return a brick's once complete.
+
+        Plane offsets come from the request's own channel range, so a
+        read planned before the layers changed is still split correctly;
+        channels it holds that are no longer layers are dropped.
+
+        Returns
+        -------
+        list[np.ndarray] or None
+            The brick's planes in layer order once every layer channel
+            has arrived, else ``None``.
+        """
+        start, stop = req.axis_selections[self._channel_axis]
+        wanted = [ch for ch in channels if start <= ch < stop]
+        if not wanted:
+            return None
+        planes = gathered.setdefault(brick_id, {})
+        planes.update(
+            zip(
+                wanted,
+                _channel_planes(
+                    data,
+                    req.axis_selections,
+                    self._channel_axis,
+                    [ch - start for ch in wanted],
+                ),
+            )
+        )
+        if any(ch not in planes for ch in channels):
+            return None
+        del gathered[brick_id]
+        return [planes[ch] for ch in channels]
+
     # ------------------------------------------------------------------
     # Planning
     # ------------------------------------------------------------------
@@ -485,14 +683,18 @@ class GFXMultichannelMultiscaleImageVisual:
         lod_bias: float = 1.0,
         dims_state: DimsState | None = None,
         force_level: int | None = None,
+        progressive: bool = False,
     ) -> list[ChunkRequest]:
-        """Plan 3D bricks once, then materialize for each visible channel."""
-        visible_channels = {
-            ch_idx: ap
+        """Plan 3D bricks once and request each brick for all claimed channels.
+
+        The planner stages the plan in the shared tile manager; each
+        brick is read with one request per run of consecutive claimed
+        channels (see ``_split_channel_runs``).
+        """
+        if not any(
+            ap.visible and ch_idx in self._channel_to_slot
             for ch_idx, ap in self._visual_model.channels.items()
-            if ap.visible and ch_idx in self._channel_to_slot
-        }
-        if not visible_channels:
+        ):
             return []
 
         planner = self._slots[self._planner_slot_index]
@@ -503,16 +705,24 @@ class GFXMultichannelMultiscaleImageVisual:
             if displayed != self._last_displayed_axes:
                 self._rebuild_slot_geometries(displayed)
 
-        # Set current slice coord on all slots so _materialize_brick_requests
-        # embeds the correct non-displayed axis position in every BlockKey3D.
+        # The planner's slice coord is embedded in every BlockKey3D and
+        # used by every rebuild of the shared LUT.
         current_slice_coord_3d: tuple[tuple[int, int], ...] = ()
         if dims_state is not None:
             current_slice_coord_3d = tuple(
                 sorted(dims_state.selection.slice_indices.items())
             )
-        for slot in self._slots:
-            slot._current_slice_coord_3d = current_slice_coord_3d
+        planner._current_slice_coord_3d = current_slice_coord_3d
+
+        layers = self._sync_layers("3d")
+        if layers is None:
+            return []
 
+        # One shared plan: a brick is only skipped as empty when it is
+        # empty in every channel layer.
+        layer_slots = [
+            self._slots[self._channel_to_slot[ch]] for ch in self._layer_channels_3d
+        ]
         brick_arr = planner._plan_bricks(
             camera_pos_world,
             frustum_corners_world,
@@ -520,35 +730,32 @@ class GFXMultichannelMultiscaleImageVisual:
             screen_height_px,
             lod_bias,
             force_level,
+            progressive,
+            empty_mask=lambda arr: np.logical_and.reduce(
+                [slot._empty_brick_mask(arr) for slot in layer_slots]
+            ),
         )
         if not len(brick_arr):
             return []
 
         sid = uuid4()
         self._current_slice_request_id_3d = sid
-        from itertools import zip_longest
-
-        channel_request_lists: list[list[ChunkRequest]] = []
-        for ch_idx in visible_channels:
-            slot_idx = self._channel_to_slot[ch_idx]
-            channel_slot = self._slots[slot_idx]
-            if force_level is not None:
-                channel_slot._block_cache_3d.tile_manager.evict_finer_than(force_level)
-            channel_request_lists.append(
-                channel_slot._materialize_brick_requests(
-                    brick_arr,
-                    sid,
-                    dims_state,
-                    fill={self._channel_axis: ch_idx},
-                    slice_coord=current_slice_coord_3d,
-                )
-            )
-        return [
-            req
-            for brick_group in zip_longest(*channel_request_lists)
-            for req in brick_group
-            if req is not None
-        ]
+
+        if force_level is not None:
+            layers.tile_manager.evict_finer_than(force_level)
+        runs = _channel_runs(self._layer_channels_3d)
+        requests = planner._materialize_brick_requests(
+            brick_arr,
+            sid,
+            dims_state,
+            fill={self._channel_axis: runs[0]},
+            slice_coord=current_slice_coord_3d,
+        )
+        self._brick_planes_3d = {}
+        requests, self._brick_reads_3d = _split_channel_runs(
+            requests, self._channel_axis, runs
+        )
+        return requests
 
     def build_slice_request_2d(
         self,
@@ -562,13 +769,15 @@ class GFXMultichannelMultiscaleImageVisual:
         force_level: int | None = None,
         use_culling: bool = True,
     ) -> list[ChunkRequest]:
-        """Plan 2D tiles once, then materialize for each visible channel."""
-        visible_channels = {
-            ch_idx: ap
+        """Plan 2D tiles once and request each tile for all claimed channels.
+
+        As in ``build_slice_request``, tiles are staged only in the
+        planner's shared tile manager and read once per channel run.
+        """
+        if not any(
+            ap.visible and ch_idx in self._channel_to_slot
             for ch_idx, ap in self._visual_model.channels.items()
-            if ap.visible and ch_idx in self._channel_to_slot
-        }
-        if not visible_channels:
+        ):
             return []
 
         planner = self._slots[self._planner_slot_index]
@@ -578,10 +787,14 @@ class GFXMultichannelMultiscaleImageVisual:
         if displayed != self._last_displayed_axes:
             self._rebuild_slot_geometries(displayed)
 
-        # Set current slice coord on all slots (needed by _materialize_tile_requests).
-        current_slice_coord = tuple(sorted(dims_state.selection.slice_indices.items()))
-        for slot in self._slots:
-            slot._current_slice_coord = current_slice_coord
+        # Needed by _materialize_tile_requests and every shared LUT rebuild.
+        planner._current_slice_coord = tuple(
+            sorted(dims_state.selection.slice_indices.items())
+        )
+
+        layers = self._sync_layers("2d")
+        if layers is None:
+            return []
 
         planner._frame_number += 1
 
@@ -595,79 +808,151 @@ class GFXMultichannelMultiscaleImageVisual:
             force_level=force_level,
             use_culling=use_culling,
         )
-        # Propagate the viewport region (computed inside _plan_tiles_2d) to all
-        # slots so per-slot LUT rebuilds clip stale background tiles to the view.
-        for slot in self._slots:
-            slot._current_viewport_cells = planner._current_viewport_cells
         if not required:
             return []
 
         sid = uuid4()
         self._current_slice_request_id_2d = sid
-        from itertools import zip_longest
-
-        channel_request_lists: list[list[ChunkRequest]] = []
-        for ch_idx in visible_channels:
-            slot_idx = self._channel_to_slot[ch_idx]
-            channel_slot = self._slots[slot_idx]
-            channel_request_lists.append(
-                channel_slot._materialize_tile_requests(
-                    required,
-                    target_level,
-                    dims_state,
-                    sid,
-                    fill={self._channel_axis: ch_idx},
-                )
-            )
-        return [
-            req
-            for tile_group in zip_longest(*channel_request_lists)
-            for req in tile_group
-            if req is not None
-        ]
+
+        runs = _channel_runs(self._layer_channels_2d)
+        requests = planner._materialize_tile_requests(
+            required,
+            target_level,
+            dims_state,
+            sid,
+            fill={self._channel_axis: runs[0]},
+        )
+        self._brick_planes_2d = {}
+        requests, self._brick_reads_2d = _split_channel_runs(
+            requests, self._channel_axis, runs
+        )
+        return requests
 
     # ------------------------------------------------------------------
     # Commit
     # ------------------------------------------------------------------
 
     def on_data_ready(self, batch: list[tuple[ChunkRequest, np.ndarray]]) -> None:
-        """Route arriving 3D bricks to the correct channel slot."""
-        by_channel: dict[int, list[tuple[ChunkRequest, np.ndarray]]] = {}
-        for request, data in batch:
-            if request.slice_request_id != self._current_slice_request_id_3d:
-                continue
-            ch_idx = int(request.axis_selections[self._channel_axis])
-            by_channel.setdefault(ch_idx, []).append((request, data))
+        """Write arriving 3D bricks into every channel layer, then upload.
 
-        for ch_idx, sub_batch in by_channel.items():
-            slot_idx = self._channel_to_slot.get(ch_idx)
-            if slot_idx is None:
+        Each read is split into its channel planes; once every layer
+        channel of a brick has arrived, the planes are staged in the same
+        cache slot of every layer.  The slot's brick maximum is the
+        maximum over channels, so the shader only skips a brick that is
+        dark in every channel.
+        """
+        layers = self._layers_3d
+        if layers is None:
+            return
+        planner = self._slots[self._planner_slot_index]
+        channels = self._layer_channels_3d
+
+        ranges: dict[tuple, list[tuple]] = {}
+        for req, data in batch:
+            if req.slice_request_id != self._current_slice_request_id_3d:
                 continue
-            self._slots[slot_idx].on_data_ready(sub_batch)
+            brick_id = self._brick_reads_3d.get(
+                req.chunk_request_id, req.chunk_request_id
+            )
+            entry = planner._pending_slot_map.get(brick_id)
+            if entry is None:
+                continue
+            planes = self._gather_planes(
+                req, data, brick_id, self._brick_planes_3d, channels
+            )
+            if planes is None:
+                continue
+            brick_key, slot = entry
+            lows = [float(plane.min()) for plane in planes]
+            highs = [float(plane.max()) for plane in planes]
+            slot.brick_max = max(highs)
+            ranges.setdefault(brick_key.slice_coord, []).append(
+                (
+                    brick_key.level,
+                    brick_key.g0,
+                    brick_key.g1,
+                    brick_key.g2,
+                    *lows,
+                    *highs,
+                )
+            )
+            layers.write(slot, planes, key=brick_key)
+
+        n = len(channels)
+        for slice_coord, rows in ranges.items():
+            rows_arr = np.array(rows)
+            brick_arr = rows_arr[:, :4].astype(np.int64)
+            for i, ch in enumerate(channels):
+                slot_idx = self._channel_to_slot.get(ch)
+                if slot_idx is None:
+                    continue
+                self._slots[slot_idx]._brick_ranges_3d.record(
+                    brick_arr,
+                    rows_arr[:, 4 + i],
+                    rows_arr[:, 4 + n + i],
+                    slice_coord=slice_coord,
+                )
+        self._flush_layers_3d()
 
     def on_data_ready_2d(self, batch: list[tuple[ChunkRequest, np.ndarray]]) -> None:
-        """Route arriving 2D tiles to the correct channel slot."""
-        accepted: list[tuple[ChunkRequest, np.ndarray]] = []
-        rejected = 0
-        for request, data in batch:
-            if request.slice_request_id != self._current_slice_request_id_2d:
-                rejected += 1
-            else:
-                accepted.append((request, data))
-        ch_counts: dict[int, int] = {}
-        for request, _ in accepted:
-            ch = int(request.axis_selections[self._channel_axis])
-            ch_counts[ch] = ch_counts.get(ch, 0) + 1
-        by_channel: dict[int, list[tuple[ChunkRequest, np.ndarray]]] = {}
-        for request, data in accepted:
-            ch_idx = int(request.axis_selections[self._channel_axis])
-            by_channel.setdefault(ch_idx, []).append((request, data))
-
-        for ch_idx, sub_batch in by_channel.items():
-            slot_idx = self._channel_to_slot.get(ch_idx)
-            if slot_idx is None:
+        """Write arriving 2D tiles into every channel layer, then upload."""
+        layers = self._layers_2d
+        if layers is None:
+            return
+        planner = self._slots[self._planner_slot_index]
+        channels = self._layer_channels_2d
+
+        for req, data in batch:
+            if req.slice_request_id != self._current_slice_request_id_2d:
                 continue
-            self._slots[slot_idx].on_data_ready_2d(sub_batch)
+            tile_id = self._brick_reads_2d.get(
+                req.chunk_request_id, req.chunk_request_id
+            )
+            entry = planner._pending_slot_map_2d.get(tile_id)
+            if entry is None:
+                continue
+            planes = self._gather_planes(
+                req, data, tile_id, self._brick_planes_2d, channels
+            )
+            if planes is None:
+                continue
+            tile_key, slot = entry
+            layers.write(slot, planes, key=tile_key)
+        self._flush_layers_2d()
+
+    def _flush_layers_3d(self) -> None:
+        """Upload staged bricks to every layer, then rebuild the shared LUT once."""
+        committed = self._layers_3d.flush_uploads()
+        if not committed:
+            return
+        tile_manager = self._layers_3d.tile_manager
+        _GPU_LOGGER.info(
+            "gpu_flush  bricks_in_batch=%d  resident=%d  staged=%d  layers=%d",
+            len(committed),
+            len(tile_manager.tilemap),
+            self._layers_3d.n_pending_uploads,
+            len(self._layers_3d),
+        )
+        self._rebuild_planner_lut("3d")
+        for slot in self._slots:
+            slot._reveal_aabb_3d()
+
+    def _flush_layers_2d(self) -> None:
+        """Upload staged tiles to every layer, then rebuild the shared LUT once."""
+        committed = self._layers_2d.flush_uploads()
+        if not committed:
+            return
+        tile_manager = self._layers_2d.tile_manager
+        _GPU_LOGGER.info(
+            "gpu_flush  tiles_in_batch=%d  resident=%d  staged=%d  layers=%d",
+            len(committed),
+            len(tile_manager.tilemap),
+            self._layers_2d.n_pending_uploads,
+            len(self._layers_2d),
+        )
+        self._rebuild_planner_lut("2d")
+        for slot in self._slots:
+            slot._reveal_aabb_2d()
 
     # ------------------------------------------------------------------
     # Standard event handlers
@@ -709,4 +994,12 @@ class GFXMultichannelMultiscaleImageVisual:
             slot.on_aabb_changed(event)
 
     def tick(self) -> None:
-        """No per-frame state to advance."""
+        """Flush the channel layers' uploads held back by the per-frame budget."""
+        if self._layers_3d is not None:
+            self._layers_3d.begin_frame()
+            if self._layers_3d.n_pending_uploads:
+                self._flush_layers_3d()
+        if self._layers_2d is not None:
+            self._layers_2d.begin_frame()
+            if self._layers_2d.n_pending_uploads:
+                self._flush_layers_2d()
@@ -314,6 +314,7 @@ class GFXLabelMemoryVisual:
         lod_bias: float = 1.0,
         dims_state: DimsState | None = None,
         force_level: int | None = None,
+        progressive: bool = False,
     ) -> list[ChunkRequest]:
         if dims_state is None:
             ndim = self._data_store.ndim
@@ -17,15 +17,16 @@ from cellier.render._frustum import (
 )
 from cellier.render._level_of_detail import (
     arr_to_brick_keys,
+    progressive_cover_order,
     select_levels_arr_forced,
     select_levels_from_cache,
     sort_arr_by_distance,
 )
 from cellier.render._level_of_detail_2d import (
     arr_to_block_keys_2d,
-    select_lod_2d,
+    select_level_2d,
     sort_tiles_by_distance_2d,
-    viewport_cull_2d,
+    tiles_in_view_2d,
 )
 from cellier.render.block_cache import (
     BlockCache3D,
@@ -612,6 +613,7 @@ class GFXMultiscaleLabelVisual:
         lod_bias: float = 1.0,
         dims_state: DimsState | None = None,
         force_level: int | None = None,
+        progressive: bool = False,
     ) -> list[ChunkRequest]:
         t_plan_start = time.perf_counter()
         self._frame_number += 1
@@ -710,6 +712,12 @@ class GFXMultiscaleLabelVisual:
             frustum_cull_ms = (time.perf_counter() - t0) * 1000
             n_culled = n_total - len(brick_arr)
 
+        # Progressive refinement: coarse cover first, then coarse-to-fine.
+        if progressive and force_level is None and geo.n_levels > 1:
+            brick_arr = progressive_cover_order(
+                brick_arr, geo, camera_pos_data, frustum_planes=frustum_planes
+            )
+
         n_needed = len(brick_arr)
         n_budget = self._block_cache_3d.info.n_slots - 1
         n_dropped = max(0, n_needed - n_budget)
@@ -731,7 +739,7 @@ class GFXMultiscaleLabelVisual:
 
         # When all required bricks are cache hits, on_data_ready never fires
         # so the LUT would remain stale (pointing to a different slice position).
-        # Rebuild immediately in that case — mirrors the 2D all-hits guard.
+        # Rebuild immediately in that case.
         if not fill_plan:
             self._lut_manager_3d.rebuild(
                 self._block_cache_3d.tile_manager,
@@ -829,7 +837,7 @@ class GFXMultiscaleLabelVisual:
             if contains_label:
                 non_bg_bricks += 1
             self._block_cache_3d.write_brick(slot, data, key=brick_key)
-            self._block_cache_3d.tile_manager.commit(brick_key, slot)
+        self._block_cache_3d.flush_uploads()
 
         _GPU_LOGGER.info(
             "gpu_flush  bricks_in_batch=%d  resident=%d",
@@ -935,8 +943,7 @@ class GFXMultiscaleLabelVisual:
             self._current_viewport_cells = None
 
         t0 = time.perf_counter()
-        tile_arr = select_lod_2d(
-            geo2d._level_grids,
+        target_level = select_level_2d(
             n_levels,
             viewport_width_px=viewport_width_px,
             voxel_width=voxel_width,
@@ -946,6 +953,21 @@ class GFXMultiscaleLabelVisual:
         )
         lod_select_ms = (time.perf_counter() - t0) * 1000
 
+        t0 = time.perf_counter()
+        grid_dims = geo2d._tile_grid_dims[target_level - 1]
+        tile_arr = tiles_in_view_2d(
+            target_level,
+            grid_dims,
+            block_size,
+            view_min,
+            view_max,
+            level_scale_arr_shader=geo2d._scale_arr_shader,
+            level_translation_arr_shader=geo2d._translation_arr_shader,
+        )
+        n_total = grid_dims[0] * grid_dims[1]
+        n_culled = n_total - len(tile_arr)
+        cull_ms = (time.perf_counter() - t0) * 1000
+
         t0 = time.perf_counter()
         tile_arr = sort_tiles_by_distance_2d(
             tile_arr,
@@ -957,21 +979,6 @@ class GFXMultiscaleLabelVisual:
         distance_sort_ms = (time.perf_counter() - t0) * 1000
 
         required = arr_to_block_keys_2d(tile_arr, slice_coord=self._current_slice_coord)
-        n_total = len(required)
-
-        n_culled = 0
-        cull_ms = 0.0
-        if use_culling and view_min is not None and view_max is not None:
-            t0 = time.perf_counter()
-            required, n_culled = viewport_cull_2d(
-                required,
-                block_size,
-                view_min,
-                view_max,
-                level_scale_arr_shader=geo2d._scale_arr_shader,
-                level_translation_arr_shader=geo2d._translation_arr_shader,
-            )
-            cull_ms = (time.perf_counter() - t0) * 1000
 
         n_needed = len(required)
         n_budget = self._block_cache_2d.info.n_slots - 1
@@ -980,7 +987,6 @@ class GFXMultiscaleLabelVisual:
             keys_to_keep = list(required.keys())[:n_budget]
             required = {k: required[k] for k in keys_to_keep}
 
-        target_level = int(tile_arr[0, 0]) if len(tile_arr) > 0 else 1
         self._block_cache_2d.tile_manager.evict_finer_than(target_level)
 
         t0 = time.perf_counter()
@@ -989,12 +995,12 @@ class GFXMultiscaleLabelVisual:
         )
         stage_ms = (time.perf_counter() - t0) * 1000
 
-        if not fill_plan:
-            self._lut_manager_2d.rebuild(
-                self._block_cache_2d.tile_manager,
-                current_slice_coord=self._current_slice_coord,
-                viewport_cells=self._current_viewport_cells,
-            )
+        # Unconditional: stage() may have promoted reserve tiles.
+        self._lut_manager_2d.rebuild(
+            self._block_cache_2d.tile_manager,
+            current_slice_coord=self._current_slice_coord,
+            viewport_cells=self._current_viewport_cells,
+        )
 
         slice_id = uuid4()
         chunk_requests: list[ChunkRequest] = []
@@ -1080,7 +1086,7 @@ class GFXMultiscaleLabelVisual:
                 continue
             tile_key, slot = entry
             self._block_cache_2d.write_tile(slot, data, key=tile_key)
-            self._block_cache_2d.tile_manager.commit(tile_key, slot)
+        self._block_cache_2d.flush_uploads()
 
         n_resident = len(self._block_cache_2d.tile_manager.tilemap)
 
@@ -272,6 +272,7 @@ class GFXLinesMemoryVisual:
         lod_bias: float = 1.0,
         dims_state: DimsState | None = None,
         force_level: int | None = None,
+        progressive: bool = False,
     ) -> list[LinesSliceRequest]:
         """3-D planning path — returns one LinesSliceRequest."""
         displayed = dims_state.selection.displayed_axes
@@ -277,6 +277,7 @@ class GFXMeshMemoryVisual:
         lod_bias: float = 1.0,
         dims_state: DimsState | None = None,
         force_level: int | None = None,
+        progressive: bool = False,
     ) -> list[MeshSliceRequest]:
         """3-D planning path — returns one MeshSliceRequest."""
         displayed = dims_state.selection.displayed_axes
@@ -266,6 +266,7 @@ class GFXPointsMemoryVisual:
         lod_bias: float = 1.0,
         dims_state: DimsState | None = None,
         force_level: int | None = None,
+        progressive: bool = False,
     ) -> list[PointsSliceRequest]:
         """3-D planning path — returns one PointsSliceRequest."""
         displayed = dims_state.selection.displayed_axes
@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
+import itertools
 import logging
 import math
 import time
-from collections.abc import Callable, Coroutine
+from collections.abc import Callable, Coroutine, Hashable
 from typing import TYPE_CHECKING, Any
 
 import numpy as np
@@ -17,6 +19,8 @@ from cellier.logging import _PERF_LOGGER, _SLICER_LOGGER
 if TYPE_CHECKING:
     from uuid import UUID
 
+    from cellier.render._host_brick_cache import HostBrickCache
+
 # ---------------------------------------------------------------------------
 # PySide6 compatibility patch
 #
@@ -100,6 +104,198 @@ BatchCallback = Callable[[list[tuple[ChunkRequest, np.ndarray]]], None]
 # completion only — never on cancellation).
 CompleteCallback = Callable[[], None]
 
+# Callable reading many ChunkRequests at once; returns one ndarray per request.
+BatchFetchFn = Callable[[list[ChunkRequest]], Coroutine[Any, Any, list[np.ndarray]]]
+
+# Submission-level priority; compared lexicographically, lower loads first.
+Priority = tuple[int, ...]
+
+# An in-flight read: the future resolving to the chunk, or (for a shared
+# batch read) to a list indexed by the second element.
+Read = tuple[asyncio.Future, int | None]
+
+
+class _FetchScheduler:
+    """Global priority gate bounding the number of concurrent chunk reads.
+
+    Every ``fetch_fn`` call made by any ``AsyncSlicer`` task acquires one
+    of ``max_in_flight`` slots first; a coalesced batch read acquires one
+    slot per chunk it reads, atomically.  When the slots are busy, waiters
+    queue in a min-heap ordered by their priority key and are admitted
+    strictly in that order as slots are released.
+
+    Parameters
+    ----------
+    max_in_flight :
+        Maximum number of reads running concurrently across all tasks.
+    """
+
+    def __init__(self, max_in_flight: int) -> None:
+        self._max_in_flight = max(1, max_in_flight)
+        self._in_flight = 0
+        self._waiters: list[tuple[tuple, int, int, asyncio.Future]] = []
+        self._seq = itertools.count()
+
+    @property
+    def in_flight(self) -> int:
+        """Number of slots currently held."""
+        return self._in_flight
+
+    @property
+    def n_waiting(self) -> int:
+        """Number of queued waiters, including lazily-deleted cancelled ones."""
+        return len(self._waiters)
+
+    async def acquire(self, key: tuple, n: int = 1) -> int:
+        """Wait until *n* slots are free and *key* is the best queued priority.
+
+        *n* is clamped to ``[1, max_in_flight]`` so an oversized batch
+        cannot wait forever.  Returns the number of slots actually held,
+        which must be passed back to ``release``.
+        """
+        n = min(max(1, n), self._max_in_flight)
+        if not self._waiters and self._in_flight + n <= self._max_in_flight:
+            self._in_flight += n
+            return n
+        fut = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (key, next(self._seq), n, fut))
+        try:
+            await fut
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():
+                # Slots were handed over just before cancellation; pass them on.
+                self.release(n)
+            else:
+                # A cancelled head-of-line waiter may be blocking others.
+                self._wake()
+            raise
+        return n
+
+    def release(self, n: int = 1) -> None:
+        """Free *n* slots and admit queued waiters in priority order."""
+        self._in_flight -= n
+        self._wake()
+
+    def _wake(self) -> None:
+        """Admit live waiters from the head of the heap while they fit."""
+        while self._waiters:
+            _, _, n, fut = self._waiters[0]
+            if fut.done():
+                heapq.heappop(self._waiters)
+                continue
+            if self._in_flight + n > self._max_in_flight:
+                return
+            heapq.heappop(self._waiters)
+            self._in_flight += n
+            fut.set_result(None)
+
+
+class _BatchTuner:
+    """AIMD controller for ``AsyncSlicer`` batch size and render cadence.
+
+    ``batch_size`` grows additively while per-chunk throughput keeps up
+    and is halved when batch latency rises without a throughput gain,
+    i.e. once the storage is saturated and extra concurrency only queues.
+    A steady batch size is probed upward every ``_PROBE_AFTER`` batches
+    so the controller follows storage that speeds up again.
+
+    ``render_every`` grows by one while redraws (the time spent yielding
+    to Qt, which flushes GPU uploads and draws) take more than
+    ``render_overhead_fraction`` of the loading wall time, and shrinks by
+    one when they take less than half of it.
+
+    Parameters
+    ----------
+    batch_size :
+        Starting batch size.
+    render_every :
+        Starting number of batches between redraws.
+    max_batch_size :
+        Upper bound on ``batch_size``.
+    max_render_every :
+        Upper bound on ``render_every``.
+    render_overhead_fraction :
+        Target share of loading wall time spent redrawing.
+    """
+
+    # Relative change below which two measurements count as equal.
+    _TOLERANCE = 0.1
+    _INCREASE = 2
+    _DECREASE = 0.5
+    _PROBE_AFTER = 4
+
+    def __init__(
+        self,
+        batch_size: int,
+        render_every: int,
+        max_batch_size: int,
+        max_render_every: int,
+        render_overhead_fraction: float,
+    ) -> None:
+        self._max_batch_size = max(1, max_batch_size)
+        self._max_render_every = max(1, max_render_every)
+        self._render_overhead_fraction = render_overhead_fraction
+        self.batch_size = min(max(1, batch_size), self._max_batch_size)
+        self.render_every = min(max(1, render_every), self._max_render_every)
+        # (chunks per ms, batch ms) when throughput last improved.
+        self._baseline: tuple[float, float] | None = None
+        self._n_steady = 0
+
+    def record_batch(self, n_chunks: int, batch_ms: float) -> None:
+        """Feed one full batch of *n_chunks* that took *batch_ms* to read."""
+        if batch_ms <= 0.0:
+            return
+        throughput = n_chunks / batch_ms
+        if self._baseline is None:
+            # Measure the current size, then probe the next one up.
+            self._baseline = (throughput, batch_ms)
+            self._resize(self.batch_size + self._INCREASE)
+            return
+        base_throughput, base_ms = self._baseline
+        if throughput > base_throughput * (1 + self._TOLERANCE):
+            self._baseline = (throughput, batch_ms)
+            self._resize(self.batch_size + self._INCREASE)
+        elif batch_ms > base_ms * (1 + self._TOLERANCE):
+            self._baseline = None
+            self._resize(int(self.batch_size * self._DECREASE))
+        else:
+            self._n_steady += 1
+            if self._n_steady >= self._PROBE_AFTER:
+                self._resize(self.batch_size + self._INCREASE)
+
+    def record_render(self, render_ms: float, loading_ms: float) -> None:
+        """Feed one redraw of *render_ms* after *loading_ms* of loading."""
+        total_ms = render_ms + loading_ms
+        if total_ms <= 0.0:
+            return
+        fraction = render_ms / total_ms
+        render_every = self.render_every
+        if fraction > self._render_overhead_fraction:
+            render_every += 1
+        elif fraction < self._render_overhead_fraction / 2:
+            render_every -= 1
+        render_every = min(max(1, render_every), self._max_render_every)
+        if render_every != self.render_every:
+            self.render_every = render_every
+            _SLICER_LOGGER.info(
+                "tuned  batch_size=%d  render_every=%d  render_fraction=%.2f",
+                self.batch_size,
+                self.render_every,
+                fraction,
+            )
+
+    def _resize(self, batch_size: int) -> None:
+        self._n_steady = 0
+        batch_size = min(max(1, batch_size), self._max_batch_size)
+        if batch_size != self.batch_size:
+            _SLICER_LOGGER.info(
+                "tuned  batch_size=%d  render_every=%d  previous_batch_size=%d",
+                batch_size,
+                self.render_every,
+                self.batch_size,
+            )
+            self.batch_size = batch_size
+
 
 class AsyncSlicer:
     """Generic cancellable async batch-fetch service.
@@ -109,9 +305,32 @@ class AsyncSlicer:
     on each ``submit()`` call so the same slicer instance can serve any
     storage backend or chunk type (volumes, images, point clouds).
 
-    All reads within a batch are issued concurrently via ``asyncio.gather``.
-    After each batch the callback fires and ``asyncio.sleep(0)`` yields to
-    Qt so the renderer can flush pending GPU uploads and redraw.
+    All reads within a batch are issued concurrently.  After each batch
+    the callback fires and ``asyncio.sleep(0)`` yields to Qt so the
+    renderer can flush pending GPU uploads and redraw.  With ``adaptive``
+    set, the batch size and render cadence are tuned from the measured
+    batch and redraw times (see ``_BatchTuner``).
+
+    Reads from every task pass through one global scheduler that caps the
+    number of concurrent reads at ``max_in_flight``.  Queued reads are
+    ordered by ``(priority, -scale_index, position)``: the submission's
+    ``priority`` tuple first, then coarser levels before finer ones, then
+    the request's position within its submission.  Planners emit requests
+    nearest-first, so position stands in for screen-space distance; since
+    the i-th request of every equal-priority task shares the same
+    position, competing visuals are served round-robin.
+
+    Submissions that pass a ``batch_fetch_fn`` read each batch with one
+    call instead of one ``fetch_fn`` call per chunk, letting the store
+    coalesce neighbouring reads; the call holds one scheduler slot per
+    chunk it reads, taken at the priority of its most urgent chunk.
+
+    A replan that still needs some of a task's chunks can ``detach()``
+    the task instead of cancelling it: the task stops, but its started
+    reads keep running and are handed to the next ``submit()`` as
+    ``adopt``.  Requests there with a matching ``chunk_request_id`` wait
+    on the running read instead of issuing a new one; reads nobody
+    claims are cancelled.
 
     Parameters
     ----------
@@ -126,13 +345,64 @@ class AsyncSlicer:
         Default 1 renders after every batch.  Set higher (e.g. 4) to
         reduce intermediate render overhead at the cost of less frequent
         visual feedback during loading.
+    max_in_flight :
+        Global cap on concurrent ``fetch_fn`` calls across all tasks.
+        Default 32.
+    host_cache :
+        Optional shared host-RAM cache of decoded chunks.  Consulted
+        before ``fetch_fn`` for submissions that pass a
+        ``cache_namespace``; ``None`` disables host caching entirely.
+    adaptive :
+        When ``True``, ``batch_size`` and ``render_every`` are starting
+        values that are tuned at runtime; read the current values from
+        the ``batch_size`` and ``render_every`` properties.
+    max_batch_size :
+        Upper bound on the tuned batch size, capped at ``max_in_flight``
+        (a larger batch could not read concurrently).  Ignored unless
+        ``adaptive``.
+    max_render_every :
+        Upper bound on the tuned ``render_every``.  Ignored unless
+        ``adaptive``.
+    render_overhead_fraction :
+        Target share of loading wall time spent redrawing, used to tune
+        ``render_every``.  Ignored unless ``adaptive``.
     """
 
-    def __init__(self, batch_size: int = 8, render_every: int = 1) -> None:
+    def __init__(
+        self,
+        batch_size: int = 8,
+        render_every: int = 1,
+        max_in_flight: int = 32,
+        host_cache: HostBrickCache | None = None,
+        adaptive: bool = False,
+        max_batch_size: int = 32,
+        max_render_every: int = 8,
+        render_overhead_fraction: float = 0.25,
+    ) -> None:
         self._batch_size = batch_size
         self._render_every = max(1, render_every)
+        self._tuner = (
+            _BatchTuner(
+                batch_size,
+                render_every,
+                min(max_batch_size, max_in_flight),
+                max_render_every,
+                render_overhead_fraction,
+            )
+            if adaptive
+            else None
+        )
+        self._scheduler = _FetchScheduler(max_in_flight)
+        self._host_cache = host_cache
         # Maps slice_request_id -> running asyncio.Task.
         self._tasks: dict[UUID, asyncio.Task] = {}
+        # Maps slice_request_id -> chunk_request_id -> started (or adopted)
+        # read whose result the task has not consumed yet.
+        self._reads: dict[UUID, dict[UUID, Read]] = {}
+        # Maps chunk_request_id -> (start, end) perf_counter times of its
+        # store read, for the tuner.  Queue wait and host-cache hits are
+        # not included.
+        self._read_spans: dict[UUID, tuple[float, float]] = {}
 
     # ── Public API ──────────────────────────────────────────────────────
 
@@ -143,6 +413,10 @@ class AsyncSlicer:
         callback: BatchCallback,
         consumer_id: str | None = None,
         on_complete: CompleteCallback | None = None,
+        cache_namespace: Hashable | None = None,
+        priority: Priority = (),
+        batch_fetch_fn: BatchFetchFn | None = None,
+        adopt: dict[UUID, Read] | None = None,
     ) -> UUID | None:
         """Submit a batch of chunk requests for async loading.
 
@@ -172,6 +446,29 @@ class AsyncSlicer:
             thread, after every batch has committed via ``callback``.  It is
             **not** called if the task is cancelled before all batches finish.
             Used to signal that a visual's reslice cycle is fully complete.
+        cache_namespace :
+            Identity of the data source behind ``fetch_fn`` (typically the
+            data store ``id``).  When given and the slicer owns a host
+            cache, chunks are looked up by
+            ``(cache_namespace, scale_index, axis_selections)`` before
+            reading and stored after reading.  ``None`` bypasses the cache.
+        priority :
+            Submission-level priority tuple, compared lexicographically
+            against other submissions; lower values load first.  The
+            ``SliceCoordinator`` passes ``(tier, visual load_priority,
+            canvas rank)``: displayed-view reads outrank prefetch reads,
+            and the focused canvas wins ties.
+        batch_fetch_fn :
+            Optional async callable ``(list[ChunkRequest]) ->
+            list[np.ndarray]`` reading the same source as ``fetch_fn``
+            (typically ``data_store.get_data_batch``).  When given, each
+            batch's host-cache misses are read with a single call so the
+            store can merge reads of shared storage chunks.
+        adopt :
+            Reads returned by ``detach()`` for the task this submission
+            supersedes.  Requests whose ``chunk_request_id`` has a read
+            here reuse it; the remaining reads are cancelled, even when
+            ``requests`` is empty.
 
         Returns
         -------
@@ -180,6 +477,7 @@ class AsyncSlicer:
             ``requests`` was empty.  Store this to pass to ``cancel()``
             before the next ``submit()`` call.
         """
+        adopted = self._claim_reads(requests, adopt) if adopt else {}
         if not requests:
             return None
 
@@ -190,18 +488,39 @@ class AsyncSlicer:
         # submitting a fresh batch, but this guards against accidental
         # same-ID resubmission.
         if slice_id in self._tasks:
-            self._tasks[slice_id].cancel()
+            self.cancel(slice_id)
+
+        fetch_fn = self._compose_fetch_fn(fetch_fn, cache_namespace)
+        batch_fetch = (
+            self._compose_batch_fetch_fn(batch_fetch_fn, cache_namespace)
+            if batch_fetch_fn is not None
+            else None
+        )
 
         task = asyncio.ensure_future(
-            self._run(requests, fetch_fn, callback, slice_id, on_complete)
+            self._run(
+                requests,
+                fetch_fn,
+                callback,
+                slice_id,
+                on_complete,
+                priority,
+                batch_fetch,
+            )
         )
         self._tasks[slice_id] = task
+        # Registered before the task first runs so that cancelling or
+        # detaching it straight away still accounts for the adopted reads.
+        self._reads[slice_id] = adopted
 
         _SLICER_LOGGER.info(
-            "task_submitted  requests=%d  slice_id=%s  consumer=%r",
+            "task_submitted  requests=%d  adopted=%d  slice_id=%s  consumer=%r  "
+            "priority=%s",
             len(requests),
+            len(adopted),
             slice_id,
             consumer_id,
+            priority,
         )
 
         return slice_id
@@ -225,14 +544,240 @@ class AsyncSlicer:
         """
         if slice_request_id is None:
             return False
+        self.cancel_reads(self._reads.pop(slice_request_id, {}))
         task = self._tasks.pop(slice_request_id, None)
         if task is not None and not task.done():
             task.cancel()
             return True
         return False
 
+    def detach(self, slice_request_id: UUID | None) -> dict[UUID, Read]:
+        """Stop the task for ``slice_request_id`` but keep its reads running.
+
+        The task's callbacks (including ``on_complete``) never fire again.
+        Pass the returned reads to the superseding ``submit()`` as
+        ``adopt``, or to ``cancel_reads()`` if there is none.
+
+        Parameters
+        ----------
+        slice_request_id :
+            The ID returned by a previous ``submit()`` call.
+
+        Returns
+        -------
+        reads :
+            Maps ``chunk_request_id`` to each read the task had started
+            (or adopted) but not yet delivered.  Empty if the ID is
+            unknown or the task has finished.
+        """
+        if slice_request_id is None:
+            return {}
+        reads = self._reads.pop(slice_request_id, {})
+        task = self._tasks.pop(slice_request_id, None)
+        if task is not None and not task.done():
+            task.cancel()
+        return reads
+
+    @staticmethod
+    def cancel_reads(reads: dict[UUID, Read]) -> None:
+        """Cancel reads obtained from ``detach()``."""
+        for future, _ in reads.values():
+            future.cancel()
+
+    @property
+    def host_cache(self) -> HostBrickCache | None:
+        """The shared host-RAM chunk cache, or ``None`` if disabled."""
+        return self._host_cache
+
+    @property
+    def batch_size(self) -> int:
+        """Number of chunks read per batch (the tuned value if adaptive)."""
+        return self._tuner.batch_size if self._tuner else self._batch_size
+
+    @property
+    def render_every(self) -> int:
+        """Batches between redraws (the tuned value if adaptive)."""
+        return self._tuner.render_every if self._tuner else self._render_every
+
     # ── Internal coroutine ──────────────────────────────────────────────
 
+    def _claim_reads(
+        self, requests: list[ChunkRequest], adopt: dict[UUID, Read]
+    ) -> dict[UUID, Read]:
+        """Split *adopt* into reads *requests* reuse and reads to cancel.
+
+        A shared batch read writes every member's destination, so it is
+        only kept when all of its members are requested again; otherwise
+        the whole read is cancelled and its requested members re-read.
+        """
+        wanted = {req.chunk_request_id for req in requests}
+        members: dict[asyncio.Future, list[UUID]] = {}
+        for chunk_id, (future, _) in adopt.items():
+            members.setdefault(future, []).append(chunk_id)
+        claimed: dict[UUID, Read] = {}
+        for future, chunk_ids in members.items():
+            if not future.cancelled() and all(c in wanted for c in chunk_ids):
+                claimed.update((c, adopt[c]) for c in chunk_ids)
+            else:
+                future.cancel()
+        _SLICER_LOGGER.info(
+            "reads_adopted  adopted=%d  cancelled=%d",
+            len(claimed),
+            len(adopt) - len(claimed),
+        )
+        return claimed
+
+    def _start_reads(
+        self,
+        batch: list[ChunkRequest],
+        keys: list[tuple],
+        fetch_fn: FetchFn,
+        batch_fetch: Callable | None,
+        reads: dict[UUID, Read],
+    ) -> list[Read]:
+        """Return one read per request in *batch*, starting any not in *reads*.
+
+        New reads are registered in *reads* so ``detach()`` can hand them
+        on.  Each read is its own future, so cancelling the task that
+        awaits them does not cancel the reads themselves.
+        """
+        fresh = [i for i, req in enumerate(batch) if req.chunk_request_id not in reads]
+        if batch_fetch is not None and fresh:
+            future = asyncio.ensure_future(
+                batch_fetch([batch[i] for i in fresh], [keys[i] for i in fresh])
+            )
+            for j, i in enumerate(fresh):
+                reads[batch[i].chunk_request_id] = (future, j)
+        else:
+            for i in fresh:
+                reads[batch[i].chunk_request_id] = (
+                    asyncio.ensure_future(
+                        self._scheduled_fetch(fetch_fn, batch[i], keys[i])
+                    ),
+                    None,
+                )
+        return [reads[req.chunk_request_id] for req in batch]
+
+    def _compose_fetch_fn(
+        self,
+        fetch_fn: FetchFn,
+        namespace: Hashable | None,
+    ) -> FetchFn:
+        """Wrap *fetch_fn* with the host cache and store-read timing.
+
+        Returns *fetch_fn* unchanged when neither applies.
+        """
+        cache = self._host_cache
+        if namespace is None or cache is None or not cache.enabled:
+            cache = None
+        if cache is None and self._tuner is None:
+            return fetch_fn
+
+        async def _fetch(request: ChunkRequest) -> np.ndarray:
+            if cache is not None:
+                key = cache.make_key(namespace, request)
+                hit = cache.get(key)
+                if hit is not None:
+                    return hit
+            data = await self._timed_read([request], fetch_fn(request))
+            if cache is not None:
+                cache.put(key, data)
+            return data
+
+        return _fetch
+
+    def _compose_batch_fetch_fn(
+        self,
+        batch_fetch_fn: BatchFetchFn,
+        namespace: Hashable | None,
+    ) -> Callable[
+        [list[ChunkRequest], list[tuple]], Coroutine[Any, Any, list[np.ndarray]]
+    ]:
+        """Wrap *batch_fetch_fn* with the host cache and the scheduler.
+
+        The returned coroutine function takes a batch and the per-request
+        scheduler keys.  Host-cache hits are served without a scheduler
+        slot; the misses are read with one ``batch_fetch_fn`` call holding
+        one slot per miss.
+        """
+        cache = self._host_cache
+        if namespace is None or cache is None or not cache.enabled:
+            cache = None
+
+        async def _fetch_batch(
+            batch: list[ChunkRequest], keys: list[tuple]
+        ) -> list[np.ndarray]:
+            results: list[np.ndarray | None] = [None] * len(batch)
+            cache_keys: list[Any] = [None] * len(batch)
+            misses: list[int] = []
+            for i, request in enumerate(batch):
+                if cache is not None:
+                    cache_keys[i] = cache.make_key(namespace, request)
+                    hit = cache.get(cache_keys[i])
+                    if hit is not None:
+                        results[i] = hit
+                        continue
+                misses.append(i)
+            if not misses:
+                return results
+
+            held = await self._scheduler.acquire(
+                min(keys[i] for i in misses), len(misses)
+            )
+            try:
+                reqs = [batch[i] for i in misses]
+                data = await self._timed_read(reqs, batch_fetch_fn(reqs))
+            finally:
+                self._scheduler.release(held)
+
+            for i, chunk in zip(misses, data):
+                results[i] = chunk
+                if cache is not None:
+                    cache.put(cache_keys[i], chunk)
+            return results
+
+        return _fetch_batch
+
+    async def _timed_read(self, requests: list[ChunkRequest], read: Coroutine) -> Any:
+        """Await the store *read* of *requests*, recording its span for the tuner."""
+        if self._tuner is None:
+            return await read
+        t0 = time.perf_counter()
+        data = await read
+        t1 = time.perf_counter()
+        for request in requests:
+            self._read_spans[request.chunk_request_id] = (t0, t1)
+        return data
+
+    async def _scheduled_fetch(
+        self, fetch_fn: FetchFn, request: ChunkRequest, key: tuple
+    ) -> np.ndarray:
+        """Run ``fetch_fn(request)`` while holding a global scheduler slot."""
+        await self._scheduler.acquire(key)
+        try:
+            return await fetch_fn(request)
+        finally:
+            self._scheduler.release()
+
+    def _record_store_reads(
+        self, batch: list[ChunkRequest], batch_size: int, t_batch: float
+    ) -> None:
+        """Feed the tuner the store-read time of *batch*.
+
+        Only full batches read entirely from storage within this batch
+        are measured: tail batches are short and would read as a
+        speed-up, and host-cache hits or adopted reads started earlier
+        would skew the latency.
+        """
+        spans = [self._read_spans.pop(req.chunk_request_id, None) for req in batch]
+        if len(batch) != batch_size or any(
+            span is None or span[0] < t_batch for span in spans
+        ):
+            return
+        start = min(span[0] for span in spans)
+        end = max(span[1] for span in spans)
+        self._tuner.record_batch(len(batch), (end - start) * 1000)
+
     async def _run(
         self,
         requests: list[ChunkRequest],
@@ -240,12 +785,17 @@ class AsyncSlicer:
         callback: BatchCallback,
         slice_id: UUID,
         on_complete: CompleteCallback | None = None,
+        priority: Priority = (),
+        batch_fetch: Callable | None = None,
     ) -> None:
         """Drive the batched read loop.
 
-        Splits ``requests`` into batches of ``self._batch_size``, calls
-        ``fetch_fn`` for all chunks in each batch concurrently via
-        ``asyncio.gather``, fires the callback, then yields to Qt.
+        Splits ``requests`` into batches of ``self.batch_size``, calls
+        ``fetch_fn`` for all chunks in each batch concurrently (each call
+        gated by the global scheduler), fires the callback, then yields to
+        Qt.  When ``batch_fetch`` is given (see ``_compose_batch_fetch_fn``)
+        each batch is read with a single call instead.  Requests with an
+        adopted read in ``self._reads[slice_id]`` wait on it instead.
 
         ``CancelledError`` is always re-raised so asyncio marks the task
         as cancelled.  Partially-completed batches at the time of
@@ -253,52 +803,79 @@ class AsyncSlicer:
         for the in-progress batch.
 
         The ``finally`` block removes ``slice_id`` from ``self._tasks``
-        unconditionally (normal completion, exception, or cancellation).
+        unconditionally (normal completion, exception, or cancellation)
+        and cancels the reads still registered for it; ``detach()``
+        unregisters them first to keep them running.
         We use ``finally`` rather than ``add_done_callback`` because
         ``QAsyncioTask`` does not implement ``_make_cancelled_error``, a
         CPython-internal method that ``asyncio`` invokes when processing
         done-callbacks on cancelled futures.
         """
-        batches = [
-            requests[i : i + self._batch_size]
-            for i in range(0, len(requests), self._batch_size)
-        ]
-        n_batches = len(batches)
-
+        n_requests = len(requests)
         _SLICER_LOGGER.info(
-            "task_start  slice_id=%s  total_requests=%d  n_batches=%d",
+            "task_start  slice_id=%s  total_requests=%d  batch_size=%d",
             slice_id,
-            len(requests),
-            n_batches,
+            n_requests,
+            self.batch_size,
         )
 
         _cancelled = False
         batch_idx = 0
+        # Start of the next batch; also the number of chunks delivered.
+        offset = 0
         batch_times_ms: list[float] = []
         t_fetch_start = time.perf_counter()
+        # Wall time since the last redraw, and batches committed since.
+        t_since_render = t_fetch_start
+        n_since_render = 0
+        reads = self._reads.setdefault(slice_id, {})
 
         try:
-            for batch_idx, batch in enumerate(batches):
-                # asyncio.gather issues all reads in the batch concurrently,
-                # allowing tensorstore to pipeline chunk fetches.
-                #
-                # The PySide6 compatibility patch applied at module load time
-                # (see above) adds the missing _make_cancelled_error() method
-                # to QAsyncioTask, which is required by gather's internal
-                # _GatheringFuture._done_callback when child tasks are cancelled.
+            # The batch size is re-read per batch: an adaptive slicer may
+            # retune it while the task runs.
+            while offset < n_requests:
+                batch_size = self.batch_size
+                batch = requests[offset : offset + batch_size]
+                # All reads in the batch are issued concurrently, allowing
+                # tensorstore to pipeline chunk fetches.  asyncio.wait (unlike
+                # gather) leaves them running if this task is cancelled, so a
+                # detached task's reads survive; the finally block cancels
+                # them otherwise.
                 t_batch = time.perf_counter()
-                results: list[np.ndarray] = await asyncio.gather(
-                    *[fetch_fn(req) for req in batch]
+                keys = [
+                    (priority, -req.scale_index, offset + i)
+                    for i, req in enumerate(batch)
+                ]
+                batch_reads = self._start_reads(
+                    batch, keys, fetch_fn, batch_fetch, reads
+                )
+                futures = {future for future, _ in batch_reads}
+                _, not_done = await asyncio.wait(
+                    futures, return_when=asyncio.FIRST_EXCEPTION
                 )
+                if not_done:
+                    # A read failed: re-raise its error.
+                    for future in futures - not_done:
+                        if future.cancelled() or future.exception() is not None:
+                            future.result()
+                results: list[np.ndarray] = [
+                    future.result() if index is None else future.result()[index]
+                    for future, index in batch_reads
+                ]
+                for req in batch:
+                    reads.pop(req.chunk_request_id, None)
                 batch_ms = (time.perf_counter() - t_batch) * 1000
                 batch_times_ms.append(batch_ms)
+                if self._tuner is not None:
+                    self._record_store_reads(batch, batch_size, t_batch)
 
                 # Per-batch fetch timing at DEBUG.
                 _PERF_LOGGER.debug(
-                    "fetch_batch  %d/%d  bricks=%d  elapsed=%.1fms",
+                    "fetch_batch  %d  bricks=%d  done=%d/%d  elapsed=%.1fms",
                     batch_idx + 1,
-                    n_batches,
                     len(batch),
+                    offset + len(batch),
+                    n_requests,
                     batch_ms,
                 )
 
@@ -310,10 +887,11 @@ class AsyncSlicer:
                             scale_counts.get(req.scale_index, 0) + 1
                         )
                     _SLICER_LOGGER.info(
-                        "batch_done  %d/%d  bricks=%d  scales=%s",
+                        "batch_done  %d  bricks=%d  done=%d/%d  scales=%s",
                         batch_idx + 1,
-                        n_batches,
                         len(batch),
+                        offset + len(batch),
+                        n_requests,
                         scale_counts,
                     )
 
@@ -328,12 +906,23 @@ class AsyncSlicer:
                         )
 
                 callback(list(zip(batch, results)))
+                offset += len(batch)
+                batch_idx += 1
+                n_since_render += 1
                 # Yield to Qt every render_every batches so the renderer can
                 # flush pending GPU uploads and redraw.  Always yield on the
                 # final batch so the completed state is always visible.
-                is_last_batch = batch_idx == n_batches - 1
-                if is_last_batch or (batch_idx + 1) % self._render_every == 0:
+                if offset >= n_requests or n_since_render >= self.render_every:
+                    t_render = time.perf_counter()
                     await asyncio.sleep(0)
+                    t_resume = time.perf_counter()
+                    if self._tuner is not None:
+                        self._tuner.record_render(
+                            (t_resume - t_render) * 1000,
+                            (t_render - t_since_render) * 1000,
+                        )
+                    t_since_render = t_resume
+                    n_since_render = 0
 
             # All batches committed without cancellation — signal completion.
             # Placed inside the try (after the loop) so it never fires on the
@@ -344,17 +933,23 @@ class AsyncSlicer:
         except asyncio.CancelledError:
             _cancelled = True
             _SLICER_LOGGER.info(
-                "task_cancelled  slice_id=%s  batches_done=%d/%d",
+                "task_cancelled  slice_id=%s  batches_done=%d  bricks_done=%d/%d",
                 slice_id,
                 batch_idx,
-                n_batches,
+                offset,
+                n_requests,
             )
             raise  # mandatory -- marks the task as cancelled
 
         finally:
             # Always remove from the live-task dict, whether we completed
             # normally, were cancelled, or raised an unexpected exception.
+            # Reads still registered were not detached: nobody will use them.
             self._tasks.pop(slice_id, None)
+            self.cancel_reads(self._reads.pop(slice_id, {}))
+            if self._read_spans:
+                for req in requests:
+                    self._read_spans.pop(req.chunk_request_id, None)
 
             # Emit fetch timing summary (both normal completion and
             # cancellation — partial stats are still useful).
@@ -30,6 +30,12 @@ class MultiscaleImageAppearance(BaseImageAppearance):
         Overrides automatic LOD selection when set. Default None.
     frustum_cull : bool
         Skip bricks outside the camera frustum. Default True.
+    load_priority : int
+        Scheduling priority of this visual's chunk reads relative to
+        other visuals; lower values load first. Default 0.
+    progressive : bool
+        Load a coarse cover of the visible volume first, then refine
+        coarse-to-fine in 3D. Default False.
     iso_threshold : float
         Isosurface threshold for 3D raycast rendering. Default 0.2.
     render_mode : str
@@ -42,6 +48,8 @@ class MultiscaleImageAppearance(BaseImageAppearance):
     lod_bias: float = 1.0
     force_level: int | None = None
     frustum_cull: bool = True
+    load_priority: int = 0
+    progressive: bool = False
     iso_threshold: float = 0.2
     render_mode: Literal["iso", "mip", "smooth_iso", "attenuated_mip"] = "iso"
     attenuation: float = 1.0
@@ -69,12 +77,37 @@ class MultiscaleImageRenderConfig(BaseModel):
         block_size=32).  Default 512 = 4 MB.  When exhausted during a
         session, further paint is staged to the WriteBuffer (and persisted
         on commit) but invisible until commit.
+    cache_precision : {"native", "float16", "uint8"}
+        Opt-in lossy GPU cache storage for data that would otherwise be
+        cached as float32 (float32, uint16, ...).  ``"float16"`` halves and
+        ``"uint8"`` quarters the bytes per voxel, fitting 2x / 4x more
+        bricks in the same budget.  ``"uint8"`` quantizes each brick over
+        its own value range.  Default ``"native"`` (lossless).
+    upload_budget_bytes : int
+        Maximum bytes uploaded into each GPU cache texture per frame.
+        Larger slicer batches are spread over several frames so they do
+        not cause a frame-time spike.  Default 64 MiB.
+    lod_strategy : {"distance_bands", "octree", "screen_space_error"}
+        How 3-D LOD levels are selected.  ``"distance_bands"`` scores every
+        brick of every level against the camera.  ``"octree"`` refines the
+        brick pyramid top-down from the coarsest level and prunes subtrees
+        outside the view frustum, so planning cost follows the visible
+        bricks rather than the dataset size.  ``"screen_space_error"``
+        refines the brick with the largest projected voxel size first and
+        stops when the GPU cache is full, so the view is never left with
+        holes; ``lod_bias`` is the target voxel size in pixels.  Default
+        ``"distance_bands"``.
     """
 
     block_size: int = 32
     gpu_budget_bytes: int = 1 * 1024**3
     gpu_budget_bytes_2d: int = 64 * 1024**2
     paint_max_tiles: int = 512
+    cache_precision: Literal["native", "float16", "uint8"] = "native"
+    upload_budget_bytes: int = 64 * 1024**2
+    lod_strategy: Literal["distance_bands", "octree", "screen_space_error"] = (
+        "distance_bands"
+    )
 
 
 class MultiscaleImageVisual(BaseVisual):
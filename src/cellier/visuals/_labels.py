@@ -34,6 +34,12 @@ class MultiscaleLabelsAppearance(BaseLabelsAppearance):
         Overrides automatic LOD selection when set. Default None.
     frustum_cull : bool
         Skip bricks outside the camera frustum. Default True.
+    load_priority : int
+        Scheduling priority of this visual's chunk reads relative to
+        other visuals; lower values load first. Default 0.
+    progressive : bool
+        Load a coarse cover of the visible volume first, then refine
+        coarse-to-fine in 3D. Default False.
     """
 
     render_mode: Literal[
@@ -42,6 +48,8 @@ class MultiscaleLabelsAppearance(BaseLabelsAppearance):
     lod_bias: float = 1.0
     force_level: int | None = None
     frustum_cull: bool = True
+    load_priority: int = 0
+    progressive: bool = False
 
 
 class MultiscaleLabelRenderConfig(BaseModel):
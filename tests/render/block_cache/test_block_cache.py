@@ -15,6 +15,12 @@ CACHE_INFO = compute_block_cache_parameters_3d(
 )
 
 
+def _flushed_uploads(cache) -> list:
+    """Flush staged writes; drain the ``(offset, size, data)`` texture uploads."""
+    cache.flush_uploads()
+    return cache.cache_tex._gfx_get_chunk_descriptions()
+
+
 def _stage_and_commit(cache: BlockCache3D, bricks: dict, frame_number: int):
     """Stage bricks and immediately commit all misses (synchronous helper)."""
     fill_plan = cache.stage(bricks, frame_number=frame_number)
@@ -93,17 +99,434 @@ def test_write_brick_fills_correct_slice() -> None:
     cache.write_brick(slot, data)
 
     sz, sy, sx = slot.grid_pos
-    z0, y0, x0 = sz * pbs, sy * pbs, sx * pbs
-    assert np.all(cache.cache_data[z0 : z0 + pbs, y0 : y0 + pbs, x0 : x0 + pbs] == 7.0)
+    ((offset, size, uploaded),) = _flushed_uploads(cache)
+    assert offset == (sx * pbs, sy * pbs, sz * pbs)
+    assert size == (pbs, pbs, pbs)
+    assert np.all(uploaded == 7.0)
+
+
+def test_cache_has_no_host_mirror() -> None:
+    cache = BlockCache3D(CACHE_INFO)
+    assert cache.cache_tex.data is None
+    assert cache.cache_tex.size == tuple(reversed(CACHE_INFO.cache_shape))
 
 
-def test_write_brick_does_not_touch_other_slots() -> None:
+def test_write_brick_uploads_matching_dtype_without_copy() -> None:
     cache = BlockCache3D(CACHE_INFO)
     key = BlockKey3D(level=1, g0=0, g1=0, g2=0)
-    fill_plan = cache.stage({key: 1}, frame_number=1)
-    slot = fill_plan[0][1]
+    slot = cache.stage({key: 1}, frame_number=1)[0][1]
+
+    pbs = cache.info.padded_block_size
+    data = np.full((pbs, pbs, pbs), 3.0, dtype=np.float32)
+    cache.write_brick(slot, data)
+
+    ((_, _, uploaded),) = _flushed_uploads(cache)
+    assert np.shares_memory(uploaded, data)
+
+
+def test_write_brick_casts_to_cache_dtype() -> None:
+    cache = BlockCache3D(CACHE_INFO, dtype=np.float16)
+    key = BlockKey3D(level=1, g0=0, g1=0, g2=0)
+    slot = cache.stage({key: 1}, frame_number=1)[0][1]
+
+    pbs = cache.info.padded_block_size
+    cache.write_brick(slot, np.full((pbs, pbs, pbs), 2.5, dtype=np.float64))
+
+    ((_, _, uploaded),) = _flushed_uploads(cache)
+    assert uploaded.dtype == np.float16
+    assert np.all(uploaded == 2.5)
+
+
+def test_missing_skips_resident_and_loading_without_staging() -> None:
+    cache = BlockCache3D(CACHE_INFO)
+    hot, loading, new = (BlockKey3D(level=1, g0=i, g1=0, g2=0) for i in range(3))
+    _stage_and_commit(cache, {hot: 1}, frame_number=1)
+    cache.stage({hot: 1, loading: 1}, frame_number=2)
+    n_free = len(cache.tile_manager.free_slots)
+
+    assert cache.tile_manager.missing([new, hot, loading]) == [new]
+    assert len(cache.tile_manager.free_slots) == n_free
+
+
+def test_resident_bricks_exports_tilemap_as_arrays() -> None:
+    cache = BlockCache3D(CACHE_INFO)
+    old = BlockKey3D(level=2, g0=0, g1=1, g2=0, slice_coord=((0, 1),))
+    new = BlockKey3D(level=1, g0=3, g1=2, g2=1, slice_coord=((0, 2),))
+    plan = dict(_stage_and_commit(cache, {old: 2, new: 1}, frame_number=1))
+    plan[new].brick_max = 5.0
+
+    bricks = cache.tile_manager.resident_bricks()
+
+    assert len(bricks) == 2
+    np.testing.assert_array_equal(bricks.level, [2, 1])
+    np.testing.assert_array_equal(bricks.grid, [[0, 1, 0], [3, 2, 1]])
+    np.testing.assert_array_equal(
+        bricks.slot_grid_pos, [plan[old].grid_pos, plan[new].grid_pos]
+    )
+    np.testing.assert_array_equal(bricks.brick_max, [0.0, 5.0])
+    np.testing.assert_array_equal(bricks.slice_mask(((0, 2),)), [False, True])
+    assert not bricks.slice_mask(((0, 3),)).any()
+
+
+def test_restage_adopts_still_required_in_flight_bricks() -> None:
+    cache = BlockCache3D(CACHE_INFO)
+    kept, dropped, new = (BlockKey3D(level=1, g0=i, g1=0, g2=0) for i in range(3))
+    first = dict(cache.stage({kept: 1, dropped: 1}, frame_number=1))
+    n_free = len(cache.tile_manager.free_slots)
+
+    fill_plan = cache.stage({kept: 1, new: 1}, frame_number=2)
+
+    # kept stays in flight in its slot; dropped's slot is freed and reused.
+    assert [key for key, _ in fill_plan] == [new]
+    assert fill_plan[0][1].index == first[dropped].index
+    assert cache.tile_manager.in_flight == {
+        first[kept].index: kept,
+        first[dropped].index: new,
+    }
+    assert len(cache.tile_manager.free_slots) == n_free
+
+
+def test_restage_adopts_still_required_in_flight_tiles_2d() -> None:
+    from cellier.render.block_cache._cache_parameters_2d import (
+        compute_block_cache_parameters_2d,
+    )
+    from cellier.render.block_cache._tile_manager_2d import BlockKey2D, TileManager2D
+
+    manager = TileManager2D(
+        compute_block_cache_parameters_2d(gpu_budget_bytes=8 * 6**2 * 4, block_size=4)
+    )
+    kept, dropped = BlockKey2D(level=1, g0=0, g1=0), BlockKey2D(level=1, g0=1, g1=0)
+    first = dict(manager.stage({kept: 1, dropped: 1}, frame_number=1))
+
+    assert manager.stage({kept: 1}, frame_number=2) == []
+    assert manager.in_flight == {first[kept].index: kept}
+    assert first[dropped].index in manager.free_slots
+
+
+def _tile_manager_2d():
+    from cellier.render.block_cache._cache_parameters_2d import (
+        compute_block_cache_parameters_2d,
+    )
+    from cellier.render.block_cache._tile_manager_2d import TileManager2D
+
+    # grid_side=2: 4 slots, 3 usable.
+    return TileManager2D(
+        compute_block_cache_parameters_2d(gpu_budget_bytes=4 * 6**2 * 4, block_size=4)
+    )
+
+
+def test_other_slice_tiles_demote_after_load_and_promote_without_fetch_2d() -> None:
+    from cellier.render.block_cache._tile_manager_2d import BlockKey2D
+
+    manager = _tile_manager_2d()
+    z1 = BlockKey2D(level=1, g0=0, g1=0, slice_coord=((0, 1),))
+    z2 = BlockKey2D(level=1, g0=0, g1=0, slice_coord=((0, 2),))
+    for key, slot in manager.stage({z1: 1}, frame_number=1):
+        manager.commit(key, slot)
+
+    (new,) = manager.stage({z2: 1}, frame_number=2)
+    # The old slice keeps rendering until the new one has loaded.
+    assert z1 in manager.tilemap
+    manager.commit(*new)
+    assert set(manager.tilemap) == {z2}
+    assert manager.missing([z1, z2]) == []
+
+    # Going back is a promotion: no fill-plan entry, same slot.
+    slot = manager._reserve[z1]
+    assert manager.stage({z1: 1}, frame_number=3) == []
+    assert manager.tilemap[z1] is slot
+    assert set(manager._reserve) == {z2}
+
+
+def test_eviction_takes_reserve_before_hot_2d() -> None:
+    from cellier.render.block_cache._tile_manager_2d import BlockKey2D
+
+    manager = _tile_manager_2d()
+    old = [BlockKey2D(level=1, g0=i, g1=0, slice_coord=((0, 1),)) for i in range(2)]
+    new = [BlockKey2D(level=1, g0=i, g1=0, slice_coord=((0, 2),)) for i in range(2)]
+    for frame, keys in enumerate((old, new[:1]), start=1):
+        for key, slot in manager.stage(dict.fromkeys(keys, 1), frame_number=frame):
+            manager.commit(key, slot)
+    assert set(manager._reserve) == set(old)
+
+    for key, slot in manager.stage(dict.fromkeys(new, 1), frame_number=3):
+        manager.commit(key, slot)
+
+    # The free slot and then the oldest reserve tile were reused.
+    assert set(manager.tilemap) == set(new)
+    assert len(manager._reserve) == 1
+
+
+@pytest.mark.parametrize(
+    ("data_dtype", "cache_dtype", "fmt", "scale"),
+    [
+        (np.uint8, np.uint8, "1xu1", 255.0),
+        (np.float16, np.float16, "1xf2", 1.0),
+        (np.uint16, np.float32, "1xf4", 1.0),
+        (None, np.float32, "1xf4", 1.0),
+    ],
+)
+def test_native_dtype_cache_format_and_scale(data_dtype, cache_dtype, fmt, scale):
+    from cellier.render.block_cache._cache_dtype import (
+        cache_dtype_for,
+        cache_value_scale,
+    )
+
+    dtype = cache_dtype_for(data_dtype)
+    cache = BlockCache3D(CACHE_INFO, dtype=dtype)
+
+    assert dtype == cache_dtype
+    assert cache.dtype == cache_dtype
+    assert cache.cache_tex.format == fmt
+    assert cache_value_scale(dtype) == scale
+
+
+def test_narrow_cache_dtype_fits_more_slots() -> None:
+    from cellier.render.block_cache._cache_parameters_2d import (
+        compute_block_cache_parameters_2d,
+    )
+
+    budget = 64 * 6**3 * 4
+    f32 = compute_block_cache_parameters_3d(4, budget, dtype=np.float32)
+    u8 = compute_block_cache_parameters_3d(4, budget, dtype=np.uint8)
+    f32_2d = compute_block_cache_parameters_2d(budget, 4, dtype=np.float32)
+    u8_2d = compute_block_cache_parameters_2d(budget, 4, dtype=np.uint8)
+
+    # A quarter of the bytes per voxel buys (about) four times the slots.
+    assert u8.n_slots >= 4 * f32.n_slots
+    assert u8_2d.n_slots >= 4 * f32_2d.n_slots
+
+
+def test_uint8_precision_quantizes_per_brick_within_error_bound() -> None:
+    cache = BlockCache3D(CACHE_INFO, precision="uint8")
+    key = BlockKey3D(level=1, g0=0, g1=0, g2=0)
+    slot = cache.stage({key: 1}, frame_number=1)[0][1]
+    pbs = cache.info.padded_block_size
+    data = np.random.default_rng(0).uniform(10.0, 20.0, (pbs,) * 3)
+
+    cache.write_brick(slot, data.astype(np.float32))
+
+    ((_, _, codes),) = _flushed_uploads(cache)
+    restored = codes * slot.brick_scale + slot.brick_offset
+    assert codes.dtype == np.uint8
+    assert slot.brick_error == pytest.approx(0.5 * (data.max() - data.min()) / 255)
+    assert np.abs(restored - data).max() <= slot.brick_error * (1 + 1e-5)
+    sz, sy, sx = slot.grid_pos
+    np.testing.assert_allclose(
+        cache.slot_params_data[sz, sy, sx], (slot.brick_scale, slot.brick_offset)
+    )
+
+
+def test_float16_precision_reports_rounding_bound() -> None:
+    from cellier.render.block_cache._block_cache_2d import BlockCache2D
+    from cellier.render.block_cache._cache_parameters_2d import (
+        compute_block_cache_parameters_2d,
+    )
+    from cellier.render.block_cache._tile_manager_2d import BlockKey2D
 
+    cache = BlockCache2D(
+        compute_block_cache_parameters_2d(gpu_budget_bytes=8 * 6**2 * 4, block_size=4),
+        precision="float16",
+    )
+    key = BlockKey2D(level=1, g0=0, g1=0)
+    slot = cache.tile_manager.stage({key: 1}, frame_number=1)[0][1]
+    data = np.linspace(-300.0, 1000.0, 36, dtype=np.float32).reshape(6, 6)
+
+    cache.write_tile(slot, data, key=key)
+
+    ((_, _, uploaded),) = _flushed_uploads(cache)
+    assert cache.slot_params_tex is None
+    assert slot.brick_error == 0.25  # half an ulp of float16 at 1000
+    assert np.abs(uploaded[0] - data).max() <= slot.brick_error
+
+
+# ── Upload scheduling ────────────────────────────────────────────────────────
+
+
+def _stage_and_write(cache: BlockCache3D, keys: list, frame_number: int = 1):
+    pbs = cache.info.padded_block_size
+    fill_plan = cache.stage(dict.fromkeys(keys, 1), frame_number=frame_number)
+    for key, slot in fill_plan:
+        cache.write_brick(slot, np.full((pbs,) * 3, slot.index, np.float32), key=key)
+    return fill_plan
+
+
+def test_merge_slot_boxes_merges_full_grid_into_one_box() -> None:
+    from cellier.render.block_cache._upload_scheduler import merge_slot_boxes
+
+    blocks = {
+        (z, y, x): np.full((2, 2, 2), 4 * z + 2 * y + x)
+        for z in range(2)
+        for y in range(2)
+        for x in range(2)
+    }
+
+    ((start, block),) = merge_slot_boxes(blocks)
+
+    assert start == (0, 0, 0)
+    assert block.shape == (4, 4, 4)
+    assert block[3, 0, 2] == 4 * 1 + 2 * 0 + 1
+
+
+def test_merge_slot_boxes_keeps_gaps_and_mismatched_runs_apart() -> None:
+    from cellier.render.block_cache._upload_scheduler import merge_slot_boxes
+
+    blocks = {pos: np.zeros((2, 2)) for pos in [(0, 0), (0, 1), (1, 0), (0, 3)]}
+
+    boxes = sorted((start, block.shape) for start, block in merge_slot_boxes(blocks))
+
+    assert boxes == [((0, 0), (2, 4)), ((0, 3), (2, 2)), ((1, 0), (2, 2))]
+
+
+def test_flush_uploads_coalesces_batch_and_commits_it() -> None:
+    cache = BlockCache3D(CACHE_INFO)
+    keys = [BlockKey3D(level=1, g0=i, g1=0, g2=0) for i in range(7)]
+    fill_plan = _stage_and_write(cache, keys)
+    assert cache.n_pending_uploads == 7
+    assert cache.n_resident == 0
+
+    committed = cache.flush_uploads()
+    uploads = cache.cache_tex._gfx_get_chunk_descriptions()
+
+    assert committed == fill_plan
+    assert cache.n_resident == 7
+    assert len(uploads) < 7
+    pbs = cache.info.padded_block_size
+    assert sum(data.size for _, _, data in uploads) == 7 * pbs**3
+
+
+def test_upload_budget_spreads_batch_over_frames() -> None:
+    pbs = CACHE_INFO.padded_block_size
+    cache = BlockCache3D(CACHE_INFO, upload_budget_bytes=2 * pbs**3 * 4)
+    keys = [BlockKey3D(level=1, g0=i, g1=0, g2=0) for i in range(5)]
+    _stage_and_write(cache, keys)
+
+    assert [k for k, _ in cache.flush_uploads()] == keys[:2]
+    assert cache.flush_uploads() == []
+    assert cache.n_pending_uploads == 3
+
+    cache.begin_frame()
+    assert [k for k, _ in cache.flush_uploads()] == keys[2:4]
+    cache.begin_frame()
+    assert [k for k, _ in cache.flush_uploads()] == keys[4:]
+    assert cache.n_resident == 5
+
+
+def test_upload_budget_always_sends_one_brick_per_frame() -> None:
+    cache = BlockCache3D(CACHE_INFO, upload_budget_bytes=1)
+    keys = [BlockKey3D(level=1, g0=i, g1=0, g2=0) for i in range(2)]
+    _stage_and_write(cache, keys)
+
+    assert len(cache.flush_uploads()) == 1
+    cache.begin_frame()
+    assert len(cache.flush_uploads()) == 1
+
+
+def test_flush_drops_writes_for_released_slots() -> None:
+    cache = BlockCache3D(CACHE_INFO)
+    _stage_and_write(cache, [BlockKey3D(level=1, g0=0, g1=0, g2=0)])
+    cache.tile_manager.release_all_in_flight()
+
+    assert cache.flush_uploads() == []
+    assert cache.n_pending_uploads == 0
+    assert cache.cache_tex._gfx_get_chunk_descriptions() == []
+
+
+def test_newer_write_to_a_slot_replaces_the_staged_one() -> None:
+    cache = BlockCache3D(CACHE_INFO)
+    key = BlockKey3D(level=1, g0=0, g1=0, g2=0)
+    ((_, slot),) = _stage_and_write(cache, [key])
     pbs = cache.info.padded_block_size
-    cache.write_brick(slot, np.ones((pbs, pbs, pbs), dtype=np.float32))
+    cache.write_brick(slot, np.full((pbs,) * 3, 9.0, np.float32), key=key)
+
+    ((_, _, uploaded),) = _flushed_uploads(cache)
+
+    assert np.all(uploaded == 9.0)
+
+
+# ── Layered caches ───────────────────────────────────────────────────────────
+
+
+def _layered(n_layers: int, **kwargs):
+    from cellier.render.block_cache import LayeredBlockCache
+
+    first = BlockCache3D(CACHE_INFO, **kwargs)
+    rest = [
+        BlockCache3D(CACHE_INFO, tile_manager=first.tile_manager, **kwargs)
+        for _ in range(n_layers - 1)
+    ]
+    return LayeredBlockCache([first, *rest])
+
+
+def test_layered_cache_commits_each_brick_once_with_every_layer_uploaded() -> None:
+    layered = _layered(2)
+    pbs = CACHE_INFO.padded_block_size
+    keys = [BlockKey3D(level=1, g0=i, g1=0, g2=0) for i in range(3)]
+    fill_plan = layered.tile_manager.stage(dict.fromkeys(keys, 1), frame_number=1)
+    for key, slot in fill_plan:
+        planes = [np.full((pbs,) * 3, float(c), np.float32) for c in range(2)]
+        layered.write(slot, planes, key=key)
+
+    committed = layered.flush_uploads()
+
+    assert committed == fill_plan
+    assert set(layered.tile_manager.tilemap) == set(keys)
+    for c, layer in enumerate(layered.layers):
+        uploads = layer.cache_tex._gfx_get_chunk_descriptions()
+        assert sum(data.size for _, _, data in uploads) == 3 * pbs**3
+        assert all(np.all(data == c) for _, _, data in uploads)
+
+
+def test_layered_cache_budget_keeps_layers_in_lockstep() -> None:
+    pbs = CACHE_INFO.padded_block_size
+    layered = _layered(3, upload_budget_bytes=pbs**3 * 4)
+    keys = [BlockKey3D(level=1, g0=i, g1=0, g2=0) for i in range(2)]
+    for key, slot in layered.tile_manager.stage(dict.fromkeys(keys, 1), 1):
+        layered.write(slot, [np.zeros((pbs,) * 3, np.float32)] * 3, key=key)
+
+    assert [k for k, _ in layered.flush_uploads()] == keys[:1]
+    assert layered.n_pending_uploads == 1
+    assert all(layer.n_pending_uploads == 1 for layer in layered.layers)
+
+    layered.begin_frame()
+    assert [k for k, _ in layered.flush_uploads()] == keys[1:]
+
+    layered.clear()
+    assert layered.n_pending_uploads == 0
+    assert len(layered.tile_manager.tilemap) == 0
+
+
+def test_layered_cache_commits_a_slot_only_once_every_layer_sent_it() -> None:
+    from cellier.render.block_cache import LayeredBlockCache
+
+    pbs = CACHE_INFO.padded_block_size
+    fast = BlockCache3D(CACHE_INFO)
+    slow = BlockCache3D(
+        CACHE_INFO, tile_manager=fast.tile_manager, upload_budget_bytes=pbs**3 * 4
+    )
+    layered = LayeredBlockCache([fast, slow])
+    keys = [BlockKey3D(level=1, g0=i, g1=0, g2=0) for i in range(2)]
+    fill_plan = layered.tile_manager.stage(dict.fromkeys(keys, 1), 1)
+    for key, slot in fill_plan:
+        layered.write(slot, [np.zeros((pbs,) * 3, np.float32)] * 2, key=key)
+
+    # The fast layer sends both bricks, the slow one only the first.
+    assert layered.flush_uploads() == fill_plan[:1]
+    second_key, second_slot = fill_plan[1]
+    assert layered.tile_manager.is_in_flight(second_slot, second_key)
+
+    layered.begin_frame()
+    assert layered.flush_uploads() == fill_plan[1:]
+    assert not layered.tile_manager.is_in_flight(second_slot, second_key)
+
+
+def test_layered_cache_rejects_layers_without_a_shared_tile_manager() -> None:
+    from cellier.render.block_cache import LayeredBlockCache
 
-    assert cache.cache_data.sum() == pytest.approx(float(pbs**3))
+    with pytest.raises(ValueError, match="share"):
+        LayeredBlockCache([BlockCache3D(CACHE_INFO), BlockCache3D(CACHE_INFO)])
+    with pytest.raises(ValueError, match="at least one"):
+        LayeredBlockCache([])
+    layered = _layered(2)
+    with pytest.raises(ValueError, match="expected 2"):
+        layered.write(None, [np.zeros(1)])
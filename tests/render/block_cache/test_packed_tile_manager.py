@@ -0,0 +1,178 @@
+"""Tests for the array-native PackedTileManager3D."""
+
+import numpy as np
+import pytest
+
+from cellier.render.block_cache import (
+    BlockKey3D,
+    PackedTileManager3D,
+    TileManager3D,
+    compute_block_cache_parameters_3d,
+    pack_brick_ids,
+    unpack_brick_ids,
+)
+from cellier.render.lut_indirection import BlockLayout3D, LutIndirectionManager3D
+
+# block_size=4, overlap=1, grid_side=2: 8 slots, 7 usable.
+SMALL_CACHE = compute_block_cache_parameters_3d(
+    block_size=4, gpu_budget_bytes=8 * 6**3 * 4
+)
+# grid_side=6: 216 slots, enough that the parity test never evicts.
+LARGE_CACHE = compute_block_cache_parameters_3d(
+    block_size=4, gpu_budget_bytes=216 * 6**3 * 4
+)
+
+
+def _rows(*bricks) -> np.ndarray:
+    return np.array(bricks, dtype=np.int32).reshape(-1, 4)
+
+
+def _stage_and_commit(manager, rows, frame, slice_coord=()):
+    ids, slots = manager.stage(rows, frame_number=frame, slice_coord=slice_coord)
+    manager.commit(ids, slots)
+    return ids, slots
+
+
+def _resident_set(bricks) -> set:
+    return {
+        (int(level), *map(int, grid), bricks.slice_coords[int(sid)])
+        for level, grid, sid in zip(bricks.level, bricks.grid, bricks.slice_id)
+    }
+
+
+def test_pack_brick_ids_round_trips() -> None:
+    rows = _rows([1, 0, 0, 0], [3, 100, 7, 16383], [31, 2, 9000, 5])
+    level, grid, slice_id = unpack_brick_ids(pack_brick_ids(rows, slice_id=42))
+    np.testing.assert_array_equal(level, rows[:, 0])
+    np.testing.assert_array_equal(grid, rows[:, 1:])
+    assert np.all(slice_id == 42)
+
+
+def test_pack_brick_ids_rejects_out_of_range_fields() -> None:
+    with pytest.raises(ValueError):
+        pack_brick_ids(_rows([1, 0, 0, 1 << 14]))
+    with pytest.raises(ValueError):
+        pack_brick_ids(_rows([1, 0, 0, 0]), slice_id=1 << 16)
+
+
+def test_restage_of_committed_bricks_is_all_hits() -> None:
+    manager = PackedTileManager3D(SMALL_CACHE)
+    rows = _rows([1, 0, 0, 0], [1, 0, 0, 1], [2, 0, 0, 0])
+    ids, slots = _stage_and_commit(manager, rows, frame=1)
+
+    assert len(ids) == 3
+    assert 0 not in slots
+    again, _ = manager.stage(rows, frame_number=2)
+    assert len(again) == 0
+    np.testing.assert_array_equal(manager.hot_slots(ids), slots)
+
+
+def test_dropped_bricks_demote_once_plan_loads_then_promote() -> None:
+    manager = PackedTileManager3D(SMALL_CACHE)
+    old = _rows([1, 0, 0, 0])
+    new = _rows([1, 1, 0, 0])
+    _stage_and_commit(manager, old, frame=1)
+
+    ids, slots = manager.stage(new, frame_number=2)
+    # Still hot while the replacement loads.
+    assert manager.n_hot == 1
+    manager.commit(ids, slots)
+    assert manager.n_hot == 1
+    assert manager.n_reserve == 1
+
+    # Re-planning the old brick promotes it without a load.
+    misses, _ = manager.stage(old, frame_number=3)
+    assert len(misses) == 0
+    assert manager.n_reserve == 1  # the new brick, now dropped and demoted
+
+
+def test_restage_adopts_required_and_releases_dropped_in_flight() -> None:
+    manager = PackedTileManager3D(SMALL_CACHE)
+    kept, dropped, new = _rows([1, 0, 0, 0]), _rows([1, 1, 0, 0]), _rows([1, 2, 0, 0])
+    first_ids, _ = manager.stage(np.vstack((kept, dropped)), frame_number=1)
+
+    ids, _ = manager.stage(np.vstack((kept, new)), frame_number=2)
+
+    np.testing.assert_array_equal(ids, manager.brick_ids(new))
+    assert sorted(manager.in_flight.values()) == sorted(
+        [int(first_ids[0]), int(ids[0])]
+    )
+
+    manager.release_all_in_flight()
+    assert manager.in_flight == {}
+
+
+def test_eviction_takes_reserve_before_oldest_hot() -> None:
+    manager = PackedTileManager3D(SMALL_CACHE)
+    first = _rows(*[[1, i, 0, 0] for i in range(4)])
+    second = _rows(*[[1, i, 1, 0] for i in range(3)])
+    _stage_and_commit(manager, first, frame=1)
+    # Dropping `first` demotes it to reserve once `second` commits.
+    _stage_and_commit(manager, second, frame=2)
+    assert manager.n_reserve == 4
+
+    _stage_and_commit(manager, np.vstack((second, _rows([1, 5, 5, 0]))), frame=3)
+
+    assert manager.n_hot == 4
+    assert manager.n_reserve == 3
+    assert len(manager.missing(second)) == 0
+
+
+def test_stage_raises_when_every_slot_is_in_flight() -> None:
+    manager = PackedTileManager3D(SMALL_CACHE)
+    with pytest.raises(RuntimeError):
+        manager.stage(_rows(*[[1, i, 0, 0] for i in range(8)]), frame_number=1)
+
+
+def test_hot_and_reserve_sets_match_tile_manager_3d() -> None:
+    """Without eviction pressure both managers agree on every tier."""
+    rng = np.random.default_rng(0)
+    packed = PackedTileManager3D(LARGE_CACHE)
+    reference = TileManager3D(LARGE_CACHE)
+    slice_coords = (((0, 1),), ((0, 2),))
+    for frame in range(1, 20):
+        rows = np.column_stack(
+            (rng.integers(1, 3, size=12), rng.integers(0, 4, size=(12, 3)))
+        ).astype(np.int32)
+        slice_coord = slice_coords[frame % 2]
+
+        ids, slots = packed.stage(rows, frame_number=frame, slice_coord=slice_coord)
+        required = {
+            BlockKey3D(*map(int, row), slice_coord=slice_coord): int(row[0])
+            for row in rows
+        }
+        fill_plan = reference.stage(required, frame_number=frame)
+        assert len(ids) == len(fill_plan)
+
+        # Every third frame commits only half the plan, then cancels it.
+        n_commit = len(ids) if frame % 3 else len(ids) // 2
+        packed.commit(ids[:n_commit], slots[:n_commit])
+        for key, slot in fill_plan[:n_commit]:
+            reference.commit(key, slot)
+
+        expected = {
+            (key.level, key.g0, key.g1, key.g2, key.slice_coord)
+            for key in reference.tilemap
+        }
+        assert _resident_set(packed.resident_bricks()) == expected
+        assert packed.n_reserve == len(reference._reserve)
+        assert len(packed.in_flight) == len(reference.in_flight)
+        if frame % 3 == 0:
+            packed.release_all_in_flight()
+            reference.release_all_in_flight()
+
+
+def test_lut_rebuild_accepts_packed_manager() -> None:
+    layout = BlockLayout3D(volume_shape=(4, 4, 4), block_size=1)
+    manager = PackedTileManager3D(SMALL_CACHE)
+    _, slots = _stage_and_commit(manager, _rows([2, 0, 0, 0], [1, 0, 0, 0]), 1)
+    manager.set_brick_max(slots, [3.0, 5.0])
+    lut = LutIndirectionManager3D(layout, n_levels=2)
+
+    lut.rebuild(manager)
+
+    sz, sy, sx = manager.slot_grid_pos(slots[1])
+    np.testing.assert_array_equal(lut.lut_data[0, 0, 0], [sx, sy, sz, 1])
+    assert lut.lut_data[1, 1, 1, 3] == 2
+    assert lut.brick_max_data[0, 0, 0] == 5.0
+    assert lut.brick_max_data[1, 1, 1] == 3.0
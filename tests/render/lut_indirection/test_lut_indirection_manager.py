@@ -1,11 +1,17 @@
 import numpy as np
+import pytest
 
 from cellier.render.block_cache import (
+    BlockCacheParameters3D,
     BlockKey3D,
     TileManager3D,
     compute_block_cache_parameters_3d,
 )
-from cellier.render.lut_indirection import BlockLayout3D, LutIndirectionManager3D
+from cellier.render.lut_indirection import (
+    BlockLayout3D,
+    LutIndirectionManager3D,
+    _lut_indirection_manager_3d,
+)
 
 CACHE_INFO = compute_block_cache_parameters_3d(
     block_size=4, gpu_budget_bytes=8 * 6**3 * 4
@@ -16,6 +22,12 @@ BASE_LAYOUT = BlockLayout3D(volume_shape=(4, 4, 4), block_size=1)
 N_LEVELS = 2
 
 
+@pytest.fixture
+def free_box_rewrites(monkeypatch):
+    """Drop the fixed per-box cost so deltas on these tiny grids stay incremental."""
+    monkeypatch.setattr(_lut_indirection_manager_3d, "_BOX_VISITS", 0)
+
+
 def _stage_and_commit(tile_manager: TileManager3D, bricks: dict, frame_number: int):
     """Stage bricks and immediately commit all misses (synchronous helper)."""
     fill_plan = tile_manager.stage(bricks, frame_number=frame_number)
@@ -108,3 +120,192 @@ def test_fine_brick_slot_coordinates_are_correct() -> None:
     assert lut.lut_data[0, 0, 0, 0] == sx
     assert lut.lut_data[0, 0, 0, 1] == sy
     assert lut.lut_data[0, 0, 0, 2] == sz
+
+
+def _record_update_ranges(tex) -> list:
+    """Wrap ``tex.update_range`` so each scheduled upload is recorded."""
+    calls = []
+    original = tex.update_range
+
+    def _update_range(offset, size):
+        calls.append((tuple(offset), tuple(size)))
+        original(offset, size)
+
+    tex.update_range = _update_range
+    return calls
+
+
+@pytest.mark.usefixtures("free_box_rewrites")
+def test_incremental_commit_uploads_only_its_footprint() -> None:
+    """A brick committed after the first rebuild re-uploads only its cell."""
+    lut = LutIndirectionManager3D(BASE_LAYOUT, n_levels=N_LEVELS)
+    tile_manager = TileManager3D(CACHE_INFO)
+    coarse_key = BlockKey3D(level=2, g0=0, g1=0, g2=0)
+    _stage_and_commit(tile_manager, {coarse_key: 2}, frame_number=1)
+    lut.rebuild(tile_manager)
+
+    calls = _record_update_ranges(lut.lut_tex)
+    fine_key = BlockKey3D(level=1, g0=1, g1=0, g2=1)
+    _stage_and_commit(tile_manager, {coarse_key: 2, fine_key: 1}, frame_number=2)
+    lut.rebuild(tile_manager)
+
+    assert calls == [((1, 0, 1), (1, 1, 1))]
+    assert lut.lut_data[1, 0, 1, 3] == 1
+    assert lut.lut_data[0, 0, 0, 3] == 2
+
+
+def test_unchanged_tilemap_schedules_no_upload() -> None:
+    lut = LutIndirectionManager3D(BASE_LAYOUT, n_levels=N_LEVELS)
+    tile_manager = TileManager3D(CACHE_INFO)
+    _stage_and_commit(
+        tile_manager, {BlockKey3D(level=1, g0=0, g1=0, g2=0): 1}, frame_number=1
+    )
+    lut.rebuild(tile_manager)
+
+    calls = _record_update_ranges(lut.lut_tex)
+    lut.rebuild(tile_manager)
+
+    assert calls == []
+
+
+@pytest.mark.usefixtures("free_box_rewrites")
+def test_eviction_restores_coarse_fallback() -> None:
+    """Releasing a fine brick re-exposes the coarse brick beneath it."""
+    lut = LutIndirectionManager3D(BASE_LAYOUT, n_levels=N_LEVELS)
+    tile_manager = TileManager3D(CACHE_INFO)
+    coarse_key = BlockKey3D(level=2, g0=0, g1=0, g2=0)
+    fine_key = BlockKey3D(level=1, g0=0, g1=0, g2=0)
+    _stage_and_commit(tile_manager, {coarse_key: 2, fine_key: 1}, frame_number=1)
+    lut.rebuild(tile_manager)
+    assert lut.lut_data[0, 0, 0, 3] == 1
+
+    tile_manager.tilemap.pop(fine_key)
+    lut.rebuild(tile_manager)
+
+    reference = LutIndirectionManager3D(BASE_LAYOUT, n_levels=N_LEVELS)
+    reference.rebuild(tile_manager)
+    np.testing.assert_array_equal(lut.lut_data, reference.lut_data)
+    assert lut.lut_data[0, 0, 0, 3] == 2
+
+
+@pytest.mark.usefixtures("free_box_rewrites")
+def test_incremental_updates_match_full_rebuild() -> None:
+    """A sequence of commits and slice changes matches a from-scratch rebuild."""
+    lut = LutIndirectionManager3D(BASE_LAYOUT, n_levels=N_LEVELS)
+    tile_manager = TileManager3D(CACHE_INFO)
+    rng = np.random.default_rng(0)
+    slice_coords = (((0, 1),), ((0, 2),))
+    current = slice_coords[0]
+    for frame in range(1, 12):
+        level = int(rng.integers(1, N_LEVELS + 1))
+        n = 4 // 2 ** (level - 1)
+        g0, g1, g2 = (int(v) for v in rng.integers(0, n, size=3))
+        key = BlockKey3D(
+            level=level,
+            g0=g0,
+            g1=g1,
+            g2=g2,
+            slice_coord=slice_coords[frame % 2],
+        )
+        fill_plan = tile_manager.stage({key: level}, frame_number=frame)
+        for staged_key, slot in fill_plan:
+            slot.brick_max = float(frame)
+            tile_manager.commit(staged_key, slot)
+        if frame == 6:
+            current = slice_coords[1]
+        lut.rebuild(tile_manager, current_slice_coord=current)
+
+        reference = LutIndirectionManager3D(BASE_LAYOUT, n_levels=N_LEVELS)
+        reference.rebuild(tile_manager, current_slice_coord=current)
+        np.testing.assert_array_equal(lut.lut_data, reference.lut_data)
+        np.testing.assert_array_equal(lut.brick_max_data, reference.brick_max_data)
+
+
+def test_coarse_delta_rewrites_only_its_footprint() -> None:
+    """A coarse brick committed over many fine ones is applied as a delta.
+
+    Its box is rewritten level by level: the coarser bricks around it
+    are clipped to the box and the fine bricks inside are found without
+    sweeping every fine grid position.
+    """
+    layout = BlockLayout3D(volume_shape=(16, 16, 16), block_size=1)
+    tile_manager = TileManager3D(
+        BlockCacheParameters3D(grid_side=16, block_size=8, overlap=1)
+    )
+    rng = np.random.default_rng(0)
+    bricks = {BlockKey3D(level=5, g0=0, g1=0, g2=0): 5}
+    bricks[BlockKey3D(level=4, g0=0, g1=1, g2=0)] = 4
+    while len(bricks) < 400:
+        g0, g1, g2 = (int(v) for v in rng.integers(0, 16, size=3))
+        bricks[BlockKey3D(level=1, g0=g0, g1=g1, g2=g2)] = 1
+    for key, slot in tile_manager.stage(bricks, frame_number=1):
+        slot.brick_max = float(rng.random())
+        tile_manager.commit(key, slot)
+    lut = LutIndirectionManager3D(layout, n_levels=5)
+    lut.rebuild(tile_manager)
+
+    calls = _record_update_ranges(lut.lut_tex)
+    coarse_key = BlockKey3D(level=3, g0=1, g1=2, g2=1)
+    for key, slot in tile_manager.stage({**bricks, coarse_key: 3}, frame_number=2):
+        slot.brick_max = 2.0
+        tile_manager.commit(key, slot)
+    lut.rebuild(tile_manager)
+
+    assert calls == [((4, 8, 4), (4, 4, 4))]
+    reference = LutIndirectionManager3D(layout, n_levels=5)
+    reference.rebuild(tile_manager)
+    np.testing.assert_array_equal(lut.lut_data, reference.lut_data)
+    np.testing.assert_array_equal(lut.brick_max_data, reference.brick_max_data)
+    assert np.any(lut.lut_data[4:8, 8:12, 4:8, 3] == 3)
+
+
+def test_anisotropic_levels_cover_their_scaled_footprint() -> None:
+    """Per-axis level scales set each brick's footprint in the base grid."""
+    scale_vecs = [np.array([1.0, 1.0, 1.0]), np.array([1.0, 2.0, 4.0])]
+    lut = LutIndirectionManager3D(
+        BASE_LAYOUT, n_levels=N_LEVELS, level_scale_vecs_data=scale_vecs
+    )
+    tile_manager = TileManager3D(CACHE_INFO)
+    coarse_key = BlockKey3D(level=2, g0=3, g1=1, g2=0)
+    plan = dict(_stage_and_commit(tile_manager, {coarse_key: 2}, frame_number=1))
+    plan[coarse_key].brick_max = 7.0
+
+    lut.rebuild(tile_manager)
+
+    expected = np.zeros((4, 4, 4), dtype=bool)
+    expected[3, 2:4, 0:4] = True
+    np.testing.assert_array_equal(lut.lut_data[..., 3] == 2, expected)
+    np.testing.assert_array_equal(lut.brick_max_data == 7.0, expected)
+
+
+def test_per_brick_and_scatter_writes_agree(monkeypatch) -> None:
+    """Sparse levels are written brick by brick with the same result."""
+    from cellier.render.lut_indirection import _lut_indirection_manager_3d
+
+    tile_manager = TileManager3D(CACHE_INFO)
+    bricks = {
+        BlockKey3D(level=1, g0=3, g1=3, g2=2): 1,
+        BlockKey3D(level=1, g0=1, g1=2, g2=3): 1,
+        BlockKey3D(level=2, g0=1, g1=0, g2=1): 2,
+        BlockKey3D(level=2, g0=0, g1=1, g2=1): 2,
+    }
+    for frame, (_key, slot) in enumerate(
+        _stage_and_commit(tile_manager, bricks, frame_number=1), start=1
+    ):
+        slot.brick_max = float(frame)
+
+    luts = []
+    for write_cells in (0, 10**9):
+        monkeypatch.setattr(
+            _lut_indirection_manager_3d, "_BRICK_WRITE_CELLS", write_cells
+        )
+        lut = LutIndirectionManager3D(BASE_LAYOUT, n_levels=N_LEVELS)
+        lut.rebuild(tile_manager)
+        luts.append(lut)
+
+    scatter, per_brick = luts
+    # Two 8-cell coarse bricks, one fine brick outside them, one inside.
+    assert np.count_nonzero(scatter.lut_data[..., 3]) == 2 * 8 + 1
+    assert scatter.lut_data[1, 2, 3, 3] == 1
+    np.testing.assert_array_equal(scatter.lut_data, per_brick.lut_data)
+    np.testing.assert_array_equal(scatter.brick_max_data, per_brick.brick_max_data)
@@ -113,3 +113,89 @@ def test_foreground_overwrites_clipped_background_in_view() -> None:
     assert lut.lut_data[0, 0, 0] == sx
     assert lut.lut_data[0, 0, 1] == sy
     assert lut.lut_data[0, 0, 2] == 1
+
+
+def test_incremental_commit_uploads_only_its_cell() -> None:
+    """A tile committed under an unchanged view re-uploads only its cell."""
+    lut = _make_manager()
+    tm = TileManager2D(CACHE_INFO)
+    kept_key = BlockKey2D(level=1, g0=0, g1=0, slice_coord=NEW_SLICE)
+    _stage_and_commit(tm, {kept_key: 1}, frame=1)
+    lut.rebuild(tm, current_slice_coord=NEW_SLICE, viewport_cells=(0, 0, 4, 4))
+
+    calls = []
+    original = lut.lut_tex.update_range
+    lut.lut_tex.update_range = lambda offset, size: (
+        calls.append((tuple(offset), tuple(size))),
+        original(offset, size),
+    )
+    fg_key = BlockKey2D(level=1, g0=2, g1=1, slice_coord=NEW_SLICE)
+    _stage_and_commit(tm, {kept_key: 1, fg_key: 1}, frame=2)
+    lut.rebuild(tm, current_slice_coord=NEW_SLICE, viewport_cells=(0, 0, 4, 4))
+
+    assert calls == [((1, 2, 0), (1, 1, 1))]
+    assert lut.lut_data[2, 1, 2] == 1
+    assert lut.lut_data[0, 0, 2] == 1
+
+
+def test_viewport_change_reclips_background() -> None:
+    """Moving the viewport falls back to a full rebuild that re-clips stale tiles."""
+    lut = _make_manager()
+    tm = TileManager2D(CACHE_INFO)
+    bg_key = BlockKey2D(level=1, g0=3, g1=3, slice_coord=OLD_SLICE)
+    _stage_and_commit(tm, {bg_key: 1}, frame=1)
+
+    lut.rebuild(tm, current_slice_coord=NEW_SLICE, viewport_cells=(2, 2, 4, 4))
+    assert lut.lut_data[3, 3, 2] == 1
+
+    lut.rebuild(tm, current_slice_coord=NEW_SLICE, viewport_cells=(0, 0, 2, 2))
+    assert np.all(lut.lut_data[..., 2] == 0)
+
+
+def test_coarse_tile_fills_cells_whose_fine_tile_is_missing() -> None:
+    """Finer tiles overwrite a resident coarse cover only where they exist."""
+    layout = BlockLayout2D.from_shape(shape=(4, 4), block_size=1, overlap=1)
+    lut = LutIndirectionManager2D(layout, n_levels=2)
+    tm = TileManager2D(CACHE_INFO)
+    cover = BlockKey2D(level=2, g0=0, g1=0, slice_coord=NEW_SLICE)
+    fine = BlockKey2D(level=1, g0=0, g1=0, slice_coord=NEW_SLICE)
+    _stage_and_commit(tm, {cover: 2, fine: 1}, frame=1)
+
+    lut.rebuild(tm, current_slice_coord=NEW_SLICE, viewport_cells=(0, 0, 4, 4))
+
+    np.testing.assert_array_equal(lut.lut_data[:2, :2, 2], [[1, 2], [2, 2]])
+    assert np.all(lut.lut_data[2:, :, 2] == 0)
+
+
+def test_coarse_delta_rewrites_only_its_footprint() -> None:
+    """A coarse tile committed over many fine ones is applied as a delta."""
+    layout = BlockLayout2D.from_shape(shape=(16, 16), block_size=1, overlap=1)
+    lut = LutIndirectionManager2D(layout, n_levels=3)
+    tm = TileManager2D(
+        compute_block_cache_parameters_2d(
+            gpu_budget_bytes=256 * 3 * 3 * 4, block_size=1, overlap=1
+        )
+    )
+    rng = np.random.default_rng(0)
+    tiles = {BlockKey2D(level=3, g0=0, g1=0, slice_coord=NEW_SLICE): 3}
+    while len(tiles) < 100:
+        g0, g1 = (int(v) for v in rng.integers(0, 16, size=2))
+        tiles[BlockKey2D(level=1, g0=g0, g1=g1, slice_coord=NEW_SLICE)] = 1
+    _stage_and_commit(tm, tiles, frame=1)
+    lut.rebuild(tm, current_slice_coord=NEW_SLICE)
+
+    calls = []
+    original = lut.lut_tex.update_range
+    lut.lut_tex.update_range = lambda offset, size: (
+        calls.append((tuple(offset), tuple(size))),
+        original(offset, size),
+    )
+    coarse_key = BlockKey2D(level=3, g0=2, g1=1, slice_coord=NEW_SLICE)
+    _stage_and_commit(tm, {**tiles, coarse_key: 3}, frame=2)
+    lut.rebuild(tm, current_slice_coord=NEW_SLICE)
+
+    assert calls == [((4, 8, 0), (4, 4, 1))]
+    reference = LutIndirectionManager2D(layout, n_levels=3)
+    reference.rebuild(tm, current_slice_coord=NEW_SLICE)
+    np.testing.assert_array_equal(lut.lut_data, reference.lut_data)
+    assert np.any(lut.lut_data[8:12, 4:8, 2] == 3)
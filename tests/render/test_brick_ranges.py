@@ -0,0 +1,89 @@
+"""Tests for cellier.render._brick_ranges (empty-space skipping metadata)."""
+
+from __future__ import annotations
+
+from uuid import uuid4
+
+import numpy as np
+
+from cellier.render._brick_ranges import BrickValueRanges
+
+
+def _rows(*bricks) -> np.ndarray:
+    return np.array(bricks, dtype=np.int64).reshape(-1, 4)
+
+
+def test_lookup_returns_recorded_ranges_and_nan_when_unknown():
+    ranges = BrickValueRanges()
+    ranges.record(_rows([1, 0, 0, 0], [2, 1, 2, 3]), [0.0, 5.0], [1.0, 9.0])
+
+    mins, maxs = ranges.lookup(_rows([2, 1, 2, 3], [1, 0, 0, 1], [1, 0, 0, 0]))
+
+    np.testing.assert_array_equal(mins[[0, 2]], [5.0, 0.0])
+    np.testing.assert_array_equal(maxs[[0, 2]], [9.0, 1.0])
+    assert np.isnan(mins[1]) and np.isnan(maxs[1])
+
+
+def test_later_record_replaces_earlier_and_slices_are_separate():
+    ranges = BrickValueRanges()
+    brick = _rows([1, 0, 0, 0])
+    ranges.record(brick, [0.0], [1.0], slice_coord=((0, 1),))
+    ranges.record(brick, [0.0], [7.0], slice_coord=((0, 1),))
+    ranges.record(brick, [0.0], [3.0], slice_coord=((0, 2),))
+
+    assert ranges.lookup(brick, slice_coord=((0, 1),))[1][0] == 7.0
+    assert ranges.lookup(brick, slice_coord=((0, 2),))[1][0] == 3.0
+    assert np.isnan(ranges.lookup(brick)[1][0])
+    assert len(ranges) == 2
+
+
+def test_empty_mask_uses_cutoff_and_keeps_unknown_bricks():
+    ranges = BrickValueRanges()
+    maxs = np.array([[[0.1, 0.5], [np.nan, 2.0]]])
+    ranges.record_level(2, np.zeros_like(maxs), maxs)
+    arr = _rows([2, 0, 0, 0], [2, 0, 0, 1], [2, 0, 1, 0], [2, 0, 1, 1])
+
+    np.testing.assert_array_equal(
+        ranges.empty_mask(arr, 0.3), [True, False, False, False]
+    )
+    # Raising the cutoff needs no new data.
+    np.testing.assert_array_equal(
+        ranges.empty_mask(arr, 1.0), [True, True, False, False]
+    )
+
+    ranges.clear()
+    assert not ranges.empty_mask(arr, 1.0).any()
+
+
+def test_plan_bricks_skips_bricks_below_the_contrast_floor():
+    from cellier.render.visuals._image import GFXMultiscaleImageVisual
+    from cellier.transform import AffineTransform
+    from cellier.visuals import MultiscaleImageAppearance, MultiscaleImageVisual
+
+    model = MultiscaleImageVisual(
+        name="vol",
+        data_store_id=str(uuid4()),
+        level_transforms=[AffineTransform.identity(ndim=3)],
+        appearance=MultiscaleImageAppearance(
+            color_map="grays", clim=(0.2, 1.0), render_mode="mip"
+        ),
+    )
+    visual = GFXMultiscaleImageVisual.from_cellier_model(
+        model=model,
+        level_shapes=[(64, 64, 64)],
+        render_modes={"3d"},
+        displayed_axes=(0, 1, 2),
+    )
+    args = (np.array([32.0, 32.0, 200.0]), None, 1.0, 2000.0, 1.0, None)
+    assert len(visual._plan_bricks(*args)) == 8
+
+    maxs = np.full((2, 2, 2), 0.9)
+    maxs[0, 0, 0] = 0.1
+    visual.set_brick_value_ranges(1, np.zeros_like(maxs), maxs)
+    planned = {tuple(map(int, row)) for row in visual._plan_bricks(*args)}
+    assert len(planned) == 7
+    assert (1, 0, 0, 0) not in planned
+
+    # Lowering the contrast floor brings the brick back without new ranges.
+    visual.material_3d.clim = (0.0, 1.0)
+    assert len(visual._plan_bricks(*args)) == 8
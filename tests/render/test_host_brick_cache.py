@@ -0,0 +1,101 @@
+"""Tests for the shared host-RAM decoded chunk cache."""
+
+from __future__ import annotations
+
+import asyncio
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from cellier.data.image import ChunkRequest
+from cellier.render._host_brick_cache import HostBrickCache
+from cellier.slicer import AsyncSlicer
+
+
+def _request(scale_index: int = 0, start: int = 0) -> ChunkRequest:
+    return ChunkRequest(
+        chunk_request_id=uuid4(),
+        slice_request_id=uuid4(),
+        scale_index=scale_index,
+        axis_selections=((start, start + 4), (0, 4)),
+    )
+
+
+def test_key_ignores_request_ids():
+    a = _request()
+    b = _request()
+    assert HostBrickCache.make_key("s", a) == HostBrickCache.make_key("s", b)
+    assert HostBrickCache.make_key("s", a) != HostBrickCache.make_key("t", a)
+
+
+def test_put_get_marks_read_only():
+    cache = HostBrickCache(budget_bytes=1024)
+    data = np.ones((4, 4), dtype=np.float32)
+    cache.put(("s", 0, ()), data)
+    out = cache.get(("s", 0, ()))
+    assert out is data
+    assert not out.flags.writeable
+    assert cache.get(("s", 1, ())) is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_lru_eviction_respects_budget():
+    brick = np.zeros((4, 4), dtype=np.float32)  # 64 bytes
+    cache = HostBrickCache(budget_bytes=2 * brick.nbytes)
+    cache.put("a", brick.copy())
+    cache.put("b", brick.copy())
+    cache.get("a")  # "b" is now least recently used
+    cache.put("c", brick.copy())
+    assert "a" in cache and "c" in cache
+    assert "b" not in cache
+    assert cache.nbytes == 2 * brick.nbytes
+
+
+def test_oversized_and_disabled_are_not_cached():
+    data = np.zeros(64, dtype=np.float32)
+    cache = HostBrickCache(budget_bytes=data.nbytes - 1)
+    cache.put("a", data)
+    assert len(cache) == 0
+    disabled = HostBrickCache(budget_bytes=0)
+    assert not disabled.enabled
+
+
+def test_invalidate_drops_only_namespace():
+    cache = HostBrickCache(budget_bytes=1 << 20)
+    cache.put(("s", 0, ()), np.zeros(4, dtype=np.float32))
+    cache.put(("s", 1, ()), np.zeros(4, dtype=np.float32))
+    cache.put(("t", 0, ()), np.zeros(4, dtype=np.float32))
+    assert cache.invalidate("s") == 2
+    assert len(cache) == 1
+    assert cache.nbytes == 16
+
+
+@pytest.mark.parametrize("namespace", ["store", None])
+async def test_slicer_serves_repeat_reads_from_host_cache(namespace):
+    cache = HostBrickCache(budget_bytes=1 << 20)
+    slicer = AsyncSlicer(batch_size=2, host_cache=cache)
+    n_fetches = 0
+
+    async def fetch(req: ChunkRequest) -> np.ndarray:
+        nonlocal n_fetches
+        n_fetches += 1
+        return np.full((4, 4), req.scale_index, dtype=np.float32)
+
+    received: list[np.ndarray] = []
+    requests = [_request(scale_index=s) for s in range(3)]
+    for _ in range(2):
+        # Fresh request IDs each pass, as produced by a replan.
+        batch = [r._replace(chunk_request_id=uuid4()) for r in requests]
+        slice_id = uuid4()
+        batch = [r._replace(slice_request_id=slice_id) for r in batch]
+        slicer.submit(
+            batch,
+            fetch_fn=fetch,
+            callback=lambda b: received.extend(d for _, d in b),
+            cache_namespace=namespace,
+        )
+        await asyncio.gather(*slicer._tasks.values())
+
+    assert len(received) == 6
+    assert n_fetches == (3 if namespace is not None else 6)
@@ -1,34 +1,37 @@
 """Render + commit tests for ``GFXMultichannelMultiscaleImageVisual`` (Phase 3).
 
 Drives a 2-channel (CZYX) multiscale pyramid through the controller: each
-channel occupies a slot, reslice fans requests out per channel, and the slots
-composite additively.  Covers channel fan-out, per-channel colormap/clim, and
-additive blending output.  Uses the shared harness fixtures (``controller``,
+channel occupies a slot, the slots share one tile manager and LUT, reslice
+requests each brick once as a channel-range read, and the slots composite
+additively.  Covers channel layers, per-channel colormap/clim, and additive
+blending output.  Uses the shared harness fixtures (``controller``,
 ``render_scene``, ``reslice``); the CZYX store + stacked-axis scene are built
 locally because they are specific to the multichannel layout.
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from types import SimpleNamespace
 from uuid import uuid4
 
 import numpy as np
 import pytest
 import tensorstore as ts
 
+from cellier.data.image import ChunkRequest
 from cellier.data.image._zarr_multiscale_store import MultiscaleZarrDataStore
 from cellier.events._events import ChannelAppearanceChangedEvent
+from cellier.render.visuals._image_multiscale_multichannel import (
+    GFXMultichannelMultiscaleImageVisual,
+    _channel_planes,
+    _channel_runs,
+    _split_channel_runs,
+)
 from cellier.scene.dims import AxisAlignedSelection, CoordinateSystem, DimsManager
 from cellier.scene.scene import Scene
 from cellier.visuals._channel_appearance import ChannelAppearance
 from cellier.visuals._image import MultiscaleImageRenderConfig
 
-if TYPE_CHECKING:
-    from cellier.render.visuals._image_multiscale_multichannel import (
-        GFXMultichannelMultiscaleImageVisual,
-    )
-
 # ---------------------------------------------------------------------------
 # Fixtures: CZYX multiscale store + stacked-axis scene
 # ---------------------------------------------------------------------------
@@ -280,3 +283,139 @@ async def test_channel_unknown_index_is_ignored(
     gfx = _gfx_visual(controller, scene.id, visual.id)
     # Channel 5 was never added -> handler returns early without raising.
     gfx.on_channel_appearance_changed(_channel_event(visual.id, 5, "opacity", 0.1))
+
+
+# ---------------------------------------------------------------------------
+# Channel layers
+# ---------------------------------------------------------------------------
+
+
+def test_channel_planes_pick_layer_channels_out_of_a_range_read():
+    """Offsets index the channel dim, after range axes preceding it."""
+    data = np.arange(2 * 3 * 4, dtype=np.float32).reshape(2, 3, 4)
+    # Channel axis 1, preceded by a ranged axis: channel dim 1 of the result.
+    planes = _channel_planes(data, ((0, 2), (4, 7), (0, 4)), 1, [0, 2])
+
+    np.testing.assert_array_equal(planes[0], data[:, 0])
+    np.testing.assert_array_equal(planes[1], data[:, 2])
+    # A point selection before the channel axis adds no output dim.
+    planes = _channel_planes(data, (5, (0, 2), (0, 3), (0, 4)), 1, [1])
+    np.testing.assert_array_equal(planes[0], data[1])
+
+
+def test_channel_runs_read_only_claimed_channels():
+    """Each run of consecutive channels gets one request per brick."""
+    assert _channel_runs((0, 40)) == [(0, 1), (40, 41)]
+    assert _channel_runs((0, 1, 2, 5, 6)) == [(0, 3), (5, 7)]
+
+    bricks = [
+        ChunkRequest(uuid4(), uuid4(), 0, ((0, 3), (0, 8))),
+        ChunkRequest(uuid4(), uuid4(), 0, ((0, 3), (8, 16))),
+    ]
+    requests, owners = _split_channel_runs(bricks, 0, [(0, 3), (5, 7)])
+
+    assert [r.axis_selections for r in requests] == [
+        ((0, 3), (0, 8)),
+        ((5, 7), (0, 8)),
+        ((0, 3), (8, 16)),
+        ((5, 7), (8, 16)),
+    ]
+    assert owners == {
+        requests[1].chunk_request_id: bricks[0].chunk_request_id,
+        requests[3].chunk_request_id: bricks[1].chunk_request_id,
+    }
+    assert _split_channel_runs(bricks, 0, [(0, 3)]) == (bricks, {})
+
+
+def test_gathered_planes_use_the_reads_own_channel_range():
+    """Planes are placed by each read's range, not the current layers."""
+    visual = SimpleNamespace(_channel_axis=0)
+    data = np.arange(3 * 2, dtype=np.float32).reshape(3, 2)
+    brick_id = uuid4()
+    gathered: dict = {}
+
+    def _gather(selection, channels):
+        req = ChunkRequest(uuid4(), uuid4(), 0, (selection, (0, 2)))
+        return GFXMultichannelMultiscaleImageVisual._gather_planes(
+            visual,
+            req,
+            data[: selection[1] - selection[0]],
+            brick_id,
+            gathered,
+            channels,
+        )
+
+    # Planned for channels 0-2; channel 1 has since been released.
+    assert _gather((0, 3), (0, 2, 7)) is None
+    planes = _gather((7, 8), (0, 2, 7))
+    np.testing.assert_array_equal(planes[0], data[0])
+    np.testing.assert_array_equal(planes[1], data[2])
+    np.testing.assert_array_equal(planes[2], data[0])
+    assert gathered == {}
+    # A read holding none of the layer channels is dropped.
+    assert _gather((4, 5), (0, 2, 7)) is None
+    assert gathered == {}
+
+
+async def test_channel_range_read_matches_per_channel_reads(multichannel_store):
+    """A channel-range read, split apart, equals reading each channel alone."""
+    # Padded edge brick: the halo extends past the store on the low side.
+    spatial = ((-1, 9), (7, 17), (3, 13))
+    fused = ChunkRequest(
+        chunk_request_id=uuid4(),
+        slice_request_id=uuid4(),
+        scale_index=0,
+        axis_selections=((0, 2), *spatial),
+    )
+
+    (data,) = await multichannel_store.get_data_batch([fused])
+    planes = _channel_planes(data, fused.axis_selections, 0, [0, 1])
+    for ch, plane in enumerate(planes):
+        request = ChunkRequest(
+            chunk_request_id=uuid4(),
+            slice_request_id=uuid4(),
+            scale_index=0,
+            axis_selections=(ch, *spatial),
+        )
+        np.testing.assert_array_equal(plane, await multichannel_store.get_data(request))
+
+
+@pytest.mark.parametrize("dim", ["2d", "3d"])
+async def test_reslice_reads_each_brick_once_for_all_channels(
+    controller, render_scene, reslice, multichannel_store, monkeypatch, dim
+):
+    """One channel-range request per brick fills every channel layer."""
+    scene = _make_scene(controller, dim)
+    channels = {
+        0: ChannelAppearance(color_map="green", clim=(0.0, 1.0)),
+        1: ChannelAppearance(color_map="magenta", clim=(0.0, 1.0)),
+    }
+    visual = _add_visual(controller, scene, multichannel_store, channels, dim)
+    gfx = _gfx_visual(controller, scene.id, visual.id)
+
+    name = "build_slice_request_2d" if dim == "2d" else "build_slice_request"
+    build = getattr(gfx, name)
+    issued: list[ChunkRequest] = []
+
+    def _record(*args, **kwargs):
+        requests = build(*args, **kwargs)
+        issued.extend(requests)
+        return requests
+
+    monkeypatch.setattr(gfx, name, _record)
+    await reslice(controller, scene.id)
+
+    assert issued
+    assert all(r.axis_selections[0] == (0, 2) for r in issued)
+    slots = [gfx._slots[gfx._channel_to_slot[ch]] for ch in (0, 1)]
+    caches = [s._block_cache_2d if dim == "2d" else s._block_cache_3d for s in slots]
+    # Channels share one slot allocation and one LUT.
+    assert caches[0].tile_manager is caches[1].tile_manager
+    lut = [s._lut_manager_2d if dim == "2d" else s._lut_manager_3d for s in slots]
+    assert lut[0] is lut[1]
+    material = [s.material_2d if dim == "2d" else s.material_3d for s in slots]
+    assert material[0].lut_texture is material[1].lut_texture
+    assert len(caches[0].tile_manager.tilemap) == len(issued)
+
+    frame = render_scene(controller, scene.id)
+    assert np.count_nonzero(frame[..., 3]) > 0
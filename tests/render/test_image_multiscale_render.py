@@ -80,6 +80,113 @@ def test_construction_3d_builds_3d_material(controller, multiscale_image_store):
     assert gfx._block_cache_3d is not None
 
 
+def test_uint8_store_keeps_native_dtype_caches():
+    """uint8 data is cached as r8unorm and rescaled to data units in the shader."""
+    from cellier.render.visuals._image import GFXMultiscaleImageVisual
+    from cellier.transform import AffineTransform
+    from cellier.visuals import MultiscaleImageVisual
+
+    model = MultiscaleImageVisual(
+        name="img",
+        data_store_id=str(uuid4()),
+        level_transforms=[AffineTransform.identity(ndim=3)],
+        appearance=MultiscaleImageAppearance(color_map="grays", clim=(0.0, 255.0)),
+    )
+    gfx = GFXMultiscaleImageVisual.from_cellier_model(
+        model=model,
+        level_shapes=[(64, 64, 64)],
+        render_modes={"2d", "3d"},
+        displayed_axes=(0, 1, 2),
+        data_dtype=np.dtype(np.uint8),
+    )
+    gfx.rebuild_geometry(gfx._full_level_shapes, (1, 2))
+
+    for cache in (gfx._block_cache_3d, gfx._block_cache_2d):
+        assert cache.dtype == np.uint8
+        assert cache.cache_tex.format == "1xu1"
+    assert gfx.material_3d.uniform_buffer.data["value_scale"] == 255.0
+    assert gfx.material_2d.uniform_buffer.data["value_scale"] == 255.0
+
+
+def test_uint8_cache_precision_quantizes_float_data():
+    """Opt-in uint8 precision uploads float bricks as per-brick 8-bit codes."""
+    from cellier.render.visuals._image import GFXMultiscaleImageVisual
+    from cellier.transform import AffineTransform
+    from cellier.visuals import MultiscaleImageVisual
+
+    model = MultiscaleImageVisual(
+        name="img",
+        data_store_id=str(uuid4()),
+        level_transforms=[AffineTransform.identity(ndim=3)],
+        appearance=MultiscaleImageAppearance(color_map="grays", clim=(0.0, 1.0)),
+        render_config=MultiscaleImageRenderConfig(cache_precision="uint8"),
+    )
+    gfx = GFXMultiscaleImageVisual.from_cellier_model(
+        model=model,
+        level_shapes=[(64, 64, 64)],
+        render_modes={"3d"},
+        displayed_axes=(0, 1, 2),
+        data_dtype=np.dtype(np.float32),
+    )
+    requests = gfx.build_slice_request(
+        camera_pos_world=np.array([32.0, 32.0, 200.0]),
+        frustum_corners_world=None,
+        fov_y_rad=1.0,
+        screen_height_px=600.0,
+        dims_state=None,
+    )
+
+    pbs = gfx._block_cache_3d.info.padded_block_size
+    data = np.linspace(0.0, 1.0, pbs**3, dtype=np.float32).reshape((pbs,) * 3)
+    gfx.on_data_ready([(requests[0], data)])
+
+    cache = gfx._block_cache_3d
+    ((_, _, codes),) = cache.cache_tex._gfx_get_chunk_descriptions()
+    assert codes.dtype == np.uint8
+    assert codes.max() == 255
+    assert gfx.material_3d.slot_params_texture is cache.slot_params_tex
+
+
+def test_upload_budget_defers_bricks_to_later_ticks():
+    """Bricks over the per-frame upload budget commit on later frames."""
+    from cellier.render.visuals._image import GFXMultiscaleImageVisual
+    from cellier.transform import AffineTransform
+    from cellier.visuals import MultiscaleImageVisual
+
+    model = MultiscaleImageVisual(
+        name="img",
+        data_store_id=str(uuid4()),
+        level_transforms=[AffineTransform.identity(ndim=3)],
+        appearance=MultiscaleImageAppearance(color_map="grays", clim=(0.0, 1.0)),
+        render_config=MultiscaleImageRenderConfig(upload_budget_bytes=1),
+    )
+    gfx = GFXMultiscaleImageVisual.from_cellier_model(
+        model=model,
+        level_shapes=[(64, 64, 64)],
+        render_modes={"3d"},
+        displayed_axes=(0, 1, 2),
+        data_dtype=np.dtype(np.float32),
+    )
+    requests = gfx.build_slice_request(
+        camera_pos_world=np.array([32.0, 32.0, 200.0]),
+        frustum_corners_world=None,
+        fov_y_rad=1.0,
+        screen_height_px=600.0,
+        dims_state=None,
+    )
+    pbs = gfx._block_cache_3d.info.padded_block_size
+    brick = np.ones((pbs,) * 3, dtype=np.float32)
+
+    gfx.on_data_ready([(req, brick) for req in requests[:3]])
+    assert gfx._block_cache_3d.n_resident == 1
+    assert gfx._block_cache_3d.n_pending_uploads == 2
+
+    gfx.tick()
+    gfx.tick()
+    assert gfx._block_cache_3d.n_resident == 3
+    assert gfx._block_cache_3d.n_pending_uploads == 0
+
+
 # ---------------------------------------------------------------------------
 # Rendered output
 # ---------------------------------------------------------------------------
@@ -23,10 +23,9 @@ def test_build_cache_texture_2d_int32():
         block_size=16,
         overlap=1,
     )
-    data, tex = build_cache_texture_2d(params, dtype=np.int32)
-    assert data.dtype == np.int32
-    # pygfx Texture object should be created without error
-    assert tex is not None
+    tex = build_cache_texture_2d(params, dtype=np.int32)
+    assert tex.format == "1xi4"
+    assert tex.data is None
 
 
 def test_build_cache_texture_2d_float32_default():
@@ -34,8 +33,8 @@ def test_build_cache_texture_2d_float32_default():
         gpu_budget_bytes=4 * 1024**2,
         block_size=16,
     )
-    data, _tex = build_cache_texture_2d(params)
-    assert data.dtype == np.float32
+    tex = build_cache_texture_2d(params)
+    assert tex.format == "1xf4"
 
 
 def test_block_cache_2d_int32_write():
@@ -45,7 +44,7 @@ def test_block_cache_2d_int32_write():
         overlap=1,
     )
     cache = BlockCache2D(cache_parameters=params, dtype=np.int32)
-    assert cache.cache_data.dtype == np.int32
+    assert cache.dtype == np.int32
 
     # Stage a slot and write
     from cellier.render.block_cache._tile_manager_2d import BlockKey2D
@@ -58,11 +57,13 @@ def test_block_cache_2d_int32_write():
     pbs = params.padded_block_size
     data = np.arange(pbs * pbs, dtype=np.int32).reshape(pbs, pbs)
     cache.write_tile(slot, data, key=tile_key)
+    cache.flush_uploads()
 
     sy, sx = slot.grid_pos
-    y0 = sy * pbs
-    x0 = sx * pbs
-    np.testing.assert_array_equal(cache.cache_data[y0 : y0 + pbs, x0 : x0 + pbs], data)
+    ((offset, size, uploaded),) = cache.cache_tex._gfx_get_chunk_descriptions()
+    assert offset == (sx * pbs, sy * pbs, 0)
+    assert size == (pbs, pbs, 1)
+    np.testing.assert_array_equal(uploaded[0], data)
 
 
 # ── 3D int32 cache ────────────────────────────────────────────────────────────
@@ -76,7 +77,7 @@ def test_block_cache_3d_int32():
         dtype=np.int32,
     )
     cache = BlockCache3D(cache_parameters=params, dtype=np.int32)
-    assert cache.cache_data.dtype == np.int32
+    assert cache.dtype == np.int32
 
 
 def test_block_cache_3d_int32_write_brick():
@@ -133,4 +134,4 @@ def test_block_cache_3d_float32_default_unchanged():
         overlap=3,
     )
     cache = BlockCache3D(cache_parameters=params)
-    assert cache.cache_data.dtype == np.float32
+    assert cache.dtype == np.float32
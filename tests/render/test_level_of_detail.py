@@ -13,6 +13,7 @@ import pytest
 from cellier.render._level_of_detail import (
     arr_to_brick_keys,
     build_level_grids,
+    progressive_order,
     select_levels_arr_forced,
     select_levels_from_cache,
     sort_arr_by_distance,
@@ -410,3 +411,67 @@ def test_arr_to_brick_keys_default_empty_slice_coord():
     keys = arr_to_brick_keys(arr)
     (key,) = keys
     assert key.slice_coord == ()
+
+
+# ---------------------------------------------------------------------------
+# progressive_order
+# ---------------------------------------------------------------------------
+
+
+def test_progressive_order_cover_first_then_coarse_to_fine():
+    cover = np.array([[3, 0, 0, 0], [3, 0, 0, 1]], dtype=np.int32)
+    # nearest-first target plan mixing levels; the level-3 row is in the cover
+    arr = np.array(
+        [[1, 0, 0, 0], [2, 0, 0, 1], [1, 0, 1, 0], [3, 0, 0, 1], [2, 1, 1, 1]],
+        dtype=np.int32,
+    )
+    out = progressive_order(arr, cover)
+    np.testing.assert_array_equal(
+        out,
+        [
+            [3, 0, 0, 0],
+            [3, 0, 0, 1],
+            [2, 0, 0, 1],
+            [2, 1, 1, 1],
+            [1, 0, 0, 0],
+            [1, 0, 1, 0],
+        ],
+    )
+    # An empty cover leaves the plan untouched.
+    assert progressive_order(arr, cover[:0]) is arr
+
+
+def test_plan_bricks_progressive_prepends_coarse_cover():
+    from uuid import uuid4
+
+    from cellier.render.visuals._image import GFXMultiscaleImageVisual
+    from cellier.transform import AffineTransform
+    from cellier.visuals import MultiscaleImageAppearance, MultiscaleImageVisual
+
+    model = MultiscaleImageVisual(
+        name="vol",
+        data_store_id=str(uuid4()),
+        level_transforms=[
+            AffineTransform.identity(ndim=3),
+            AffineTransform.from_scale_and_translation(
+                (2.0, 2.0, 2.0), (0.5, 0.5, 0.5)
+            ),
+        ],
+        appearance=MultiscaleImageAppearance(color_map="grays", clim=(0.0, 1.0)),
+    )
+    visual = GFXMultiscaleImageVisual.from_cellier_model(
+        model=model,
+        level_shapes=[(64, 64, 64), (32, 32, 32)],
+        render_modes={"3d"},
+        displayed_axes=(0, 1, 2),
+    )
+    # Close enough that the target plan is all finest-level bricks.
+    args = (np.array([32.0, 32.0, 40.0]), None, 1.0, 2000.0, 1.0, None)
+
+    target = visual._plan_bricks(*args)
+    progressive = visual._plan_bricks(*args, progressive=True)
+
+    n_cover = len(visual._volume_geometry._level_grids[-1]["arr"])
+    assert (progressive[:n_cover, 0] == 2).all()
+    assert (progressive[n_cover:, 0] == 1).all()
+    assert {tuple(r) for r in target} <= {tuple(r) for r in progressive}
@@ -1,8 +1,9 @@
 """Tests for cellier.render._level_of_detail_2d (2D tile LOD selection).
 
 Pure NumPy.  Mirrors the 3D LOD tests for the 2D tiled-image pipeline:
-grid construction, zoom-based level selection, distance sorting, and the
-viewport (2D frustum) cull.
+grid construction, zoom-based level selection, the coarse-cover mixed-LOD
+plan, distance sorting, and the viewport (2D frustum) cull, both dict-based
+and array-native.
 """
 
 from __future__ import annotations
@@ -13,8 +14,12 @@ import pytest
 from cellier.render._level_of_detail_2d import (
     arr_to_block_keys_2d,
     build_tile_grids_2d,
+    select_level_2d,
     select_lod_2d,
+    select_mixed_lod_2d,
     sort_tiles_by_distance_2d,
+    tile_grid_dims_2d,
+    tiles_in_view_2d,
     viewport_cull_2d,
 )
 from cellier.render.block_cache._tile_manager_2d import BlockKey2D
@@ -232,6 +237,105 @@ def test_viewport_cull_anisotropic():
     assert culled == {}
 
 
+# ---------------------------------------------------------------------------
+# tiles_in_view_2d
+# ---------------------------------------------------------------------------
+
+
+def test_tile_grid_dims_match_built_grids(base_layout, level_shapes):
+    for shapes in (level_shapes, None):
+        grids = build_tile_grids_2d(base_layout, 2, level_shapes=shapes)
+        dims = tile_grid_dims_2d(base_layout, 2, level_shapes=shapes)
+        assert [len(g["arr"]) for g in grids] == [gh * gw for gh, gw in dims]
+
+
+def test_select_level_matches_select_lod(base_layout):
+    grids = build_tile_grids_2d(base_layout, 2)
+    for voxel_width in (0.0, 50.0, 100.0, 200.0, 800.0):
+        level = select_level_2d(2, 100.0, voxel_width)
+        arr = select_lod_2d(grids, 2, 100.0, voxel_width)
+        assert (arr[:, 0] == level).all()
+
+
+@pytest.mark.parametrize("level", [1, 2, 3])
+def test_tiles_in_view_match_culling_the_full_grid(level):
+    layout = BlockLayout2D.from_shape((200, 120), block_size=BLOCK_SIZE, overlap=1)
+    shapes = [(200, 120), (100, 60), (50, 30)]
+    grids = build_tile_grids_2d(layout, 3, level_shapes=shapes)
+    dims = tile_grid_dims_2d(layout, 3, level_shapes=shapes)
+    scale = np.array([[1.0, 1.0], [2.0, 2.5], [4.0, 5.0]])
+    translation = np.array([[0.0, 0.0], [0.5, -3.0], [1.5, 2.0]])
+    rng = np.random.default_rng(level)
+    # Random views, plus views whose edges sit exactly on tile boundaries
+    # and one that misses the image entirely.
+    views = [np.sort(rng.uniform(-20.0, 220.0, size=(2, 2)), axis=0) for _ in range(20)]
+    views += [
+        np.array([[16.0, 8.0], [48.0, 64.0]]),
+        np.array([[-9.0, -9.0], [-1.0, -1.0]]),
+    ]
+
+    for view_min, view_max in views:
+        arr = tiles_in_view_2d(
+            level,
+            dims[level - 1],
+            BLOCK_SIZE,
+            view_min,
+            view_max,
+            level_scale_arr_shader=scale,
+            level_translation_arr_shader=translation,
+        )
+        expected, _ = viewport_cull_2d(
+            arr_to_block_keys_2d(grids[level - 1]["arr"]),
+            BLOCK_SIZE,
+            view_min,
+            view_max,
+            level_scale_arr_shader=scale,
+            level_translation_arr_shader=translation,
+        )
+        assert list(arr_to_block_keys_2d(arr)) == list(expected)
+
+    full = tiles_in_view_2d(level, dims[level - 1], BLOCK_SIZE)
+    np.testing.assert_array_equal(full, grids[level - 1]["arr"])
+
+
+# ---------------------------------------------------------------------------
+# select_mixed_lod_2d
+# ---------------------------------------------------------------------------
+
+
+def _visible_tiles(level: int) -> dict:
+    """An 8x8 level-1 view: 64, 16, 4 and 1 tiles at levels 1 to 4."""
+    side = 8 >> (level - 1)
+    return {
+        BlockKey2D(level, g0, g1): level for g0 in range(side) for g1 in range(side)
+    }
+
+
+def test_mixed_lod_puts_coarse_cover_first_when_budget_allows():
+    required = select_mixed_lod_2d(_visible_tiles(1), 1, 4, 100, _visible_tiles)
+    levels = [key.level for key in required]
+    assert levels[0] == 4
+    assert levels[1:] == [1] * 64
+
+
+def test_mixed_lod_foveates_when_budget_is_tight():
+    target = _visible_tiles(1)
+    required = select_mixed_lod_2d(target, 1, 4, 40, _visible_tiles)
+
+    levels = [key.level for key in required]
+    # Cover (1), then level 2 for the periphery (16 <= 39 // 2), then the
+    # 23 target tiles nearest the centre fill the rest of the budget.
+    assert levels == [4] + [2] * 16 + [1] * 23
+    assert list(required)[17:] == list(target)[:23]
+
+
+def test_mixed_lod_leaves_coarsest_and_oversized_cover_unchanged():
+    target = _visible_tiles(4)
+    assert select_mixed_lod_2d(target, 4, 4, 100, _visible_tiles) is target
+    required = select_mixed_lod_2d(_visible_tiles(1), 1, 2, 8, _visible_tiles)
+    assert [key.level for key in required] == [2] * 16
+
+
 # ---------------------------------------------------------------------------
 # arr_to_block_keys_2d
 # ---------------------------------------------------------------------------
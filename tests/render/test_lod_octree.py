@@ -0,0 +1,257 @@
+"""Tests for cellier.render._lod_octree (top-down octree LOD traversal)."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from cellier.render._frustum import bricks_in_frustum_arr, frustum_planes_from_corners
+from cellier.render._lod_octree import (
+    build_octree_levels,
+    select_levels_octree,
+    select_levels_sse,
+)
+from cellier.render.lut_indirection import BlockLayout3D
+
+BLOCK_SIZE = 4
+N_LEVELS = 3
+LEVEL_SHAPES = [(64, 64, 64), (32, 32, 32), (16, 16, 16)]
+SCALES = [np.full(3, float(1 << k)) for k in range(N_LEVELS)]
+TRANSLATIONS = [np.zeros(3) for _ in range(N_LEVELS)]
+
+
+@pytest.fixture
+def levels():
+    return build_octree_levels(
+        BlockLayout3D(volume_shape=LEVEL_SHAPES[0], block_size=BLOCK_SIZE),
+        N_LEVELS,
+        SCALES,
+        TRANSLATIONS,
+        level_shapes=LEVEL_SHAPES,
+    )
+
+
+def _box_corners(lo, hi) -> np.ndarray:
+    """Frustum corners of an axis-aligned box seen by a camera looking down -z."""
+    (x0, y0, z0), (x1, y1, z1) = lo, hi
+    return np.array(
+        [
+            [[x0, y0, z1], [x1, y0, z1], [x1, y1, z1], [x0, y1, z1]],
+            [[x0, y0, z0], [x1, y0, z0], [x1, y1, z0], [x0, y1, z0]],
+        ],
+        dtype=np.float64,
+    )
+
+
+def _finest_coverage(arr: np.ndarray) -> np.ndarray:
+    """Count how many selected bricks cover each finest-level brick."""
+    counts = np.zeros(tuple(s // BLOCK_SIZE for s in LEVEL_SHAPES[0]), dtype=int)
+    for level, gz, gy, gx in arr:
+        f = 1 << (level - 1)
+        counts[gz * f : (gz + 1) * f, gy * f : (gy + 1) * f, gx * f : (gx + 1) * f] += 1
+    return counts
+
+
+def _rows(arr: np.ndarray) -> set:
+    return {tuple(map(int, row)) for row in arr}
+
+
+@pytest.mark.parametrize("camera", [(0.0, 0.0, 0.0), (40.0, 10.0, 63.0)])
+def test_selection_partitions_the_volume(levels, camera):
+    arr = select_levels_octree(levels, np.array(camera), [20.0, 40.0])
+
+    assert set(np.unique(arr[:, 0])) == {1, 2, 3}
+    assert (_finest_coverage(arr) == 1).all()
+
+
+def test_kept_bricks_respect_thresholds(levels):
+    thresholds = [20.0, 40.0]
+    cam = np.array([10.0, 30.0, 50.0])
+    arr = select_levels_octree(levels, cam, thresholds)
+
+    for level, gz, gy, gx in arr:
+        if level == 1:
+            continue
+        bw = BLOCK_SIZE * (1 << (level - 1))
+        lo = np.array([gx, gy, gz], dtype=np.float64) * bw
+        nearest = np.linalg.norm(np.maximum(np.maximum(lo - cam, cam - lo - bw), 0.0))
+        assert nearest >= thresholds[level - 2]
+
+
+def test_empty_thresholds_return_coarsest_level(levels):
+    arr = select_levels_octree(levels, np.zeros(3), [])
+    assert len(arr) == 4**3
+    assert (arr[:, 0] == N_LEVELS).all()
+
+
+def test_frustum_pruning_matches_post_cull(levels):
+    cam = np.array([30.0, 30.0, 70.0])
+    planes = frustum_planes_from_corners(
+        _box_corners((10.0, 20.0, 30.0), (40.0, 50.0, 64.0))
+    )
+
+    culled = select_levels_octree(levels, cam, [20.0, 40.0], frustum_planes=planes)
+    full = select_levels_octree(levels, cam, [20.0, 40.0])
+    expected, _ = bricks_in_frustum_arr(
+        full,
+        BLOCK_SIZE,
+        planes,
+        level_scale_arr_shader=np.stack(SCALES),
+        level_translation_arr_shader=np.stack(TRANSLATIONS),
+    )
+
+    assert 0 < len(culled) < len(full)
+    assert _rows(culled) == _rows(expected)
+
+
+def test_child_ranges_tile_odd_level_shapes():
+    shapes = [(33, 20, 9), (17, 10, 5), (9, 5, 3)]
+    levels = build_octree_levels(
+        BlockLayout3D(volume_shape=shapes[0], block_size=BLOCK_SIZE),
+        3,
+        SCALES,
+        TRANSLATIONS,
+        level_shapes=shapes,
+    )
+    for parent, child in zip(levels[1:], levels[:-1]):
+        for axis in range(3):
+            start = parent["child_start"][axis]
+            stop = parent["child_stop"][axis]
+            assert start[0] == 0
+            np.testing.assert_array_equal(start[1:], stop[:-1])
+            assert stop[-1] == child["grid_dims"][axis]
+
+    # Everything refines to the finest level: exactly one row per brick.
+    arr = select_levels_octree(levels, np.zeros(3), [1e9, 1e9])
+    assert (arr[:, 0] == 1).all()
+    assert len(_rows(arr)) == len(arr) == int(np.prod(levels[0]["grid_dims"]))
+
+
+def _max_error(arr: np.ndarray, cam: np.ndarray, focal_px: float) -> float:
+    """Largest projected voxel size, in pixels, among refinable rows."""
+    worst = 0.0
+    for level, gz, gy, gx in arr:
+        if level == 1:
+            continue
+        bw = BLOCK_SIZE * (1 << (level - 1))
+        lo = np.array([gx, gy, gz], dtype=np.float64) * bw
+        nearest = np.linalg.norm(np.maximum(np.maximum(lo - cam, cam - lo - bw), 0.0))
+        worst = max(worst, (1 << (level - 1)) * focal_px / nearest)
+    return worst
+
+
+@pytest.mark.parametrize("max_bricks", [64, 150, 400, 2000])
+def test_sse_selection_covers_volume_within_budget(levels, max_bricks):
+    cam = np.array([5.0, 5.0, 70.0])
+    arr = select_levels_sse(levels, BLOCK_SIZE, cam, 100.0, max_bricks)
+
+    assert len(arr) <= max_bricks
+    assert (_finest_coverage(arr) == 1).all()
+
+
+def test_sse_refines_largest_error_first(levels):
+    cam = np.array([5.0, 5.0, 70.0])
+    errors = [
+        _max_error(select_levels_sse(levels, BLOCK_SIZE, cam, 100.0, n), cam, 100.0)
+        for n in (64, 150, 400, 2000)
+    ]
+    assert errors == sorted(errors, reverse=True)
+    assert errors[0] > errors[-1]
+
+
+def test_sse_stops_at_pixel_tolerance_and_brick_budget(levels):
+    cam = np.array([5.0, 5.0, 70.0])
+    arr = select_levels_sse(levels, BLOCK_SIZE, cam, 100.0, 10**6, pixel_tolerance=4.0)
+    assert _max_error(arr, cam, 100.0) <= 4.0
+    assert len(arr) < 8**3 * 8  # not everything was refined to level 1
+
+    capped = select_levels_sse(levels, BLOCK_SIZE, cam, 100.0, max_bricks=100)
+    assert len(capped) <= 100
+
+
+def test_sse_keeps_coarse_cover_when_budget_is_too_small(levels):
+    arr = select_levels_sse(levels, BLOCK_SIZE, np.zeros(3), 100.0, max_bricks=10)
+    assert len(arr) == 4**3
+    assert (arr[:, 0] == N_LEVELS).all()
+
+
+def test_sse_culls_against_frustum(levels):
+    cam = np.array([30.0, 30.0, 70.0])
+    planes = frustum_planes_from_corners(
+        _box_corners((10.0, 20.0, 30.0), (40.0, 50.0, 64.0))
+    )
+    full = select_levels_sse(levels, BLOCK_SIZE, cam, 100.0, 10**6)
+    culled = select_levels_sse(
+        levels, BLOCK_SIZE, cam, 100.0, 10**6, frustum_planes=planes
+    )
+    expected, _ = bricks_in_frustum_arr(
+        full,
+        BLOCK_SIZE,
+        planes,
+        level_scale_arr_shader=np.stack(SCALES),
+        level_translation_arr_shader=np.stack(TRANSLATIONS),
+    )
+    assert _rows(culled) == _rows(expected)
+
+
+def _visual(lod_strategy: str, gpu_budget_bytes: int = 1 * 1024**3):
+    from uuid import uuid4
+
+    from cellier.render.visuals._image import GFXMultiscaleImageVisual
+    from cellier.transform import AffineTransform
+    from cellier.visuals import (
+        MultiscaleImageAppearance,
+        MultiscaleImageRenderConfig,
+        MultiscaleImageVisual,
+    )
+
+    model = MultiscaleImageVisual(
+        name="vol",
+        data_store_id=str(uuid4()),
+        level_transforms=[
+            AffineTransform.identity(ndim=3),
+            AffineTransform.from_scale_and_translation((2.0, 2.0, 2.0), (0.0,) * 3),
+        ],
+        appearance=MultiscaleImageAppearance(color_map="grays", clim=(0.0, 1.0)),
+        render_config=MultiscaleImageRenderConfig(
+            block_size=8,
+            gpu_budget_bytes=gpu_budget_bytes,
+            lod_strategy=lod_strategy,
+        ),
+    )
+    return GFXMultiscaleImageVisual.from_cellier_model(
+        model=model,
+        level_shapes=[(64, 64, 64), (32, 32, 32)],
+        render_modes={"3d"},
+        displayed_axes=(0, 1, 2),
+    )
+
+
+def test_plan_bricks_octree_strategy_culls_without_level_grids():
+    visual = _visual("octree")
+    corners = _box_corners((0.0, 0.0, 0.0), (7.0, 7.0, 7.0))
+    args = (np.array([3.0, 3.0, 8.0]), corners, 1.0, 2000.0, 1.0, None)
+
+    arr = visual._plan_bricks(*args)
+
+    # Close to the camera and inside a 7^3 box: one finest-level brick.
+    np.testing.assert_array_equal(arr, [[1, 0, 0, 0]])
+    # The per-brick grids were never needed.
+    assert visual._volume_geometry._level_grids_cache is None
+
+
+def test_plan_bricks_screen_space_error_fills_budget_without_holes(caplog):
+    # A 5^3 slot grid: 124 usable slots, well below the 512 finest-level
+    # bricks the distance bands would ask for.
+    visual = _visual("screen_space_error", gpu_budget_bytes=216 * 14**3 * 4)
+    n_budget = visual._block_cache_3d.info.n_slots - 1
+    args = (np.array([4.0, 4.0, 70.0]), None, 1.0, 2000.0, 1.0, None)
+
+    with caplog.at_level("WARNING"):
+        arr = visual._plan_bricks(*args)
+
+    assert "budget_truncation" not in caplog.text
+    assert n_budget - 7 < len(arr) <= n_budget
+    assert set(np.unique(arr[:, 0])) == {1, 2}
+    volume = sum(8 ** (int(level) - 1) for level in arr[:, 0])
+    assert volume == 8**3  # covered exactly, in level-1 brick units
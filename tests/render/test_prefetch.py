@@ -0,0 +1,362 @@
+"""Tests for camera-motion prediction, prefetch, and in-flight read reuse."""
+
+from __future__ import annotations
+
+from uuid import uuid4
+
+import numpy as np
+
+from cellier._state import AxisAlignedSelectionState
+from cellier.data.image import ChunkRequest
+from cellier.render._config import CameraConfig, SlicePrefetchConfig
+from cellier.render._host_brick_cache import HostBrickCache
+from cellier.render._prefetch import CameraMotionPredictor, neighbour_slice_states
+from cellier.render._requests import DimsState, ReslicingRequest
+from cellier.render.scene_manager import SceneManager
+from cellier.render.slice_coordinator import SliceCoordinator
+from cellier.render.visuals._image import GFXMultiscaleImageVisual
+from cellier.transform import AffineTransform
+from cellier.visuals import MultiscaleImageAppearance, MultiscaleImageVisual
+
+
+def _request(
+    pos: tuple[float, float, float],
+    extent: tuple[float, float] = (0.0, 0.0),
+    camera_type: str = "perspective",
+) -> ReslicingRequest:
+    return ReslicingRequest(
+        camera_type=camera_type,
+        camera_pos=np.array(pos, dtype=np.float64),
+        frustum_corners=np.zeros((2, 4, 3), dtype=np.float64) + np.array(pos),
+        fov_y_rad=1.0,
+        screen_size_px=(800.0, 600.0),
+        world_extent=extent,
+        dims_state=DimsState(
+            axis_labels=("z", "y", "x"),
+            selection=AxisAlignedSelectionState(
+                displayed_axes=(0, 1, 2), slice_indices={}
+            ),
+        ),
+        request_id=uuid4(),
+        scene_id=uuid4(),
+        canvas_id=uuid4(),
+        target_visual_ids=None,
+    )
+
+
+def _predictor(**kwargs) -> CameraMotionPredictor:
+    cfg = {"prefetch_lookahead_s": 0.5, "prefetch_interval_s": 0.1}
+    cfg.update(kwargs)
+    return CameraMotionPredictor(CameraConfig(**cfg))
+
+
+def test_camera_prefetch_is_opt_in():
+    assert not CameraConfig().prefetch_enabled
+
+
+def test_predictor_extrapolates_position_and_frustum():
+    predictor = _predictor()
+    assert predictor.update(_request((0.0, 0.0, 0.0)), t=0.0) is None
+
+    predicted = predictor.update(_request((10.0, 0.0, 0.0)), t=0.1)
+
+    # 100 units/s for 0.5 s ahead of the latest sample.
+    np.testing.assert_allclose(predicted.camera_pos, [60.0, 0.0, 0.0])
+    np.testing.assert_allclose(predicted.frustum_corners[..., 0], 60.0)
+
+
+def test_predictor_extrapolates_zoom_geometrically():
+    predictor = _predictor(prefetch_lookahead_s=0.2)
+    predictor.update(_request((0, 0, 0), (100.0, 50.0), "orthographic"), t=0.0)
+
+    predicted = predictor.update(
+        _request((0, 0, 0), (50.0, 25.0), "orthographic"), t=0.1
+    )
+
+    np.testing.assert_allclose(predicted.world_extent, (12.5, 6.25))
+
+
+def test_predictor_rate_limits_and_ignores_stale_or_still_samples():
+    predictor = _predictor(settle_threshold_s=0.3)
+    predictor.update(_request((0.0, 0.0, 0.0)), t=0.0)
+    # Too soon: ignored, and the baseline sample is kept.
+    assert predictor.update(_request((5.0, 0.0, 0.0)), t=0.05) is None
+    # Stationary camera: no prediction.
+    assert predictor.update(_request((0.0, 0.0, 0.0)), t=0.2) is None
+    # Gap longer than the settle threshold starts a new gesture.
+    assert predictor.update(_request((9.0, 0.0, 0.0)), t=1.0) is None
+    assert predictor.update(_request((10.0, 0.0, 0.0)), t=1.1) is not None
+
+
+class _RecordingSlicer:
+    def __init__(self, host_cache: HostBrickCache) -> None:
+        self.host_cache = host_cache
+        self.submitted: list[tuple[list[ChunkRequest], tuple]] = []
+        self.cancelled: list = []
+
+    def submit(self, requests, fetch_fn, callback, priority=(), **kwargs):
+        if not requests:
+            return None
+        self.submitted.append((requests, priority))
+        return uuid4()
+
+    def cancel(self, slice_request_id) -> bool:
+        self.cancelled.append(slice_request_id)
+        return True
+
+
+def test_coordinator_prefetch_skips_cached_chunks_and_runs_last():
+    from unittest.mock import MagicMock
+
+    cache = HostBrickCache(budget_bytes=1 << 20)
+    slicer = _RecordingSlicer(cache)
+    request = _request((0.0, 0.0, 0.0))
+    sm = SceneManager(scene_id=request.scene_id)
+    store = MagicMock(host_cacheable=True, supports_batch_read=False)
+    chunks = [
+        ChunkRequest(
+            chunk_request_id=uuid4(),
+            slice_request_id=uuid4(),
+            scale_index=0,
+            axis_selections=((i, i + 1), (0, 1), (0, 1)),
+        )
+        for i in range(3)
+    ]
+    visual = MagicMock(visual_model_id=uuid4(), render_modes={"3d"})
+    visual.build_prefetch_request.return_value = chunks
+    sm.add_visual(visual, (0, 1, 2))
+    coordinator = SliceCoordinator(
+        scenes={request.scene_id: sm},
+        slicer=slicer,
+        data_stores={visual.visual_model_id: store},
+    )
+    cache.put(cache.make_key(store.id, chunks[0]), np.zeros(1))
+
+    assert coordinator.prefetch(request, {}) == 2
+    assert slicer.submitted[0][0] == chunks[1:]
+    assert slicer.submitted[0][1][0] > 0
+    visual.build_slice_request.assert_not_called()
+
+    # A new prediction for the same canvas supersedes the previous one.
+    coordinator.prefetch(request, {})
+    assert len(slicer.cancelled) == 1
+
+
+def _multiscale_visual(displayed_axes) -> GFXMultiscaleImageVisual:
+    model = MultiscaleImageVisual(
+        name="img",
+        data_store_id=str(uuid4()),
+        level_transforms=[
+            AffineTransform.identity(ndim=3),
+            AffineTransform.from_scale_and_translation(
+                (2.0, 2.0, 2.0), (0.5, 0.5, 0.5)
+            ),
+        ],
+        appearance=MultiscaleImageAppearance(color_map="grays", clim=(0.0, 255.0)),
+    )
+    return GFXMultiscaleImageVisual.from_cellier_model(
+        model=model,
+        level_shapes=[(64, 64, 64), (32, 32, 32)],
+        render_modes={"2d", "3d"},
+        displayed_axes=displayed_axes,
+    )
+
+
+def test_visual_prefetch_plans_like_reslice_without_staging_3d():
+    visual = _multiscale_visual((0, 1, 2))
+    kwargs = {
+        "camera_pos_world": np.array([32.0, 32.0, 200.0]),
+        "frustum_corners_world": None,
+        "fov_y_rad": 1.0,
+        "screen_height_px": 600.0,
+        "dims_state": _request((0, 0, 0)).dims_state,
+    }
+    n_free = len(visual._block_cache_3d.tile_manager.free_slots)
+
+    prefetch = visual.build_prefetch_request(**kwargs)
+    assert prefetch
+    assert len(visual._block_cache_3d.tile_manager.free_slots) == n_free
+    assert visual._pending_slot_map == {}
+
+    real = visual.build_slice_request(**kwargs)
+    assert [r.axis_selections for r in prefetch] == [r.axis_selections for r in real]
+    # Everything is now loading, so there is nothing left to prefetch.
+    assert visual.build_prefetch_request(**kwargs) == []
+
+
+def test_visual_replan_keeps_chunk_ids_of_in_flight_bricks():
+    visual = _multiscale_visual((0, 1, 2))
+    kwargs = {
+        "camera_pos_world": np.array([32.0, 32.0, 200.0]),
+        "frustum_corners_world": None,
+        "fov_y_rad": 1.0,
+        "screen_height_px": 600.0,
+        "dims_state": _request((0, 0, 0)).dims_state,
+    }
+    first = visual.build_slice_request(**kwargs)
+    slots = dict(visual._pending_slot_map)
+
+    again = visual.build_slice_request(**kwargs)
+
+    assert [r.chunk_request_id for r in again] == [r.chunk_request_id for r in first]
+    assert again[0].slice_request_id != first[0].slice_request_id
+    assert visual._pending_slot_map == slots
+    assert visual._last_plan_stats["adopted"] == len(first)
+    assert visual._last_plan_stats["misses"] == 0
+
+
+def test_visual_prefetch_plans_like_reslice_without_staging_2d():
+    visual = _multiscale_visual((1, 2))
+    dims_state = DimsState(
+        axis_labels=("z", "y", "x"),
+        selection=AxisAlignedSelectionState(
+            displayed_axes=(1, 2), slice_indices={0: 10}
+        ),
+    )
+    kwargs = {
+        "camera_pos_world": np.array([32.0, 32.0, 0.0]),
+        "viewport_width_px": 800.0,
+        "world_width": 64.0,
+        "view_min_world": np.array([0.0, 0.0]),
+        "view_max_world": np.array([64.0, 64.0]),
+        "dims_state": dims_state,
+    }
+
+    prefetch = visual.build_prefetch_request_2d(**kwargs)
+    assert prefetch
+    assert visual._current_viewport_cells is None
+    assert visual._pending_slot_map_2d == {}
+
+    real = visual.build_slice_request_2d(**kwargs)
+    assert [r.axis_selections for r in prefetch] == [r.axis_selections for r in real]
+
+
+def test_visual_returning_to_a_previous_slice_needs_no_reads_2d():
+    visual = _multiscale_visual((1, 2))
+
+    def _plan(z: int) -> list[ChunkRequest]:
+        return visual.build_slice_request_2d(
+            camera_pos_world=np.array([32.0, 32.0, 0.0]),
+            viewport_width_px=800.0,
+            world_width=64.0,
+            view_min_world=np.array([0.0, 0.0]),
+            view_max_world=np.array([64.0, 64.0]),
+            dims_state=DimsState(
+                axis_labels=("z", "y", "x"),
+                selection=AxisAlignedSelectionState(
+                    displayed_axes=(1, 2), slice_indices={0: z}
+                ),
+            ),
+        )
+
+    def _load(requests: list[ChunkRequest]) -> None:
+        pbs = visual._block_cache_2d.info.padded_block_size
+        visual.on_data_ready_2d(
+            [(r, np.zeros((pbs, pbs), dtype=np.float32)) for r in requests]
+        )
+
+    first = _plan(10)
+    assert first
+    _load(first)
+    visual.invalidate_2d_cache()
+    _load(_plan(11))
+
+    visual.invalidate_2d_cache()
+    assert _plan(10) == []
+    assert visual._last_plan_stats["hits"] == len(first)
+    resident = visual._block_cache_2d.tile_manager.tilemap
+    assert {key.slice_coord for key in resident} == {((0, 10),)}
+
+
+def _dims_2d(slice_indices: dict[int, int]) -> DimsState:
+    return DimsState(
+        axis_labels=("t", "z", "y", "x"),
+        selection=AxisAlignedSelectionState(
+            displayed_axes=(2, 3), slice_indices=slice_indices
+        ),
+    )
+
+
+def test_neighbour_slice_states_nearest_first_with_axis_radius():
+    config = SlicePrefetchConfig(default_radius=1, axis_radius={"t": 2})
+
+    states = neighbour_slice_states(_dims_2d({0: 0, 1: 5}), config)
+
+    # t=-1 is skipped; distance 2 only exists along t.
+    assert [s.selection.slice_indices for s in states] == [
+        {0: 1, 1: 5},
+        {0: 0, 1: 6},
+        {0: 0, 1: 4},
+        {0: 2, 1: 5},
+    ]
+    assert (
+        neighbour_slice_states(
+            _dims_2d({0: 0, 1: 5}), SlicePrefetchConfig(default_radius=0)
+        )
+        == []
+    )
+
+
+def test_neighbour_slice_states_stop_at_the_axis_extent():
+    config = SlicePrefetchConfig(default_radius=2)
+
+    states = neighbour_slice_states(_dims_2d({0: 0, 1: 9}), config, {0: 1, 1: 10})
+
+    # t has a single position; z=10 and z=11 are past the last slice.
+    assert [s.selection.slice_indices for s in states] == [
+        {0: 0, 1: 8},
+        {0: 0, 1: 7},
+    ]
+
+
+def test_coordinator_prefetch_slices_dedups_and_respects_budget():
+    from unittest.mock import MagicMock
+
+    cache = HostBrickCache(budget_bytes=1 << 20)
+    slicer = _RecordingSlicer(cache)
+    request = _request((0.0, 0.0, 0.0), (64.0, 64.0), "orthographic")._replace(
+        dims_state=_dims_2d({0: 0, 1: 5})
+    )
+    sm = SceneManager(scene_id=request.scene_id)
+    store = MagicMock(host_cacheable=True, supports_batch_read=False)
+
+    def _plan(dims_state, **kwargs):
+        # Two 8x8 tiles per slice; z < 4 clamps onto z=4 like a store edge.
+        z = max(dims_state.selection.slice_indices[1], 4)
+        return [
+            ChunkRequest(
+                chunk_request_id=uuid4(),
+                slice_request_id=uuid4(),
+                scale_index=0,
+                axis_selections=(0, z, y, (0, 8)),
+            )
+            for y in ((0, 8), (8, 16))
+        ]
+
+    visual = MagicMock(visual_model_id=uuid4(), render_modes={"2d"})
+    visual.build_prefetch_request_2d.side_effect = _plan
+    sm.add_visual(visual, (2, 3))
+    coordinator = SliceCoordinator(
+        scenes={request.scene_id: sm},
+        slicer=slicer,
+        data_stores={visual.visual_model_id: store},
+    )
+    cache.put(cache.make_key(store.id, _plan(_dims_2d({0: 0, 1: 6}))[0]), np.zeros(1))
+    config = SlicePrefetchConfig(default_radius=0, axis_radius={"z": 2})
+
+    # z=6 (one tile cached), z=4, z=7; z=3 duplicates z=4.
+    assert coordinator.prefetch_slices(request, config, {}) == 5
+    submitted, priority = slicer.submitted[0]
+    assert [r.axis_selections[1:3] for r in submitted] == [
+        (6, (8, 16)),
+        (4, (0, 8)),
+        (4, (8, 16)),
+        (7, (0, 8)),
+        (7, (8, 16)),
+    ]
+    assert priority[0] > 0
+
+    # The budget trims the farthest slices; the earlier task is replaced.
+    config.budget_bytes = 3 * 8 * 8 * 4
+    assert coordinator.prefetch_slices(request, config, {}) == 3
+    assert len(slicer.cancelled) == 1
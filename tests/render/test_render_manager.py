@@ -62,6 +62,7 @@ def _make_mock_visual(visual_id: UUID | None = None) -> MagicMock:
     visual.node_3d = MagicMock()
     visual.node_2d = None
     visual.render_modes = {"3d"}
+    visual.reuses_in_flight = False
     visual._volume_geometry.n_levels = 3
     visual.build_slice_request.return_value = []
     return visual
@@ -73,7 +74,10 @@ class _StubSlicer:
     def __init__(self) -> None:
         self.submitted: list[tuple[list[ChunkRequest], str | None]] = []
         self.cancelled: list[UUID] = []
+        self.detached: list[UUID] = []
+        self.adopted: list[dict | None] = []
         self.on_complete_callbacks: list = []
+        self.priorities: list[tuple[int, ...]] = []
         self._next_id = 0
 
     def submit(
@@ -83,10 +87,16 @@ class _StubSlicer:
         callback,
         consumer_id=None,
         on_complete=None,
+        cache_namespace=None,
+        priority=(),
+        batch_fetch_fn=None,
+        adopt=None,
     ) -> UUID | None:
         if not requests:
             return None
+        self.adopted.append(adopt)
         self.submitted.append((requests, consumer_id))
+        self.priorities.append(priority)
         self.on_complete_callbacks.append(on_complete)
         result = uuid4()
         return result
@@ -97,6 +107,15 @@ class _StubSlicer:
             return True
         return False
 
+    def detach(self, slice_request_id) -> dict:
+        if slice_request_id is None:
+            return {}
+        self.detached.append(slice_request_id)
+        return {slice_request_id: "read"}
+
+    def cancel_reads(self, reads) -> None:
+        self.cancelled.extend(reads)
+
 
 # ---------------------------------------------------------------------------
 # DimsState and ReslicingRequest
@@ -316,6 +335,56 @@ def test_slice_coordinator_second_submit_cancels_first() -> None:
     assert len(stub_slicer.cancelled) == 1
 
 
+def test_slice_coordinator_detaches_visuals_that_reuse_reads() -> None:
+    """Replans hand a reusing visual's running reads to the new submission."""
+    coordinator, stub_slicer, _sm, visuals, scene_id, canvas_id = (
+        _make_coordinator_with_scene()
+    )
+    visual = visuals[0]
+    visual.reuses_in_flight = True
+    visual.render_modes = {"2d", "3d"}
+
+    coordinator.submit(
+        _make_reslicing_request(scene_id=scene_id, canvas_id=canvas_id), {}
+    )
+    coordinator.submit(
+        _make_reslicing_request(scene_id=scene_id, canvas_id=canvas_id), {}
+    )
+
+    first_id = stub_slicer.detached[0]
+    assert stub_slicer.cancelled == []
+    assert stub_slicer.adopted[1] == {first_id: "read"}
+    # Only the other dimensionality's pending slots are released.
+    visual.cancel_pending.assert_not_called()
+    assert visual.cancel_pending_2d.call_count == 2
+
+    # A replan with nothing to load drops the reads and the slots.
+    visual.build_slice_request.return_value = []
+    coordinator.submit(
+        _make_reslicing_request(scene_id=scene_id, canvas_id=canvas_id), {}
+    )
+    assert stub_slicer.cancelled == [stub_slicer.detached[1]]
+    visual.cancel_pending.assert_called_once()
+
+
+def test_slice_coordinator_priority_prefers_focused_canvas() -> None:
+    """Reads from a non-focused canvas rank behind the focused canvas."""
+    coordinator, stub_slicer, _sm, visuals, scene_id, canvas_id = (
+        _make_coordinator_with_scene()
+    )
+    vid = visuals[0].visual_model_id
+    cfg = {vid: VisualRenderConfig(load_priority=2)}
+
+    coordinator.submit(_make_reslicing_request(scene_id=scene_id), cfg)
+    coordinator.focused_canvas_id = canvas_id
+    coordinator.submit(_make_reslicing_request(scene_id=scene_id), cfg)
+    coordinator.submit(
+        _make_reslicing_request(scene_id=scene_id, canvas_id=canvas_id), cfg
+    )
+
+    assert stub_slicer.priorities == [(0, 2, 0), (0, 2, 1), (0, 2, 0)]
+
+
 def test_slice_coordinator_cancel_visual_releases_pending() -> None:
     """cancel_visual must call visual.cancel_pending()."""
     coordinator, _stub_slicer, _sm, visuals, scene_id, canvas_id = (
@@ -423,6 +492,9 @@ def test_reslice_visual_only_targets_one_visual() -> None:
         def submit(self, req, visual_configs=None):
             captured_requests.append(req)
 
+        def prefetch_slices(self, req, config, visual_configs=None):
+            return 0
+
     rm._slice_coordinator = _CapturingCoordinator()
 
     canvas_mock = MagicMock()
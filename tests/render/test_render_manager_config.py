@@ -10,6 +10,7 @@ from cellier.render._config import (
     CameraConfig,
     RenderManagerConfig,
     SlicingConfig,
+    StorageConfig,
     TemporalAccumulationConfig,
 )
 
@@ -67,3 +68,70 @@ def test_alpha_must_be_in_range():
 def test_settle_threshold_must_be_positive():
     with pytest.raises(ValidationError):
         CameraConfig(settle_threshold_s=0.0)
+
+
+def test_host_cache_bytes_default_and_disable():
+    assert SlicingConfig().host_cache_bytes > 0
+    manager = RenderManager(
+        config=RenderManagerConfig(slicing=SlicingConfig(host_cache_bytes=0))
+    )
+    assert manager._slicer.host_cache.enabled is False
+
+
+def test_host_cache_bytes_must_be_non_negative():
+    with pytest.raises(ValidationError):
+        SlicingConfig(host_cache_bytes=-1)
+
+
+def test_max_in_flight_must_be_positive():
+    with pytest.raises(ValidationError):
+        SlicingConfig(max_in_flight=0)
+
+
+def test_adaptive_slicing_reports_tuned_values_without_touching_config():
+    config = RenderManagerConfig(
+        slicing=SlicingConfig(adaptive=True, batch_size=4, max_batch_size=16)
+    )
+    manager = RenderManager(config=config)
+    manager._slicer._tuner.batch_size = 12
+
+    assert manager.slicing_cadence == (12, 1)
+    assert manager.config.slicing.batch_size == 4
+    with pytest.raises(ValidationError):
+        SlicingConfig(render_overhead_fraction=1.0)
+
+
+def test_storage_config_context_spec():
+    assert StorageConfig().context_spec() == {"cache_pool": {"total_bytes_limit": 0}}
+    spec = StorageConfig(
+        cache_pool_bytes=1024,
+        file_io_concurrency=4,
+        request_concurrency=64,
+        max_retries=3,
+        retry_max_delay_s=10.0,
+    ).context_spec()
+
+    assert spec["cache_pool"] == {"total_bytes_limit": 1024}
+    assert spec["file_io_concurrency"] == {"limit": 4}
+    assert spec["s3_request_concurrency"] == {"limit": 64}
+    assert spec["gcs_request_retries"] == {"max_retries": 3, "max_delay": "10.0s"}
+    assert "data_copy_concurrency" not in spec
+
+
+def test_async_slicer_defaults_match_slicing_config():
+    import inspect
+
+    from cellier.slicer import AsyncSlicer
+
+    params = inspect.signature(AsyncSlicer).parameters
+    config = SlicingConfig()
+    for name in (
+        "batch_size",
+        "render_every",
+        "max_in_flight",
+        "adaptive",
+        "max_batch_size",
+        "max_render_every",
+        "render_overhead_fraction",
+    ):
+        assert params[name].default == getattr(config, name), name
@@ -0,0 +1,326 @@
+"""Tests for the global priority scheduler inside AsyncSlicer."""
+
+from __future__ import annotations
+
+import asyncio
+from uuid import uuid4
+
+import numpy as np
+
+from cellier.data.image import ChunkRequest
+from cellier.slicer import AsyncSlicer, _BatchTuner, _FetchScheduler
+
+
+def _requests(n: int, scale_index: int = 0) -> list[ChunkRequest]:
+    slice_id = uuid4()
+    return [
+        ChunkRequest(
+            chunk_request_id=uuid4(),
+            slice_request_id=slice_id,
+            scale_index=scale_index,
+            axis_selections=((i, i + 1),),
+        )
+        for i in range(n)
+    ]
+
+
+async def test_scheduler_wakes_waiters_in_priority_order():
+    scheduler = _FetchScheduler(max_in_flight=1)
+    await scheduler.acquire((0,))
+    order: list[int] = []
+
+    async def waiter(p: int) -> None:
+        await scheduler.acquire((p,))
+        order.append(p)
+        scheduler.release()
+
+    tasks = [asyncio.ensure_future(waiter(p)) for p in (3, 1, 2)]
+    await asyncio.sleep(0)
+    scheduler.release()
+    await asyncio.gather(*tasks)
+
+    assert order == [1, 2, 3]
+    assert scheduler.in_flight == 0
+
+
+async def test_scheduler_cancelled_waiter_does_not_leak_slot():
+    scheduler = _FetchScheduler(max_in_flight=1)
+    await scheduler.acquire(())
+    task = asyncio.ensure_future(scheduler.acquire(()))
+    await asyncio.sleep(0)
+    task.cancel()
+    await asyncio.sleep(0)
+    scheduler.release()
+
+    assert scheduler.in_flight == 0
+    assert scheduler.n_waiting == 0
+
+
+async def test_scheduler_weighted_acquire_waits_for_enough_slots():
+    scheduler = _FetchScheduler(max_in_flight=4)
+    await scheduler.acquire((0,), n=3)
+    task = asyncio.ensure_future(scheduler.acquire((1,), n=3))
+    await asyncio.sleep(0)
+    assert not task.done()
+
+    scheduler.release(3)
+    assert await task == 3
+    # Oversized requests are clamped so they can still be admitted.
+    scheduler.release(3)
+    assert await scheduler.acquire((0,), n=10) == 4
+    scheduler.release(4)
+    assert scheduler.in_flight == 0
+
+
+async def test_slicer_caps_in_flight_and_orders_by_priority():
+    slicer = AsyncSlicer(batch_size=4, max_in_flight=2)
+    running = 0
+    peak = 0
+    started: list[str] = []
+
+    def make_fetch(label: str):
+        async def fetch(req: ChunkRequest) -> np.ndarray:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            started.append(label)
+            await asyncio.sleep(0)
+            running -= 1
+            return np.zeros(1, dtype=np.float32)
+
+        return fetch
+
+    # Background canvas submits first but must not starve the focused one.
+    slicer.submit(_requests(4), make_fetch("bg"), lambda b: None, priority=(0, 1))
+    slicer.submit(_requests(4), make_fetch("fg"), lambda b: None, priority=(0, 0))
+    await asyncio.gather(*slicer._tasks.values())
+
+    assert peak == 2
+    # First two reads grab free slots immediately; every queued read after
+    # that goes to the higher-priority submission first.
+    assert started[2:6] == ["fg"] * 4
+
+
+async def test_slicer_equal_priority_round_robin_and_coarse_first():
+    slicer = AsyncSlicer(batch_size=4, max_in_flight=1)
+    started: list[tuple[str, int]] = []
+
+    def make_fetch(label: str):
+        async def fetch(req: ChunkRequest) -> np.ndarray:
+            started.append((label, req.scale_index))
+            await asyncio.sleep(0)
+            return np.zeros(1, dtype=np.float32)
+
+        return fetch
+
+    slicer.submit(_requests(2, scale_index=0), make_fetch("a"), lambda b: None)
+    slicer.submit(_requests(2, scale_index=0), make_fetch("b"), lambda b: None)
+    slicer.submit(_requests(1, scale_index=2), make_fetch("c"), lambda b: None)
+    await asyncio.gather(*slicer._tasks.values())
+
+    # "a" takes the free slot; coarse "c" jumps the queue; then a/b alternate.
+    assert [label for label, _ in started] == ["a", "c", "b", "a", "b"]
+
+
+async def test_slicer_batch_fetch_reads_misses_in_one_call():
+    from cellier.render._host_brick_cache import HostBrickCache
+
+    cache = HostBrickCache(budget_bytes=1 << 20)
+    slicer = AsyncSlicer(batch_size=4, max_in_flight=2, host_cache=cache)
+    requests = _requests(4)
+    cache.put(cache.make_key("ns", requests[1]), np.full(1, 7.0, np.float32))
+    calls: list[int] = []
+
+    async def fetch(req: ChunkRequest) -> np.ndarray:
+        raise AssertionError("per-request fetch_fn must not be used")
+
+    async def fetch_batch(reqs) -> list[np.ndarray]:
+        calls.append(len(reqs))
+        # Weighted acquire is clamped to max_in_flight.
+        assert slicer._scheduler.in_flight == 2
+        return [np.full(1, req.axis_selections[0][0], np.float32) for req in reqs]
+
+    received: list[tuple[ChunkRequest, np.ndarray]] = []
+    slicer.submit(
+        requests,
+        fetch,
+        received.extend,
+        cache_namespace="ns",
+        batch_fetch_fn=fetch_batch,
+    )
+    await asyncio.gather(*slicer._tasks.values())
+
+    assert calls == [3]
+    assert [float(d[0]) for _, d in received] == [0.0, 7.0, 2.0, 3.0]
+    assert cache.make_key("ns", requests[3]) in cache
+    assert slicer._scheduler.in_flight == 0
+
+
+def _adopting(old: list[ChunkRequest], keep: list[int], n_new: int):
+    """A replan keeping ``old[keep]`` (same chunk ids) plus new requests."""
+    slice_id = uuid4()
+    kept = [old[i]._replace(slice_request_id=slice_id) for i in keep]
+    return kept + [r._replace(slice_request_id=slice_id) for r in _requests(n_new)]
+
+
+async def test_slicer_detach_hands_running_reads_to_next_submit():
+    slicer = AsyncSlicer(batch_size=4, max_in_flight=4)
+    gate = asyncio.Event()
+    started: list[int] = []
+    cancelled: list[int] = []
+
+    async def fetch(req: ChunkRequest) -> np.ndarray:
+        started.append(req.axis_selections[0][0])
+        try:
+            await gate.wait()
+        except asyncio.CancelledError:
+            cancelled.append(req.axis_selections[0][0])
+            raise
+        return np.full(1, req.axis_selections[0][0], np.float32)
+
+    old = _requests(3)
+    stale: list = []
+    old_id = slicer.submit(old, fetch, stale.extend)
+    for _ in range(3):
+        await asyncio.sleep(0)
+    reads = slicer.detach(old_id)
+    assert len(reads) == 3
+
+    new = _adopting(old, keep=[2, 0], n_new=1)
+    received: list[tuple[ChunkRequest, np.ndarray]] = []
+    slicer.submit(new, fetch, received.extend, adopt=reads)
+    await asyncio.sleep(0)
+    gate.set()
+    await asyncio.gather(*slicer._tasks.values())
+
+    # old[1] is no longer needed; the kept reads are not issued again.
+    assert cancelled == [1]
+    assert started == [0, 1, 2, 0]
+    assert [float(d[0]) for _, d in received] == [2.0, 0.0, 0.0]
+    assert stale == []
+    assert slicer._scheduler.in_flight == 0
+
+
+async def test_slicer_partially_adopted_batch_read_is_reissued():
+    slicer = AsyncSlicer(batch_size=4, max_in_flight=4)
+    gate = asyncio.Event()
+    calls: list[int] = []
+
+    async def fetch(req: ChunkRequest) -> np.ndarray:
+        raise AssertionError("per-request fetch_fn must not be used")
+
+    async def fetch_batch(reqs) -> list[np.ndarray]:
+        calls.append(len(reqs))
+        await gate.wait()
+        return [np.full(1, req.axis_selections[0][0], np.float32) for req in reqs]
+
+    old = _requests(2)
+    old_id = slicer.submit(old, fetch, lambda b: None, batch_fetch_fn=fetch_batch)
+    for _ in range(3):
+        await asyncio.sleep(0)
+    reads = slicer.detach(old_id)
+    (shared,) = {future for future, _ in reads.values()}
+
+    # The shared read would also fill old[1]'s destination, so it is
+    # cancelled and old[0] is read again with the new request.
+    new = _adopting(old, keep=[0], n_new=1)
+    received: list = []
+    slicer.submit(new, fetch, received.extend, batch_fetch_fn=fetch_batch, adopt=reads)
+    await asyncio.sleep(0)
+    gate.set()
+    await asyncio.gather(*slicer._tasks.values())
+
+    assert shared.cancelled()
+    assert calls == [2, 2]
+    assert len(received) == 2
+
+
+def test_batch_tuner_grows_while_throughput_scales_and_halves_when_saturated():
+    tuner = _BatchTuner(
+        batch_size=8,
+        render_every=1,
+        max_batch_size=64,
+        max_render_every=8,
+        render_overhead_fraction=0.25,
+    )
+    # Unsaturated storage: latency is flat, so throughput grows with size.
+    for _ in range(4):
+        tuner.record_batch(tuner.batch_size, 10.0)
+    assert tuner.batch_size == 16
+
+    # Saturated: the latency grew with the size, throughput did not.
+    tuner.record_batch(tuner.batch_size, 16.0)
+    assert tuner.batch_size == 8
+
+
+def test_batch_tuner_spaces_redraws_to_meet_overhead_target():
+    tuner = _BatchTuner(
+        batch_size=8,
+        render_every=2,
+        max_batch_size=64,
+        max_render_every=3,
+        render_overhead_fraction=0.25,
+    )
+    for _ in range(3):
+        tuner.record_render(render_ms=50.0, loading_ms=50.0)
+    assert tuner.render_every == 3
+
+    tuner.record_render(render_ms=1.0, loading_ms=99.0)
+    assert tuner.render_every == 2
+
+
+async def test_adaptive_slicer_retunes_batch_size_mid_task():
+    slicer = AsyncSlicer(batch_size=2, adaptive=True, max_batch_size=4)
+    sizes: list[int] = []
+
+    async def fetch(req: ChunkRequest) -> np.ndarray:
+        return np.zeros(1, dtype=np.float32)
+
+    slicer._tuner.record_batch = lambda n, ms: setattr(slicer._tuner, "batch_size", 4)
+    done: list[bool] = []
+    slicer.submit(
+        _requests(10),
+        fetch,
+        lambda batch: sizes.append(len(batch)),
+        on_complete=lambda: done.append(True),
+    )
+    await asyncio.gather(*slicer._tasks.values())
+
+    assert sizes == [2, 4, 4]
+    assert done == [True]
+    assert slicer.batch_size == 4
+
+
+def test_adaptive_slicer_caps_max_batch_size_at_max_in_flight():
+    slicer = AsyncSlicer(adaptive=True, max_batch_size=64, max_in_flight=8)
+
+    assert slicer._tuner._max_batch_size == 8
+
+
+async def test_adaptive_slicer_times_store_reads_only():
+    from cellier.render._host_brick_cache import HostBrickCache
+
+    cache = HostBrickCache(budget_bytes=1 << 20)
+    slicer = AsyncSlicer(batch_size=2, max_in_flight=2, adaptive=True, host_cache=cache)
+    requests = _requests(4)
+    cache.put(cache.make_key("ns", requests[3]), np.zeros(1, np.float32))
+    recorded: list[tuple[int, float]] = []
+    slicer._tuner.record_batch = lambda n, ms: recorded.append((n, ms))
+
+    async def fetch(req: ChunkRequest) -> np.ndarray:
+        await asyncio.sleep(0.01)
+        return np.zeros(1, dtype=np.float32)
+
+    # Hold the scheduler so the first batch queues before reading.
+    await slicer._scheduler.acquire((), 2)
+    slicer.submit(requests, fetch, lambda batch: None, cache_namespace="ns")
+    await asyncio.sleep(0.05)
+    slicer._scheduler.release(2)
+    await asyncio.gather(*slicer._tasks.values())
+
+    # The second batch holds a cache hit and is not measured.
+    assert len(recorded) == 1
+    n, ms = recorded[0]
+    assert n == 2
+    assert ms < 45.0
+    assert slicer._read_spans == {}
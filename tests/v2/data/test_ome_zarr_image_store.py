@@ -15,6 +15,7 @@ if TYPE_CHECKING:
 from cellier.data.image._axis_info import AxisInfo
 from cellier.data.image._image_requests import ChunkRequest
 from cellier.data.image._ome_zarr_image_store import OMEZarrImageDataStore
+from cellier.data.image._padded_read import read_padded_into
 
 # ---------------------------------------------------------------------------
 # Synthetic OME-Zarr v0.5 fixture
@@ -64,22 +65,24 @@ _DATASETS = [
 ]
 
 
-def _write_zarr3_array(path: pathlib.Path, shape: tuple[int, ...]) -> None:
-    """Write a minimal zarr v3 array with float32 data filled with 1s."""
+def _write_zarr3_array(
+    path: pathlib.Path, shape: tuple[int, ...], dtype: str = "float32"
+) -> None:
+    """Write a minimal zarr v3 array filled with 1s."""
     import zarr
 
     store = zarr.storage.LocalStore(str(path))
     arr = zarr.create(
         store=store,
         shape=shape,
-        dtype="float32",
+        dtype=dtype,
         chunks=tuple(min(s, 16) for s in shape),
         zarr_format=3,
     )
-    arr[...] = np.ones(shape, dtype=np.float32)
+    arr[...] = np.ones(shape, dtype=dtype)
 
 
-def _write_synthetic_ome_zarr(root: pathlib.Path) -> None:
+def _write_synthetic_ome_zarr(root: pathlib.Path, dtype: str = "float32") -> None:
     """Build a minimal 5D OME-Zarr v0.5 store on disk."""
     root.mkdir(parents=True, exist_ok=True)
 
@@ -105,7 +108,7 @@ def _write_synthetic_ome_zarr(root: pathlib.Path) -> None:
 
     # Write each level as a zarr v3 array.
     for ds, shape in zip(_DATASETS, _LEVEL_SHAPES):
-        _write_zarr3_array(root / ds["path"], shape)
+        _write_zarr3_array(root / ds["path"], shape, dtype)
 
 
 # ---------------------------------------------------------------------------
@@ -295,6 +298,53 @@ def test_serialisation_roundtrip(ome_zarr_5d: str) -> None:
     assert restored.level_shapes == store.level_shapes
 
 
+# ---------------------------------------------------------------------------
+# Tests: shared tensorstore context
+# ---------------------------------------------------------------------------
+
+
+async def test_render_manager_opens_store_in_configured_context(
+    ome_zarr_5d: str,
+) -> None:
+    from unittest.mock import MagicMock
+
+    import pygfx as gfx
+
+    from cellier.render import RenderManager, RenderManagerConfig, StorageConfig
+
+    # Stores created before the manager (e.g. deserialized) are not open yet.
+    store = OMEZarrImageDataStore.from_path(ome_zarr_5d)
+    assert store._ts_handles == []
+    manager = RenderManager(
+        RenderManagerConfig(storage=StorageConfig(cache_pool_bytes=1 << 20))
+    )
+    limit = manager.ts_context["cache_pool"].to_json()
+    assert limit == {"total_bytes_limit": 1 << 20}
+
+    scene_id = uuid4()
+    manager.add_scene(scene_id)
+    visual = MagicMock(visual_model_id=uuid4())
+    visual.get_node_for_dims.return_value = gfx.Group()
+    manager.add_visual(scene_id, visual, store, (2, 3, 4))
+
+    assert store._ts_context is manager.ts_context
+    result = await store.get_data(_req(0, 0, 0, 5, (0, 32), (0, 32)))
+    np.testing.assert_array_equal(result, 1.0)
+
+
+def test_open_ts_stores_never_reopens_handles(ome_zarr_5d: str) -> None:
+    import tensorstore as ts
+
+    store = OMEZarrImageDataStore.from_path(ome_zarr_5d)
+    handles = store._ts_stores
+    context = store._ts_context
+
+    store.open_ts_stores(ts.Context())
+
+    assert store._ts_stores is handles
+    assert store._ts_context is context
+
+
 # ---------------------------------------------------------------------------
 # Tests: get_data
 # ---------------------------------------------------------------------------
@@ -321,6 +371,74 @@ async def test_get_data_2d_slice(ome_zarr_5d: str) -> None:
     np.testing.assert_array_equal(result, 1.0)
 
 
+async def test_read_padded_into_strided_out_zero_fills_halo(
+    ome_zarr_5d: str,
+) -> None:
+    """Reading into a strided view writes in place and zeroes only the halo."""
+    store = OMEZarrImageDataStore.from_path(ome_zarr_5d)
+    # z range extends 2 past the top of level 0 (16 planes).
+    req = _req(0, 0, 0, (-2, 6), (30, 38), (0, 8))
+    backing = np.full((12, 12, 12), -5.0, dtype=np.float32)
+    out = backing[2:10, 2:10, 2:10]
+
+    result = await read_padded_into(store._ts_stores[0], req.axis_selections, out)
+
+    assert result is out
+    np.testing.assert_array_equal(out[2:, :2, :], 1.0)
+    assert np.all(out[:2] == 0.0)
+    assert np.all(out[:, 2:, :] == 0.0)
+    # Memory outside the destination view is untouched.
+    assert np.all(backing[:2] == -5.0)
+
+
+async def test_reads_keep_native_dtype(tmp_path: pathlib.Path) -> None:
+    """uint8 data is read as uint8; a float32 destination receives a cast."""
+    store_path = tmp_path / "u8.ome.zarr"
+    _write_synthetic_ome_zarr(store_path, dtype="uint8")
+    store = OMEZarrImageDataStore.from_path(f"file://{store_path}")
+    req = _req(0, 0, 0, (-1, 3), (0, 4), (0, 4))
+
+    result = await store.get_data(req)
+    (batched,) = await store.get_data_batch([req])
+    out = await read_padded_into(
+        store._ts_stores[0], req.axis_selections, np.full((4, 4, 4), -1.0, np.float32)
+    )
+
+    assert store.read_dtype == np.uint8
+    assert result.dtype == batched.dtype == np.uint8
+    np.testing.assert_array_equal(result[0], 0)
+    np.testing.assert_array_equal(result[1:], 1)
+    np.testing.assert_array_equal(batched, result)
+    np.testing.assert_array_equal(out, result.astype(np.float32))
+
+
+async def test_get_data_batch_matches_get_data(ome_zarr_5d: str) -> None:
+    """Coalesced batch reads return exactly what per-brick reads return."""
+    import zarr
+
+    level0 = zarr.open_array(ome_zarr_5d.removeprefix("file://") + "/0", mode="r+")
+    level0[...] = np.arange(level0.size, dtype=np.float32).reshape(level0.shape)
+    store = OMEZarrImageDataStore.from_path(ome_zarr_5d)
+
+    requests = [
+        # Neighbouring padded bricks sharing chunks, incl. out-of-bounds halo.
+        _req(0, 0, 0, (-1, 9), (-1, 9), (-1, 9)),
+        _req(0, 0, 0, (-1, 9), (-1, 9), (7, 17)),
+        _req(0, 0, 0, (7, 17), (23, 33), (23, 33)),
+        _req(0, 1, 0, (-1, 9), (-1, 9), (-1, 9)),
+        # A 2D tile and a brick entirely outside the store.
+        _req(0, 0, 0, 5, (10, 20), (10, 20)),
+        _req(0, 0, 0, (40, 48), (0, 8), (0, 8)),
+    ]
+
+    results = await store.get_data_batch(requests)
+
+    for req, result in zip(requests, results):
+        expected = await store.get_data(req)
+        assert result.dtype == np.float32
+        np.testing.assert_array_equal(result, expected)
+
+
 # ---------------------------------------------------------------------------
 # Bf2Raw (bioformats2raw) multi-series container support
 # ---------------------------------------------------------------------------
@@ -6,6 +6,7 @@ All tests are headless — no Qt event loop, no GPU.
 from __future__ import annotations
 
 import asyncio
+from unittest.mock import MagicMock
 from uuid import uuid4
 
 import numpy as np
@@ -18,7 +19,8 @@ from cellier.data.lines._lines_memory_store import LinesMemoryStore
 from cellier.data.mesh._mesh_memory_store import MeshMemoryStore
 from cellier.data.points._points_memory_store import PointsMemoryStore
 from cellier.events._events import CameraChangedEvent, TransformChangedEvent
-from cellier.render._config import CameraConfig, RenderManagerConfig
+from cellier.render._config import CameraConfig, RenderManagerConfig, SlicingConfig
+from cellier.render._requests import ReslicingRequest
 from cellier.scene.dims import CoordinateSystem
 from cellier.transform import AffineTransform
 from cellier.viewer_model import ViewerModel
@@ -263,7 +265,9 @@ def test_reslice_scene_reads_appearance_fields(small_zarr_store):
     cs = _make_cs()
     scene = controller.add_scene(dim="3d", coordinate_system=cs, name="main")
     store = _make_store(small_zarr_store)
-    appearance = _make_appearance(lod_bias=2.5, force_level=1, frustum_cull=False)
+    appearance = _make_appearance(
+        lod_bias=2.5, force_level=1, frustum_cull=False, load_priority=3
+    )
     visual = controller.add_image_multiscale(
         data=store, scene_id=scene.id, appearance=appearance, name="vol"
     )
@@ -282,6 +286,91 @@ def test_reslice_scene_reads_appearance_fields(small_zarr_store):
     assert cfg.lod_bias == 2.5
     assert cfg.force_level == 1
     assert cfg.frustum_cull is False
+    assert cfg.load_priority == 3
+
+
+def test_reslice_visual_reads_load_priority(small_zarr_store):
+    controller = CellierController()
+    scene = controller.add_scene(dim="3d", coordinate_system=_make_cs(), name="main")
+    visual = controller.add_image_multiscale(
+        data=_make_store(small_zarr_store),
+        scene_id=scene.id,
+        appearance=_make_appearance(load_priority=2),
+        name="vol",
+    )
+    configs = []
+    controller._render_manager.reslice_visual = (
+        lambda vid, dims, cfg: configs.append(cfg)
+    )
+
+    controller.reslice_visual(visual.id)
+
+    assert [cfg.load_priority for cfg in configs] == [2]
+
+
+def _attach_fake_canvas(controller: CellierController, scene_id) -> None:
+    """Register a canvas stand-in whose camera looks down z at the volume."""
+    canvas_id = uuid4()
+
+    def _capture(dims_state, target_visual_ids=None) -> ReslicingRequest:
+        return ReslicingRequest(
+            camera_type="perspective",
+            camera_pos=np.array([4.0, 4.0, 40.0]),
+            frustum_corners=np.zeros((2, 4, 3)),
+            fov_y_rad=1.0,
+            screen_size_px=(400.0, 400.0),
+            world_extent=(0.0, 0.0),
+            dims_state=dims_state,
+            request_id=uuid4(),
+            scene_id=scene_id,
+            canvas_id=canvas_id,
+            target_visual_ids=target_visual_ids,
+        )
+
+    canvas = MagicMock()
+    canvas.capture_reslicing_request.side_effect = _capture
+    controller._render_manager._canvases[canvas_id] = canvas
+    controller._render_manager._canvas_to_scene[canvas_id] = scene_id
+
+
+async def test_load_priority_schedules_reads_first(small_zarr_store):
+    """A visual with a lower load_priority has its reads served first."""
+    # One read slot, so reads are served strictly in scheduling order.
+    controller = CellierController(
+        render_config=RenderManagerConfig(slicing=SlicingConfig(max_in_flight=1))
+    )
+    scene = controller.add_scene(dim="3d", coordinate_system=_make_cs(), name="main")
+    # Added first, so it would be served first at equal priority.
+    background = controller.add_image_multiscale(
+        data=_make_store(small_zarr_store),
+        scene_id=scene.id,
+        appearance=_make_appearance(load_priority=1, frustum_cull=False),
+        name="background",
+    )
+    focus = controller.add_image_multiscale(
+        data=_make_store(small_zarr_store),
+        scene_id=scene.id,
+        appearance=_make_appearance(load_priority=0, frustum_cull=False),
+        name="focus",
+    )
+    _attach_fake_canvas(controller, scene.id)
+    render_manager = controller._render_manager
+    arrivals = []
+    for visual in (background, focus):
+        gfx_visual = render_manager._scenes[scene.id].get_visual(visual.id)
+        gfx_visual.on_data_ready = lambda batch, vid=visual.id: arrivals.append(vid)
+
+    # Hold every read slot so both visuals' reads queue up, then let go.
+    scheduler = render_manager._slicer._scheduler
+    held = await scheduler.acquire((-1,), n=1_000_000)
+    controller.reslice_scene(scene.id)
+    while scheduler.n_waiting < 2:
+        await asyncio.sleep(0)
+    scheduler.release(held)
+    await asyncio.gather(*render_manager._slicer._tasks.values())
+
+    assert arrivals[0] == focus.id
+    assert set(arrivals) == {background.id, focus.id}
 
 
 def test_to_file_roundtrip(tmp_path, small_zarr_store):